@@ -372,6 +372,9 @@ ext_data = dict(
              "depends" : [],
              "sources" : []},
     _smoothers_lowess = {"name" : "statsmodels/nonparametric/_smoothers_lowess.c",
+             "depends" : [],
+             "sources" : []},
+    _exponential_smoothers = {"name" : "statsmodels/tsa/_exponential_smoothers.c",
              "depends" : [],
              "sources" : []}
     )
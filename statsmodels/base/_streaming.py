@@ -0,0 +1,157 @@
+"""
+Helper functions and mixins for models fit to data chunks
+
+The streaming models iterate over chunks of data and only keep sufficient
+statistics of the data, see `statsmodels.regression.streaming` and
+`statsmodels.genmod.streaming`.
+
+Author: statsmodels developers
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+
+from statsmodels.base.data import handle_data
+
+
+def _chunk_endog_exog(endog, exog, k_vars=None):
+    """convert endog and exog of one chunk to ndarrays and check them"""
+    endog = np.asarray(endog, dtype=np.float64).squeeze()
+    if endog.ndim == 0:
+        endog = endog[None]
+    if endog.ndim != 1:
+        raise ValueError("endog in each chunk needs to be 1-dimensional")
+    exog = np.asarray(exog, dtype=np.float64)
+    if exog.ndim == 1:
+        # either one observation or one regressor
+        exog = exog[:, None] if k_vars in (None, 1) else exog[None, :]
+    if exog.shape[0] != endog.shape[0]:
+        raise ValueError("endog and exog in a chunk do not have the same "
+                         "number of observations")
+    if k_vars is not None and exog.shape[1] != k_vars:
+        raise ValueError("all chunks need to have the same number of "
+                         "columns in exog, got %d instead of %d" %
+                         (exog.shape[1], k_vars))
+    return endog, exog
+
+
+def _chunk_vector(value, nobs, name='weights'):
+    """convert weights or offsets of one chunk to an ndarray of length nobs"""
+    if value is None:
+        return None
+    value = np.asarray(value, dtype=np.float64)
+    if value.ndim == 0:
+        value = np.repeat(value, nobs)
+    if value.shape != (nobs,):
+        raise ValueError("%s in a chunk need to be a scalar or have the "
+                         "same length as endog" % name)
+    return value
+
+
+class StreamingModelMixin(object):
+    """
+    Iteration over the data chunks of a streaming model
+
+    Subclasses define `_as_chunk(chunk, k_vars)`, which converts a chunk to
+    ndarrays, or returns None for a chunk that is skipped. The data instance,
+    which provides the names of endog and exog, is created from the first
+    observation of the first chunk.
+    """
+
+    data = None
+    k_vars = None
+    _consumed = False
+
+    def _iter_chunks(self):
+        """iterate over the chunks converted by `_as_chunk`"""
+        chunks = self.chunks
+        if callable(chunks):
+            chunks = chunks()
+        elif iter(chunks) is chunks:
+            if self._consumed:
+                raise ValueError("the chunks have already been consumed. "
+                                 "Use a callable that returns a new iterator "
+                                 "of chunks to allow several passes over the "
+                                 "data.")
+            self._consumed = True
+        for chunk in chunks:
+            if self.data is None:
+                self._attach_data(chunk)
+            chunk = self._as_chunk(chunk, self.k_vars)
+            if chunk is not None:
+                yield chunk
+
+    def _attach_data(self, chunk):
+        # create the data instance from the first observation for names and
+        # wrapping of the results
+        if hasattr(chunk, 'keys'):
+            endog, exog = chunk['endog'], chunk['exog']
+        else:
+            endog, exog = chunk[0], chunk[1]
+        if np.asarray(exog).ndim == 1 and isinstance(exog, np.ndarray):
+            exog = exog[:, None]
+        self.data = handle_data(endog[:1], exog[:1], missing='none',
+                                hasconst=True)
+        self.k_vars = np.asarray(self.data.exog).shape[1]
+
+    @property
+    def endog_names(self):
+        return self.data.ynames
+
+    @property
+    def exog_names(self):
+        return self.data.xnames
+
+
+class _NotStored(object):
+    """
+    results attribute that needs the observations
+
+    Raises AttributeError if none of the other base classes of the results
+    defines the attribute.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        defined = any(not isinstance(vars(klass)[self.name], _NotStored)
+                      for klass in type(obj).__mro__
+                      if self.name in vars(klass))
+        if not defined:
+            raise AttributeError(self.name)
+        raise NotImplementedError("%s is not available for %s, the "
+                                  "observations are not stored." %
+                                  (self.name, obj.model.__class__.__name__))
+
+
+class StreamingResultsMixin(object):
+    """
+    Results attributes of streaming models that need the observations
+
+    Residuals, fitted values and the other attributes of the results classes
+    that are computed from the individual observations raise
+    NotImplementedError.
+    """
+
+    fittedvalues = _NotStored('fittedvalues')
+    resid = _NotStored('resid')
+    wresid = _NotStored('wresid')
+    resid_pearson = _NotStored('resid_pearson')
+    resid_response = _NotStored('resid_response')
+    resid_working = _NotStored('resid_working')
+    resid_deviance = _NotStored('resid_deviance')
+    resid_anscombe = _NotStored('resid_anscombe')
+    resid_anscombe_scaled = _NotStored('resid_anscombe_scaled')
+    resid_anscombe_unscaled = _NotStored('resid_anscombe_unscaled')
+    mu = _NotStored('mu')
+    null = _NotStored('null')
+
+    def remove_data(self):
+        """
+        Streaming results do not store the data, this does nothing.
+        """
+        pass
@@ -460,6 +460,62 @@ class PatsyData(ModelData):
         return arr.design_info.column_names
 
 
+class SparseData(ModelData):
+    """
+    Data handling class for exog given as a scipy.sparse matrix
+
+    exog is stored as a CSR matrix of floats and is never converted to a
+    dense array. Missing value handling is not available, and metadata of
+    a pandas endog is not attached to the results.
+    """
+
+    @classmethod
+    def handle_missing(cls, endog, exog, missing, **kwargs):
+        raise NotImplementedError("missing data handling is not available "
+                                  "for sparse exog")
+
+    def _get_xarr(self, exog):
+        from scipy import sparse
+        return sparse.csr_matrix(exog, dtype=np.float64)
+
+    def _handle_constant(self, hasconst):
+        if hasconst is not None:
+            return super(SparseData, self)._handle_constant(hasconst)
+
+        exog = self.exog
+        if not np.isfinite(exog.data).all():
+            raise MissingDataError('exog contains inf or nans')
+        # min and max include the implicit zeros
+        xmax = exog.max(0).toarray().ravel()
+        xmin = exog.min(0).toarray().ravel()
+        const_idx = np.flatnonzero((xmax == xmin) & (xmax != 0))
+        if const_idx.size > 0:
+            self.k_constant = 1
+            ones = const_idx[xmax[const_idx] == 1]
+            self.const_idx = ones[0] if ones.size > 0 else const_idx[0]
+        else:
+            # implicit constant, e.g. a full set of dummy variables, if a
+            # column of ones is in the column space of exog
+            from scipy.sparse.linalg import lsqr
+            nobs = exog.shape[0]
+            r1norm = lsqr(exog, np.ones(nobs), atol=1e-12, btol=1e-12)[3]
+            self.k_constant = int(r1norm < 1e-6 * np.sqrt(nobs))
+            self.const_idx = None
+
+    def _check_integrity(self):
+        if self.exog.shape[0] != len(self.endog):
+            raise ValueError("endog and exog matrices are different sizes")
+
+    @cache_writable()
+    def xnames(self):
+        k_vars = self.exog.shape[1]
+        if self.const_idx is None:
+            return ['x%d' % i for i in range(1, k_vars + 1)]
+        xnames = ['x%d' % i for i in range(1, k_vars)]
+        xnames.insert(self.const_idx, 'const')
+        return xnames
+
+
 class PandasData(ModelData):
     """
     Data handling class which knows how to reattach pandas metadata to model
@@ -606,7 +662,9 @@ def handle_data_class_factory(endog, exog):
     """
     Given inputs
     """
-    if data_util._is_using_ndarray_type(endog, exog):
+    if data_util._is_sparse(exog):
+        klass = SparseData
+    elif data_util._is_using_ndarray_type(endog, exog):
         klass = ModelData
     elif data_util._is_using_pandas(endog, exog):
         klass = PandasData
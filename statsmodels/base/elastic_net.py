@@ -1,6 +1,7 @@
 import numpy as np
 from statsmodels.base.model import Results
 import statsmodels.base.wrapper as wrap
+from statsmodels.tools import data as data_util
 from statsmodels.tools.decorators import cache_readonly
 
 """
@@ -62,7 +63,8 @@ def _gen_npfuncs(k, L1_wt, alpha, loglike_kwds, score_kwds, hess_kwds):
 def fit_elasticnet(model, method="coord_descent", maxiter=100,
          alpha=0., L1_wt=1., start_params=None, cnvrg_tol=1e-7,
          zero_tol=1e-8, refit=False, check_step=True,
-         loglike_kwds=None, score_kwds=None, hess_kwds=None):
+         loglike_kwds=None, score_kwds=None, hess_kwds=None,
+         use_irls=False):
     """
     Return an elastic net regularized fit to a regression model.
 
@@ -107,6 +109,10 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
         Keyword arguments for the score function.
     hess_kwds : dict-like or None
         Keyword arguments for the Hessian function.
+    use_irls : bool
+        If True, the model is fit by penalized iteratively reweighted
+        least squares, see Notes.  This requires that the model
+        implements ``_irls_working_data``.
 
     Returns
     -------
@@ -130,6 +136,14 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
 
     then repeatedly optimize the L1 penalized version of this function
     along coordinate axes.
+
+    If `use_irls` is True, the quadratic approximation is instead the
+    weighted least squares problem of an iteration of IRLS, as in glmnet.
+    The weighted cross-products of `exog` are formed once per IRLS
+    iteration, and the coordinate descent for the penalized weighted
+    least squares problem only uses these cross-products.  Each IRLS
+    iteration is a proximal Newton step, which is halved if it does not
+    decrease the objective function.
     """
 
     k_exog = model.exog.shape[1]
@@ -148,8 +162,73 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
     else:
         params = start_params.copy()
 
+    if use_irls:
+        params, converged, n_iter = _irls_coord_descent(
+            model, params, alpha, L1_wt, maxiter, cnvrg_tol, loglike_kwds)
+    else:
+        params, converged, n_iter = _coord_descent(
+            model, params, alpha, L1_wt, np.arange(k_exog), maxiter,
+            cnvrg_tol, zero_tol, check_step, loglike_kwds, score_kwds,
+            hess_kwds)
+
+    # Set approximate zero coefficients to be exactly zero
+    params[np.abs(params) < zero_tol] = 0
+
+    if not refit:
+        results = RegularizedResults(model, params)
+        return RegularizedResultsWrapper(results)
+
+    # Fit the reduced model to get standard errors and other
+    # post-estimation results.
+    ii = np.flatnonzero(params)
+    cov = np.zeros((k_exog, k_exog))
+    init_args = dict([(k, getattr(model, k, None)) for k in model._init_keys])
+    if len(ii) > 0:
+        model1 = model.__class__(model.endog, model.exog[:, ii],
+                               **init_args)
+        rslt = model1.fit()
+        cov[np.ix_(ii, ii)] = rslt.normalized_cov_params
+    else:
+        # Hack: no variables were selected but we need to run fit in
+        # order to get the correct results class.  So just fit a model
+        # with one variable.
+        model1 = model.__class__(model.endog, model.exog[:, 0], **init_args)
+        rslt = model1.fit(maxiter=0)
+
+    # fit may return a results or a results wrapper
+    if issubclass(rslt.__class__, wrap.ResultsWrapper):
+        klass = rslt._results.__class__
+    else:
+        klass = rslt.__class__
+
+    # Not all models have a scale
+    if hasattr(rslt, 'scale'):
+        scale = rslt.scale
+    else:
+        scale = 1.
+
+    # Assuming a standard signature for creating results classes.
+    refit = klass(model, params, cov, scale=scale)
+    refit.regularized = True
+    refit.method = method
+    refit.fit_history = {'iteration' : n_iter}
+
+    return refit
+
+
+def _coord_descent(model, params, alpha, L1_wt, idx, maxiter, cnvrg_tol,
+                   zero_tol, check_step, loglike_kwds, score_kwds, hess_kwds):
+    """
+    Coordinate descent over the coordinates in `idx`.
+
+    The coordinates that are not in `idx` are held fixed at their values
+    in `params`.  Returns the updated params, the convergence flag and
+    the number of iteration cycles.
+    """
+
     converged = False
     btol = 1e-4
+    params = params.copy()
     params_zero = np.zeros(len(params), dtype=bool)
 
     init_args = dict([(k, getattr(model, k)) for k in model._init_keys
@@ -157,13 +236,14 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
     init_args['hasconst'] = False
 
     fgh_list = [_gen_npfuncs(k, L1_wt, alpha, loglike_kwds, score_kwds, hess_kwds)
-                for k in range(k_exog)]
+                for k in range(len(params))]
 
+    itr = 0
     for itr in range(maxiter):
 
         # Sweep through the parameters
         params_save = params.copy()
-        for k in range(k_exog):
+        for k in idx:
 
             # Under the active set method, if a parameter becomes
             # zero we don't try to change it again.
@@ -200,49 +280,281 @@ def fit_elasticnet(model, method="coord_descent", maxiter=100,
             converged = True
             break
 
-    # Set approximate zero coefficients to be exactly zero
-    params[np.abs(params) < zero_tol] = 0
+    return params, converged, itr + 1
 
-    if not refit:
-        results = RegularizedResults(model, params)
-        return RegularizedResultsWrapper(results)
 
-    # Fit the reduced model to get standard errors and other
-    # post-estimation results.
-    ii = np.flatnonzero(params)
-    cov = np.zeros((k_exog, k_exog))
-    init_args = dict([(k, getattr(model, k, None)) for k in model._init_keys])
-    if len(ii) > 0:
-        model1 = model.__class__(model.endog, model.exog[:, ii],
-                               **init_args)
-        rslt = model1.fit()
-        cov[np.ix_(ii, ii)] = rslt.normalized_cov_params
-    else:
-        # Hack: no variables were selected but we need to run fit in
-        # order to get the correct results class.  So just fit a model
-        # with one variable.
-        model1 = model.__class__(model.endog, model.exog[:, 0], **init_args)
-        rslt = model1.fit(maxiter=0)
+def _irls_coord_descent(model, params, alpha, L1_wt, maxiter, cnvrg_tol,
+                        loglike_kwds, inner_maxiter=1000, max_halving=30):
+    """
+    Penalized IRLS with coordinate descent for the weighted least squares
+    problem of each iteration.
 
-    # fit may return a results or a results wrapper
-    if issubclass(rslt.__class__, wrap.ResultsWrapper):
-        klass = rslt._results.__class__
-    else:
-        klass = rslt.__class__
+    ``model._irls_working_data(params)`` returns the working endog and the
+    weights such that ``sum(weights * (wendog - exog params)**2) / 2``
+    is the quadratic approximation of the negative log-likelihood at
+    params, up to a constant.
+    """
 
-    # Not all models have a scale
-    if hasattr(rslt, 'scale'):
-        scale = rslt.scale
-    else:
-        scale = 1.
+    nobs = model.exog.shape[0]
+    exog = model.exog
 
-    # Assuming a standard signature for creating results classes.
-    refit = klass(model, params, cov, scale=scale)
-    refit.regularized = True
-    refit.method = method
-    refit.fit_history = {'iteration' : itr + 1}
+    def objective(params):
+        llf = model.loglike(params, **loglike_kwds)
+        pen = alpha * ((1 - L1_wt) * params**2 / 2 +
+                       L1_wt * np.abs(params))
+        return -llf / nobs + pen.sum()
 
-    return refit
+    obj = objective(params)
+    converged = False
+    itr = 0
+    for itr in range(maxiter):
+        wendog, weights = model._irls_working_data(params)
+        wexog = exog * weights[:, None]
+        xtx = np.dot(wexog.T, exog) / nobs
+        xty = np.dot(wexog.T, wendog) / nobs
+        params_new = _gram_coord_descent(
+            xtx, xty, params, alpha, L1_wt, np.arange(len(params)),
+            inner_maxiter, cnvrg_tol)[0]
+
+        # Step halving if the proximal Newton step is uphill
+        step = params_new - params
+        for _ in range(max_halving):
+            obj_new = objective(params + step)
+            if np.isfinite(obj_new) and obj_new <= obj + 1e-12 * abs(obj):
+                break
+            step /= 2
+        params = params + step
+        obj = obj_new
+
+        if np.max(np.abs(step)) < cnvrg_tol:
+            converged = True
+            break
+
+    return params, converged, itr + 1
+
+
+def _gram_coord_descent(xtx, xty, params, alpha, L1_wt, idx, maxiter,
+                        cnvrg_tol):
+    """
+    Coordinate descent for a least squares loss given by its Gram matrix.
+
+    Minimizes ``params' xtx params / 2 - xty' params`` plus the elastic
+    net penalty over the coordinates in `idx`.  The gradient
+    ``xty - xtx params`` is updated with one column of `xtx` whenever a
+    coordinate changes, so a sweep does not touch the data.
+
+    Returns the updated params, the gradient at params, the convergence
+    flag and the number of iteration cycles.
+    """
+
+    params = params.copy()
+    grad = xty - np.dot(xtx, params)
+    diag = np.diag(xtx)
+    l1 = alpha * L1_wt
+    denom = diag + alpha * (1 - L1_wt)
+
+    converged = False
+    itr = 0
+    for itr in range(maxiter):
+        pchange = 0.
+        for k in idx:
+            z = grad[k] + diag[k] * params[k]
+            if z > l1[k]:
+                new = (z - l1[k]) / denom[k]
+            elif z < -l1[k]:
+                new = (z + l1[k]) / denom[k]
+            else:
+                new = 0.
+            delta = new - params[k]
+            if delta != 0:
+                grad -= xtx[:, k] * delta
+                params[k] = new
+                pchange = max(pchange, abs(delta))
+        if pchange < cnvrg_tol:
+            converged = True
+            break
+
+    return params, grad, converged, itr + 1
+
+
+def fit_elasticnet_path(model, alphas=None, L1_wt=1., n_alphas=100,
+                        alpha_min_ratio=1e-3, penalty_wts=None,
+                        strong_rules=True, maxiter=100, cnvrg_tol=1e-7,
+                        zero_tol=1e-8, check_step=True, gram=None,
+                        loglike_kwds=None, score_kwds=None, hess_kwds=None):
+    """
+    Return elastic net fits for a decreasing sequence of penalty weights.
+
+    Parameters
+    ----------
+    model : model object
+        A statsmodels object implementing ``loglike``, ``score``, and
+        ``hessian``.
+    alphas : array-like, optional
+        Decreasing sequence of scalar penalty weights.  If not provided,
+        `n_alphas` values are used that are equally spaced on the log
+        scale between the smallest penalty weight at which all penalized
+        coefficients are zero, and `alpha_min_ratio` times that value.
+    L1_wt : scalar
+        The fraction of the penalty given to the L1 penalty term.
+        Must be between 0 and 1 (inclusive).
+    n_alphas : int
+        The number of penalty weights if `alphas` is not provided.
+    alpha_min_ratio : float
+        The ratio of the smallest to the largest penalty weight if
+        `alphas` is not provided.
+    penalty_wts : array-like, optional
+        Relative penalty weight of each coefficient; the penalty weight
+        of coefficient ``j`` at path point ``i`` is
+        ``alphas[i] * penalty_wts[j]``.  Coefficients with zero weight,
+        e.g. an intercept, are not penalized.  Defaults to ones.
+    strong_rules : bool
+        If True, coordinates that are likely to be zero at the next
+        penalty weight are screened out with the sequential strong rule,
+        and added back if they violate the optimality conditions.
+    maxiter : integer
+        The maximum number of iteration cycles for each penalty weight.
+    cnvrg_tol : scalar
+        Convergence threshold for the change in `params` in one cycle.
+    zero_tol : scalar
+        Any estimated coefficient smaller than this value is
+        replaced with zero.
+    check_step : bool
+        If True, confirm that the first step is an improvement and search
+        further if it is not.  Not used if `gram` is provided.
+    gram : tuple of ndarrays, optional
+        ``(xtx, xty)`` such that the smooth loss is, up to a constant,
+        ``params' xtx params / 2 - xty' params``.  This is the case for
+        least squares with ``xtx = exog' exog / nobs`` and
+        ``xty = exog' endog / nobs``.  The data is then not used after
+        the Gram matrix has been formed.
+    loglike_kwds : dict-like or None
+        Keyword arguments for the log-likelihood function.
+    score_kwds : dict-like or None
+        Keyword arguments for the score function.
+    hess_kwds : dict-like or None
+        Keyword arguments for the Hessian function.
+
+    Returns
+    -------
+    A RegularizationPathResults instance.
+
+    Notes
+    -----
+    The objective function at each penalty weight is the one of
+    `fit_elasticnet`.  The path follows glmnet: the solution for each
+    penalty weight is used as starting value for the next, smaller one,
+    and coordinate descent runs only over the coefficients that have
+    been nonzero before or that pass the strong rule
+
+    |gradient_j| >= L1_wt * penalty_wts_j * (2 * alpha_new - alpha_old)
+
+    where the gradient of the log-likelihood divided by nobs is evaluated
+    at the previous solution.  After convergence, the optimality
+    conditions are checked for all coefficients at zero.
+
+    References
+    ----------
+    Tibshirani, R., J. Bien, J. Friedman, T. Hastie, N. Simon, J. Taylor
+    and R. J. Tibshirani (2012). Strong rules for discarding predictors in
+    lasso-type problems. Journal of the Royal Statistical Society:
+    Series B 74, 245-266.
+    """
+
+    k_exog = model.exog.shape[1]
+    nobs = model.exog.shape[0]
+
+    loglike_kwds = {} if loglike_kwds is None else loglike_kwds
+    score_kwds = {} if score_kwds is None else score_kwds
+    hess_kwds = {} if hess_kwds is None else hess_kwds
+
+    if penalty_wts is None:
+        penalty_wts = np.ones(k_exog)
+    else:
+        penalty_wts = np.asarray(penalty_wts, dtype=np.float64)
+        if penalty_wts.shape != (k_exog,):
+            raise ValueError("penalty_wts needs to have one element for "
+                             "each column of exog")
+
+    if gram is not None:
+        xtx, xty = gram
+
+        def solve(params, alpha, idx):
+            params, grad, converged, itr = _gram_coord_descent(
+                xtx, xty, params, alpha, L1_wt, idx, maxiter, cnvrg_tol)
+            small = (params != 0) & (np.abs(params) < zero_tol)
+            if small.any():
+                params[small] = 0
+                grad = xty - np.dot(xtx, params)
+            return params, grad, converged, itr
+
+        def gradient(params):
+            return xty - np.dot(xtx, params)
+    else:
+        def gradient(params):
+            return model.score(params, **score_kwds) / nobs
+
+        def solve(params, alpha, idx):
+            params, converged, itr = _coord_descent(
+                model, params, alpha, L1_wt, idx, maxiter, cnvrg_tol,
+                zero_tol, check_step, loglike_kwds, score_kwds, hess_kwds)
+            params[np.abs(params) < zero_tol] = 0
+            return params, gradient(params), converged, itr
+
+    # Solution with all penalized coefficients at zero
+    params = np.zeros(k_exog)
+    unpenalized = np.flatnonzero(penalty_wts == 0)
+    if len(unpenalized) > 0:
+        params, grad, _, _ = solve(params, np.zeros(k_exog), unpenalized)
+    else:
+        grad = gradient(params)
+
+    if alphas is None:
+        if L1_wt == 0:
+            raise ValueError("alphas are required if L1_wt is 0")
+        penalized = penalty_wts > 0
+        alpha_max = np.max(np.abs(grad[penalized]) / penalty_wts[penalized])
+        alpha_max /= L1_wt
+        alphas = np.exp(np.linspace(np.log(alpha_max),
+                                    np.log(alpha_max * alpha_min_ratio),
+                                    n_alphas))
+    else:
+        alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+        if alphas.ndim != 1 or np.any(np.diff(alphas) > 0):
+            raise ValueError("alphas needs to be a decreasing 1d sequence")
+
+    screen = strong_rules and L1_wt > 0
+    n = len(alphas)
+    params_path = np.zeros((n, k_exog))
+    converged = np.zeros(n, dtype=bool)
+    n_iter = np.zeros(n, dtype=np.int64)
+    alpha_prev = alphas[0]
+    for i, alpha_i in enumerate(alphas):
+        alpha = alpha_i * penalty_wts
+        if screen:
+            thresh = L1_wt * penalty_wts * (2 * alpha_i - alpha_prev)
+            keep = (params != 0) | (np.abs(grad) >= thresh)
+            keep[unpenalized] = True
+        else:
+            keep = np.ones(k_exog, dtype=bool)
+
+        while True:
+            params, grad, converged[i], itr = solve(params, alpha,
+                                                    np.flatnonzero(keep))
+            n_iter[i] += itr
+            if keep.all():
+                break
+            # Optimality conditions for the screened out coefficients
+            violation = ~keep & (np.abs(grad) > L1_wt * alpha * (1 + 1e-8))
+            if not violation.any():
+                break
+            keep |= violation
+
+        params_path[i] = params
+        alpha_prev = alpha_i
+
+    return RegularizationPathResults(model, alphas, params_path, L1_wt,
+                                     penalty_wts, converged, n_iter)
 
 
 def _opt_1d(func, grad, hess, model, start, L1_wt, tol,
@@ -352,3 +664,68 @@ class RegularizedResultsWrapper(wrap.ResultsWrapper):
 
 wrap.populate_wrapper(RegularizedResultsWrapper,
                       RegularizedResults)
+
+
+class RegularizationPathResults(object):
+    """
+    Elastic net fits along a sequence of penalty weights
+
+    Attributes
+    ----------
+    model : model instance
+        The model that has been fit.
+    alphas : ndarray
+        The decreasing sequence of penalty weights.
+    params : ndarray or DataFrame
+        The parameters, one row for each penalty weight.  If the model
+        data is a pandas object, then this is a DataFrame indexed by the
+        penalty weights.
+    L1_wt : float
+        The fraction of the penalty given to the L1 penalty term.
+    penalty_wts : ndarray
+        Relative penalty weights of the coefficients.
+    converged : ndarray
+        Convergence flag of the fit at each penalty weight.
+    n_iter : ndarray
+        Number of coordinate descent cycles at each penalty weight.
+    """
+
+    def __init__(self, model, alphas, params, L1_wt, penalty_wts,
+                 converged, n_iter):
+        self.model = model
+        self.alphas = alphas
+        self._params = params
+        self.L1_wt = L1_wt
+        self.penalty_wts = penalty_wts
+        self.converged = converged
+        self.n_iter = n_iter
+
+    @cache_readonly
+    def params(self):
+        orig_exog = getattr(self.model.data, 'orig_exog', None)
+        if data_util._is_using_pandas(orig_exog, None):
+            import pandas as pd
+            return pd.DataFrame(self._params, index=self.alphas,
+                                columns=self.model.exog_names)
+        return self._params
+
+    @cache_readonly
+    def df_model(self):
+        """Number of nonzero coefficients at each penalty weight"""
+        return (self._params != 0).sum(1)
+
+    def get_results(self, idx):
+        """
+        Return the regularized results at one penalty weight.
+
+        Parameters
+        ----------
+        idx : int
+            Position of the penalty weight in `alphas`.
+
+        Returns
+        -------
+        A RegularizedResults instance.
+        """
+        results = RegularizedResults(self.model, self._params[idx].copy())
+        return RegularizedResultsWrapper(results)
@@ -0,0 +1,113 @@
+"""
+Tests for models with a scipy.sparse design matrix
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+from scipy import sparse
+import pytest
+
+from statsmodels.base.data import SparseData, handle_data
+from statsmodels.discrete.discrete_model import Logit, Poisson
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.genmod import families
+from statsmodels.regression.linear_model import OLS, WLS
+
+
+def _gen_data(nobs=1500, n_groups=30, seed=412357):
+    np.random.seed(seed)
+    groups = np.random.randint(0, n_groups, size=nobs)
+    dummies = sparse.csr_matrix((np.ones(nobs), (np.arange(nobs), groups)),
+                                shape=(nobs, n_groups))
+    x = np.random.randn(nobs, 2)
+    exog = sparse.hstack([dummies, sparse.csr_matrix(x)]).tocsr()
+    linpred = 0.1 * (groups % 5) - 0.2 + 0.5 * x[:, 0] - 0.3 * x[:, 1]
+    return groups, exog, linpred
+
+
+def test_data_handling():
+    groups, exog, linpred = _gen_data()
+    data = handle_data(linpred, exog)
+    assert isinstance(data, SparseData)
+    assert sparse.isspmatrix_csr(data.exog)
+    # implicit constant from the full set of dummies
+    assert_equal(data.k_constant, 1)
+    assert data.const_idx is None
+    assert_equal(data.xnames[:2], ['x1', 'x2'])
+
+    data = handle_data(linpred, exog[:, 1:])
+    assert_equal(data.k_constant, 0)
+
+    const = sparse.csr_matrix(np.ones((exog.shape[0], 1)))
+    data = handle_data(linpred, sparse.hstack([exog[:, -2:], const]))
+    assert_equal(data.k_constant, 1)
+    assert_equal(data.const_idx, 2)
+    assert_equal(data.xnames, ['x1', 'x2', 'const'])
+
+    with pytest.raises(NotImplementedError):
+        handle_data(linpred, exog, missing='drop')
+
+
+@pytest.mark.parametrize('method', ['pinv', 'cholesky', 'lsqr'])
+def test_ols(method):
+    groups, exog, linpred = _gen_data()
+    endog = linpred + np.random.randn(len(linpred))
+    res1 = OLS(endog, exog).fit(method=method, cov_type='HC1')
+    res2 = OLS(endog, exog.toarray()).fit(cov_type='HC1')
+    assert_allclose(res1.params, res2.params, rtol=1e-9, atol=1e-12)
+    assert_allclose(res1.bse, res2.bse, rtol=1e-9)
+    assert_allclose(res1.rsquared, res2.rsquared, rtol=1e-10)
+    assert_allclose(res1.llf, res2.llf, rtol=1e-10)
+    assert_equal(res1.df_model, res2.df_model)
+    assert_allclose(res1.predict(exog[:10]), res2.fittedvalues[:10],
+                    rtol=1e-10)
+    res1.summary()
+
+
+def test_wls_hc3():
+    groups, exog, linpred = _gen_data()
+    endog = linpred + np.random.randn(len(linpred))
+    weights = np.random.uniform(0.5, 2, size=len(endog))
+    res1 = WLS(endog, exog, weights=weights).fit(cov_type='HC3')
+    res2 = WLS(endog, exog.toarray(), weights=weights).fit(cov_type='HC3')
+    assert_allclose(res1.params, res2.params, rtol=1e-9, atol=1e-12)
+    assert_allclose(res1.bse, res2.bse, rtol=1e-9)
+
+    with pytest.raises(ValueError):
+        OLS(endog, exog).fit(method='qr')
+
+
+@pytest.mark.parametrize('family', [families.Poisson, families.Binomial])
+def test_glm(family):
+    groups, exog, linpred = _gen_data()
+    if family is families.Poisson:
+        endog = np.random.poisson(np.exp(linpred))
+    else:
+        endog = np.random.binomial(1, 1 / (1 + np.exp(-linpred)))
+    res1 = GLM(endog, exog, family=family()).fit()
+    res2 = GLM(endog, exog.toarray(), family=family()).fit()
+    assert_allclose(res1.params, res2.params, rtol=1e-8, atol=1e-12)
+    assert_allclose(res1.bse, res2.bse, rtol=1e-8)
+    assert_allclose(res1.llf, res2.llf, rtol=1e-10)
+    assert_equal(res1.df_model, res2.df_model)
+    res1.summary()
+
+
+@pytest.mark.parametrize('klass', [Poisson, Logit])
+def test_discrete(klass):
+    groups, exog, linpred = _gen_data()
+    if klass is Poisson:
+        endog = np.random.poisson(np.exp(linpred))
+    else:
+        endog = np.random.binomial(1, 1 / (1 + np.exp(-linpred)))
+    res1 = klass(endog, exog).fit(disp=0)
+    res2 = klass(endog, exog.toarray()).fit(disp=0)
+    assert_allclose(res1.params, res2.params, rtol=1e-8, atol=1e-12)
+    assert_allclose(res1.bse, res2.bse, rtol=1e-8)
+    assert_allclose(res1.llf, res2.llf, rtol=1e-10)
+    assert_allclose(res1.prsquared, res2.prsquared, rtol=1e-8)
+    assert_allclose(res1.predict(), res2.predict(), rtol=1e-10)
+    res1.summary()
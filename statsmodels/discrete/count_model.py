@@ -8,15 +8,15 @@ import numpy as np
 import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
 import statsmodels.regression.linear_model as lm
+import statsmodels.tools.tools as tools
 from statsmodels.discrete.discrete_model import (DiscreteModel, CountModel,
                                                  Poisson, Logit, CountResults,
                                                  L1CountResults, Probit,
                                                  _discrete_results_docs,
                                                  GeneralizedPoisson,
-                                                 NegativeBinomialP)
+                                                 NegativeBinomialP,
+                                                 _hessian_from_factors)
 from statsmodels.distributions import zipoisson, zigenpoisson, zinegbin
-from statsmodels.tools.numdiff import (approx_fprime, approx_hess,
-                                       approx_hess_cs, approx_fprime_cs)
 from statsmodels.tools.decorators import (resettable_cache, cache_readonly)
 
 
@@ -75,12 +75,9 @@ class GenericZeroInflated(CountModel):
         if inflation == 'logit':
             self.model_infl = Logit(np.zeros(self.exog_infl.shape[0]),
                                     self.exog_infl)
-            self._hessian_inflate = self._hessian_logit
         elif inflation == 'probit':
             self.model_infl = Probit(np.zeros(self.exog_infl.shape[0]),
                                     self.exog_infl)
-            self._hessian_inflate = self._hessian_probit
-
         else:
             raise TypeError("inflation == %s, which is not handled"
                 % inflation)
@@ -233,6 +230,44 @@ class GenericZeroInflated(CountModel):
 
     fit_regularized.__doc__ = DiscreteModel.fit_regularized.__doc__
 
+    def _predict_infl_derivs(self, params_infl):
+        """
+        Inflation probability and its first and second derivative with
+        respect to the linear predictor of the inflation model
+        """
+        linpred = self.exog_infl.dot(params_infl)
+        w = self.model_infl.cdf(linpred)
+        w = np.clip(w, np.finfo(float).eps, 1 - np.finfo(float).eps)
+        dw = self.model_infl.pdf(linpred)
+        if self.inflation == 'logit':
+            d2w = dw * (1 - 2 * w)
+        else:
+            d2w = -linpred * dw
+        return w, dw, d2w
+
+    def _score_factors(self, params):
+        """
+        Factors of the score and Hessian shared by `score_obs` and `hessian`
+
+        The score of an observation with respect to the inflation parameters
+        is ``factor_infl * exog_infl`` and with respect to the parameters of
+        the main model ``factor_main * score_main``.
+        """
+        params_infl = params[:self.k_inflate]
+        params_main = params[self.k_inflate:]
+
+        zero = (self.endog == 0)
+        w, dw, d2w = self._predict_infl_derivs(params_infl)
+        score_main = self.model_main.score_obs(params_main)
+        pmf_main = np.exp(self.model_main.loglikeobs(params_main))
+        pmf_zero = w + (1 - w) * pmf_main
+
+        factor_main = np.where(zero, (1 - w) * pmf_main / pmf_zero, 1.)
+        factor_infl = np.where(zero, dw * (1 - pmf_main) / pmf_zero,
+                               -dw / (1 - w))
+        return (score_main, factor_main, factor_infl, zero, w, dw, d2w,
+                pmf_main, pmf_zero)
+
     def score_obs(self, params):
         """
         Generic Zero Inflated model score (gradient) vector of the log-likelihood
@@ -247,88 +282,19 @@ class GenericZeroInflated(CountModel):
         score : ndarray, 1-D
             The score vector of the model, i.e. the first derivative of the
             loglikelihood function, evaluated at `params`
-        """
-        params_infl = params[:self.k_inflate]
-        params_main = params[self.k_inflate:]
-
-        y = self.endog
-        w = self.model_infl.predict(params_infl)
-        w = np.clip(w, np.finfo(float).eps, 1 - np.finfo(float).eps)
-        score_main = self.model_main.score_obs(params_main)
-        llf_main = self.model_main.loglikeobs(params_main)
-        llf = self.loglikeobs(params)
-        zero_idx = np.nonzero(y == 0)[0]
-        nonzero_idx = np.nonzero(y)[0]
 
-        mu = self.model_main.predict(params_main)
-
-        dldp = np.zeros((self.exog.shape[0], self.k_exog), dtype=np.float64)
-        dldw = np.zeros_like(self.exog_infl, dtype=np.float64)
-
-        dldp[zero_idx,:] = (score_main[zero_idx].T *
-                     (1 - (w[zero_idx]) / np.exp(llf[zero_idx]))).T
-        dldp[nonzero_idx,:] = score_main[nonzero_idx]
-
-        if self.inflation == 'logit':
-            dldw[zero_idx,:] =  (self.exog_infl[zero_idx].T * w[zero_idx] *
-                                 (1 - w[zero_idx]) *
-                                 (1 - np.exp(llf_main[zero_idx])) /
-                                  np.exp(llf[zero_idx])).T
-            dldw[nonzero_idx,:] = -(self.exog_infl[nonzero_idx].T *
-                                    w[nonzero_idx]).T
-        elif self.inflation == 'probit':
-            return approx_fprime(params, self.loglikeobs)
-
-        return np.hstack((dldw, dldp))
+        Notes
+        -----
+        The score is computed in closed form from the score of the main
+        model for both the logit and the probit inflation model.
+        """
+        score_main, factor_main, factor_infl = self._score_factors(params)[:3]
+        return np.hstack((factor_infl[:, None] * self.exog_infl,
+                          factor_main[:, None] * score_main))
 
     def score(self, params):
         return self.score_obs(params).sum(0)
 
-    def _hessian_main(self, params):
-        pass
-
-    def _hessian_logit(self, params):
-        params_infl = params[:self.k_inflate]
-        params_main = params[self.k_inflate:]
-
-        y = self.endog
-        w = self.model_infl.predict(params_infl)
-        w = np.clip(w, np.finfo(float).eps, 1 - np.finfo(float).eps)
-        score_main = self.model_main.score_obs(params_main)
-        llf_main = self.model_main.loglikeobs(params_main)
-        llf = self.loglikeobs(params)
-        zero_idx = np.nonzero(y == 0)[0]
-        nonzero_idx = np.nonzero(y)[0]
-
-        hess_arr = np.zeros((self.k_inflate, self.k_exog + self.k_inflate))
-
-        pmf = np.exp(llf)
-
-        #d2l/dw2
-        for i in range(self.k_inflate):
-            for j in range(i, -1, -1):
-                hess_arr[i, j] = ((
-                    self.exog_infl[zero_idx, i] * self.exog_infl[zero_idx, j] *
-                    (w[zero_idx] * (1 - w[zero_idx]) * ((1 -
-                    np.exp(llf_main[zero_idx])) * (1 - 2 * w[zero_idx]) *
-                    np.exp(llf[zero_idx]) - (w[zero_idx] - w[zero_idx]**2) *
-                    (1 - np.exp(llf_main[zero_idx]))**2) /
-                    pmf[zero_idx]**2)).sum() -
-                    (self.exog_infl[nonzero_idx, i] * self.exog_infl[nonzero_idx, j] *
-                    w[nonzero_idx] * (1 - w[nonzero_idx])).sum())
-
-        #d2l/dpdw
-        for i in range(self.k_inflate):
-            for j in range(self.k_exog):
-                hess_arr[i, j + self.k_inflate] = -(score_main[zero_idx, j] *
-                    w[zero_idx] * (1 - w[zero_idx]) *
-                    self.exog_infl[zero_idx, i] / pmf[zero_idx]).sum()
-
-        return hess_arr
-
-    def _hessian_probit(self, params):
-        pass
-
     def hessian(self, params):
         """
         Generic Zero Inflated model Hessian matrix of the loglikelihood
@@ -346,24 +312,38 @@ class GenericZeroInflated(CountModel):
 
         Notes
         -----
+        The Hessian is computed in closed form from the `score_obs` and the
+        `hessian_factor` of the main model. For zero observations with
+        :math:`c_i = (1 - w_i) P_i / (w_i + (1 - w_i) P_i)`, where
+        :math:`P_i` is the probability of a zero in the main model, the
+        block of the main parameters is
+        :math:`c_i H_i + c_i (1 - c_i) s_i s_i^{\prime}`, where
+        :math:`s_i` and :math:`H_i` are the score and Hessian of the
+        loglikelihood of the main model.
         """
-        hess_arr_main = self._hessian_main(params)
-        hess_arr_infl = self._hessian_inflate(params)
-
-        if hess_arr_main is None or hess_arr_infl is None:
-            return approx_hess(params, self.loglike)
-
-        dim = self.k_exog + self.k_inflate
-
-        hess_arr = np.zeros((dim, dim))
+        params_main = params[self.k_inflate:]
+        (score_main, factor_main, factor_infl, zero, w, dw, d2w,
+         pmf_main, pmf_zero) = self._score_factors(params)
+        exog_infl = self.exog_infl
+
+        hess_factor = self.model_main.hessian_factor(params_main)
+        if isinstance(hess_factor, tuple):
+            hess_main = _hessian_from_factors(
+                self.exog, *[factor_main * h for h in hess_factor])
+        else:
+            hess_main = tools._cross_product(self.exog,
+                                             factor_main * hess_factor)
+        hess_main += tools._cross_product(score_main,
+                                          factor_main * (1 - factor_main))
 
-        hess_arr[:self.k_inflate,:] = hess_arr_infl
-        hess_arr[self.k_inflate:,self.k_inflate:] = hess_arr_main
+        hess_infl = (np.where(zero, d2w * (1 - pmf_main) / pmf_zero,
+                              -d2w / (1 - w)) - factor_infl**2)
+        hess_infl = tools._cross_product(exog_infl, hess_infl)
 
-        tri_idx = np.triu_indices(self.k_exog + self.k_inflate, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        hess_mix = np.where(zero, -dw * pmf_main / pmf_zero**2, 0)
+        hess_mix = (exog_infl.T * hess_mix).dot(score_main)
 
-        return hess_arr
+        return np.block([[hess_infl, hess_mix], [hess_mix.T, hess_main]])
 
     def predict(self, params, exog=None, exog_infl=None, exposure=None,
                 offset=None, which='mean'):
@@ -493,35 +473,6 @@ class ZeroInflatedPoisson(GenericZeroInflated):
         self.result_class_reg = L1ZeroInflatedPoissonResults
         self.result_class_reg_wrapper = L1ZeroInflatedPoissonResultsWrapper
 
-    def _hessian_main(self, params):
-        params_infl = params[:self.k_inflate]
-        params_main = params[self.k_inflate:]
-
-        y = self.endog
-        w = self.model_infl.predict(params_infl)
-        w = np.clip(w, np.finfo(float).eps, 1 - np.finfo(float).eps)
-        score = self.score(params)
-        zero_idx = np.nonzero(y == 0)[0]
-        nonzero_idx = np.nonzero(y)[0]
-
-        mu = self.model_main.predict(params_main)
-
-        hess_arr = np.zeros((self.k_exog, self.k_exog))
-
-        coeff = (1 + w[zero_idx] * (np.exp(mu[zero_idx]) - 1))
-
-        #d2l/dp2
-        for i in range(self.k_exog):
-            for j in range(i, -1, -1):
-                hess_arr[i, j] = ((
-                    self.exog[zero_idx, i] * self.exog[zero_idx, j] *
-                    mu[zero_idx] * (w[zero_idx] - 1) * (1 / coeff -
-                    w[zero_idx] * mu[zero_idx] * np.exp(mu[zero_idx]) /
-                    coeff**2)).sum() - (mu[nonzero_idx] * self.exog[nonzero_idx, i] *
-                    self.exog[nonzero_idx, j]).sum())
-
-        return hess_arr
-
     def _predict_prob(self, params, exog, exog_infl, exposure, offset):
         params_infl = params[:self.k_inflate]
         params_main = params[self.k_inflate:]
@@ -33,7 +33,8 @@ from scipy.stats import nbinom
 import statsmodels.tools.tools as tools
 from statsmodels.tools import data as data_tools
 from statsmodels.tools.decorators import resettable_cache, cache_readonly
-from statsmodels.tools.sm_exceptions import PerfectSeparationError
+from statsmodels.tools.sm_exceptions import (PerfectSeparationError,
+                                             HessianInversionWarning)
 from statsmodels.tools.numdiff import approx_fprime_cs
 import statsmodels.base.model as base
 from statsmodels.base.data import handle_data  # for mnlogit
@@ -156,6 +157,23 @@ def _pandas_to_dummies(endog):
     return endog_dummies, ynames, yname
 
 
+def _hessian_from_factors(exog, hess_main, hess_mix, hess_alpha):
+    """
+    Hessian of a count model with one extra parameter from its factors
+
+    `hess_main`, `hess_mix` and `hess_alpha` are the second derivatives of
+    the loglikelihood of each observation with respect to the linear
+    predictor, the linear predictor and the extra parameter, and the extra
+    parameter, as returned by the `hessian_factor` methods.
+    """
+    dim = exog.shape[1]
+    hess_arr = np.empty((dim + 1, dim + 1))
+    hess_arr[:-1, :-1] = tools._cross_product(exog, hess_main)
+    hess_arr[-1, :-1] = hess_arr[:-1, -1] = exog.T.dot(hess_mix)
+    hess_arr[-1, -1] = hess_alpha.sum()
+    return hess_arr
+
+
 #### Private Model Classes ####
 
 
@@ -178,9 +196,12 @@ class DiscreteModel(base.LikelihoodModel):
         and should contain any preprocessing that needs to be done for a model.
         """
         # assumes constant
-        self.df_model = float(np_matrix_rank(self.exog) - 1)
-        self.df_resid = (float(self.exog.shape[0] -
-                         np_matrix_rank(self.exog)))
+        if data_tools._is_sparse(self.exog):
+            rank = np_matrix_rank(tools._cross_product(self.exog))
+        else:
+            rank = np_matrix_rank(self.exog)
+        self.df_model = float(rank - 1)
+        self.df_resid = float(self.exog.shape[0] - rank)
 
     def cdf(self, X):
         """
@@ -196,7 +217,7 @@ class DiscreteModel(base.LikelihoodModel):
 
     def _check_perfect_pred(self, params, *args):
         endog = self.endog
-        fittedvalues = self.cdf(np.dot(self.exog, params[:self.exog.shape[1]]))
+        fittedvalues = self.cdf(self.exog.dot(params[:self.exog.shape[1]]))
         if (self.raise_on_perfect_prediction and
                 np.allclose(fittedvalues - endog, 0)):
             msg = "Perfect separation detected, results not available"
@@ -443,10 +464,14 @@ class BinaryModel(DiscreteModel):
         """
         if exog is None:
             exog = self.exog
+        if data_tools._is_sparse(exog):
+            linpred = exog.dot(params)
+        else:
+            linpred = np.dot(exog, params)
         if not linear:
-            return self.cdf(np.dot(exog, params))
+            return self.cdf(linpred)
         else:
-            return np.dot(exog, params)
+            return linpred
 
     def fit_regularized(self, start_params=None, method='l1',
             maxiter='defined_by_method', full_output=1, disp=1, callback=None,
@@ -599,6 +624,16 @@ class MultinomialModel(BinaryModel):
             start_params = np.zeros((self.K * (self.J-1)))
         else:
             start_params = np.asarray(start_params)
+        defer_hessian = False
+        if method == 'lbfgs':
+            # evaluate loglike and score in one pass and do not compute the
+            # Hessian before the covariance of the parameters is requested
+            if (hasattr(self, '_loglike_and_score_mean') and
+                    not kwargs.get('approx_grad', False)):
+                kwargs.setdefault('loglike_and_score',
+                                  self._loglike_and_score_mean)
+            defer_hessian = not kwargs.get('skip_hessian', False)
+            kwargs['skip_hessian'] = True
         callback = lambda x : None # placeholder until check_perfect_pred
         # skip calling super to handle results from LikelihoodModel
         mnfit = base.LikelihoodModel.fit(self, start_params = start_params,
@@ -606,8 +641,16 @@ class MultinomialModel(BinaryModel):
                 disp=disp, callback=callback, **kwargs)
         mnfit.params = mnfit.params.reshape(self.K, -1, order='F')
         mnfit = MultinomialResults(self, mnfit)
+        mnfit._defer_hessian = defer_hessian
         return MultinomialResultsWrapper(mnfit)
-    fit.__doc__ = DiscreteModel.fit.__doc__
+    fit.__doc__ = DiscreteModel.fit.__doc__ + """
+        Notes
+        -----
+        With method 'lbfgs' the loglikelihood and score are evaluated
+        together by `loglike_and_score`, and the Hessian, which has
+        ((J-1) * K)**2 elements, is only computed when the covariance of the
+        parameters is first requested, e.g. by `cov_params` or `bse`.
+        """
 
     def fit_regularized(self, start_params=None, method='l1',
             maxiter='defined_by_method', full_output=1, disp=1, callback=None,
@@ -740,8 +783,9 @@ class CountModel(DiscreteModel):
         # promote dtype to float64 if needed
         dt = np.promote_types(self.endog.dtype, np.float64)
         self.endog = np.asarray(self.endog, dt)
-        dt = np.promote_types(self.exog.dtype, np.float64)
-        self.exog = np.asarray(self.exog, dt)
+        if not data_tools._is_sparse(self.exog):
+            dt = np.promote_types(self.exog.dtype, np.float64)
+            self.exog = np.asarray(self.exog, dt)
 
 
     def _check_inputs(self, offset, exposure, endog):
@@ -782,7 +826,10 @@ class CountModel(DiscreteModel):
         if offset is None:
             offset = getattr(self, 'offset', 0)
 
-        fitted = np.dot(exog, params[:exog.shape[1]])
+        if data_tools._is_sparse(exog):
+            fitted = exog.dot(params[:exog.shape[1]])
+        else:
+            fitted = np.dot(exog, params[:exog.shape[1]])
         linpred = fitted + exposure + offset
         if not linear:
             return np.exp(linpred) # not cdf
@@ -979,7 +1026,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = self.exog.dot(params) + offset + exposure
         endog = self.endog
         return np.sum(-np.exp(XB) +  endog*XB - gammaln(endog+1))
 
@@ -1007,7 +1054,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = self.exog.dot(params) + offset + exposure
         endog = self.endog
         #np.sum(stats.poisson.logpmf(endog, np.exp(XB)))
         return -np.exp(XB) +  endog*XB - gammaln(endog+1)
@@ -1157,8 +1204,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
-        return np.dot(self.endog - L, X)
+        L = np.exp(X.dot(params) + offset + exposure)
+        return X.T.dot(self.endog - L)
 
     def score_obs(self, params):
         """
@@ -1187,8 +1234,48 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
-        return (self.endog - L)[:,None] * X
+        L = np.exp(X.dot(params) + offset + exposure)
+        return tools._multiply_rows(X, self.endog - L)
+
+    def score_factor(self, params):
+        """
+        Poisson model score factor, the derivative of the loglikelihood of
+        each observation with respect to the linear predictor
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        score_factor : ndarray, 1-D
+            The score_obs are obtained by ``score_factor[:, None] * exog``
+        """
+        offset = getattr(self, "offset", 0)
+        exposure = getattr(self, "exposure", 0)
+        L = np.exp(self.exog.dot(params) + offset + exposure)
+        return self.endog - L
+
+    def hessian_factor(self, params):
+        """
+        Poisson model hessian factor, the second derivative of the
+        loglikelihood of each observation with respect to the linear
+        predictor
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        hessian_factor : ndarray, 1-D
+            The hessian is obtained by ``(exog.T * hessian_factor).dot(exog)``
+        """
+        offset = getattr(self, "offset", 0)
+        exposure = getattr(self, "exposure", 0)
+        return -np.exp(self.exog.dot(params) + offset + exposure)
 
     def hessian(self, params):
         """
@@ -1217,8 +1304,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + exposure + offset)
-        return -np.dot(L*X.T, X)
+        L = np.exp(X.dot(params) + exposure + offset)
+        return -tools._cross_product(X, L)
 
 
 class GeneralizedPoisson(CountModel):
@@ -1449,7 +1536,29 @@ class GeneralizedPoisson(CountModel):
 
     fit_regularized.__doc__ = DiscreteModel.fit_regularized.__doc__
 
-    def score_obs(self, params):
+    def score_factor(self, params):
+        """
+        Generalized Poisson model score factors
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        dparams : ndarray, 1-D
+            Derivative of the loglikelihood of each observation with respect
+            to the linear predictor.
+        dalpha : ndarray, 1-D
+            Derivative of the loglikelihood of each observation with respect
+            to alpha.
+
+        Notes
+        -----
+        The score_obs are obtained by ``dparams[:, None] * exog`` for the
+        mean parameters and ``dalpha`` for alpha.
+        """
         if self._transparams:
             alpha = np.exp(params[-1])
         else:
@@ -1457,30 +1566,41 @@ class GeneralizedPoisson(CountModel):
 
         params = params[:-1]
         p = self.parameterization
-        exog = self.exog
-        y = self.endog[:,None]
-        mu = self.predict(params)[:,None]
+        y = self.endog
+        mu = self.predict(params)
         mu_p = np.power(mu, p)
         a1 = 1 + alpha * mu_p
         a2 = mu + alpha * mu_p * y
         a3 = alpha * p * mu ** (p - 1)
         a4 = a3 * y
-        dmudb = mu * exog
 
         dalpha = (mu_p * (y * ((y - 1) / a2 - 2 / a1) + a2 / a1**2))
-        dparams = dmudb * (-a4 / a1 + a3 * a2 / (a1 ** 2) + (1 + a4) *
-                  ((y - 1) / a2 - 1 / a1) + 1 / mu)
+        dparams = mu * (-a4 / a1 + a3 * a2 / (a1 ** 2) + (1 + a4) *
+                        ((y - 1) / a2 - 1 / a1) + 1 / mu)
+
+        return dparams, dalpha
 
-        return np.concatenate((dparams, np.atleast_2d(dalpha)),
-                              axis=1)
+    def score_obs(self, params):
+        """
+        Generalized Poisson model score (gradient) vector of the
+        log-likelihood for each observation
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        score : ndarray, (nobs, k_vars)
+            The score vector of the model evaluated at `params`
+        """
+        dparams, dalpha = self.score_factor(params)
+        return np.column_stack((dparams[:, None] * self.exog, dalpha))
 
     def score(self, params):
-        score = np.sum(self.score_obs(params), axis=0)
-        if self._transparams:
-            score[-1] == score[-1] ** 2
-            return score
-        else:
-            return score
+        dparams, dalpha = self.score_factor(params)
+        return np.r_[self.exog.T.dot(dparams), dalpha.sum()]
 
     def _score_p(self, params):
         """
@@ -1514,9 +1634,9 @@ class GeneralizedPoisson(CountModel):
               a2 / a1 ** 2)))
         return dp
 
-    def hessian(self, params):
+    def hessian_factor(self, params):
         """
-        Generalized Poisson model Hessian matrix of the loglikelihood
+        Generalized Poisson model hessian factors
 
         Parameters
         ----------
@@ -1525,9 +1645,21 @@ class GeneralizedPoisson(CountModel):
 
         Returns
         -------
-        hess : ndarray, (k_vars, k_vars)
-            The Hessian, second derivative of loglikelihood function,
-            evaluated at `params`
+        hess_main : ndarray, 1-D
+            Second derivative of the loglikelihood of each observation with
+            respect to the linear predictor.
+        hess_mix : ndarray, 1-D
+            Cross derivative of the loglikelihood of each observation with
+            respect to the linear predictor and alpha.
+        hess_alpha : ndarray, 1-D
+            Second derivative of the loglikelihood of each observation with
+            respect to alpha.
+
+        Notes
+        -----
+        The hessian is obtained by ``(exog.T * hess_main).dot(exog)`` for the
+        mean parameters, ``exog.T.dot(hess_mix)`` for the cross derivatives
+        and ``hess_alpha.sum()`` for alpha.
         """
         if self._transparams:
             alpha = np.exp(params[-1])
@@ -1536,51 +1668,53 @@ class GeneralizedPoisson(CountModel):
 
         params = params[:-1]
         p = self.parameterization
-        exog = self.exog
-        y = self.endog[:,None]
-        mu = self.predict(params)[:,None]
+        y = self.endog
+        mu = self.predict(params)
         mu_p = np.power(mu, p)
         a1 = 1 + alpha * mu_p
         a2 = mu + alpha * mu_p * y
         a3 = alpha * p * mu ** (p - 1)
         a4 = a3 * y
         a5 = p * mu ** (p - 1)
-        dmudb = mu * exog
 
-        # for dl/dparams dparams
-        dim = exog.shape[1]
-        hess_arr = np.empty((dim+1,dim+1))
+        hess_main = mu * (mu * (a3 * a4 / a1**2 - 2 * a3**2 * a2 / a1**3 +
+                                2 * a3 * (a4 + 1) / a1**2 - a4 * p / (mu * a1) +
+                                a3 * p * a2 / (mu * a1**2) + a4 / (mu * a1) -
+                                a3 * a2 / (mu * a1**2) +
+                                (y - 1) * a4 * (p - 1) / (a2 * mu) -
+                                (y - 1) * (1 + a4)**2 / a2**2 -
+                                a4 * (p - 1) / (a1 * mu) - 1 / mu**2) +
+                          (-a4 / a1 + a3 * a2 / a1**2 + (y - 1) *
+                           (1 + a4) / a2 - (1 + a4) / a1 + 1 / mu))
 
-        for i in range(dim):
-            for j in range(i + 1):
-                hess_arr[i,j] = np.sum(mu * exog[:,i,None] * exog[:,j,None] *
-                    (mu * (a3 * a4 / a1**2 - 2 * a3**2 * a2 / a1**3 + 2 * a3 *
-                    (a4 + 1) / a1**2 - a4 * p / (mu * a1) + a3 * p * a2 /
-                    (mu * a1**2) + a4 / (mu * a1) - a3 * a2 / (mu * a1**2) +
-                    (y - 1) * a4 * (p - 1) / (a2 * mu) - (y - 1) *
-                    (1 + a4)**2 / a2**2 - a4 * (p - 1) / (a1 * mu) - 1 /
-                    mu**2) + (-a4 / a1 + a3 * a2 / a1**2 + (y - 1) *
-                    (1 + a4) / a2 - (1 + a4) / a1 + 1 / mu)), axis=0)
-        tri_idx = np.triu_indices(dim, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        hess_mix = mu * (2 * a4 * mu_p / a1**2 - 2 * a3 * mu_p * a2 / a1**3 -
+                         mu_p * y * (y - 1) * (1 + a4) / a2**2 + mu_p *
+                         (1 + a4) / a1**2 + a5 * y * (y - 1) / a2 - 2 *
+                         a5 * y / a1 + a5 * a2 / a1**2)
 
-        # for dl/dparams dalpha
-        dldpda = np.sum((2 * a4 * mu_p / a1**2 - 2 * a3 * mu_p * a2 / a1**3 -
-                        mu_p * y * (y - 1) * (1 + a4) / a2**2 + mu_p *
-                        (1 + a4) / a1**2 + a5 * y * (y - 1) / a2 - 2 *
-                        a5 * y / a1 + a5 * a2 / a1**2) * dmudb,
-                        axis=0)
+        hess_alpha = mu_p**2 * (3 * y / a1**2 - (y / a2)**2. * (y - 1) -
+                                2 * a2 / a1**3)
 
-        hess_arr[-1,:-1] = dldpda
-        hess_arr[:-1,-1] = dldpda
+        return hess_main, hess_mix, hess_alpha
 
-        # for dl/dalpha dalpha
-        dldada = mu_p**2 * (3 * y / a1**2 - (y / a2)**2. * (y - 1) - 2 * a2 /
-                            a1**3)
+    def hessian(self, params):
+        """
+        Generalized Poisson model Hessian matrix of the loglikelihood
 
-        hess_arr[-1,-1] = dldada.sum()
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
 
-        return hess_arr
+        Returns
+        -------
+        hess : ndarray, (k_vars, k_vars)
+            The Hessian, second derivative of loglikelihood function,
+            evaluated at `params`
+        """
+        hess_main, hess_mix, hess_alpha = self.hessian_factor(params)
+        return _hessian_from_factors(self.exog, hess_main, hess_mix,
+                                     hess_alpha)
 
     def predict(self, params, exog=None, exposure=None, offset=None,
                 which='mean'):
@@ -1706,7 +1840,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.sum(np.log(self.cdf(q*np.dot(X,params))))
+        return np.sum(np.log(self.cdf(q*X.dot(params))))
 
     def loglikeobs(self, params):
         """
@@ -1734,7 +1868,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.log(self.cdf(q*np.dot(X,params)))
+        return np.log(self.cdf(q*X.dot(params)))
 
     def score(self, params):
         """
@@ -1758,8 +1892,8 @@ class Logit(BinaryModel):
 
         y = self.endog
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return np.dot(y - L,X)
+        L = self.cdf(X.dot(params))
+        return X.T.dot(y - L)
 
     def score_obs(self, params):
         """
@@ -1786,8 +1920,8 @@ class Logit(BinaryModel):
 
         y = self.endog
         X = self.exog
-        L = self.cdf(np.dot(X, params))
-        return (y - L)[:,None] * X
+        L = self.cdf(X.dot(params))
+        return tools._multiply_rows(X, y - L)
 
     def hessian(self, params):
         """
@@ -1809,8 +1943,8 @@ class Logit(BinaryModel):
         .. math:: \\frac{\\partial^{2}\\ln L}{\\partial\\beta\\partial\\beta^{\\prime}}=-\\sum_{i}\\Lambda_{i}\\left(1-\\Lambda_{i}\\right)x_{i}x_{i}^{\\prime}
         """
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return -np.dot(L*(1-L)*X.T,X)
+        L = self.cdf(X.dot(params))
+        return -tools._cross_product(X, L*(1-L))
 
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
@@ -2109,8 +2243,35 @@ class MNLogit(MultinomialModel):
         In the multinomial logit model.
         .. math:: \\frac{\\exp\\left(\\beta_{j}^{\\prime}x_{i}\\right)}{\\sum_{k=0}^{J}\\exp\\left(\\beta_{k}^{\\prime}x_{i}\\right)}
         """
-        eXB = np.column_stack((np.ones(len(X)), np.exp(X)))
-        return eXB/eXB.sum(1)[:,None]
+        X = np.asarray(X)
+        eXB = np.empty((X.shape[0], X.shape[1] + 1),
+                       dtype=np.result_type(X, np.float64))
+        eXB[:, 0] = 0
+        eXB[:, 1:] = X
+        # shift by the row maximum so that exp does not overflow
+        eXB -= eXB.real.max(1)[:, None]
+        np.exp(eXB, out=eXB)
+        eXB /= eXB.sum(1)[:, None]
+        return eXB
+
+    def _logsumexp(self, linpred):
+        """
+        Log of the normalizing constant of the choice probabilities
+
+        Parameters
+        ----------
+        linpred : ndarray
+            The linear predictor of the J-1 non-base choices, (nobs, J-1).
+
+        Returns
+        -------
+        lse : ndarray
+            ``log(1 + exp(linpred).sum(1))`` evaluated without overflow.
+        """
+        shift = np.maximum(linpred.real.max(1), 0)
+        sum_exp = np.exp(linpred - shift[:, None]).sum(1)
+        sum_exp += np.exp(-shift)
+        return shift + np.log(sum_exp)
 
     def loglike(self, params):
         """
@@ -2134,10 +2295,7 @@ class MNLogit(MultinomialModel):
         where :math:`d_{ij}=1` if individual `i` chose alternative `j` and 0
         if not.
         """
-        params = params.reshape(self.K, -1, order='F')
-        d = self.wendog
-        logprob = np.log(self.cdf(np.dot(self.exog,params)))
-        return np.sum(d * logprob)
+        return np.sum(self.loglikeobs(params))
 
     def loglikeobs(self, params):
         """
@@ -2164,9 +2322,12 @@ class MNLogit(MultinomialModel):
         if not.
         """
         params = params.reshape(self.K, -1, order='F')
-        d = self.wendog
-        logprob = np.log(self.cdf(np.dot(self.exog,params)))
-        return d * logprob
+        linpred = np.dot(self.exog, params)
+        logprob = np.zeros((linpred.shape[0], self.J), dtype=linpred.dtype)
+        logprob[:, 1:] = linpred
+        logprob -= self._logsumexp(linpred)[:, None]
+        logprob *= self.wendog
+        return logprob
 
     def score(self, params):
         """
@@ -2194,10 +2355,21 @@ class MNLogit(MultinomialModel):
         as a flattened array to work with the solvers.
         """
         params = params.reshape(self.K, -1, order='F')
-        firstterm = self.wendog[:,1:] - self.cdf(np.dot(self.exog,
-                                                  params))[:,1:]
-        #NOTE: might need to switch terms if params is reshaped
-        return np.dot(firstterm.T, self.exog).flatten()
+        resid = self._resid_prob(np.dot(self.exog, params))
+        return np.dot(resid.T, self.exog).ravel()
+
+    def _resid_prob(self, linpred, lse=None):
+        """
+        Choice dummies minus probabilities of the non-base choices
+
+        `linpred` is overwritten with the result.
+        """
+        if lse is None:
+            lse = self._logsumexp(linpred)
+        linpred -= lse[:, None]
+        np.exp(linpred, out=linpred)
+        np.subtract(self.wendog[:, 1:], linpred, out=linpred)
+        return linpred
 
     def loglike_and_score(self, params):
         """
@@ -2208,12 +2380,21 @@ class MNLogit(MultinomialModel):
 
         """
         params = params.reshape(self.K, -1, order='F')
-        cdf_dot_exog_params = self.cdf(np.dot(self.exog, params))
-        loglike_value = np.sum(self.wendog * np.log(cdf_dot_exog_params))
-        firstterm = self.wendog[:, 1:] - cdf_dot_exog_params[:, 1:]
-        score_array = np.dot(firstterm.T, self.exog).flatten()
+        d = self.wendog
+        linpred = np.dot(self.exog, params)
+        lse = self._logsumexp(linpred)
+        loglike_value = (np.einsum('ij,ij->', d[:, 1:], linpred) -
+                         np.dot(d.sum(1), lse))
+        resid = self._resid_prob(linpred, lse)
+        score_array = np.dot(resid.T, self.exog).ravel()
         return loglike_value, score_array
 
+    def _loglike_and_score_mean(self, params):
+        # loglike_and_score scaled by nobs as the objective in `fit`
+        nobs = self.endog.shape[0]
+        loglike_value, score_array = self.loglike_and_score(params)
+        return loglike_value / nobs, score_array / nobs
+
     def score_obs(self, params):
         """
         Jacobian matrix for multinomial logit model log-likelihood
@@ -2240,10 +2421,9 @@ class MNLogit(MultinomialModel):
         the flatteded array of derivatives in columns.
         """
         params = params.reshape(self.K, -1, order='F')
-        firstterm = self.wendog[:,1:] - self.cdf(np.dot(self.exog,
-                                                  params))[:,1:]
-        #NOTE: might need to switch terms if params is reshaped
-        return (firstterm[:,:,None] * self.exog[:,None,:]).reshape(self.exog.shape[0], -1)
+        resid = self._resid_prob(np.dot(self.exog, params))
+        return (resid[:, :, None] * self.exog[:, None, :]).reshape(
+            self.exog.shape[0], -1)
 
     def hessian(self, params):
         """
@@ -2271,25 +2451,26 @@ class MNLogit(MultinomialModel):
         The actual Hessian matrix has J**2 * K x K elements. Our Hessian
         is reshaped to be square (J*K, J*K) so that the solvers can use it.
 
-        This implementation does not take advantage of the symmetry of
-        the Hessian and could probably be refactored for speed.
+        The Hessian is computed with two matrix products of the exog
+        weighted by the probabilities of the choices, which requires
+        nobs * (J-1) * K memory.
         """
         params = params.reshape(self.K, -1, order='F')
         X = self.exog
-        pr = self.cdf(np.dot(X,params))
-        partials = []
-        J = self.J
-        K = self.K
-        for i in range(J-1):
-            for j in range(J-1): # this loop assumes we drop the first col.
-                if i == j:
-                    partials.append(\
-                        -np.dot(((pr[:,i+1]*(1-pr[:,j+1]))[:,None]*X).T,X))
-                else:
-                    partials.append(-np.dot(((pr[:,i+1]*-pr[:,j+1])[:,None]*X).T,X))
-        H = np.array(partials)
-        # the developer's notes on multinomial should clear this math up
-        H = np.transpose(H.reshape(J-1, J-1, K, K), (0, 2, 1, 3)).reshape((J-1)*K, (J-1)*K)
+        nobs = X.shape[0]
+        J1 = int(self.J) - 1
+        K = int(self.K)
+        linpred = np.dot(X, params)
+        linpred -= self._logsumexp(linpred)[:, None]
+        pr = np.exp(linpred, out=linpred)
+
+        # exog times the probability of each choice, (nobs, (J-1) * K)
+        prX = (pr[:, :, None] * X[:, None, :]).reshape(nobs, J1 * K)
+        H = np.dot(prX.T, prX)
+        # subtract the blocks x' diag(pr[:, j]) x from the diagonal
+        diag_blocks = np.dot(X.T, prX).reshape(K, J1, K).transpose(1, 0, 2)
+        idx = np.arange(J1)
+        H.reshape(J1, K, J1, K)[idx, :, idx, :] -= diag_blocks
         return H
 
 
@@ -2916,9 +3097,9 @@ class NegativeBinomialP(CountModel):
 
         return llf
 
-    def score_obs(self, params):
+    def score_factor(self, params):
         """
-        Generalized Negative Binomial (NB-P) model score (gradient) vector of the log-likelihood for each observations.
+        Generalized Negative Binomial (NB-P) model score factors
 
         Parameters
         ----------
@@ -2927,9 +3108,17 @@ class NegativeBinomialP(CountModel):
 
         Returns
         -------
-        score : ndarray, 1-D
-            The score vector of the model, i.e. the first derivative of the
-            loglikelihood function, evaluated at `params`
+        dparams : ndarray, 1-D
+            Derivative of the loglikelihood of each observation with respect
+            to the linear predictor.
+        dalpha : ndarray, 1-D
+            Derivative of the loglikelihood of each observation with respect
+            to alpha.
+
+        Notes
+        -----
+        The score_obs are obtained by ``dparams[:, None] * exog`` for the
+        mean parameters and ``dalpha`` for alpha.
         """
         if self._transparams:
             alpha = np.exp(params[-1])
@@ -2947,17 +3136,33 @@ class NegativeBinomialP(CountModel):
         a3 = y + a1
         a4 = p * a1 / mu
 
-        dparams = ((a4 * (digamma(a3) - digamma(a1)) -
-                   (1 + a4) * a3 / a2) +
-                   y / mu + a4 * (1 + np.log(a1) - np.log(a2)))
-        dparams = (self.exog.T * mu * dparams).T
-        dalpha = (-a1 / alpha * (digamma(a3) -
-                                 digamma(a1) +
-                                 np.log(a1 / a2) +
-                                 1 - a3 / a2))
+        dgpart = digamma(a3) - digamma(a1)
+        log_a1a2 = np.log(a1) - np.log(a2)
+
+        dparams = ((a4 * dgpart - (1 + a4) * a3 / a2) +
+                   y / mu + a4 * (1 + log_a1a2))
+        dparams *= mu
+        dalpha = -a1 / alpha * (dgpart + log_a1a2 + 1 - a3 / a2)
+
+        return dparams, dalpha
+
+    def score_obs(self, params):
+        """
+        Generalized Negative Binomial (NB-P) model score (gradient) vector of the log-likelihood for each observations.
 
-        return np.concatenate((dparams, np.atleast_2d(dalpha).T),
-                              axis=1)
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        score : ndarray, 1-D
+            The score vector of the model, i.e. the first derivative of the
+            loglikelihood function, evaluated at `params`
+        """
+        dparams, dalpha = self.score_factor(params)
+        return np.column_stack((dparams[:, None] * self.exog, dalpha))
 
     def score(self, params):
         """
@@ -2974,16 +3179,12 @@ class NegativeBinomialP(CountModel):
             The score vector of the model, i.e. the first derivative of the
             loglikelihood function, evaluated at `params`
         """
-        score = np.sum(self.score_obs(params), axis=0)
-        if self._transparams:
-            score[-1] == score[-1] ** 2
-            return score
-        else:
-            return score
+        dparams, dalpha = self.score_factor(params)
+        return np.r_[self.exog.T.dot(dparams), dalpha.sum()]
 
-    def hessian(self, params):
+    def hessian_factor(self, params):
         """
-        Generalized Negative Binomial (NB-P) model hessian maxtrix of the log-likelihood
+        Generalized Negative Binomial (NB-P) model hessian factors
 
         Parameters
         ----------
@@ -2992,8 +3193,21 @@ class NegativeBinomialP(CountModel):
 
         Returns
         -------
-        hessian : ndarray, 2-D
-            The hessian matrix of the model.
+        hess_main : ndarray, 1-D
+            Second derivative of the loglikelihood of each observation with
+            respect to the linear predictor.
+        hess_mix : ndarray, 1-D
+            Cross derivative of the loglikelihood of each observation with
+            respect to the linear predictor and alpha.
+        hess_alpha : ndarray, 1-D
+            Second derivative of the loglikelihood of each observation with
+            respect to alpha.
+
+        Notes
+        -----
+        The hessian is obtained by ``(exog.T * hess_main).dot(exog)`` for the
+        mean parameters, ``exog.T.dot(hess_mix)`` for the cross derivatives
+        and ``hess_alpha.sum()`` for alpha.
         """
         if self._transparams:
             alpha = np.exp(params[-1])
@@ -3003,7 +3217,6 @@ class NegativeBinomialP(CountModel):
 
         p = 2 - self.parameterization
         y = self.endog
-        exog = self.exog
         mu = self.predict(params)
 
         mu_p = mu**p
@@ -3013,43 +3226,47 @@ class NegativeBinomialP(CountModel):
         a4 = p * a1 / mu
         a5 = a4 * p / mu
 
-        dim = exog.shape[1]
-        hess_arr = np.zeros((dim + 1, dim + 1))
-
-        coeff = mu**2 * (((1 + a4)**2 * a3 / a2**2 -
-                          a3 * (a5 - a4 / mu) / a2 - y / mu**2 -
-                          2 * a4 * (1 + a4) / a2 +
-                          a5 * (np.log(a1) - np.log(a2) - digamma(a1) +
-                                digamma(a3) + 2) -
-                          a4 * (np.log(a1) - np.log(a2) - digamma(a1) +
-                                digamma(a3) + 1) / mu -
-                          a4**2 * (polygamma(1, a1) - polygamma(1, a3))) +
-                         (-(1 + a4) * a3 / a2 + y / mu +
-                          a4 * (np.log(a1) - np.log(a2) - digamma(a1) +
-                                digamma(a3) + 1)) / mu)
+        dgpart = digamma(a3) - digamma(a1)
+        tgpart = polygamma(1, a1) - polygamma(1, a3)
+        log_a1a2 = np.log(a1) - np.log(a2)
 
-        for i in range(dim):
-            hess_arr[i, :-1] = np.sum(self.exog[:,:].T * self.exog[:, i] * coeff, axis=1)
+        hess_main = mu**2 * (((1 + a4)**2 * a3 / a2**2 -
+                              a3 * (a5 - a4 / mu) / a2 - y / mu**2 -
+                              2 * a4 * (1 + a4) / a2 +
+                              a5 * (log_a1a2 + dgpart + 2) -
+                              a4 * (log_a1a2 + dgpart + 1) / mu -
+                              a4**2 * tgpart) +
+                             (-(1 + a4) * a3 / a2 + y / mu +
+                              a4 * (log_a1a2 + dgpart + 1)) / mu)
 
+        hess_mix = (mu * a1 * ((1 + a4) * (1 - a3 / a2) / a2 -
+                               p * (log_a1a2 + dgpart + 2) / mu +
+                               p * (a3 + a1) / (mu * a2) +
+                               a4 * tgpart) / alpha)
 
-        hess_arr[-1,:-1] = (self.exog[:,:].T * mu * a1 *
-                ((1 + a4) * (1 - a3 / a2) / a2 -
-                 p * (np.log(a1 / a2) - digamma(a1) + digamma(a3) + 2) / mu +
-                 p * (a3 / mu + a4) / a2 +
-                 a4 * (polygamma(1, a1) - polygamma(1, a3))) / alpha).sum(axis=1)
+        hess_alpha = (a1 * (2 * log_a1a2 + 2 * dgpart + 3 -
+                            2 * a3 / a2 - a1 * tgpart - 2 * a1 / a2 +
+                            a1 * a3 / a2**2) / alpha**2)
 
-        da2 = (a1 * (2 * np.log(a1) - 2 * np.log(a2) -
-                     2 * digamma(a1) + 2 *digamma(a3) + 3 -
-                     2 * a3 / a2 - a1 * polygamma(1, a1) +
-                     a1 * polygamma(1, a3) - 2 * a1 / a2 +
-                     a1 * a3 / a2**2) / alpha**2)
+        return hess_main, hess_mix, hess_alpha
 
-        hess_arr[-1, -1] = da2.sum()
+    def hessian(self, params):
+        """
+        Generalized Negative Binomial (NB-P) model hessian maxtrix of the log-likelihood
 
-        tri_idx = np.triu_indices(dim + 1, k=1)
-        hess_arr[tri_idx] = hess_arr.T[tri_idx]
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
 
-        return hess_arr
+        Returns
+        -------
+        hessian : ndarray, 2-D
+            The hessian matrix of the model.
+        """
+        hess_main, hess_mix, hess_alpha = self.hessian_factor(params)
+        return _hessian_from_factors(self.exog, hess_main, hess_mix,
+                                     hess_alpha)
 
     def _get_start_params_null(self):
         offset = getattr(self, "offset", 0)
@@ -3389,7 +3606,7 @@ class DiscreteResults(base.LikelihoodModelResults):
 
     @cache_readonly
     def fittedvalues(self):
-        return np.dot(self.model.exog, self.params[:self.model.exog.shape[1]])
+        return self.model.exog.dot(self.params[:self.model.exog.shape[1]])
 
     @cache_readonly
     def aic(self):
@@ -3944,6 +4161,26 @@ class MultinomialResults(DiscreteResults):
         return np.histogram2d(self.model.endog, self.predict().argmax(1),
                               bins=bins)[0]
 
+    _defer_hessian = False
+
+    def cov_params(self, *args, **kwargs):
+        if self._defer_hessian and self.normalized_cov_params is None:
+            # fit with method 'lbfgs' does not compute the Hessian
+            self._defer_hessian = False
+            params = self.params.ravel(order='F')
+            H = -self.model.hessian(params)
+            if np.all(np.isfinite(H)):
+                eigvals, eigvecs = np.linalg.eigh(H)
+                if np.min(eigvals) > 0:
+                    Hinv = (eigvecs / eigvals).dot(eigvecs.T)
+                    self.normalized_cov_params = (Hinv + Hinv.T) / 2.
+            if self.normalized_cov_params is None:
+                warnings.warn('Inverting hessian failed, no bse or '
+                              'cov_params available', HessianInversionWarning)
+        return super(MultinomialResults, self).cov_params(*args, **kwargs)
+
+    cov_params.__doc__ = base.LikelihoodModelResults.cov_params.__doc__
+
     @cache_readonly
     def bse(self):
         bse = np.sqrt(np.diag(self.cov_params()))
@@ -5,8 +5,10 @@ import numpy as np
 from numpy.testing import (assert_, assert_raises, assert_almost_equal,
                            assert_equal, assert_array_equal, assert_allclose,
                            assert_array_less)
+import pytest
 
 import statsmodels.api as sm
+from statsmodels.tools.numdiff import approx_fprime, approx_hess
 from .results.results_discrete import RandHIE
 
 class CheckGeneric(object):
@@ -552,3 +554,40 @@ class TestZeroInflatedNegativeBinomialP_predict2(object):
             mean2 = ((1 - self.res.predict(which='prob-zero').mean()) *
                      self.res.predict(which='mean-nonzero').mean())
             assert_allclose(mean1, mean2, atol=0.2)
+
+
+def _gen_zi_data(nobs=300, seed=987125):
+    np.random.seed(seed)
+    exog = np.column_stack((np.ones(nobs), 0.5 * np.random.randn(nobs, 2)))
+    exog_infl = np.column_stack((np.ones(nobs), np.random.randn(nobs)))
+    mu = np.exp(exog.dot([0.5, 0.3, -0.2]))
+    endog = np.random.negative_binomial(2, 2 / (2 + mu))
+    endog[np.random.rand(nobs) < 0.2] = 0
+    return endog, exog, exog_infl
+
+
+@pytest.mark.parametrize('inflation', ['logit', 'probit'])
+@pytest.mark.parametrize('klass, extra, kwds', [
+    (sm.ZeroInflatedPoisson, [], {}),
+    (sm.ZeroInflatedGeneralizedPoisson, [0.2], {}),
+    (sm.ZeroInflatedNegativeBinomialP, [0.5], {}),
+    (sm.ZeroInflatedNegativeBinomialP, [0.5], {'p': 1.5}),
+    (sm.ZeroInflatedNegativeBinomialP, [0.5], {'p': 3})])
+def test_analytic_derivatives(klass, extra, kwds, inflation):
+    endog, exog, exog_infl = _gen_zi_data()
+    mod = klass(endog, exog, exog_infl=exog_infl, inflation=inflation,
+                **kwds)
+    params = np.array([-1, 0.3, 0.5, 0.3, -0.2] + extra)
+
+    score_obs = mod.score_obs(params)
+    assert_allclose(score_obs,
+                    approx_fprime(params, mod.loglikeobs, centered=True),
+                    rtol=1e-6, atol=1e-7)
+    assert_allclose(mod.score(params), score_obs.sum(0), rtol=1e-12)
+
+    hess = mod.hessian(params)
+    assert_allclose(hess, hess.T, rtol=1e-12)
+    assert_allclose(hess, approx_hess(params, mod.loglike), rtol=1e-3,
+                    atol=1e-4)
+    assert_allclose(hess, approx_fprime(params, mod.score, centered=True),
+                    rtol=1e-6, atol=1e-6)
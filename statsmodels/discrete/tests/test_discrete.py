@@ -1440,6 +1440,51 @@ class TestMNLogitLBFGSBaseZero(CheckMNLogitBaseZero):
         cls.res2 = res2
 
 
+def test_mnlogit_derivatives():
+    from statsmodels.tools.numdiff import approx_fprime, approx_fprime_cs
+    data = sm.datasets.anes96.load()
+    exog = sm.add_constant(data.exog, prepend=False)
+    mod = MNLogit(data.endog, exog)
+    np.random.seed(987125)
+    params = 0.01 * np.random.randn(exog.shape[1] * (mod.J - 1))
+
+    score = mod.score(params)
+    assert_allclose(score, approx_fprime_cs(params, mod.loglike),
+                    rtol=1e-10, atol=1e-8)
+    assert_allclose(mod.score_obs(params).sum(0), score, rtol=1e-10)
+    llf, score2 = mod.loglike_and_score(params)
+    assert_allclose(llf, mod.loglike(params), rtol=1e-13)
+    assert_allclose(llf, mod.loglikeobs(params).sum(), rtol=1e-13)
+    assert_allclose(score2, score, rtol=1e-13)
+
+    hess = mod.hessian(params)
+    assert_allclose(hess, hess.T, rtol=1e-12)
+    assert_allclose(hess, approx_fprime(params, mod.score, centered=True),
+                    rtol=1e-6, atol=1e-4)
+
+    # no overflow for extreme linear predictors
+    assert_allclose(mod.cdf(np.array([[1000., -1000, 0, 2, 0, 0]])),
+                    [[0, 1, 0, 0, 0, 0, 0]], atol=1e-300)
+
+
+def test_mnlogit_lbfgs_deferred_hessian():
+    data = sm.datasets.anes96.load()
+    exog = sm.add_constant(data.exog, prepend=False)
+    mod = MNLogit(data.endog, exog)
+    res1 = mod.fit(method="newton", disp=0)
+    res2 = mod.fit(method="lbfgs", disp=0, maxiter=5000, m=40,
+                   pgtol=1e-10, factr=5e0)
+    assert_(res2.normalized_cov_params is None)
+    assert_allclose(res2.params, res1.params, rtol=1e-4, atol=1e-5)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-4)
+    assert_allclose(res2.normalized_cov_params, res1.normalized_cov_params,
+                    rtol=1e-4, atol=1e-8)
+
+    res3 = mod.fit(method="lbfgs", disp=0, skip_hessian=True)
+    assert_(res3.normalized_cov_params is None)
+    assert_raises(ValueError, res3.cov_params)
+
+
 def test_perfect_prediction():
     cur_dir = os.path.dirname(os.path.abspath(__file__))
     iris_dir = os.path.join(cur_dir, '..', '..', 'genmod', 'tests', 'results')
@@ -2268,6 +2313,39 @@ class TestGeneralizedPoissonNull(CheckNull):
         cls.start_params = np.array([6.91127148, 0.04501334, 0.88393736])
 
 
+@pytest.mark.parametrize('klass, p, alpha', [
+    (NegativeBinomialP, 1, 0.5), (NegativeBinomialP, 2, 0.5),
+    (NegativeBinomialP, 1.5, 0.5), (NegativeBinomialP, 3, 0.5),
+    (GeneralizedPoisson, 1, 0.2), (GeneralizedPoisson, 2, 0.1)])
+def test_count_analytic_derivatives(klass, p, alpha):
+    from statsmodels.tools.numdiff import approx_fprime, approx_hess
+    np.random.seed(987125)
+    nobs = 300
+    exog = np.column_stack((np.ones(nobs), 0.5 * np.random.randn(nobs, 2)))
+    mu = np.exp(exog.dot([0.5, 0.3, -0.2]))
+    endog = np.random.negative_binomial(2, 2 / (2 + mu))
+    mod = klass(endog, exog, p=p)
+    params = np.array([0.5, 0.3, -0.2, alpha])
+
+    score_obs = mod.score_obs(params)
+    assert_allclose(score_obs,
+                    approx_fprime(params, mod.loglikeobs, centered=True),
+                    rtol=1e-6, atol=1e-7)
+    assert_allclose(mod.score(params), score_obs.sum(0), rtol=1e-12)
+    dparams, dalpha = mod.score_factor(params)
+    assert_allclose(score_obs[:, :-1], dparams[:, None] * exog, rtol=1e-12)
+    assert_allclose(score_obs[:, -1], dalpha, rtol=1e-12)
+
+    hess = mod.hessian(params)
+    assert_allclose(hess, hess.T, rtol=1e-12)
+    assert_allclose(hess, approx_hess(params, mod.loglike), rtol=1e-3)
+    assert_allclose(hess, approx_fprime(params, mod.score, centered=True),
+                    rtol=1e-6, atol=1e-6)
+    hess_main, hess_mix, hess_alpha = mod.hessian_factor(params)
+    assert_allclose(hess[:-1, :-1], (exog.T * hess_main).dot(exog),
+                    rtol=1e-12)
+
+
 def test_null_options():
     # this is a "nice" case because we only check that options are used
     # correctly
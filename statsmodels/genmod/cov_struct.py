@@ -172,6 +172,96 @@ class CovStruct(object):
         soln = [spl.cho_solve(vco, x) for x in rhs]
         return soln
 
+    def covariance_matrix_batch(self, expval, index):
+        """
+        Returns the working covariance or correlation matrices of
+        clusters of equal size.
+
+        Parameters
+        ----------
+        expval : ndarray
+            The expected values of endog, with one cluster in each row.
+        index : ndarray
+            The indices of the clusters.
+
+        Returns
+        -------
+        M : ndarray
+            The covariance or correlation matrices, stacked along the
+            first axis.
+        is_cor : bool
+            True if M contains correlation matrices, False if M
+            contains covariance matrices.
+        """
+        mats = [self.covariance_matrix(x, i) for x, i in zip(expval, index)]
+        return np.array([mat[0] for mat in mats]), mats[0][1]
+
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        """
+        Solves the matrix equations of `covariance_matrix_solve` for
+        clusters of equal size.
+
+        Parameters
+        ----------
+        expval : ndarray
+            The expected values of endog, with one cluster in each row.
+        index : ndarray
+            The indices of the clusters.
+        stdev : ndarray
+            The standard deviations of endog, with one cluster in each
+            row.
+        rhs : list/tuple of ndarray
+            A set of right-hand sides, stacked along the first axis like
+            `expval`, with an optional third axis.
+
+        Returns
+        -------
+        soln : list/tuple of ndarray
+            The solutions to the matrix equations, or None if the solver
+            fails.
+
+        Notes
+        -----
+        The default implementation stacks the covariance matrices,
+        factors them with a batched Cholesky decomposition and solves
+        with the factors.  If a matrix is not SPD, or if a subclass
+        implements `covariance_matrix_solve` but not this method, then
+        the clusters are solved one at a time with
+        `covariance_matrix_solve`.
+        """
+        if (_method_func(type(self).covariance_matrix_solve) is not
+                _method_func(CovStruct.covariance_matrix_solve)):
+            return self._solve_each(expval, index, stdev, rhs)
+
+        vmat, is_cor = self.covariance_matrix_batch(expval, index)
+        if is_cor:
+            vmat = vmat * stdev[:, :, None] * stdev[:, None, :]
+        try:
+            chol = np.linalg.cholesky(vmat)
+        except np.linalg.LinAlgError:
+            return self._solve_each(expval, index, stdev, rhs)
+        self.cov_adjust.extend([0] * len(index))
+
+        soln = []
+        for x in rhs:
+            if x.ndim == 2:
+                soln.append(_batch_cho_solve(chol, x[:, :, None])[:, :, 0])
+            else:
+                soln.append(_batch_cho_solve(chol, x))
+        return soln
+
+    def _solve_each(self, expval, index, stdev, rhs):
+        # covariance_matrix_solve for each cluster
+        soln = [np.empty(x.shape) for x in rhs]
+        for j, i in enumerate(index):
+            rslt = self.covariance_matrix_solve(expval[j], i, stdev[j],
+                                                [x[j] for x in rhs])
+            if rslt is None:
+                return None
+            for x, y in zip(soln, rslt):
+                x[j] = y
+        return soln
+
     def summary(self):
         """
         Returns a text summary of the current estimate of the
@@ -180,6 +270,30 @@ class CovStruct(object):
         raise NotImplementedError
 
 
+def _method_func(method):
+    # the function of a method, for Python 2 unbound methods
+    return getattr(method, '__func__', method)
+
+
+def _expand(stdev, x):
+    # stdev with the dimensions of the right hand side x
+    return stdev if x.ndim == stdev.ndim else stdev[..., None]
+
+
+def _batch_cho_solve(chol, x):
+    # Solves L L' y = x for a stack of lower triangular Cholesky factors
+    # L, by forward and back substitution over the (small) cluster
+    # dimension, vectorized over the clusters
+    y = np.array(x, dtype=np.float64)
+    for i in range(y.shape[1]):
+        y[:, i] -= np.matmul(chol[:, i:i + 1, :i], y[:, :i])[:, 0]
+        y[:, i] /= chol[:, i, i, None]
+    for i in range(y.shape[1] - 1, -1, -1):
+        y[:, i] -= np.matmul(chol[:, i + 1:, i][:, None], y[:, i + 1:])[:, 0]
+        y[:, i] /= chol[:, i, i, None]
+    return y
+
+
 class Independence(CovStruct):
     """
     An independence working dependence structure.
@@ -203,9 +317,15 @@ class Independence(CovStruct):
                 rslt.append(x / v[:, None])
         return rslt
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        v = stdev ** 2
+        return [x / _expand(v, x) for x in rhs]
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = \
+        CovStruct.covariance_matrix_solve_batch.__doc__
 
     def summary(self):
         return ("Observations within a cluster are modeled "
@@ -226,34 +346,33 @@ class Exchangeable(CovStruct):
 
     def update(self, params):
 
-        endog = self.model.endog_li
-
         nobs = self.model.nobs
 
         varfunc = self.model.family.variance
 
-        cached_means = self.model.cached_means
-
         has_weights = self.model.weights is not None
         weights_li = self.model.weights
 
         residsq_sum, scale = 0, 0
         fsum1, fsum2, n_pairs = 0., 0., 0.
-        for i in range(self.model.num_group):
-            expval, _ = cached_means[i]
-            stdev = np.sqrt(varfunc(expval))
-            resid = (endog[i] - expval) / stdev
-            f = weights_li[i] if has_weights else 1.
+        for block in self.model._cluster_blocks():
+            expval = block['expval']
+            ngrp = expval.shape[1]
+            stdev = np.sqrt(varfunc(expval.ravel())).reshape(expval.shape)
+            resid = (block['endog'] - expval) / stdev
+            if has_weights:
+                f = weights_li[block['index']]
+            else:
+                f = np.ones(len(resid))
 
-            ssr = np.sum(resid * resid)
-            scale += f * ssr
-            fsum1 += f * len(endog[i])
+            ssr = np.sum(resid * resid, 1)
+            scale += np.dot(f, ssr)
+            fsum1 += f.sum() * ngrp
 
-            residsq_sum += f * (resid.sum() ** 2 - ssr) / 2
-            ngrp = len(resid)
+            residsq_sum += np.dot(f, resid.sum(1) ** 2 - ssr) / 2
             npr = 0.5 * ngrp * (ngrp - 1)
-            fsum2 += f * npr
-            n_pairs += npr
+            fsum2 += f.sum() * npr
+            n_pairs += npr * len(resid)
 
         ddof = self.model.ddof_scale
         scale /= (fsum1 * (nobs - ddof) / float(nobs))
@@ -289,9 +408,28 @@ class Exchangeable(CovStruct):
 
         return rslt
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+
+        k = expval.shape[1]
+        c = self.dep_params / (1. - self.dep_params)
+        c /= 1. + self.dep_params * (k - 1)
+
+        rslt = []
+        for x in rhs:
+            sd = _expand(stdev, x)
+            x1 = x / sd
+            y = x1 / (1. - self.dep_params)
+            y -= c * x1.sum(1)[:, None]
+            y /= sd
+            rslt.append(y)
+
+        return rslt
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = \
+        CovStruct.covariance_matrix_solve_batch.__doc__
 
     def summary(self):
         return ("The correlation between two observations in the " +
@@ -396,8 +534,8 @@ class Nested(CovStruct):
             # This is used to construct the working correlation
             # matrix.
             ilabel = np.zeros((ngrp, ngrp), dtype=np.int32)
-            ilabel[[ix1, ix2]] = ncm + 1
-            ilabel[[ix2, ix1]] = ncm + 1
+            ilabel[ix1, ix2] = ncm + 1
+            ilabel[ix2, ix1] = ncm + 1
             ilabels.append(ilabel)
 
             # This is used to estimate the variance components.
@@ -472,8 +610,30 @@ class Nested(CovStruct):
         vmat /= self.scale
         return vmat, True
 
+    def covariance_matrix_batch(self, expval, index):
+
+        ngrp, dim = expval.shape
+
+        # First iteration
+        if self.dep_params is None:
+            return np.tile(np.eye(dim), (ngrp, 1, 1)), True
+
+        # the stacked labels of a set of clusters only need to be built
+        # once
+        cache = self.__dict__.setdefault('_ilabels_batch', {})
+        if id(index) not in cache or cache[id(index)][0] is not index:
+            cache[id(index)] = (index,
+                                np.array([self.ilabels[i] for i in index]))
+        ilabel = cache[id(index)][1]
+
+        c = np.r_[self.scale, np.cumsum(self.vcomp_coeff)]
+        vmat = c[ilabel]
+        vmat /= self.scale
+        return vmat, True
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
+    covariance_matrix_batch.__doc__ = CovStruct.covariance_matrix_batch.__doc__
 
     def summary(self):
         """
@@ -687,32 +847,30 @@ class Autoregressive(CovStruct):
                           "cov_struct, using unweighted covariance estimate",
                           NotImplementedWarning)
 
-        endog = self.model.endog_li
         time = self.model.time_li
+        blocks = self.model._cluster_blocks()
 
-        # Only need to compute this once
+        # Only need to compute this once.  The pairs are ordered by the
+        # clusters in `blocks`, like the residuals below.
         if self.designx is not None:
             designx = self.designx
         else:
             designx = []
-            for i in range(self.model.num_group):
-
-                ngrp = len(endog[i])
-                if ngrp == 0:
-                    continue
+            for block in blocks:
+                ngrp = block['endog'].shape[1]
+                for i in block['index']:
 
-                # Loop over pairs of observations within a cluster
-                for j1 in range(ngrp):
-                    for j2 in range(j1):
-                        designx.append(self.dist_func(time[i][j1, :],
-                                                      time[i][j2, :]))
+                    # Loop over pairs of observations within a cluster
+                    for j1 in range(ngrp):
+                        for j2 in range(j1):
+                            designx.append(self.dist_func(time[i][j1, :],
+                                                          time[i][j2, :]))
 
             designx = np.array(designx)
             self.designx = designx
 
         scale = self.model.estimate_scale()
         varfunc = self.model.family.variance
-        cached_means = self.model.cached_means
 
         # Weights
         var = 1. - self.dep_params ** (2 * designx)
@@ -721,18 +879,18 @@ class Autoregressive(CovStruct):
         wts /= wts.sum()
 
         residmat = []
-        for i in range(self.model.num_group):
+        for block in blocks:
 
-            expval, _ = cached_means[i]
-            stdev = np.sqrt(scale * varfunc(expval))
-            resid = (endog[i] - expval) / stdev
+            expval = block['expval']
+            stdev = np.sqrt(scale * varfunc(expval.ravel()))
+            resid = (block['endog'] - expval) / stdev.reshape(expval.shape)
 
-            ngrp = len(resid)
-            for j1 in range(ngrp):
-                for j2 in range(j1):
-                    residmat.append([resid[j1], resid[j2]])
+            # All pairs j2 < j1 within each cluster
+            ix1, ix2 = np.tril_indices(expval.shape[1], -1)
+            residmat.append(np.column_stack((resid[:, ix1].ravel(),
+                                             resid[:, ix2].ravel())))
 
-        residmat = np.array(residmat)
+        residmat = np.concatenate(residmat)
 
         # Need to minimize this
         def fitfunc(a):
@@ -783,7 +941,8 @@ class Autoregressive(CovStruct):
 
         # LHS has 2 columns
         if k == 2:
-            mat = np.array([[1, -self.dep_params], [-self.dep_params, 1]])
+            mat = np.array([[1, -self.dep_params], [-self.dep_params, 1]],
+                           dtype=np.float64)
             mat /= (1. - self.dep_params ** 2)
             for x in rhs:
                 if x.ndim == 1:
@@ -813,13 +972,13 @@ class Autoregressive(CovStruct):
                 flatten = True
             x1 = x / stdev[:, None]
 
-            z0 = np.zeros((1, x.shape[1]))
-            rhs1 = np.concatenate((x[1:, :], z0), axis=0)
-            rhs2 = np.concatenate((z0, x[0:-1, :]), axis=0)
+            z0 = np.zeros((1, x1.shape[1]))
+            rhs1 = np.concatenate((x1[1:, :], z0), axis=0)
+            rhs2 = np.concatenate((z0, x1[0:-1, :]), axis=0)
 
-            y = c0 * x + c2 * rhs1 + c2 * rhs2
-            y[0, :] = c1 * x[0, :] + c2 * x[1, :]
-            y[-1, :] = c1 * x[-1, :] + c2 * x[-2, :]
+            y = c0 * x1 + c2 * rhs1 + c2 * rhs2
+            y[0, :] = c1 * x1[0, :] + c2 * x1[1, :]
+            y[-1, :] = c1 * x1[-1, :] + c2 * x1[-2, :]
 
             y /= stdev[:, None]
 
@@ -830,9 +989,40 @@ class Autoregressive(CovStruct):
 
         return soln
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        # The same tri-diagonal inverse as in covariance_matrix_solve,
+        # applied along the second axis
+
+        k = expval.shape[1]
+        r = self.dep_params
+
+        if k == 1:
+            return [x / _expand(stdev, x) ** 2 for x in rhs]
+
+        c0 = (1. + r ** 2) / (1. - r ** 2)
+        c1 = 1. / (1. - r ** 2)
+        c2 = -r / (1. - r ** 2)
+        soln = []
+        for x in rhs:
+            sd = _expand(stdev, x)
+            x1 = x / sd
+
+            y = c0 * x1
+            y[:, 1:] += c2 * x1[:, :-1]
+            y[:, :-1] += c2 * x1[:, 1:]
+            y[:, 0] = c1 * x1[:, 0] + c2 * x1[:, 1]
+            y[:, -1] = c1 * x1[:, -1] + c2 * x1[:, -2]
+
+            y /= sd
+            soln.append(y)
+
+        return soln
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = \
+        CovStruct.covariance_matrix_solve_batch.__doc__
 
     def summary(self):
 
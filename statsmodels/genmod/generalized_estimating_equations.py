@@ -457,6 +457,11 @@ class GEE(base.Model):
 
     cached_means = None
 
+    # The clusters grouped by size, see _cluster_blocks
+    _blocks = None
+    _blocks_exog_li = None
+    _blocks_means = None
+
     def __init__(self, endog, exog, groups, time=None, family=None,
                  cov_struct=None, missing='none', offset=None,
                  exposure=None, dep_data=None, constraint=None,
@@ -699,6 +704,73 @@ class GEE(base.Model):
             return [np.array(array[self.group_indices[k], :])
                     for k in self.group_labels]
 
+    def _cluster_blocks(self, means=True):
+        """
+        Returns the clusters grouped by size.
+
+        Parameters
+        ----------
+        means : bool
+            If True, the cached means are included.
+
+        Returns
+        -------
+        blocks : list of dict
+            One dict for each cluster size, holding the indices of the
+            clusters in `index`, and the stacked `endog`, `exog`,
+            `offset` and `weights` of the clusters, with one cluster
+            along the first axis.  If `means` is True, the cached means
+            are included as `expval` and `lpr`.
+
+        Notes
+        -----
+        The blocks are rebuilt when `exog_li` or `cached_means` are
+        replaced, e.g. when fitting with constraints.
+        """
+
+        if self._blocks_exog_li is not self.exog_li:
+            sizes = np.asarray([len(y) for y in self.endog_li])
+            blocks = []
+            for ngrp in np.unique(sizes):
+                if ngrp == 0:
+                    continue
+                index = np.flatnonzero(sizes == ngrp)
+                block = {'index': index,
+                         'endog': np.array([self.endog_li[i] for i in index]),
+                         'exog': np.array([self.exog_li[i] for i in index]),
+                         'offset': None, 'weights': None}
+                if self.offset_li is not None:
+                    block['offset'] = np.array([self.offset_li[i]
+                                                for i in index])
+                if self.weights is not None:
+                    block['weights'] = self.weights_li[index]
+                blocks.append(block)
+            self._blocks = blocks
+            self._blocks_exog_li = self.exog_li
+            self._blocks_means = None
+
+        if means and self._blocks_means is not self.cached_means:
+            for block in self._blocks:
+                index = block['index']
+                block['expval'] = np.array([self.cached_means[i][0]
+                                            for i in index])
+                block['lpr'] = np.array([self.cached_means[i][1]
+                                         for i in index])
+            self._blocks_means = self.cached_means
+
+        return self._blocks
+
+    def _block_moments(self, block):
+        # The residuals, the derivative of the mean, and the standard
+        # deviations of a block of clusters
+        expval, lpr, exog = block['expval'], block['lpr'], block['exog']
+        resid = block['endog'] - expval
+        ngrp, dim, k = exog.shape
+        dmat = self.mean_deriv(exog.reshape(ngrp * dim, k), lpr.ravel())
+        dmat = dmat.reshape(ngrp, dim, k)
+        sdev = np.sqrt(self.family.variance(expval.ravel()))
+        return resid, dmat, sdev.reshape(expval.shape)
+
     def estimate_scale(self):
         """
         Returns an estimate of the scale parameter at the current
@@ -709,27 +781,23 @@ class GEE(base.Model):
                                     _Multinomial)):
             return 1.
 
-        endog = self.endog_li
-        cached_means = self.cached_means
         nobs = self.nobs
         varfunc = self.family.variance
 
         scale = 0.
         fsum = 0.
-        for i in range(self.num_group):
+        for block in self._cluster_blocks():
 
-            if len(endog[i]) == 0:
-                continue
+            expval = block['expval']
+            f = block['weights']
+            if f is None:
+                f = np.ones(len(expval))
 
-            expval, _ = cached_means[i]
+            sdev = np.sqrt(varfunc(expval.ravel())).reshape(expval.shape)
+            resid = (block['endog'] - expval) / sdev
 
-            f = self.weights_li[i] if self.weights is not None else 1.
-
-            sdev = np.sqrt(varfunc(expval))
-            resid = (endog[i] - expval) / sdev
-
-            scale += f * np.sum(resid ** 2)
-            fsum += f * len(endog[i])
+            scale += np.dot(f, np.sum(resid ** 2, 1))
+            fsum += f.sum() * expval.shape[1]
 
         scale /= (fsum * (nobs - self.ddof_scale) / float(nobs))
 
@@ -802,31 +870,23 @@ class GEE(base.Model):
             incorporate the scale.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-
-        cached_means = self.cached_means
-
-        varfunc = self.family.variance
-
         bmat, score = 0, 0
-        for i in range(self.num_group):
+        for block in self._cluster_blocks():
 
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
-            sdev = np.sqrt(varfunc(expval))
+            expval, index = block['expval'], block['index']
+            resid, dmat, sdev = self._block_moments(block)
 
-            rslt = self.cov_struct.covariance_matrix_solve(expval, i,
-                                                           sdev, (dmat, resid))
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (dmat, resid))
             if rslt is None:
                 return None, None
             vinv_d, vinv_resid = tuple(rslt)
 
-            f = self.weights_li[i] if self.weights is not None else 1.
+            if block['weights'] is not None:
+                dmat = dmat * block['weights'][:, None, None]
 
-            bmat += f * np.dot(dmat.T, vinv_d)
-            score += f * np.dot(dmat.T, vinv_resid)
+            bmat += np.tensordot(dmat, vinv_d, axes=([0, 1], [0, 1]))
+            score += np.tensordot(dmat, vinv_resid, axes=([0, 1], [0, 1]))
 
         update = np.linalg.solve(bmat, score)
 
@@ -843,25 +903,26 @@ class GEE(base.Model):
         keep the cached means up to date.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-        offset = self.offset_li
-
         linkinv = self.family.link.inverse
 
-        self.cached_means = []
+        self.cached_means = [None] * self.num_group
 
-        for i in range(self.num_group):
+        # The means are computed for all clusters of the same size at
+        # once, the blocks then already hold the new means.
+        blocks = self._cluster_blocks(means=False)
+        for block in blocks:
 
-            if len(endog[i]) == 0:
-                continue
+            lpr = np.dot(block['exog'], mean_params)
+            if block['offset'] is not None:
+                lpr += block['offset']
+            expval = linkinv(lpr.ravel()).reshape(lpr.shape)
+            block['expval'], block['lpr'] = expval, lpr
 
-            lpr = np.dot(exog[i], mean_params)
-            if offset is not None:
-                lpr += offset[i]
-            expval = linkinv(lpr)
+            for j, i in enumerate(block['index']):
+                self.cached_means[i] = (expval[j], lpr[j])
 
-            self.cached_means.append((expval, lpr))
+        self.cached_means = [x for x in self.cached_means if x is not None]
+        self._blocks_means = self.cached_means
 
     def _covmat(self):
         """
@@ -883,32 +944,26 @@ class GEE(base.Model):
            obtaining score test results.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-        varfunc = self.family.variance
-        cached_means = self.cached_means
-
         # Calculate the naive (model-based) and robust (sandwich)
         # covariances.
         bmat, cmat = 0, 0
-        for i in range(self.num_group):
+        for block in self._cluster_blocks():
 
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
-            sdev = np.sqrt(varfunc(expval))
+            expval, index = block['expval'], block['index']
+            resid, dmat, sdev = self._block_moments(block)
 
-            rslt = self.cov_struct.covariance_matrix_solve(
-                expval, i, sdev, (dmat, resid))
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (dmat, resid))
             if rslt is None:
                 return None, None, None, None
             vinv_d, vinv_resid = tuple(rslt)
 
-            f = self.weights_li[i] if self.weights is not None else 1.
+            if block['weights'] is not None:
+                dmat = dmat * block['weights'][:, None, None]
 
-            bmat += f * np.dot(dmat.T, vinv_d)
-            dvinv_resid = f * np.dot(dmat.T, vinv_resid)
-            cmat += np.outer(dvinv_resid, dvinv_resid)
+            bmat += np.tensordot(dmat, vinv_d, axes=([0, 1], [0, 1]))
+            dvinv_resid = np.einsum('ijk,ij->ik', dmat, vinv_resid)
+            cmat += np.dot(dvinv_resid.T, dvinv_resid)
 
         scale = self.estimate_scale()
 
@@ -925,40 +980,35 @@ class GEE(base.Model):
     def _bc_covmat(self, cov_naive):
 
         cov_naive = cov_naive / self.scaling_factor
-        endog = self.endog_li
-        exog = self.exog_li
-        varfunc = self.family.variance
-        cached_means = self.cached_means
         scale = self.estimate_scale()
 
         bcm = 0
-        for i in range(self.num_group):
+        for block in self._cluster_blocks():
 
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
-            sdev = np.sqrt(varfunc(expval))
+            expval, index = block['expval'], block['index']
+            resid, dmat, sdev = self._block_moments(block)
 
-            rslt = self.cov_struct.covariance_matrix_solve(
-                expval, i, sdev, (dmat,))
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (dmat,))
             if rslt is None:
                 return None
             vinv_d = rslt[0]
             vinv_d /= scale
 
-            hmat = np.dot(vinv_d, cov_naive)
-            hmat = np.dot(hmat, dmat.T).T
-
-            f = self.weights_li[i] if self.weights is not None else 1.
+            # The transposed hat matrices, D C' (V^-1 D)'
+            hmat = np.matmul(np.matmul(dmat, cov_naive.T),
+                             vinv_d.transpose(0, 2, 1))
 
-            aresid = np.linalg.solve(np.eye(len(resid)) - hmat, resid)
-            rslt = self.cov_struct.covariance_matrix_solve(
-                expval, i, sdev, (aresid,))
+            imat = np.eye(resid.shape[1]) - hmat
+            aresid = np.linalg.solve(imat, resid[:, :, None])[:, :, 0]
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (aresid,))
             if rslt is None:
                 return None
-            srt = rslt[0]
-            srt = f * np.dot(dmat.T, srt) / scale
-            bcm += np.outer(srt, srt)
+            srt = np.einsum('ijk,ij->ik', dmat, rslt[0]) / scale
+            if block['weights'] is not None:
+                srt *= block['weights'][:, None]
+            bcm += np.dot(srt.T, srt)
 
         cov_robust_bc = np.dot(cov_naive, np.dot(bcm, cov_naive))
         cov_robust_bc *= self.scaling_factor
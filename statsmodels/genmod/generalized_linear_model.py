@@ -27,6 +27,8 @@ import statsmodels.base.model as base
 import statsmodels.regression.linear_model as lm
 import statsmodels.base.wrapper as wrap
 import statsmodels.regression._tools as reg_tools
+from statsmodels.tools.data import _is_sparse
+from statsmodels.tools.tools import _cross_product, _multiply_rows
 
 
 from statsmodels.graphics._regressionplots_doc import (
@@ -90,6 +92,11 @@ class GLM(base.LikelihoodModel):
         array of 1's with length equal to the endog.
         WARNING: Using weights is not verified yet for all possible options
         and results, see Notes.
+    absorb : array-like, optional
+        Group labels of one or more factors, 1d or 2d (nobs, n_factors),
+        whose fixed effects are included in the model without creating
+        dummy variables. exog must not include a constant. Only available
+        with the IRLS fit method, see Notes.
     %(extra_params)s
 
     Attributes
@@ -195,6 +202,22 @@ class GLM(base.LikelihoodModel):
     about the rate (or frequency) of occurences having variance proportional to
     time.
 
+    If `absorb` is given, then in each IRLS iteration the working endog and
+    exog are demeaned within the groups of all factors, weighted by the IRLS
+    weights, with the method of alternating projections, which is warm
+    started at the previous iteration. With the Poisson family this is the
+    pseudo-Poisson maximum likelihood estimator with high-dimensional fixed
+    effects (PPML-HDFE). The parameters, their covariances and the
+    loglikelihood are the same as with dummy variables of all factors.
+    `predict` includes the estimated fixed effects only for the estimation
+    sample, i.e. if exog is None. `df_resid` is reduced by the number of
+    absorbed effects, `df_absorb`. `score_obs` and `hessian` use the
+    demeaned exog, which gives the cluster robust covariance of the slope
+    parameters, and hold the fixed effects at their estimates. Groups in
+    which endog is zero for all observations have Poisson fixed effects
+    that diverge to minus infinity, which slows down the convergence;
+    dropping those observations does not change the slope parameters.
+
     Both frequency and variance weights are verified for all basic results with
     nonrobust or heteroscedasticity robust ``cov_type``. Other robust
     covariance types have not yet been verified, and at least the small sample
@@ -299,6 +322,12 @@ class GLM(base.LikelihoodModel):
                  exposure=None, freq_weights=None, var_weights=None,
                  missing='none', **kwargs):
 
+        absorb = kwargs.get('absorb', None)
+        if (absorb is not None and np.ndim(absorb) == 2 and
+                missing != 'none'):
+            raise NotImplementedError('missing data handling is only '
+                                      'available for a 1d absorb')
+
         if (family is not None) and not isinstance(family.link,
                                                    tuple(family.safe_links)):
             import warnings
@@ -363,19 +392,57 @@ class GLM(base.LikelihoodModel):
                         'params': [np.inf],
                         'deviance': [np.inf]}
 
-        self.pinv_wexog = np.linalg.pinv(self.exog)
-        self.normalized_cov_params = np.dot(self.pinv_wexog,
-                                            np.transpose(self.pinv_wexog))
+        if _is_sparse(self.exog):
+            # avoid a dense copy of exog
+            self.pinv_wexog = None
+            xtx = _cross_product(self.exog)
+            self.normalized_cov_params = np.linalg.pinv(xtx)
+            self.df_model = np_matrix_rank(xtx) - 1
+        else:
+            self.pinv_wexog = np.linalg.pinv(self.exog)
+            self.normalized_cov_params = np.dot(self.pinv_wexog,
+                                                np.transpose(self.pinv_wexog))
+
+            self.df_model = np_matrix_rank(self.exog) - 1
 
-        self.df_model = np_matrix_rank(self.exog) - 1
+        self.df_absorb = 0
+        if getattr(self, 'absorb', None) is not None:
+            self._initialize_absorb()
 
         if (self.freq_weights is not None) and \
            (self.freq_weights.shape[0] == self.endog.shape[0]):
             self.wnobs = self.freq_weights.sum()
-            self.df_resid = self.wnobs - self.df_model - 1
+            self.df_resid = (self.wnobs - self.df_model - 1 -
+                             self.df_absorb)
         else:
             self.wnobs = self.exog.shape[0]
-            self.df_resid = self.exog.shape[0] - self.df_model - 1
+            self.df_resid = (self.exog.shape[0] - self.df_model - 1 -
+                             self.df_absorb)
+        if self.df_absorb:
+            # the constant is one of the absorbed effects
+            self.df_model += 1
+
+    def _initialize_absorb(self):
+        """
+        Group codes and degrees of freedom of the absorbed fixed effects
+        """
+        from statsmodels.tools.grouputils import (_group_codes,
+                                                  _absorbed_df_codes)
+        if _is_sparse(self.exog):
+            raise NotImplementedError('absorb is not available for sparse '
+                                      'exog')
+        if self.data.const_idx is not None:
+            raise ValueError('exog includes a constant which is absorbed '
+                             'by the fixed effects, drop it')
+        self._absorb_codes = codes = _group_codes(self.absorb)
+        for code in codes:
+            if len(code) != self.exog.shape[0]:
+                raise ValueError('absorb needs to have the same number of '
+                                 'observations as exog')
+        self.df_absorb = _absorbed_df_codes(codes)
+        self.k_constant = 0
+        self._absorbed_effects = 0.
+        self._exog_absorbed = None
 
     def _check_inputs(self, family, offset, exposure, endog, freq_weights,
                       var_weights):
@@ -444,7 +511,7 @@ class GLM(base.LikelihoodModel):
         """
         Evaluate the log-likelihood for a generalized linear model.
         """
-        lin_pred = np.dot(self.exog, params) + self._offset_exposure
+        lin_pred = self.predict(params, linear=True)
         expval = self.family.link.inverse(lin_pred)
         if scale is None:
             scale = self.estimate_scale(expval)
@@ -473,7 +540,7 @@ class GLM(base.LikelihoodModel):
         """
 
         score_factor = self.score_factor(params, scale=scale)
-        return score_factor[:, None] * self.exog
+        return _multiply_rows(self._exog_score(), score_factor)
 
     def score(self, params, scale=None):
         """score, first derivative of the loglikelihood function
@@ -494,6 +561,9 @@ class GLM(base.LikelihoodModel):
             the sum of `score_obs`
 
         """
+        if _is_sparse(self.exog):
+            score_factor = self.score_factor(params, scale=scale)
+            return self.exog.T.dot(score_factor)
         return self.score_obs(params, scale=scale).sum(0)
 
     def score_factor(self, params, scale=None):
@@ -615,9 +685,16 @@ class GLM(base.LikelihoodModel):
                 observed = True
 
         factor = self.hessian_factor(params, scale=scale, observed=observed)
-        hess = -np.dot(self.exog.T * factor, self.exog)
+        hess = -_cross_product(self._exog_score(), factor)
         return hess
 
+    def _exog_score(self):
+        """exog for score_obs and hessian, demeaned if effects are absorbed
+        """
+        if getattr(self, '_exog_absorbed', None) is not None:
+            return self._exog_absorbed
+        return self.exog
+
     def information(self, params, scale=None):
         """
         Fisher information matrix.
@@ -853,10 +930,16 @@ class GLM(base.LikelihoodModel):
         else:
             exposure = np.log(exposure)
 
+        absorbed_effects = 0.
         if exog is None:
             exog = self.exog
+            absorbed_effects = getattr(self, '_absorbed_effects', 0.)
 
-        linpred = np.dot(exog, params) + offset + exposure
+        if _is_sparse(exog):
+            linpred = exog.dot(params) + offset + exposure
+        else:
+            linpred = np.dot(exog, params) + offset + exposure
+        linpred = linpred + absorbed_effects
         if linear:
             return linpred
         else:
@@ -986,12 +1069,16 @@ class GLM(base.LikelihoodModel):
         wls_method : str, optional
             options are 'lstsq', 'pinv' and 'qr'
             specifies which linear algebra function to use for the irls
-            optimization. Default is `lstsq` which uses the same underlying
+            optimization. Default is `lstsq` which solves the normal
+            equations by a Cholesky factorization when the weighted exog
+            is well conditioned and otherwise uses the same underlying
             svd based approach as 'pinv', but is faster during iterations.
             'lstsq' and 'pinv' regularize the estimate in singular and
             near-singular cases by truncating small singular values based
             on `rcond` of the respective numpy.linalg function. 'qr' is
             only valied for cases that are not singular nor near-singular.
+            The iterations use the same solver for all options, only the
+            final WLS fit depends on `wls_method`.
 
         If a scipy optimizer is used, the following additional parameter is
         available:
@@ -1012,6 +1099,10 @@ class GLM(base.LikelihoodModel):
         """
         self.scaletype = scale
 
+        if (getattr(self, 'absorb', None) is not None and
+                method.lower() != "irls"):
+            raise NotImplementedError('absorb is only available with '
+                                      'method "IRLS"')
         if method.lower() == "irls":
             return self._fit_irls(start_params=start_params, maxiter=maxiter,
                                   tol=tol, scale=scale, cov_type=cov_type,
@@ -1030,6 +1121,59 @@ class GLM(base.LikelihoodModel):
             self._optim_hessian = None
             return fit_
 
+    @classmethod
+    def fit_chunked(cls, chunks, family=None, start_params=None, maxiter=100,
+                    tol=1e-8, scale=None, cov_type='nonrobust', use_t=None,
+                    **kwargs):
+        """
+        Fit a GLM by IRLS with one pass over data chunks per iteration
+
+        The data is never held in memory as a whole. Each iteration
+        accumulates X'WX and X'Wz of the working regression, and the deviance
+        and Pearson chi2, over the chunks.
+
+        Parameters
+        ----------
+        chunks : callable or sequence
+            A callable without arguments that returns an iterable of chunks,
+            or a sequence of chunks. Each chunk is a tuple ``(endog, exog)``
+            or a dict with keys 'endog', 'exog' and optionally 'offset',
+            'exposure', 'freq_weights' and 'var_weights'. Chunks can be
+            ndarrays, memmaps or pandas objects.
+        family : family class instance
+            The distribution family of the model. Default is Gaussian.
+        start_params : array-like, optional
+            Initial guess of the solution.
+        maxiter : int, optional
+            Maximum number of iterations.
+        tol : float
+            Convergence tolerance for the change in the deviance.
+        scale : string or float, optional
+            `scale` can be 'X2', 'dev', or a float, see `fit`.
+        cov_type : {'nonrobust', 'HC0'}
+            The type of parameter covariance. 'HC0' needs one more pass over
+            the chunks.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values.
+        kwargs
+            Additional keywords `atol` and `rtol`, see `fit`.
+
+        Returns
+        -------
+        results : StreamingGLMResults
+            A GLMResults subclass that does not store residuals or fitted
+            values.
+
+        See Also
+        --------
+        statsmodels.genmod.streaming.StreamingGLM
+        """
+        from statsmodels.genmod.streaming import StreamingGLM
+        return StreamingGLM(chunks, family=family).fit(
+            start_params=start_params, maxiter=maxiter, tol=tol, scale=scale,
+            cov_type=cov_type, use_t=use_t, **kwargs)
+
     def _fit_gradient(self, start_params=None, method="newton",
                       maxiter=100, tol=1e-8, full_output=True,
                       disp=True, scale=None, cov_type='nonrobust',
@@ -1093,12 +1237,23 @@ class GLM(base.LikelihoodModel):
 
         endog = self.endog
         wlsexog = self.exog
+        absorb = getattr(self, 'absorb', None) is not None
+        if absorb:
+            # the fixed effects are reestimated in each iteration
+            self._absorbed_effects = 0.
+            self._exog_absorbed = None
+            zx_prev = zx_dm = None
+        # reuse the buffers of the weighted design matrix across iterations
+        # if the design matrix does not change
+        workspace = None
+        if not absorb and not _is_sparse(wlsexog):
+            workspace = reg_tools._WLSWorkspace(wlsexog)
         if start_params is None:
             start_params = np.zeros(self.exog.shape[1], np.float)
             mu = self.family.starting_mu(self.endog)
             lin_pred = self.family.predict(mu)
         else:
-            lin_pred = np.dot(wlsexog, start_params) + self._offset_exposure
+            lin_pred = wlsexog.dot(start_params) + self._offset_exposure
             mu = self.family.fitted(lin_pred)
         self.scale = self.estimate_scale(mu)
         dev = self.family.deviance(self.endog, mu, self.var_weights,
@@ -1125,11 +1280,24 @@ class GLM(base.LikelihoodModel):
                             self.family.weights(mu))
             wlsendog = (lin_pred + self.family.link.deriv(mu) * (self.endog-mu)
                         - self._offset_exposure)
-            wls_results = reg_tools._MinimalWLS(
-                    wlsendog,
-                    wlsexog,
-                    self.weights).fit(method='lstsq')
-            lin_pred = np.dot(self.exog, wls_results.params)
+            if absorb:
+                zx = np.column_stack((wlsendog, self.exog))
+                zx_dm = self._demean_absorb(zx, zx_prev, zx_dm)
+                zx_prev = zx
+                wlsendog, wlsexog = zx_dm[:, 0], zx_dm[:, 1:]
+            if workspace is not None:
+                wls_results = workspace.fit(wlsendog, self.weights)
+            else:
+                wls_results = reg_tools._MinimalWLS(
+                        wlsendog,
+                        wlsexog,
+                        self.weights).fit(method='lstsq')
+            if absorb:
+                # fitted values of the regression with dummy variables
+                lin_pred = zx[:, 0] - wlsendog + wlsexog.dot(
+                    wls_results.params)
+            else:
+                lin_pred = self.exog.dot(wls_results.params)
             lin_pred += self._offset_exposure
             mu = self.family.fitted(lin_pred)
             history = self._update_history(wls_results, mu, history)
@@ -1142,8 +1310,17 @@ class GLM(base.LikelihoodModel):
             if converged:
                 break
         self.mu = mu
-
-        if maxiter > 0:  # Only if iterative used
+        if absorb and maxiter > 0:
+            self._absorbed_effects = (lin_pred - self._offset_exposure -
+                                      self.exog.dot(wls_results.params))
+            self._exog_absorbed = wlsexog
+
+        if (maxiter > 0 and workspace is not None and wls_method == 'lstsq'
+                and not attach_wls):
+            # the last iteration already solved the final WLS problem
+            wls_results.normalized_cov_params = \
+                workspace.normalized_cov_params()
+        elif maxiter > 0:  # Only if iterative used
             wls_method2 = 'pinv' if wls_method == 'lstsq' else wls_method
             wls_model = lm.WLS(wlsendog, wlsexog, self.weights)
             wls_results = wls_model.fit(method=wls_method2)
@@ -1165,6 +1342,37 @@ class GLM(base.LikelihoodModel):
         glm_results.converged = converged
         return GLMResultsWrapper(glm_results)
 
+    def _demean_absorb(self, zx, zx_prev=None, zx_dm_prev=None):
+        """
+        Demean working endog and exog within the groups of absorbed factors
+
+        The alternating projections are started at the demeaned values of
+        the previous IRLS iteration, which differ from the new solution
+        only by the change of the weights and of the working endog.
+        """
+        from statsmodels.tools.grouputils import _demean_codes
+        start = None
+        if zx_prev is not None:
+            start = zx - zx_prev + zx_dm_prev
+        zx_dm, _ = _demean_codes(zx, self._absorb_codes, weights=self.weights,
+                                 start=start)
+        return zx_dm
+
+    def _irls_working_data(self, params):
+        """
+        Working endog and weights of the IRLS iteration at params.
+
+        ``sum(weights * (wendog - exog params)**2) / 2`` is the quadratic
+        approximation of the negative log-likelihood at params, up to a
+        constant, if the scale is one.
+        """
+        lin_pred = self.exog.dot(params) + self._offset_exposure
+        mu = self.family.fitted(lin_pred)
+        weights = self.iweights * self.n_trials * self.family.weights(mu)
+        wendog = (lin_pred + self.family.link.deriv(mu) * (self.endog - mu)
+                  - self._offset_exposure)
+        return wendog, weights
+
     def fit_regularized(self, method="elastic_net", alpha=0.,
                         start_params=None, refit=False, **kwargs):
         """
@@ -1217,14 +1425,30 @@ class GLM(base.LikelihoodModel):
             Convergence threshold for line searches
         zero_tol : float
             Coefficients below this threshold are treated as zero.
+        use_irls : bool
+            If True, each iteration solves the penalized weighted least
+            squares problem of IRLS by coordinate descent on the weighted
+            cross-products of exog.  This is the default for the
+            Binomial, Poisson and NegativeBinomial families, which have a
+            fixed scale.  If False, one-dimensional optimization of the
+            log-likelihood is used for each coordinate.
         """
         from statsmodels.base.elastic_net import fit_elasticnet
 
         if method != "elastic_net":
             raise ValueError("method for fit_regularied must be elastic_net")
+        if getattr(self, 'absorb', None) is not None:
+            raise NotImplementedError('absorb is not available in '
+                                      'fit_regularized')
+
+        # The IRLS approximation of the log-likelihood needs a fixed scale
+        use_irls = (not self.scaletype and
+                    isinstance(self.family, (families.Binomial,
+                                             families.Poisson,
+                                             families.NegativeBinomial)))
 
         defaults = {"maxiter": 50, "L1_wt": 1, "cnvrg_tol": 1e-10,
-                    "zero_tol": 1e-10}
+                    "zero_tol": 1e-10, "use_irls": use_irls}
         defaults.update(kwargs)
 
         result = fit_elasticnet(self, method=method,
@@ -1609,6 +1833,24 @@ class GLMResults(base.LikelihoodModelResults):
 
     get_prediction.__doc__ = pred.get_prediction_glm.__doc__
 
+    def get_influence(self):
+        """
+        get an instance of GLMInfluence with influence and outlier measures
+
+        Returns
+        -------
+        infl : GLMInfluence instance
+            The instance has methods to calculate the main influence and
+            outlier measures based on one-step approximations of the
+            leave-one-observation-out estimates.
+
+        See Also
+        --------
+        statsmodels.stats.outliers_influence.GLMInfluence
+        """
+        from statsmodels.stats.outliers_influence import GLMInfluence
+        return GLMInfluence(self)
+
     def remove_data(self):
         # GLM has alias/reference in result instance
         self._data_attr.extend([i for i in self.model._data_attr
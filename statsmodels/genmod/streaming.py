@@ -0,0 +1,476 @@
+"""
+Generalized linear models for data that does not fit into memory.
+
+Each iteration of IRLS makes one pass over the data chunks and only keeps
+the weighted cross-products X'WX and X'Wz of the working regression,
+together with the deviance and Pearson chi2 of the current estimate, so
+the number of observations is only limited by the time needed to pass over
+the data.
+
+Author: statsmodels developers
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+
+from statsmodels.base._streaming import (StreamingModelMixin,
+                                         StreamingResultsMixin,
+                                         _chunk_endog_exog, _chunk_vector)
+import statsmodels.base.model as base
+from statsmodels.tools.decorators import cache_readonly, resettable_cache
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from . import families
+from .generalized_linear_model import (GLMResults, GLMResultsWrapper,
+                                       _check_convergence)
+
+__all__ = ['StreamingGLM', 'StreamingGLMResults']
+
+
+_chunk_keys = ('endog', 'exog', 'offset', 'exposure', 'freq_weights',
+               'var_weights')
+
+
+def _as_glm_chunk(chunk, k_vars=None):
+    """convert one chunk to a dict of ndarrays"""
+    if hasattr(chunk, 'keys'):
+        unknown = set(chunk.keys()) - set(_chunk_keys)
+        if unknown:
+            raise ValueError("unknown keys in chunk: %s" %
+                             ', '.join(sorted(unknown)))
+        chunk = dict((key, chunk.get(key)) for key in _chunk_keys)
+    elif len(chunk) == 2:
+        chunk = {'endog': chunk[0], 'exog': chunk[1]}
+    else:
+        raise ValueError("chunks need to be tuples (endog, exog) or dicts "
+                         "with keys 'endog', 'exog' and optionally 'offset', "
+                         "'exposure', 'freq_weights' and 'var_weights'")
+
+    endog, exog = _chunk_endog_exog(chunk['endog'], chunk['exog'], k_vars)
+    out = {'endog': endog, 'exog': exog}
+    for key in _chunk_keys[2:]:
+        out[key] = _chunk_vector(chunk.get(key), endog.shape[0], name=key)
+    return out
+
+
+class StreamingGLM(StreamingModelMixin):
+    """
+    Generalized linear model fit to data chunks with bounded memory
+
+    Parameters
+    ----------
+    chunks : callable or sequence
+        Source of the data. Either a callable without arguments that returns
+        an iterable of chunks, or a sequence of chunks that can be iterated
+        several times. Each chunk is a tuple ``(endog, exog)`` or a dict
+        with keys 'endog', 'exog' and optionally 'offset', 'exposure',
+        'freq_weights' and 'var_weights', as in `GLM`. Chunks can be
+        ndarrays, memmaps or pandas objects. If the first chunk contains
+        pandas objects, then their names are used for the parameters.
+    family : family class instance
+        The distribution family of the model. Default is Gaussian.
+
+    Attributes
+    ----------
+    nobs : float
+        The number of observations, available after `fit`.
+    wnobs : float
+        The sum of the frequency weights, available after `fit`.
+
+    Notes
+    -----
+    Each iteration of IRLS, and the computation of the log-likelihood and of
+    the HC0 covariance, is one pass over the chunks. Results differ from
+    `GLM` with the same data by the convergence tolerance, because the
+    covariance uses the IRLS weights at the final estimate instead of those
+    of the previous iteration, and by floating point accumulation error.
+
+    Binomial models need endog given as proportions in [0, 1], the number
+    of trials can be supplied as `var_weights`.
+
+    See Also
+    --------
+    GLM.fit_chunked
+
+    Examples
+    --------
+    >>> def chunks():
+    ...     for df in pd.read_csv('data.csv', chunksize=100000):
+    ...         yield {'endog': df['y'], 'exog': df[['const', 'x']],
+    ...                'exposure': df['t']}
+    >>> res = StreamingGLM(chunks, sm.families.Poisson()).fit()
+    """
+
+    def __init__(self, chunks, family=None):
+        if family is None:
+            family = families.Gaussian()
+        if not callable(chunks) and iter(chunks) is chunks:
+            raise ValueError("IRLS needs several passes over the data, use a "
+                             "callable that returns a new iterator of chunks "
+                             "or a sequence of chunks")
+        self.chunks = chunks
+        self.family = family
+        self._data_attr = []
+        self._has_freq_weights = False
+        self._has_var_weights = False
+        self.scaletype = None
+
+    def _as_chunk(self, chunk, k_vars):
+        chunk = _as_glm_chunk(chunk, k_vars)
+        if chunk['endog'].shape[0] == 0:
+            return None
+        return chunk
+
+    def _offset_exposure(self, chunk):
+        offset_exposure = 0.
+        if chunk['offset'] is not None:
+            offset_exposure = chunk['offset']
+        if chunk['exposure'] is not None:
+            if not isinstance(self.family.link, families.links.Log):
+                raise ValueError("exposure can only be used with the log "
+                                 "link function")
+            offset_exposure = offset_exposure + np.log(chunk['exposure'])
+        return offset_exposure
+
+    def _chunk_weights(self, chunk):
+        """freq_weights, var_weights and their product for a chunk"""
+        nobs = chunk['endog'].shape[0]
+        freq_weights = chunk['freq_weights']
+        var_weights = chunk['var_weights']
+        if freq_weights is None:
+            freq_weights = np.ones(nobs)
+        else:
+            self._has_freq_weights = True
+        if var_weights is None:
+            var_weights = np.ones(nobs)
+        else:
+            self._has_var_weights = True
+        return freq_weights, var_weights, freq_weights * var_weights
+
+    def _irls_pass(self, params):
+        """
+        Accumulate the working regression and fit statistics in one pass
+
+        If params is None, then the IRLS starting values of the family are
+        used for the mean.
+        """
+        family = self.family
+        k_vars = None
+        stats = dict(nobs=0, wnobs=0., deviance=0., pearson_chi2=0.,
+                     ssr=0.)
+        for chunk in self._iter_chunks():
+            endog, exog = chunk['endog'], chunk['exog']
+            if not np.isfinite(exog).all() or not np.isfinite(endog).all():
+                raise ValueError("chunks contain inf or nans")
+            if k_vars is None:
+                k_vars = exog.shape[1]
+                xtx = np.zeros((k_vars, k_vars))
+                xtz = np.zeros(k_vars)
+            freq_weights, var_weights, iweights = self._chunk_weights(chunk)
+            offset_exposure = self._offset_exposure(chunk)
+
+            if params is None:
+                mu = family.starting_mu(endog)
+                lin_pred = family.predict(mu)
+            else:
+                lin_pred = exog.dot(params) + offset_exposure
+                mu = family.fitted(lin_pred)
+
+            weights = iweights * family.weights(mu)
+            wlsendog = (lin_pred + family.link.deriv(mu) * (endog - mu) -
+                        offset_exposure)
+            wexog = exog * weights[:, None]
+            xtx += wexog.T.dot(exog)
+            xtz += wexog.T.dot(wlsendog)
+
+            resid = endog - mu
+            stats['nobs'] += endog.shape[0]
+            stats['wnobs'] += freq_weights.sum()
+            stats['deviance'] += family.deviance(endog, mu, var_weights,
+                                                 freq_weights, 1.)
+            stats['pearson_chi2'] += np.sum(iweights * resid**2 /
+                                            family.variance(mu))
+            stats['ssr'] += np.sum(iweights * resid**2)
+        if k_vars is None:
+            raise ValueError("no observations in chunks")
+        stats['xtx'] = xtx
+        stats['xtz'] = xtz
+        return stats
+
+    def _estimate_scale(self, stats):
+        scaletype = self.scaletype
+        if not scaletype:
+            if isinstance(self.family, (families.Binomial, families.Poisson,
+                                        families.NegativeBinomial)):
+                return 1.
+            return stats['pearson_chi2'] / self.df_resid
+        if isinstance(scaletype, float):
+            return scaletype
+        if scaletype.lower() == 'x2':
+            return stats['pearson_chi2'] / self.df_resid
+        elif scaletype.lower() == 'dev':
+            return stats['deviance'] / self.df_resid
+        raise ValueError("Scale %s with type %s not understood" %
+                         (scaletype, type(scaletype)))
+
+    def fit(self, start_params=None, maxiter=100, tol=1e-8, scale=None,
+            cov_type='nonrobust', use_t=None, atol=None, rtol=0.):
+        """
+        Fit the model by IRLS with one pass over the chunks per iteration
+
+        Parameters
+        ----------
+        start_params : array-like, optional
+            Initial guess of the solution. By default, the first iteration
+            starts at the starting values of the mean of the family.
+        maxiter : int, optional
+            Maximum number of iterations.
+        tol : float
+            Convergence tolerance for the change in the deviance, the
+            default for `atol`.
+        scale : string or float, optional
+            `scale` can be 'X2', 'dev', or a float, as in `GLM.fit`.
+        cov_type : {'nonrobust', 'HC0'}
+            The type of parameter covariance. 'HC0' needs one more pass over
+            the chunks.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values.
+        atol, rtol : float, optional
+            Absolute and relative tolerance for the change in the deviance.
+
+        Returns
+        -------
+        results : StreamingGLMResults
+        """
+        if cov_type not in ('nonrobust', 'HC0'):
+            raise ValueError("cov_type has to be 'nonrobust' or 'HC0' for "
+                             "streaming GLM")
+        self.scaletype = scale
+        atol = tol if atol is None else atol
+        if start_params is not None:
+            start_params = np.asarray(start_params, dtype=np.float64)
+
+        stats = self._irls_pass(start_params)
+        if start_params is None:
+            start_params = np.zeros(stats['xtx'].shape[0])
+        history = dict(params=[np.inf, start_params],
+                       deviance=[np.inf, stats['deviance']])
+        params = start_params
+        converged = False
+        iteration = 0
+        for iteration in range(maxiter):
+            params = np.linalg.pinv(stats['xtx']).dot(stats['xtz'])
+            stats = self._irls_pass(params)
+            history['params'].append(params)
+            history['deviance'].append(stats['deviance'])
+            converged = _check_convergence(history['deviance'],
+                                           iteration + 1, atol, rtol)
+            if converged:
+                break
+        if not converged and maxiter > 0:
+            import warnings
+            warnings.warn("IRLS did not converge in %d iterations" % maxiter,
+                          ConvergenceWarning)
+
+        xtx = stats['xtx']
+        eigvals = np.linalg.eigvalsh(xtx)
+        self.rank = int((eigvals > eigvals.max() * xtx.shape[0] *
+                         np.finfo(float).eps).sum())
+        self.nobs = float(stats['nobs'])
+        self.wnobs = stats['wnobs']
+        self.df_model = self.rank - 1
+        self.df_resid = self.wnobs - self.rank
+        self._fit_stats = stats
+        scale = self._estimate_scale(stats)
+        self.scale = scale
+
+        res = StreamingGLMResults(self, params, np.linalg.pinv(xtx), scale,
+                                  cov_type=cov_type, use_t=use_t)
+        res.method = 'IRLS'
+        history['iteration'] = iteration + 1
+        res.fit_history = history
+        res.converged = converged
+        return GLMResultsWrapper(res)
+
+    def loglike(self, params, scale=None):
+        """
+        Evaluate the log-likelihood with one pass over the chunks
+
+        Parameters
+        ----------
+        params : ndarray
+            The parameter vector.
+        scale : float, optional
+            The scale parameter, the scale of the last fit by default.
+
+        Returns
+        -------
+        llf : float
+            The value of the log-likelihood function.
+        """
+        if scale is None:
+            scale = self.scale
+        family = self.family
+        llf = 0.
+        for chunk in self._iter_chunks():
+            freq_weights, var_weights, _ = self._chunk_weights(chunk)
+            lin_pred = chunk['exog'].dot(params) + self._offset_exposure(chunk)
+            llf += family.loglike(chunk['endog'], family.fitted(lin_pred),
+                                  var_weights=var_weights,
+                                  freq_weights=freq_weights, scale=scale)
+        return llf
+
+    def _sandwich(self, params, scale):
+        """
+        Outer product of the scores and observed Hessian in one pass
+
+        The scores are divided by the square root of the frequency weights as
+        for the HC covariances of `GLM`.
+        """
+        family = self.family
+        k_vars = len(params)
+        meat = np.zeros((k_vars, k_vars))
+        hessian = np.zeros((k_vars, k_vars))
+        for chunk in self._iter_chunks():
+            endog, exog = chunk['endog'], chunk['exog']
+            freq_weights, _, iweights = self._chunk_weights(chunk)
+            lin_pred = exog.dot(params) + self._offset_exposure(chunk)
+            mu = family.fitted(lin_pred)
+            deriv = family.link.deriv(mu)
+            variance = family.variance(mu)
+            # score_factor with scale=1 and the expected information factor
+            score_factor = (endog - mu) / deriv / variance * iweights
+            eim_factor = iweights / (deriv**2 * variance)
+            tmp = variance * family.link.deriv2(mu)
+            tmp += family.variance.deriv(mu) * deriv
+            oim_factor = eim_factor * (1 + score_factor * eim_factor * tmp /
+                                       iweights)
+            sf2 = score_factor**2 / scale**2 / freq_weights
+            meat += (exog * sf2[:, None]).T.dot(exog)
+            hessian -= (exog * (oim_factor / scale)[:, None]).T.dot(exog)
+        return meat, hessian
+
+    def predict(self, params, exog=None, exposure=None, offset=None,
+                linear=False):
+        """
+        Return predicted values for a design matrix
+
+        Parameters
+        ----------
+        params : array-like
+            Parameters / coefficients of a GLM.
+        exog : array-like
+            Design / exogenous data. Required, the data of the model is not
+            stored.
+        exposure : array-like, optional
+            Exposure time values, only can be used with the log link
+            function.
+        offset : array-like, optional
+            Offset values.
+        linear : bool
+            If True, returns the linear predicted values.  If False,
+            returns the value of the inverse of the model's link function at
+            the linear predicted values.
+
+        Returns
+        -------
+        An array of fitted values
+        """
+        if exog is None:
+            raise ValueError("exog is required, streaming models do not "
+                             "store the data")
+        offset = 0. if offset is None else offset
+        exposure = 0. if exposure is None else np.log(exposure)
+        linpred = np.dot(exog, params) + offset + exposure
+        if linear:
+            return linpred
+        return self.family.fitted(linpred)
+
+    def _null_chunks(self):
+        # the chunks with exog replaced by a constant
+        for chunk in self._iter_chunks():
+            chunk = dict(chunk)
+            chunk['exog'] = np.ones((chunk['endog'].shape[0], 1))
+            yield chunk
+
+
+class StreamingGLMResults(StreamingResultsMixin, GLMResults):
+    """
+    Results of a generalized linear model fit to data chunks
+
+    The deviance, Pearson chi2 and the parameter covariance are accumulated
+    during the fit. The log-likelihood, the null deviance and the HC0
+    covariance are computed with additional passes over the chunks.
+    Residuals and fitted values are not stored.
+
+    See Also
+    --------
+    GLMResults
+    """
+
+    def __init__(self, model, params, normalized_cov_params, scale,
+                 cov_type='nonrobust', cov_kwds=None, use_t=None):
+        base.LikelihoodModelResults.__init__(
+            self, model, params, normalized_cov_params=normalized_cov_params,
+            scale=scale)
+        self.family = model.family
+        self.nobs = model.nobs
+        self.df_resid = model.df_resid
+        self.df_model = model.df_model
+        self.pinv_wexog = None
+        self._n_trials = 1
+        self._cache = resettable_cache()
+        self.use_t = False if use_t is None else use_t
+
+        if cov_type == 'nonrobust':
+            self.cov_type = 'nonrobust'
+            self.cov_kwds = {'description': 'Standard Errors assume that the' +
+                             ' covariance matrix of the errors is correctly ' +
+                             'specified.'}
+        else:
+            from statsmodels.base.covtype import get_robustcov_results
+            get_robustcov_results(self, cov_type=cov_type, use_self=True,
+                                  use_t=use_t, **(cov_kwds or {}))
+
+    @cache_readonly
+    def cov_HC0(self):
+        """
+        Heteroscedasticity robust covariance, computed with one pass
+        """
+        meat, hessian = self.model._sandwich(self.params, self.scale)
+        hessian_inv = np.linalg.inv(hessian)
+        return hessian_inv.dot(meat).dot(hessian_inv)
+
+    @cache_readonly
+    def deviance(self):
+        return self.model._fit_stats['deviance']
+
+    @cache_readonly
+    def pearson_chi2(self):
+        return self.model._fit_stats['pearson_chi2']
+
+    @cache_readonly
+    def llf(self):
+        family = self.family
+        if (isinstance(family, families.Gaussian) and
+                isinstance(family.link, families.links.Power) and
+                (family.link.power == 1.)):
+            scale = self.model._fit_stats['ssr'] / self.model.wnobs
+        else:
+            scale = self.scale
+        return self.model.loglike(self.params, scale=scale)
+
+    @cache_readonly
+    def _null_results(self):
+        null_model = StreamingGLM(self.model._null_chunks, self.family)
+        return null_model.fit(scale=self.model.scaletype)._results
+
+    @cache_readonly
+    def null_deviance(self):
+        return self._null_results.deviance
+
+    @cache_readonly
+    def llnull(self):
+        null_res = self._null_results
+        return null_res.model.loglike(null_res.params, scale=self.scale)
@@ -1653,6 +1653,66 @@ def test_missing():
     assert_almost_equal(res.params.values, res2.params.values)
 
 
+def test_covariance_matrix_solve_batch():
+    # The solves for clusters of equal size agree with the solves for
+    # each cluster, for clusters of varying size
+    np.random.seed(3413)
+    sizes = np.random.randint(1, 6, size=60)
+    groups = np.repeat(np.arange(len(sizes)), sizes)
+    n = len(groups)
+    exog = np.column_stack((np.ones(n), np.random.normal(size=(n, 2))))
+    endog = np.random.poisson(np.exp(0.2 * exog[:, 1]))
+    dep_data = np.random.randint(0, 3, size=(n, 2))
+
+    for cs in (Independence(), Exchangeable(), Autoregressive(),
+               Nested(), Stationary(max_lag=2)):
+        kwargs = {'dep_data': dep_data} if isinstance(cs, Nested) else {}
+        model = GEE(endog, exog, groups, family=Poisson(), cov_struct=cs,
+                    **kwargs)
+        model.fit()
+        for block in model._cluster_blocks():
+            expval, index = block['expval'], block['index']
+            sdev = np.sqrt(expval)
+            rhs = (block['endog'] - expval, block['exog'])
+            rslt = cs.covariance_matrix_solve_batch(expval, index, sdev, rhs)
+            for j, i in enumerate(index):
+                rslt1 = cs.covariance_matrix_solve(expval[j], i, sdev[j],
+                                                   [x[j] for x in rhs])
+                assert_allclose(rslt[0][j], rslt1[0], rtol=1e-10)
+                assert_allclose(rslt[1][j], rslt1[1], rtol=1e-10)
+
+
+def test_cluster_blocks_fit():
+    # A fit using the solves of each cluster agrees with the batched fit
+    class ExchangeableEach(Exchangeable):
+        def covariance_matrix_solve(self, expval, index, stdev, rhs):
+            return super(ExchangeableEach, self).covariance_matrix_solve(
+                expval, index, stdev, rhs)
+
+    np.random.seed(3414)
+    sizes = np.random.randint(1, 5, size=100)
+    groups = np.repeat(np.arange(len(sizes)), sizes)
+    n = len(groups)
+    exog = np.column_stack((np.ones(n), np.random.normal(size=(n, 2))))
+    endog = np.random.poisson(np.exp(0.3 * exog[:, 1] - 0.2 * exog[:, 2]))
+    offset = np.random.uniform(-0.1, 0.1, size=n)
+
+    rslts = []
+    for cs in (Exchangeable(), ExchangeableEach()):
+        model = GEE(endog, exog, groups, family=Poisson(), cov_struct=cs,
+                    offset=offset)
+        rslts.append(model.fit(cov_type='bias_reduced'))
+    res1, res2 = rslts
+
+    assert_allclose(res1.params, res2.params, rtol=1e-10)
+    assert_allclose(res1.cov_struct.dep_params,
+                    res2.cov_struct.dep_params, rtol=1e-10)
+    assert_allclose(res1.cov_robust, res2.cov_robust, rtol=1e-8)
+    assert_allclose(res1.cov_naive, res2.cov_naive, rtol=1e-8)
+    assert_allclose(res1.cov_robust_bc, res2.cov_robust_bc, rtol=1e-8)
+    assert_allclose(res1.fittedvalues, res2.fittedvalues, rtol=1e-10)
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, '-vvs', '-x', '--pdb'])
@@ -1914,6 +1914,43 @@ class TestRegularized(object):
                 llf_sm = plf(sm_result.params)
                 assert_equal(np.sign(llf_sm - llf_r), 1)
 
+    def test_regularized_path(self):
+        # warm started path for a model without a Gram matrix
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        np.random.seed(4323)
+        exog = np.random.normal(size=(300, 5))
+        endog = np.random.poisson(np.exp(0.5 * exog[:, 0] - 0.3 * exog[:, 1]))
+        model = GLM(endog, exog, family=sm.families.Poisson())
+        path = fit_elasticnet_path(model, n_alphas=6, alpha_min_ratio=0.05,
+                                   maxiter=200, cnvrg_tol=1e-10,
+                                   zero_tol=1e-10)
+        assert_equal(path.df_model[0], 0)
+        for i in [1, 3, 5]:
+            rslt = model.fit_regularized(alpha=path.alphas[i], maxiter=200)
+            assert_allclose(path.params[i], rslt.params, rtol=1e-5,
+                            atol=1e-7)
+
+    def test_regularized_irls(self):
+        # penalized IRLS agrees with one-dimensional coordinate descent
+        np.random.seed(8723)
+        exog = add_constant(np.random.normal(size=(500, 4)))
+        offset = np.random.uniform(-0.5, 0.5, size=500)
+        endog_p = np.random.poisson(np.exp(0.5 * exog[:, 1] + offset))
+        p = 1 / (1 + np.exp(-exog[:, 1] + exog[:, 2]))
+        endog_b = (np.random.uniform(size=500) < p).astype(np.float64)
+        for endog, fam, kwds in [
+                (endog_p, sm.families.Poisson(), {'offset': offset}),
+                (endog_b, sm.families.Binomial(), {})]:
+            model = GLM(endog, exog, family=fam, **kwds)
+            for L1_wt in [1, 0.5]:
+                res1 = model.fit_regularized(alpha=0.02, L1_wt=L1_wt)
+                res2 = model.fit_regularized(alpha=0.02, L1_wt=L1_wt,
+                                             use_irls=False, maxiter=200)
+                assert_allclose(res1.params, res2.params, rtol=1e-6,
+                                atol=1e-8)
+                assert_equal(res1.params == 0, res2.params == 0)
+
 
 class TestConvergence(object):
     @classmethod
@@ -2068,6 +2105,51 @@ def test_non_invertible_hessian_fails_summary():
     res.summary()
 
 
+def test_absorb_poisson():
+    # PPML with absorbed fixed effects and with dummy variables
+    import pandas as pd
+    np.random.seed(987)
+    nobs = 1000
+    firm = np.random.randint(0, 40, size=nobs)
+    year = np.random.randint(0, 8, size=nobs)
+    exog = np.random.randn(nobs, 2) + 0.02 * firm[:, None]
+    endog = np.random.poisson(np.exp(exog.dot([0.3, -0.2]) + 0.02 * firm -
+                                     0.05 * year))
+    exposure = np.random.uniform(1, 2, size=nobs)
+    dummies = np.column_stack((pd.get_dummies(firm).values,
+                               pd.get_dummies(year).values[:, 1:]))
+    exog_dummies = np.column_stack((exog, dummies.astype(float)))
+    absorb = np.column_stack((firm, year))
+    cluster = firm // 4
+
+    mod1 = GLM(endog, exog, family=sm.families.Poisson(), absorb=absorb,
+               exposure=exposure)
+    mod2 = GLM(endog, exog_dummies, family=sm.families.Poisson(),
+               exposure=exposure)
+    res1, res2 = mod1.fit(), mod2.fit()
+    assert_allclose(res1.params, res2.params[:2], rtol=1e-8)
+    assert_allclose(res1.bse, res2.bse[:2], rtol=1e-7)
+    assert_allclose(res1.llf, res2.llf, rtol=1e-12)
+    assert_allclose(res1.deviance, res2.deviance, rtol=1e-10)
+    assert_allclose(res1.mu, res2.mu, rtol=1e-8)
+    assert_equal(res1.df_resid, res2.df_resid)
+    assert_equal(res1.df_model, 2)
+
+    res1 = mod1.fit(cov_type='HC0')
+    res2 = mod2.fit(cov_type='HC0')
+    assert_allclose(res1.bse, res2.bse[:2], rtol=1e-7)
+
+    # firm effects are nested in the clusters
+    res1 = mod1.fit(cov_type='cluster', cov_kwds={'groups': cluster})
+    res2 = mod2.fit(cov_type='cluster', cov_kwds={'groups': cluster})
+    correction = (nobs - exog_dummies.shape[1]) / (nobs - 2 - 8)
+    assert_allclose(res1.cov_params(), res2.cov_params()[:2, :2] * correction,
+                    rtol=1e-7)
+    res1.summary()
+
+    assert_raises(NotImplementedError, mod1.fit, method='bfgs')
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, '-vvs', '-x', '--pdb'])
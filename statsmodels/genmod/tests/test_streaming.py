@@ -0,0 +1,109 @@
+"""
+Tests for GLM fit to data chunks
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.genmod.generalized_linear_model import GLM
+from statsmodels.genmod import families
+from statsmodels.genmod.streaming import StreamingGLM
+from statsmodels.tools.tools import add_constant
+
+
+def _gen_data(nobs=2000, seed=864213):
+    np.random.seed(seed)
+    exog = add_constant(np.random.randn(nobs, 3))
+    linpred = 0.3 * exog[:, 1:].sum(1)
+    data = dict(
+        exog=exog,
+        poisson=np.random.poisson(np.exp(linpred)),
+        gamma=np.random.gamma(2, np.exp(linpred + 0.5) / 2),
+        offset=np.random.uniform(0, 1, size=nobs),
+        freq_weights=np.random.randint(1, 4, size=nobs).astype(float),
+        var_weights=np.random.uniform(0.5, 2, size=nobs))
+    data['binomial'] = (data['poisson'] > 1).astype(float)
+    return data
+
+
+def _chunker(data, endog, keys, n_chunks=7):
+    nobs = len(data[endog])
+
+    def chunks():
+        for idx in np.array_split(np.arange(nobs), n_chunks):
+            chunk = {'endog': data[endog][idx], 'exog': data['exog'][idx]}
+            for key in keys:
+                chunk[key] = data[key][idx]
+            yield chunk
+    return chunks
+
+
+cases = [(families.Poisson(), 'poisson', ['offset']),
+         (families.Poisson(), 'poisson', ['freq_weights']),
+         (families.Gamma(families.links.log()), 'gamma', ['var_weights']),
+         (families.Binomial(), 'binomial', []),
+         (families.Gaussian(), 'gamma', ['freq_weights', 'var_weights'])]
+
+
+@pytest.mark.parametrize('family, endog, keys', cases)
+@pytest.mark.parametrize('cov_type', ['nonrobust', 'HC0'])
+def test_compare_glm(family, endog, keys, cov_type):
+    data = _gen_data()
+    kwds = dict((key, data[key]) for key in keys)
+    res1 = GLM(data[endog], data['exog'], family=family,
+               **kwds).fit(cov_type=cov_type)
+    res2 = GLM.fit_chunked(_chunker(data, endog, keys), family=family,
+                           cov_type=cov_type)
+    assert_allclose(res2.params, res1.params, rtol=1e-7)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-7)
+    assert_allclose(res2.scale, res1.scale, rtol=1e-7)
+    assert_allclose(res2.deviance, res1.deviance, rtol=1e-10)
+    assert_allclose(res2.pearson_chi2, res1.pearson_chi2, rtol=1e-7)
+    assert_allclose(res2.llf, res1.llf, rtol=1e-10)
+    assert_allclose(res2.null_deviance, res1.null_deviance, rtol=1e-8)
+    assert_allclose(res2.llnull, res1.llnull, rtol=1e-8)
+    assert_allclose(res2.aic, res1.aic, rtol=1e-10)
+    assert_allclose(res2.bic, res1.bic, rtol=1e-10)
+    assert_equal(res2.df_resid, res1.df_resid)
+    assert_equal(res2.df_model, res1.df_model)
+    assert_equal(res2.nobs, res1.nobs)
+    assert res2.converged
+    assert_equal(res2.cov_type, cov_type)
+    res2.summary()
+
+
+def test_pandas_sequence():
+    data = _gen_data()
+    exog = pd.DataFrame(data['exog'], columns=['const', 'a', 'b', 'c'])
+    endog = pd.Series(data['poisson'], name='y')
+    chunks = [(endog.iloc[i:i + 500], exog.iloc[i:i + 500])
+              for i in range(0, len(endog), 500)]
+    res1 = GLM(endog, exog, family=families.Poisson()).fit()
+    res2 = StreamingGLM(chunks, family=families.Poisson()).fit()
+    assert isinstance(res2.params, pd.Series)
+    assert_equal(res2.params.index.tolist(), ['const', 'a', 'b', 'c'])
+    assert_equal(res2.model.endog_names, 'y')
+    assert_allclose(res2.params, res1.params, rtol=1e-8)
+    assert_allclose(res2.predict(exog.iloc[:5]), res1.fittedvalues[:5],
+                    rtol=1e-8)
+
+
+def test_errors():
+    data = _gen_data()
+    chunks = _chunker(data, 'poisson', [])
+    with pytest.raises(ValueError):
+        StreamingGLM(chunks(), family=families.Poisson())
+    with pytest.raises(ValueError):
+        GLM.fit_chunked(chunks, family=families.Poisson(), cov_type='HC1')
+    res = GLM.fit_chunked(chunks, family=families.Poisson())
+    with pytest.raises(NotImplementedError):
+        res.resid_pearson
+    with pytest.raises(NotImplementedError):
+        res.fittedvalues
+    with pytest.raises(NotImplementedError):
+        res.null
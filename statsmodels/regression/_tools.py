@@ -1,6 +1,9 @@
 from collections import namedtuple
 import numpy as np
-from statsmodels.tools.tools import Bunch
+from scipy import linalg
+
+from statsmodels.tools.data import _is_sparse
+from statsmodels.tools.tools import Bunch, _cross_product, _multiply_rows
 
 _MinimalWLSModel = namedtuple('_MinimalWLSModel', ['weights'])
 
@@ -46,7 +49,7 @@ class _MinimalWLS(object):
         if np.isscalar(weights):
             self.wexog = w_half * exog
         else:
-            self.wexog = w_half[:, None] * exog
+            self.wexog = _multiply_rows(exog, w_half)
 
     def fit(self, method='pinv'):
         """
@@ -62,6 +65,10 @@ class _MinimalWLS(object):
               * "qr" uses the QR factorization.
               * "lstsq" uses the least squares implementation in numpy.linalg
 
+            If exog is a scipy.sparse matrix, then the normal equations are
+            solved with the Cholesky factorization of the dense p x p
+            cross-product matrix for all methods.
+
         Returns
         -------
         results : namedtuple
@@ -82,7 +89,14 @@ class _MinimalWLS(object):
         --------
         statsmodels.regression.linear_model.WLS
         """
-        if method == 'pinv':
+        if _is_sparse(self.wexog):
+            xtx = _cross_product(self.wexog)
+            xty = self.wexog.T.dot(self.wendog)
+            try:
+                params = linalg.cho_solve(linalg.cho_factor(xtx), xty)
+            except linalg.LinAlgError:
+                params = np.linalg.pinv(xtx).dot(xty)
+        elif method == 'pinv':
             pinv_wexog = np.linalg.pinv(self.wexog)
             params = pinv_wexog.dot(self.wendog)
         elif method == 'qr':
@@ -99,3 +113,91 @@ class _MinimalWLS(object):
 
         return Bunch(params=params, fittedvalues=fitted_values, resid=resid,
                      model=self, scale=scale)
+
+
+class _WLSWorkspace(object):
+    """
+    Repeated WLS fits with a fixed design matrix and changing weights.
+
+    Used in the iterations of IRLS. The weighted design matrix is written
+    into a buffer that is allocated once, and the normal equations are
+    solved by the Cholesky factorization of the cross-product matrix after
+    scaling it to unit diagonal. Singular and ill-conditioned problems fall
+    back to `numpy.linalg.lstsq` on the weighted data, as in `_MinimalWLS`.
+
+    Parameters
+    ----------
+    exog : ndarray
+        A dense nobs x k design matrix.
+    rcond : float, optional
+        Fall back to lstsq if the reciprocal condition number of the scaled
+        cross-product matrix, the square of that of the weighted exog, is
+        smaller than `rcond`.
+
+    Notes
+    -----
+    Does not perform any checks on the input data
+    """
+
+    def __init__(self, exog, rcond=1e-8):
+        self.exog = exog
+        self.rcond = rcond
+        self.wexog = np.empty(exog.shape)
+        self.wendog = np.empty(exog.shape[0])
+        self._w_half = np.empty(exog.shape[0])
+        self._factor = None
+
+    def fit(self, endog, weights):
+        """
+        WLS estimate for the given endog and weights.
+
+        Parameters
+        ----------
+        endog : ndarray
+            1-d endogenous response variable.
+        weights : ndarray
+            1-d array of weights.
+
+        Returns
+        -------
+        results : Bunch
+            Bunch with the parameter estimates in `params`.
+        """
+        w_half = np.sqrt(weights, out=self._w_half)
+        wexog = np.multiply(self.exog, w_half[:, None], out=self.wexog)
+        wendog = np.multiply(endog, w_half, out=self.wendog)
+
+        xtx = np.dot(wexog.T, wexog)
+        xty = np.dot(wexog.T, wendog)
+        diag = np.sqrt(np.diag(xtx))
+        self._factor = None
+        if (diag > 0).all():
+            xtx /= diag
+            xtx /= diag[:, None]
+            sv = np.linalg.svd(xtx, compute_uv=False)
+            if sv[-1] > self.rcond * sv[0]:
+                try:
+                    chol = linalg.cho_factor(xtx, check_finite=False)
+                    self._factor = (chol, diag)
+                except linalg.LinAlgError:
+                    pass
+
+        if self._factor is not None:
+            params = linalg.cho_solve(chol, xty / diag) / diag
+        else:
+            params = np.linalg.lstsq(wexog, wendog, rcond=-1)[0]
+        return Bunch(params=params)
+
+    def normalized_cov_params(self):
+        """
+        Inverse of the weighted cross-product matrix of the last fit.
+
+        The pseudoinverse, as in WLS with method 'pinv', if the last fit
+        fell back to lstsq.
+        """
+        if self._factor is None:
+            pinv_wexog = np.linalg.pinv(self.wexog)
+            return np.dot(pinv_wexog, pinv_wexog.T)
+        chol, diag = self._factor
+        k = len(diag)
+        return linalg.cho_solve(chol, np.eye(k)) / np.outer(diag, diag)
@@ -37,11 +37,14 @@ from statsmodels.compat.python import lrange, lzip, range
 
 import numpy as np
 from scipy.linalg import toeplitz
+from scipy import linalg
 from scipy import stats
 from scipy import optimize
 
 from statsmodels.compat.numpy import np_matrix_rank
-from statsmodels.tools.tools import add_constant, chain_dot, pinv_extended
+from statsmodels.tools.tools import (add_constant, chain_dot, pinv_extended,
+                                     _cross_product, _multiply_rows)
+from statsmodels.tools.data import _is_sparse
 from statsmodels.tools.decorators import (resettable_cache,
                                           cache_readonly,
                                           cache_writable)
@@ -57,7 +60,8 @@ from . import _prediction as pred
 
 __docformat__ = 'restructuredtext en'
 
-__all__ = ['GLS', 'WLS', 'OLS', 'GLSAR', 'PredictionResults']
+__all__ = ['GLS', 'WLS', 'OLS', 'GLSAR', 'BatchOLS',
+           'PredictionResults']
 
 
 _fit_regularized_doc =\
@@ -143,6 +147,27 @@ _fit_regularized_doc =\
         Statistical Software 33(1), 1-22 Feb 2010.
         """
 
+_absorb_param_doc = """    absorb : array-like, optional
+        Group labels of one or more factors, 1d or 2d (nobs, n_factors),
+        whose fixed effects are partialled out of endog and exog instead of
+        being included as dummy variables. exog must not include a
+        constant. See Notes.
+"""
+
+_absorb_notes_doc = """
+    If `absorb` is given, then the fixed effects of the group factors are
+    absorbed by demeaning endog and exog within the groups with the method
+    of alternating projections. The parameters and their covariances are
+    the same as in the regression that includes the dummy variables of all
+    factors. `df_resid` is reduced by the number of absorbed effects,
+    `df_absorb`. `resid` are the residuals of the regression with dummy
+    variables, `fittedvalues` include the fixed effects, while `predict`
+    only uses exog and the parameters. rsquared is the within R-squared.
+    In cluster robust covariances the absorbed effects of factors that are
+    nested within the clusters are not counted in the small sample
+    correction.
+"""
+
 
 def _get_sigma(sigma, nobs):
     """
@@ -169,6 +194,20 @@ def _get_sigma(sigma, nobs):
     return sigma, cholsigmainv
 
 
+def _lsqr(exog, endog):
+    """least squares solution by LSQR for each column of endog"""
+    from scipy.sparse.linalg import lsqr
+
+    def solve(y):
+        return lsqr(exog, y, atol=1e-14, btol=1e-14, conlim=1e14,
+                    iter_lim=10 * exog.shape[1] + 100)[0]
+
+    if endog.ndim == 1:
+        return solve(endog)
+    return np.column_stack([solve(endog[:, i])
+                            for i in range(endog.shape[1])])
+
+
 class RegressionModel(base.LikelihoodModel):
     """
     Base class for linear regression models. Should not be directly called.
@@ -176,12 +215,21 @@ class RegressionModel(base.LikelihoodModel):
     Intended for subclassing.
     """
     def __init__(self, endog, exog, **kwargs):
+        absorb = kwargs.get('absorb', None)
+        if (absorb is not None and np.ndim(absorb) == 2 and
+                kwargs.get('missing', 'none') != 'none'):
+            raise NotImplementedError('missing data handling is only '
+                                      'available for a 1d absorb')
         super(RegressionModel, self).__init__(endog, exog, **kwargs)
         self._data_attr.extend(['pinv_wexog', 'wendog', 'wexog', 'weights'])
 
     def initialize(self):
-        self.wexog = self.whiten(self.exog)
-        self.wendog = self.whiten(self.endog)
+        self.df_absorb = 0
+        if getattr(self, 'absorb', None) is not None:
+            self._initialize_absorb()
+        else:
+            self.wexog = self.whiten(self.exog)
+            self.wendog = self.whiten(self.endog)
         # overwrite nobs from class Model:
         self.nobs = float(self.wexog.shape[0])
 
@@ -189,6 +237,42 @@ class RegressionModel(base.LikelihoodModel):
         self._df_resid = None
         self.rank = None
 
+    def _initialize_absorb(self):
+        """
+        Partial out the fixed effects of the factors in `absorb`
+
+        wendog and wexog are the whitened within transformed variables.
+        """
+        from statsmodels.tools.grouputils import (
+            _group_codes, _demean_codes, _absorbed_df_codes)
+        if _is_sparse(self.exog):
+            raise NotImplementedError('absorb is not available for sparse '
+                                      'exog')
+        if getattr(self, 'sigma', None) is not None:
+            raise NotImplementedError('absorb is not available with sigma')
+        if self.data.const_idx is not None:
+            raise ValueError('exog includes a constant which is absorbed '
+                             'by the fixed effects, drop it')
+
+        self._absorb_codes = codes = _group_codes(self.absorb)
+        for code in codes:
+            if len(code) != self.exog.shape[0]:
+                raise ValueError('absorb needs to have the same number of '
+                                 'observations as exog')
+        weights = getattr(self, 'weights', None)
+        if weights is not None:
+            weights = np.broadcast_to(weights, (self.exog.shape[0],))
+
+        endog = self.endog
+        k_endog = 1 if endog.ndim == 1 else endog.shape[1]
+        xy = np.column_stack((endog, self.exog))
+        xy, self._absorb_iter = _demean_codes(xy, codes, weights=weights)
+        xy = self.whiten(xy)
+        self.wendog = xy[:, 0] if endog.ndim == 1 else xy[:, :k_endog]
+        self.wexog = xy[:, k_endog:]
+        self.df_absorb = _absorbed_df_codes(codes)
+        self.k_constant = 0
+
     @property
     def df_model(self):
         """
@@ -225,6 +309,13 @@ class RegressionModel(base.LikelihoodModel):
     def whiten(self, X):
         raise NotImplementedError("Subclasses should implement.")
 
+    def _reset_fit_cache(self):
+        """remove the cached decomposition of wexog used by fit"""
+        for attr in ['pinv_wexog', 'wexog_cholesky', 'exog_Q', 'exog_R',
+                     'normalized_cov_params']:
+            if hasattr(self, attr):
+                delattr(self, attr)
+
     def fit(self, method="pinv", cov_type='nonrobust', cov_kwds=None,
             use_t=None, **kwargs):
         """
@@ -236,9 +327,14 @@ class RegressionModel(base.LikelihoodModel):
         Parameters
         ----------
         method : str, optional
-            Can be "pinv", "qr".  "pinv" uses the Moore-Penrose pseudoinverse
-            to solve the least squares problem. "qr" uses the QR
-            factorization.
+            Can be "pinv", "qr", "cholesky" or "lsqr".  "pinv" uses the
+            Moore-Penrose pseudoinverse to solve the least squares problem.
+            "qr" uses the QR factorization. "cholesky" solves the normal
+            equations with the Cholesky factorization of the p x p
+            cross-product matrix and does not create arrays of size p x n,
+            see Notes. "lsqr" computes the parameters with the iterative
+            LSQR solver of scipy.sparse.linalg, which works directly on the
+            design matrix.
         cov_type : str, optional
             See `regression.linear_model.RegressionResults` for a description
             of the available covariance estimators
@@ -264,7 +360,56 @@ class RegressionModel(base.LikelihoodModel):
         -----
         The fit method uses the pseudoinverse of the design/exogenous variables
         to solve the least squares minimization.
+
+        With method "cholesky" the model does not have the attribute
+        `pinv_wexog`. The heteroscedasticity robust covariances and the
+        influence measures are then computed from `normalized_cov_params`
+        instead. This method squares the condition number of the design
+        matrix. If the cross-product matrix is singular, then its
+        pseudoinverse is used instead of the Cholesky factorization.
+        With method "lsqr", `normalized_cov_params` is also computed from the
+        cross-product matrix.
+
+        If exog is a scipy.sparse matrix, then the design matrix is not
+        converted to a dense array. "pinv" then uses "cholesky", and "qr" is
+        not available. The cross-product matrix is a dense p x p array.
+        Only the nonrobust and the HC0 to HC3 covariances are available.
         """
+        beta = self._fit_ls(method)
+
+        if self._df_model is None:
+            self._df_model = float(self.rank - self.k_constant)
+        if self._df_resid is None:
+            self.df_resid = self.nobs - self.rank - self.df_absorb
+
+        if isinstance(self, OLS):
+            lfit = OLSResults(
+                self, beta,
+                normalized_cov_params=self.normalized_cov_params,
+                cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t)
+        else:
+            lfit = RegressionResults(
+                self, beta,
+                normalized_cov_params=self.normalized_cov_params,
+                cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t,
+                **kwargs)
+        return RegressionResultsWrapper(lfit)
+
+    def _fit_ls(self, method="pinv"):
+        """
+        Least squares estimate of the parameters for `fit`
+
+        The decomposition of `wexog` is attached to the model and reused in
+        later calls. `wendog` can be 2-dimensional, in which case the
+        columns share the decomposition.
+        """
+        if _is_sparse(self.wexog):
+            if method == "pinv":
+                method = "cholesky"
+            elif method == "qr":
+                raise ValueError('method "qr" is not available for sparse '
+                                 'exog')
+
         if method == "pinv":
             if not (hasattr(self, 'pinv_wexog') and
                     hasattr(self, 'normalized_cov_params') and
@@ -299,23 +444,42 @@ class RegressionModel(base.LikelihoodModel):
             self.effects = effects = np.dot(Q.T, self.wendog)
             beta = np.linalg.solve(R, effects)
 
-        if self._df_model is None:
-            self._df_model = float(self.rank - self.k_constant)
-        if self._df_resid is None:
-            self.df_resid = self.nobs - self.rank
+        elif method in ("cholesky", "lsqr"):
+            if not (hasattr(self, 'wexog_cholesky') and
+                    hasattr(self, 'normalized_cov_params') and
+                    hasattr(self, 'rank')):
+                xtx = _cross_product(self.wexog)
+                eigvals = np.linalg.eigvalsh(xtx)[::-1]
+                singular_values = np.sqrt(np.clip(eigvals, 0, np.inf))
+                self.wexog_singular_values = singular_values
+                self.rank = np_matrix_rank(np.diag(singular_values))
+
+                self.wexog_cholesky = None
+                if self.rank == xtx.shape[0]:
+                    try:
+                        self.wexog_cholesky = np.linalg.cholesky(xtx)
+                    except np.linalg.LinAlgError:
+                        pass
+                if self.wexog_cholesky is not None:
+                    self.normalized_cov_params = linalg.cho_solve(
+                        (self.wexog_cholesky, True), np.eye(xtx.shape[0]))
+                else:
+                    self.normalized_cov_params = np.linalg.pinv(xtx)
+
+            if method == "lsqr":
+                beta = _lsqr(self.wexog, self.wendog)
+            elif self.wexog_cholesky is not None:
+                xty = self.wexog.T.dot(self.wendog)
+                beta = linalg.cho_solve((self.wexog_cholesky, True), xty)
+            else:
+                xty = self.wexog.T.dot(self.wendog)
+                beta = np.dot(self.normalized_cov_params, xty)
 
-        if isinstance(self, OLS):
-            lfit = OLSResults(
-                self, beta,
-                normalized_cov_params=self.normalized_cov_params,
-                cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t)
         else:
-            lfit = RegressionResults(
-                self, beta,
-                normalized_cov_params=self.normalized_cov_params,
-                cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t,
-                **kwargs)
-        return RegressionResultsWrapper(lfit)
+            raise ValueError('method has to be "pinv", "qr", "cholesky" or '
+                             '"lsqr"')
+
+        return beta
 
     def predict(self, params, exog=None):
         """
@@ -341,6 +505,8 @@ class RegressionModel(base.LikelihoodModel):
 
         if exog is None:
             exog = self.exog
+        if _is_sparse(exog):
+            return exog.dot(params)
 
         return np.dot(exog, params)
 
@@ -403,6 +569,7 @@ class GLS(RegressionModel):
 
     pinv_wexog : array
         `pinv_wexog` is the p x n Moore-Penrose pseudoinverse of `wexog`.
+        Only available after fit with method "pinv".
     cholsimgainv : array
         The transpose of the Cholesky decomposition of the pseudoinverse.
     df_model : float
@@ -529,7 +696,7 @@ class GLS(RegressionModel):
         """
         # TODO: combine this with OLS/WLS loglike and add _det_sigma argument
         nobs2 = self.nobs / 2.0
-        SSR = np.sum((self.wendog - np.dot(self.wexog, params))**2, axis=0)
+        SSR = np.sum((self.wendog - self.wexog.dot(params))**2, axis=0)
         llf = -np.log(SSR) * nobs2      # concentrated likelihood
         llf -= (1+np.log(np.pi/nobs2))*nobs2  # with likelihood constant
         if np.any(self.sigma):
@@ -641,8 +808,10 @@ class WLS(RegressionModel):
     If the weights are a function of the data, then the post estimation
     statistics such as fvalue and mse_model might not be correct, as the
     package does not yet support no-constant regression.
-    """ % {'params': base._model_params_doc,
-           'extra_params': base._missing_param_doc + base._extra_param_doc}
+    %(absorb_notes)s""" % {'params': base._model_params_doc,
+           'extra_params': (base._missing_param_doc + base._extra_param_doc +
+                            _absorb_param_doc),
+           'absorb_notes': _absorb_notes_doc}
 
     def __init__(self, endog, exog, weights=1., missing='none', hasconst=None,
                  **kwargs):
@@ -683,6 +852,8 @@ class WLS(RegressionModel):
             sqrt(weights)*X
         """
 
+        if _is_sparse(X):
+            return _multiply_rows(X, np.sqrt(self.weights))
         X = np.asarray(X)
         if X.ndim == 1:
             return X * np.sqrt(self.weights)
@@ -713,7 +884,7 @@ class WLS(RegressionModel):
         where :math:`W` is a diagonal matrix
         """
         nobs2 = self.nobs / 2.0
-        SSR = np.sum((self.wendog - np.dot(self.wexog, params))**2, axis=0)
+        SSR = np.sum((self.wendog - self.wexog.dot(params))**2, axis=0)
         llf = -np.log(SSR) * nobs2      # concentrated likelihood
         llf -= (1+np.log(np.pi/nobs2))*nobs2  # with constant
         llf += 0.5 * np.sum(np.log(self.weights))
@@ -807,8 +978,10 @@ class OLS(WLS):
     Notes
     -----
     No constant is added by the model unless you are using formulas.
-    """ % {'params': base._model_params_doc,
-           'extra_params': base._missing_param_doc + base._extra_param_doc}
+    %(absorb_notes)s""" % {'params': base._model_params_doc,
+           'extra_params': (base._missing_param_doc + base._extra_param_doc +
+                            _absorb_param_doc),
+           'absorb_notes': _absorb_notes_doc}
 
     # TODO: change example to use datasets.  This was the point of datasets!
     def __init__(self, endog, exog=None, missing='none', hasconst=None,
@@ -837,7 +1010,7 @@ class OLS(WLS):
         """
         nobs2 = self.nobs / 2.0
         nobs = float(self.nobs)
-        resid = self.endog - np.dot(self.exog, params)
+        resid = self.wendog - self.wexog.dot(params)
         if hasattr(self, 'offset'):
             resid -= self.offset
         ssr = np.sum(resid**2)
@@ -897,8 +1070,8 @@ class OLS(WLS):
         if hasattr(self, 'offset'):
             y = y - self.offset
         self._wendog_xprod = np.sum(y * y)
-        self._wexog_xprod = np.dot(self.wexog.T, self.wexog)
-        self._wexog_x_wendog = np.dot(self.wexog.T, y)
+        self._wexog_xprod = _cross_product(self.wexog)
+        self._wexog_x_wendog = self.wexog.T.dot(y)
 
     def hessian(self, params, scale=None):
         """
@@ -1001,6 +1174,70 @@ class OLS(WLS):
 
     fit_regularized.__doc__ = _fit_regularized_doc
 
+    def fit_regularized_path(self, alphas=None, L1_wt=1., n_alphas=100,
+                             alpha_min_ratio=1e-3, penalty_wts=None,
+                             **kwargs):
+        """
+        Return elastic net fits for a decreasing sequence of penalties.
+
+        Parameters
+        ----------
+        alphas : array-like, optional
+            Decreasing sequence of scalar penalty weights.  If not
+            provided, `n_alphas` values are used that are equally spaced
+            on the log scale between the smallest penalty weight at which
+            all penalized coefficients are zero and `alpha_min_ratio`
+            times that value.
+        L1_wt : scalar
+            The fraction of the penalty given to the L1 penalty term.
+        n_alphas : int
+            The number of penalty weights if `alphas` is not provided.
+        alpha_min_ratio : float
+            The ratio of the smallest to the largest penalty weight if
+            `alphas` is not provided.
+        penalty_wts : array-like, optional
+            Relative penalty weight of each coefficient.  Use a zero
+            weight for coefficients that are not penalized, e.g. the
+            constant.  Defaults to ones.
+        kwargs
+            Additional keyword arguments for
+            `statsmodels.base.elastic_net.fit_elasticnet_path`, e.g.
+            `strong_rules`, `maxiter`, `cnvrg_tol` and `zero_tol`.
+
+        Returns
+        -------
+        A RegularizationPathResults instance.
+
+        Notes
+        -----
+        At each penalty weight the objective function of
+        `fit_regularized` with ``profile_scale=False`` is minimized.
+        The fits are warm started from the previous penalty weight and
+        use strong rule screening.  The Gram matrix ``exog' exog / nobs``
+        is computed once, and the coordinate descent for all penalty
+        weights only updates the gradient with columns of the Gram
+        matrix, so the cost of the path after the first pass through the
+        data does not depend on the number of observations.
+        """
+        from statsmodels.base.elastic_net import fit_elasticnet_path
+
+        nobs = self.wexog.shape[0]
+        xtx = np.dot(self.wexog.T, self.wexog) / nobs
+        xty = np.dot(self.wexog.T, self.wendog) / nobs
+
+        defaults = {"maxiter": 1000, "cnvrg_tol": 1e-10, "zero_tol": 1e-10}
+        defaults.update(kwargs)
+
+        return fit_elasticnet_path(self, alphas=alphas, L1_wt=L1_wt,
+                                   n_alphas=n_alphas,
+                                   alpha_min_ratio=alpha_min_ratio,
+                                   penalty_wts=penalty_wts,
+                                   gram=(xtx, xty),
+                                   loglike_kwds={"scale": 1},
+                                   score_kwds={"scale": 1},
+                                   hess_kwds={"scale": 1},
+                                   **defaults)
+
     def _fit_ridge(self, alpha):
         """
         Fit a linear model using ridge regression.
@@ -1038,6 +1275,74 @@ class OLS(WLS):
         return RegularizedResults(self, params)
 
 
+class BatchOLS(OLS):
+    __doc__ = """
+    Ordinary least squares for many dependent variables with one design
+
+    All columns of `endog` are regressed on the same `exog`. The design
+    matrix is decomposed only once and the parameters for all columns are
+    obtained in one solve.
+
+    Parameters
+    ----------
+    endog : array-like
+        2-d endogenous response variables, one column per regression.
+    exog : array-like
+        A nobs x k array where `nobs` is the number of observations and `k`
+        is the number of regressors. An intercept is not included by default
+        and should be added by the user. See
+        :func:`statsmodels.tools.add_constant`.
+    %(extra_params)s
+
+    See Also
+    --------
+    OLS
+
+    Notes
+    -----
+    If `missing` is 'drop', then an observation is dropped for all columns
+    of `endog` if any of them is missing.
+
+    Examples
+    --------
+    >>> res = BatchOLS(Y, X).fit()
+    >>> res.params          # k x n_endog array of parameters
+    >>> res.rsquared        # one value for each column of Y
+    >>> res.get_results(3).summary()
+    """ % {'extra_params': base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, missing='none', hasconst=None,
+                 **kwargs):
+        super(BatchOLS, self).__init__(endog, exog, missing=missing,
+                                       hasconst=hasconst, **kwargs)
+        if self.endog.ndim != 2:
+            raise ValueError("endog needs to be 2-dimensional")
+        self.missing = missing
+
+    def fit(self, method="pinv"):
+        """
+        Fit all regressions using one decomposition of the design matrix
+
+        Parameters
+        ----------
+        method : str, optional
+            "pinv", "qr" or "cholesky", see `RegressionModel.fit`.
+
+        Returns
+        -------
+        BatchOLSResults
+        """
+        params = self._fit_ls(method)
+        if self._df_model is None:
+            self._df_model = float(self.rank - self.k_constant)
+        if self._df_resid is None:
+            self.df_resid = self.nobs - self.rank
+        res = BatchOLSResults(self, params,
+                              normalized_cov_params=self.normalized_cov_params,
+                              method=method)
+        return BatchOLSResultsWrapper(res)
+
+
 class GLSAR(GLS):
     __doc__ = """
     A regression model with an AR(p) covariance structure.
@@ -1136,8 +1441,7 @@ class GLSAR(GLS):
         i = -1  # need to initialize for maxiter < 1 (skip loop)
         history = {'params': [], 'rho': [self.rho]}
         for i in range(maxiter - 1):
-            if hasattr(self, 'pinv_wexog'):
-                del self.pinv_wexog
+            self._reset_fit_cache()
             self.initialize()
             results = self.fit()
             history['params'].append(results.params)
@@ -1157,8 +1461,7 @@ class GLSAR(GLS):
         # Use kwarg to insert history
         if not converged and maxiter > 0:
             # maxiter <= 0 just does OLS
-            if hasattr(self, 'pinv_wexog'):
-                del self.pinv_wexog
+            self._reset_fit_cache()
             self.initialize()
 
         # if converged then this is a duplicate fit, because we didn't
@@ -1491,6 +1794,9 @@ class RegressionResults(base.LikelihoodModelResults):
 
     @cache_readonly
     def fittedvalues(self):
+        if getattr(self.model, 'df_absorb', 0):
+            # include the absorbed fixed effects
+            return self.model.endog - self.resid
         return self.model.predict(self.params, self.model.exog)
 
     @cache_readonly
@@ -1500,6 +1806,12 @@ class RegressionResults(base.LikelihoodModelResults):
 
     @cache_readonly
     def resid(self):
+        if getattr(self.model, 'df_absorb', 0):
+            # residuals of the within regression, unwhitened
+            weights = getattr(self.model, 'weights', None)
+            if weights is None:
+                return self.wresid
+            return self.wresid / np.sqrt(weights)
         return self.model.endog - self.model.predict(
             self.params, self.model.exog)
 
@@ -1634,10 +1946,24 @@ class RegressionResults(base.LikelihoodModelResults):
 
     # TODO: make these properties reset bse
     def _HCCM(self, scale):
-        H = np.dot(self.model.pinv_wexog,
-                   scale[:, None] * self.model.pinv_wexog.T)
+        if hasattr(self.model, 'pinv_wexog'):
+            H = np.dot(self.model.pinv_wexog,
+                       scale[:, None] * self.model.pinv_wexog.T)
+        else:
+            # avoid the p x n pseudoinverse, e.g. after fit with cholesky
+            xxi = self.normalized_cov_params
+            H = chain_dot(xxi, _cross_product(self.model.wexog, scale), xxi)
         return H
 
+    @cache_readonly
+    def _wexog_leverage(self):
+        """diagonal of the hat matrix of the whitened design"""
+        wexog = self.model.wexog
+        xc = wexog.dot(self.normalized_cov_params)
+        if _is_sparse(wexog):
+            return np.asarray(wexog.multiply(xc).sum(1)).ravel()
+        return (xc * wexog).sum(1)
+
     @cache_readonly
     def cov_HC0(self):
         """
@@ -1664,10 +1990,7 @@ class RegressionResults(base.LikelihoodModelResults):
         See statsmodels.RegressionResults
         """
 
-        # probably could be optimized
-        h = np.diag(chain_dot(self.model.wexog,
-                              self.normalized_cov_params,
-                              self.model.wexog.T))
+        h = self._wexog_leverage
         self.het_scale = self.wresid**2/(1-h)
         cov_HC2 = self._HCCM(self.het_scale)
         return cov_HC2
@@ -1677,8 +2000,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         See statsmodels.RegressionResults
         """
-        h = np.diag(chain_dot(
-            self.model.wexog, self.normalized_cov_params, self.model.wexog.T))
+        h = self._wexog_leverage
         self.het_scale = (self.wresid / (1 - h))**2
         cov_HC3 = self._HCCM(self.het_scale)
         return cov_HC3
@@ -2772,6 +3094,159 @@ class OLSResults(RegressionResults):
         return (lowerl, upperl)
 
 
+class BatchOLSResults(object):
+    """
+    Results of least squares regressions of many variables on one design
+
+    The statistics are arrays with one column, or element, for each column
+    of `endog`. Results for a single column are available as a
+    `RegressionResults` instance from `get_results`.
+
+    Attributes
+    ----------
+    params : ndarray
+        k_vars x k_endog array of parameter estimates.
+    bse, tvalues, pvalues : ndarray
+        k_vars x k_endog arrays of standard errors, t-statistics and
+        two-sided p-values based on the t distribution.
+    scale : ndarray
+        Residual variance estimate for each column, `ssr / df_resid`.
+    ssr, rsquared, rsquared_adj, fvalue, f_pvalue, llf : ndarray
+        Sum of squared residuals, R-squared, adjusted R-squared, F-statistic
+        of the regression, its p-value and log-likelihood for each column.
+    df_model, df_resid, nobs : float
+        Degrees of freedom and number of observations, shared by all
+        columns.
+    """
+
+    def __init__(self, model, params, normalized_cov_params=None,
+                 method="pinv"):
+        self.model = model
+        self.params = params
+        self.normalized_cov_params = normalized_cov_params
+        self.method = method
+        self.nobs = model.nobs
+        self.df_model = model.df_model
+        self.df_resid = model.df_resid
+        self.k_constant = model.k_constant
+        self._column_results = {}
+        self._cache = resettable_cache()
+
+    @cache_readonly
+    def fittedvalues(self):
+        return np.dot(self.model.exog, self.params)
+
+    @cache_readonly
+    def resid(self):
+        return self.model.endog - self.fittedvalues
+
+    @cache_readonly
+    def ssr(self):
+        wresid = self.model.wendog - np.dot(self.model.wexog, self.params)
+        return (wresid**2).sum(0)
+
+    @cache_readonly
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def bse(self):
+        var_params = np.diag(self.normalized_cov_params)
+        return np.sqrt(var_params[:, None] * self.scale)
+
+    @cache_readonly
+    def tvalues(self):
+        return self.params / self.bse
+
+    @cache_readonly
+    def pvalues(self):
+        return stats.t.sf(np.abs(self.tvalues), self.df_resid) * 2
+
+    @cache_readonly
+    def centered_tss(self):
+        wendog = self.model.wendog
+        return ((wendog - wendog.mean(0))**2).sum(0)
+
+    @cache_readonly
+    def uncentered_tss(self):
+        return (self.model.wendog**2).sum(0)
+
+    @cache_readonly
+    def ess(self):
+        if self.k_constant:
+            return self.centered_tss - self.ssr
+        else:
+            return self.uncentered_tss - self.ssr
+
+    @cache_readonly
+    def rsquared(self):
+        if self.k_constant:
+            return 1 - self.ssr / self.centered_tss
+        else:
+            return 1 - self.ssr / self.uncentered_tss
+
+    @cache_readonly
+    def rsquared_adj(self):
+        return 1 - (np.divide(self.nobs - self.k_constant, self.df_resid)
+                    * (1 - self.rsquared))
+
+    @cache_readonly
+    def fvalue(self):
+        return (self.ess / self.df_model) / (self.ssr / self.df_resid)
+
+    @cache_readonly
+    def f_pvalue(self):
+        return stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    @cache_readonly
+    def llf(self):
+        nobs2 = self.nobs / 2.0
+        return -nobs2 * (np.log(2 * np.pi * self.ssr / self.nobs) + 1)
+
+    @cache_readonly
+    def aic(self):
+        return -2 * self.llf + 2 * (self.df_model + self.k_constant)
+
+    @cache_readonly
+    def bic(self):
+        return (-2 * self.llf + np.log(self.nobs) * (self.df_model +
+                                                     self.k_constant))
+
+    def get_results(self, idx):
+        """
+        Results of the regression for one column of endog
+
+        Parameters
+        ----------
+        idx : int
+            Index of the column of `endog`.
+
+        Returns
+        -------
+        OLSResults
+            The results are created when they are first requested and
+            reuse the decomposition of the design matrix.
+        """
+        if idx not in self._column_results:
+            model = self.model
+            endog = model.data.orig_endog
+            exog = model.data.orig_exog
+            if hasattr(endog, 'iloc'):
+                endog = endog.iloc[:, idx]
+            else:
+                endog = model.endog[:, idx]
+                exog = model.exog
+            mod = OLS(endog, exog, missing=model.missing,
+                      hasconst=bool(model.k_constant))
+            for attr in ['pinv_wexog', 'exog_Q', 'exog_R', 'wexog_cholesky',
+                         'normalized_cov_params', 'wexog_singular_values',
+                         'rank']:
+                if hasattr(model, attr):
+                    setattr(mod, attr, getattr(model, attr))
+            self._column_results[idx] = mod.fit(method=self.method)
+        return self._column_results[idx]
+
+
 class RegressionResultsWrapper(wrap.ResultsWrapper):
 
     _attrs = {
@@ -2801,6 +3276,23 @@ wrap.populate_wrapper(RegressionResultsWrapper,
                       RegressionResults)
 
 
+class BatchOLSResultsWrapper(wrap.ResultsWrapper):
+    _attrs = {
+        'params': 'columns_eq',
+        'bse': 'columns_eq',
+        'tvalues': 'columns_eq',
+        'pvalues': 'columns_eq',
+        'fittedvalues': 'rows',
+        'resid': 'rows',
+        'normalized_cov_params': 'cov',
+    }
+    _wrap_attrs = _attrs
+    _wrap_methods = {}
+
+wrap.populate_wrapper(BatchOLSResultsWrapper,
+                      BatchOLSResults)
+
+
 if __name__ == "__main__":
     import statsmodels.api as sm
     data = sm.datasets.longley.load()
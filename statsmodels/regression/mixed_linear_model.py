@@ -9,9 +9,11 @@ hierarchical linear models.
 The MixedLM class fits linear mixed effects models to data, and
 provides support for some common post-estimation tasks.  This is a
 group-based implementation that is most efficient for models in which
-the data can be partitioned into independent groups.  Some models with
-crossed effects can be handled by specifying a model with a single
-group.
+the data can be partitioned into independent groups.  Groups with the
+same random effects structure are processed together.  Some models
+with crossed effects can be handled by specifying a model with a
+single group, these use a sparse factorization if the random effects
+design is sparse.
 
 The data are partitioned into disjoint groups.  The probability model
 for group i is:
@@ -148,8 +150,9 @@ import statsmodels.base.model as base
 from scipy.optimize import fmin_ncg, fmin_cg, fmin_bfgs, fmin
 from statsmodels.tools.decorators import cache_readonly
 from statsmodels.tools import data as data_tools
+from statsmodels.tools.numdiff import approx_fprime
 from scipy.stats.distributions import norm
-from scipy import sparse
+from scipy import sparse, linalg
 import pandas as pd
 import patsy
 from statsmodels.compat.collections import OrderedDict
@@ -161,6 +164,10 @@ from statsmodels.base._penalties import Penalty
 from statsmodels.compat.numpy import np_matrix_rank
 from pandas import DataFrame
 
+# The minimum number of columns of a sparse random effects design for
+# which a group is solved with a sparse factorization.
+_sparse_min_re = 100
+
 
 def _dot(x, y):
     """
@@ -175,27 +182,6 @@ def _dot(x, y):
         return y.T.dot(x.T).T
 
 
-# From numpy, adapted to work with sparse and dense arrays.
-def _multi_dot_three(A, B, C):
-    """
-    Find best ordering for three arrays and do the multiplication.
-
-    Doing in manually instead of using dynamic programing is
-    approximately 15 times faster.
-    """
-    # cost1 = cost((AB)C)
-    cost1 = (A.shape[0] * A.shape[1] * B.shape[1] +  # (AB)
-             A.shape[0] * B.shape[1] * C.shape[1])   # (--)C
-    # cost2 = cost((AB)C)
-    cost2 = (B.shape[0] * B.shape[1] * C.shape[1] +  # (BC)
-             A.shape[0] * A.shape[1] * C.shape[1])   # A(--)
-
-    if cost1 < cost2:
-        return _dot(_dot(A, B), C)
-    else:
-        return _dot(A, _dot(B, C))
-
-
 def _dotsum(x, y):
     """
     Returns sum(x * y), where '*' is the pointwise product, computed
@@ -209,6 +195,91 @@ def _dotsum(x, y):
         return np.dot(x.ravel(), y.ravel())
 
 
+def _takahashi_diag(lu):
+    """
+    Returns the diagonal of the inverse of a symmetric matrix from its
+    sparse LU factorization without pivoting, or None if the pattern
+    of the factor does not allow it.
+
+    With Q = L D L', the entries of Q^-1 on the pattern of L are
+    computed with the Takahashi recurrences (a selected inverse),
+    starting from the last column, so that the dense inverse is never
+    formed.  The largest trailing block in which L is at least half
+    filled in, e.g. the columns of the smaller factor of a crossed
+    design, is inverted as a dense matrix.
+    """
+
+    fac = sparse.csc_matrix(lu.L)
+    fac.sort_indices()
+    d = lu.U.diagonal()
+    q = len(d)
+
+    # The number of entries of L in the trailing blocks, compared to
+    # their lower triangles
+    nnz = np.cumsum(np.diff(fac.indptr)[::-1])[::-1]
+    size = q - np.arange(q)
+    dense = np.flatnonzero(2 * nnz >= size * (size + 1) / 2)
+    t0 = dense[0] if len(dense) > 0 else q
+
+    # Q^-1 on the trailing block is the inverse of the Schur complement
+    # L_22 D_2 L_22'
+    li = fac[t0:, t0:].toarray()
+    li = linalg.solve_triangular(li, np.eye(q - t0), lower=True,
+                                 unit_diagonal=True)
+    z22 = np.dot(li.T, li / d[t0:, None])
+
+    # The entries of column j of the inverse below the diagonal, on
+    # the pattern of L
+    rows, vals = [None] * t0, [None] * t0
+    dg = np.empty(q)
+    dg[t0:] = np.diag(z22)
+    for i in range(t0 - 1, -1, -1):
+        ii = slice(fac.indptr[i], fac.indptr[i + 1])
+        r, l = fac.indices[ii], fac.data[ii]
+        r, l = r[r > i], l[r > i]
+        m1 = np.searchsorted(r, t0)
+        zrr = np.empty((len(r), len(r)))
+        zrr[m1:, m1:] = z22[np.ix_(r[m1:] - t0, r[m1:] - t0)]
+        for k in range(m1):
+            j = r[k]
+            zrr[k, k] = dg[j]
+            pos = np.searchsorted(rows[j], r[k + 1:])
+            if len(pos) > 0 and (pos[-1] >= len(rows[j]) or
+                                 (rows[j][pos] != r[k + 1:]).any()):
+                return None
+            zrr[k + 1:, k] = zrr[k, k + 1:] = vals[j][pos]
+        rows[i], vals[i] = r, -np.dot(zrr, l)
+        dg[i] = 1 / d[i] - np.dot(l, vals[i])
+
+    return dg
+
+
+def _sparse_inv_diag(lu):
+    """
+    Returns the diagonal of the inverse of a symmetric matrix from its
+    sparse LU factorization.
+
+    Uses a selected inverse if the factorization was not pivoted, and
+    otherwise solves against blocks of unit vectors.
+    """
+
+    q = lu.shape[0]
+    natural = np.arange(q)
+    if (np.array_equal(lu.perm_r, natural) and
+            np.array_equal(lu.perm_c, natural)):
+        dg = _takahashi_diag(lu)
+        if dg is not None:
+            return dg
+
+    dg = np.empty(q)
+    for j in range(0, q, 256):
+        ix = np.arange(j, min(j + 256, q))
+        e = np.zeros((q, len(ix)))
+        e[ix, ix - j] = 1
+        dg[ix] = lu.solve(e)[ix, ix - j]
+    return dg
+
+
 def _get_exog_re_names(self, exog_re):
     """
     Passes through if given a list of names. Otherwise, gets pandas names
@@ -468,45 +539,6 @@ def _smw_solver(s, A, AtA, BI, di):
     return solver
 
 
-def _smw_logdet(s, A, AtA, BI, di, B_logdet):
-    """
-    Returns the log determinant of s*I + A*B*A'.
-
-    Uses the matrix determinant lemma to accelerate the calculation.
-
-    Parameters
-    ----------
-    s : scalar
-        See above for usage
-    A : square symmetric ndarray
-        See above for usage
-    AtA : square matrix
-        A.T * A
-    BI : square symmetric ndarray
-        The upper left block of B^-1.
-    di : array-like
-        The diagonal elements of the lower right block of B^-1.
-    B_logdet : real
-        The log determinant of B
-
-    Returns
-    -------
-    The log determinant of s*I + A*B*A'.
-    """
-
-    p = A.shape[0]
-    ld = p * np.log(s)
-    qmat = AtA / s
-    m = BI.shape[0]
-    qmat[0:m, 0:m] += BI
-    ix = np.arange(m, A.shape[1])
-    qmat[ix, ix] += di
-    if sparse.issparse(qmat):
-        qmat = qmat.todense()
-    _, ld1 = np.linalg.slogdet(qmat)
-    return B_logdet + ld + ld1
-
-
 class MixedLM(base.LikelihoodModel):
     """
     An object specifying a linear mixed effects model.  Use the `fit`
@@ -720,6 +752,8 @@ class MixedLM(base.LikelihoodModel):
         # Precompute this
         self._lin, self._quad = self._reparam()
 
+        self._setup_blocks()
+
     def _setup_vcomp(self, exog_vc):
         if exog_vc is None:
             exog_vc = {}
@@ -780,6 +814,11 @@ class MixedLM(base.LikelihoodModel):
             An array-like object of booleans, integers, or index
             values that indicate the subset of df to use in the
             model. Assumes df is a `pandas.DataFrame`
+        use_sparse : bool
+            If True, the variance component design matrices are stored
+            as sparse matrices.  Groups with large sparse designs, e.g.
+            crossed random effects in a single group, are then fit
+            using a sparse factorization.
         missing : string
             Either 'none' or 'drop'
         args : extra arguments
@@ -1162,30 +1201,8 @@ class MixedLM(base.LikelihoodModel):
         if self.k_fe == 0:
             return np.array([])
 
-        if self.k_re == 0:
-            cov_re_inv = np.empty((0, 0))
-        else:
-            cov_re_inv = np.linalg.inv(cov_re)
-
-        # Cache these quantities that don't change.
-        if not hasattr(self, "_endex_li"):
-            self._endex_li = []
-            for group_ix, _ in enumerate(self.group_labels):
-                mat = np.concatenate(
-                    (self.exog_li[group_ix],
-                     self.endog_li[group_ix][:, None]), axis=1)
-                self._endex_li.append(mat)
-
-        xtxy = 0.
-        for group_ix, group in enumerate(self.group_labels):
-            vc_var = self._expand_vcomp(vcomp, group)
-            exog = self.exog_li[group_ix]
-            ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
-            u = solver(self._endex_li[group_ix])
-            xtxy += np.dot(exog.T, u)
-
-        fe_params = np.linalg.solve(xtxy[:, 0:-1], xtxy[:, -1])
+        mom = self._block_moments(cov_re, vcomp)
+        fe_params = np.linalg.solve(mom["xvx"], mom["xvy"])
 
         return fe_params
 
@@ -1305,6 +1322,311 @@ class MixedLM(base.LikelihoodModel):
 
         return ex
 
+    def _setup_blocks(self):
+        """
+        Group the data for the likelihood calculations.
+
+        The groups are stacked into blocks of groups having the same
+        random effects design columns, i.e. the same number of columns
+        for each variance component.  The cross products of the
+        random effects design with itself, `exog` and `endog` are
+        computed once per group, so that the likelihood, score and
+        Hessian only need batched solves of the small SMW systems, see
+        `_block_moments`.
+
+        Groups with a sparse random effects design of at least
+        `_sparse_min_re` columns, e.g. a single group holding crossed
+        random effects, form blocks of their own.  The likelihood of
+        these groups is computed with a sparse LU factorization of the
+        SMW system, eliminating the variance components with the most
+        levels first and the standard random effects last, which
+        limits the fill-in for nested and crossed designs.  The score
+        of these groups uses the same factorization, and the Hessian
+        is obtained by differencing the score (see `hessian`).
+        """
+
+        k_re, k_fe = self.k_re, self.k_fe
+
+        # The columns of each variance component in each group
+        vc_counts = np.zeros((self.n_groups, self.k_vc), dtype=np.int64)
+        for j, k in enumerate(self._vc_names):
+            for group_ix, group in enumerate(self.group_labels):
+                if group in self.exog_vc[k]:
+                    vc_counts[group_ix, j] = self.exog_vc[k][group].shape[1]
+
+        keys = {}
+        for group_ix in range(self.n_groups):
+            ex_r = self._aex_r[group_ix]
+            is_sparse = (sparse.issparse(ex_r) and
+                         ex_r.shape[1] >= _sparse_min_re)
+            key = (is_sparse,) + tuple(vc_counts[group_ix])
+            if is_sparse:
+                key += (group_ix,)
+            keys.setdefault(key, []).append(group_ix)
+
+        self._blocks = []
+        for key in sorted(keys):
+            ix = np.asarray(keys[key])
+            counts = vc_counts[ix[0]]
+            rows = [np.asarray(self.row_indices[self.group_labels[i]])
+                    for i in ix]
+            block = {"vc_counts": counts, "sparse": key[0],
+                     "rows": np.concatenate(rows),
+                     "starts": np.cumsum([0] + [len(r) for r in rows[:-1]])}
+
+            if block["sparse"]:
+                ex_r = sparse.csr_matrix(self._aex_r[ix[0]])
+                block["exog_re"] = ex_r
+                block["zz"] = sparse.csc_matrix(ex_r.T.dot(ex_r))
+                pos = k_re + np.r_[0, np.cumsum(counts)]
+                perm = [np.arange(pos[j], pos[j + 1])
+                        for j in np.argsort(-counts, kind='mergesort')]
+                perm = np.concatenate(perm + [np.arange(k_re)])
+                block["perm"] = perm
+                block["zz_perm"] = sparse.csc_matrix(
+                    block["zz"][perm, :][:, perm])
+                block["zx"] = np.asarray(ex_r.T.dot(self.exog_li[ix[0]]))
+                block["zy"] = np.asarray(ex_r.T.dot(self.endog_li[ix[0]]))
+                block["zx"], block["zy"] = block["zx"][None], block["zy"][None]
+            else:
+                ex_r = [self._aex_r[i] for i in ix]
+                ex_r = [x.toarray() if sparse.issparse(x) else x
+                        for x in ex_r]
+                block["exog_re"] = np.concatenate(ex_r)
+                block["zz"] = np.array([np.dot(x.T, x) for x in ex_r])
+                block["zx"] = np.array([np.dot(x.T, self.exog_li[i])
+                                        for x, i in zip(ex_r, ix)])
+                block["zy"] = np.array([np.dot(x.T, self.endog_li[i])
+                                        for x, i in zip(ex_r, ix)])
+
+            # For each covariance parameter, the columns Z_l and Z_r of
+            # the design such that the derivative of the marginal
+            # covariance is Z_l Z_r' (+ Z_r Z_l' if not symmetric).
+            deriv_ix = []
+            jj = 0
+            for j1 in range(k_re):
+                for j2 in range(j1 + 1):
+                    deriv_ix.append((jj, slice(j1, j1 + 1),
+                                     slice(j2, j2 + 1), j1 == j2))
+                    jj += 1
+            pos = k_re
+            for j, c in enumerate(counts):
+                if c > 0:
+                    cols = slice(pos, pos + c)
+                    deriv_ix.append((self.k_re2 + j, cols, cols, True))
+                pos += c
+            block["deriv_ix"] = deriv_ix
+
+            self._blocks.append(block)
+
+        self._xtx = np.dot(self.exog.T, self.exog)
+        self._xty = np.dot(self.exog.T, self.endog)
+
+    def _block_moments(self, cov_re, vcomp, fe_params=None, derivs=False):
+        """
+        Quadratic forms in the inverse marginal covariance matrices.
+
+        Parameters
+        ----------
+        cov_re : ndarray
+            The random effects covariance matrix, in the profile
+            parameterization.
+        vcomp : array-like
+            The variance components, in the profile parameterization.
+        fe_params : array-like or None
+            If None, the quadratic forms involving `endog` are
+            returned, otherwise the quadratic forms involving the
+            residuals ``r = endog - exog * fe_params``.
+        derivs : bool
+            If True, also return the group-wise quantities needed by
+            the score and the Hessian.
+
+        Returns
+        -------
+        A dict containing, with V the marginal covariance matrix, X
+        the fixed effects and Z the random effects design of a group,
+        and the sums taken over the groups:
+
+        logdet : sum of log|V|
+        xvx : sum of X' V^-1 X
+        xvy : sum of X' V^-1 endog, if `fe_params` is None
+        rvr, xvr : sum of r' V^-1 r and X' V^-1 r, if `fe_params` is
+            given
+        dlv : if `derivs` is True, the derivatives of the sum of
+            log|V| with respect to the covariance parameters
+        blocks : if `derivs` is True, a list with a tuple
+            ``(deriv_ix, W, M, ZVX)`` for each block, where ``W``, ``M``
+            and ``ZVX`` hold Z' V^-1 r, Z' V^-1 Z and Z' V^-1 X for the
+            groups of the block, stacked along the first axis.  ``M``
+            is None for the blocks using the sparse factorization.
+
+        Notes
+        -----
+        Uses V^-1 = I - Z Q^-1 Z' and log|V| = log|B| + log|Q|, with
+        B the covariance matrix of the random effects and Q = Z'Z +
+        B^-1, so that only the cross products of the design are used.
+
+        For the sparse blocks, ``W`` and ``ZVX`` are obtained from
+        sparse solves, and the traces in `dlv` from Z' V^-1 Z = B^-1 -
+        B^-1 Q^-1 B^-1, which only needs the diagonal of Q^-1 (see
+        `_sparse_inv_diag`) and its random effects block.
+        """
+
+        k_re, k_fe = self.k_re, self.k_fe
+
+        if k_re > 0:
+            cov_re_inv = np.linalg.inv(cov_re)
+            _, cov_re_logdet = np.linalg.slogdet(cov_re)
+        else:
+            cov_re_inv = np.zeros((0, 0))
+            cov_re_logdet = 0.
+
+        mom = {"xvx": self._xtx.copy(), "logdet": 0.}
+        if fe_params is None:
+            mom["xvy"] = self._xty.copy()
+        else:
+            resid = self.endog - np.dot(self.exog, fe_params)
+            mom["rvr"] = np.dot(resid, resid)
+            mom["xvr"] = np.dot(self.exog.T, resid)
+        mom["blocks"] = []
+        if derivs:
+            mom["dlv"] = np.zeros(self.k_re2 + self.k_vc)
+
+        for block_ix, block in enumerate(self._blocks):
+
+            vc_var = np.repeat(vcomp, block["vc_counts"])
+            q = k_re + len(vc_var)
+            zz, zx = block["zz"], block["zx"]
+            ngrp = zx.shape[0]
+
+            # The right hand side cross products Z' endog or Z' r
+            if fe_params is None:
+                zv = block["zy"]
+            elif block["sparse"]:
+                zv = block["exog_re"].T.dot(resid[block["rows"]])[None]
+            else:
+                zv = block["exog_re"] * resid[block["rows"]][:, None]
+                zv = np.add.reduceat(zv, block["starts"], axis=0)
+
+            if block["sparse"]:
+                lu, ld = self._sparse_factor(block_ix, cov_re_inv, vc_var)
+                perm = block["perm"]
+                rhs = np.concatenate((zx[0], zv[0][:, None]), axis=1)
+                sol = np.empty_like(rhs)
+                sol[perm] = lu.solve(rhs[perm])
+                sol, ld = sol[None], np.r_[ld]
+            else:
+                qmat = zz.copy()
+                qmat[:, 0:k_re, 0:k_re] += cov_re_inv
+                ix = np.arange(k_re, q)
+                qmat[:, ix, ix] += 1 / vc_var
+                _, ld = np.linalg.slogdet(qmat)
+                rhs = [zx, zv[:, :, None]]
+                if derivs:
+                    rhs.append(zz)
+                sol = np.linalg.solve(qmat, np.concatenate(rhs, axis=2))
+
+            b_logdet = cov_re_logdet + np.sum(np.log(vc_var))
+            mom["logdet"] += ngrp * b_logdet + np.sum(ld)
+
+            sx, sv = sol[:, :, 0:k_fe], sol[:, :, k_fe]
+            mom["xvx"] -= np.einsum('gqi,gqj->ij', zx, sx)
+            if fe_params is None:
+                mom["xvy"] -= np.einsum('gqi,gq->i', zx, sv)
+            else:
+                mom["rvr"] -= np.sum(zv * sv)
+                mom["xvr"] -= np.einsum('gqi,gq->i', zx, sv)
+
+            if not derivs:
+                continue
+
+            if block["sparse"]:
+                w = zv - zz.dot(sv[0])[None]
+                zvx = zx - zz.dot(sx[0])[None]
+                m = None
+
+                # The diagonal and the random effects block of
+                # Z' V^-1 Z = B^-1 - B^-1 Q^-1 B^-1
+                qdiag = np.empty(q)
+                qdiag[perm] = _sparse_inv_diag(lu)
+                if k_re > 0:
+                    ipos = np.argsort(perm)[0:k_re]
+                    e = np.zeros((q, k_re))
+                    e[ipos, np.arange(k_re)] = 1
+                    qre = lu.solve(e)[ipos]
+                    m_re = cov_re_inv - np.dot(cov_re_inv,
+                                               np.dot(qre, cov_re_inv))
+                else:
+                    m_re = np.zeros((0, 0))
+                m_diag = np.r_[np.diag(m_re),
+                               1 / vc_var - qdiag[k_re:] / vc_var**2]
+            else:
+                sz = sol[:, :, k_fe + 1:]
+                w = zv - np.einsum('gqr,gr->gq', zz, sv)
+                m = zz - np.matmul(zz, sz)
+                zvx = zx - np.matmul(zz, sx)
+                m_sum = m.sum(0)
+                m_re, m_diag = m_sum[0:k_re, 0:k_re], np.diag(m_sum)
+
+            # dV/dQ_jj = Z_l Z_r' (+ Z_r Z_l' if not sym), where Z_l
+            # and Z_r are the columns ml and mr of the random effects
+            # design, so d log|V| / dQ_jj = tr(Z_r' V^-1 Z_l) (+ ...).
+            # Only the variance components (with ml == mr) involve
+            # columns beyond the standard random effects.
+            for jj, ml, mr, sym in block["deriv_ix"]:
+                if ml.start < k_re:
+                    mom["dlv"][jj] += np.trace(m_re[mr, ml])
+                    if not sym:
+                        mom["dlv"][jj] += np.trace(m_re[ml, mr])
+                else:
+                    mom["dlv"][jj] += np.sum(m_diag[ml])
+
+            mom["blocks"].append((block["deriv_ix"], w, m, zvx))
+
+        return mom
+
+    def _sparse_factor(self, block_ix, cov_re_inv, vc_var):
+        """
+        Sparse LU factorization of the SMW system Q = Z'Z + B^-1 of a
+        block with a single group, in the order of `block["perm"]`.
+
+        Returns the factorization and log|Q|.  The last factorization
+        of each block is reused, e.g. by `loglike` after
+        `get_fe_params`.
+        """
+
+        key = (cov_re_inv.tobytes(), vc_var.tobytes())
+        cache = self.__dict__.setdefault("_sparse_lu", {})
+        if block_ix in cache and cache[block_ix][0] == key:
+            return cache[block_ix][1]
+
+        block = self._blocks[block_ix]
+        k_re, perm = self.k_re, block["perm"]
+        q = len(perm)
+        bi = sparse.diags(np.r_[np.zeros(k_re), 1 / vc_var][perm])
+        if k_re > 0:
+            ii, jj = np.indices((k_re, k_re))
+            ipos = np.argsort(perm)[0:k_re]
+            bi = bi + sparse.coo_matrix(
+                (cov_re_inv.ravel(), (ipos[ii.ravel()], ipos[jj.ravel()])),
+                shape=(q, q))
+
+        # Q is SPD, so no pivoting is needed, and log|Q| is the log of
+        # the product of the pivots.
+        lu = sparse.linalg.splu(sparse.csc_matrix(block["zz_perm"] + bi),
+                                permc_spec="NATURAL", diag_pivot_thresh=0,
+                                options={"SymmetricMode": True})
+        ld = np.sum(np.log(np.abs(lu.U.diagonal())))
+
+        cache[block_ix] = (key, (lu, ld))
+        return lu, ld
+
+    def __getstate__(self):
+        # The sparse factorizations can not be pickled
+        state = self.__dict__.copy()
+        state.pop("_sparse_lu", None)
+        return state
+
     def loglike(self, params, profile_fe=True):
         """
         Evaluate the (profile) log-likelihood of the linear mixed
@@ -1350,14 +1672,8 @@ class MixedLM(base.LikelihoodModel):
                 cov_re_inv = np.linalg.inv(cov_re)
             except np.linalg.LinAlgError:
                 cov_re_inv = None
-            _, cov_re_logdet = np.linalg.slogdet(cov_re)
         else:
             cov_re_inv = np.zeros((0, 0))
-            cov_re_logdet = 0
-
-        # The residuals
-        expval = np.dot(self.exog, fe_params)
-        resid_all = self.endog - expval
 
         likeval = 0.
 
@@ -1369,31 +1685,16 @@ class MixedLM(base.LikelihoodModel):
         if (self.fe_pen is not None):
             likeval -= self.fe_pen.func(fe_params)
 
-        xvx, qf = 0., 0.
-        for k, group in enumerate(self.group_labels):
-
-            vc_var = self._expand_vcomp(vcomp, group)
-            cov_aug_logdet = cov_re_logdet + np.sum(np.log(vc_var))
-
-            exog = self.exog_li[k]
-            ex_r, ex2_r = self._aex_r[k], self._aex_r2[k]
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
-
-            resid = resid_all[self.row_indices[group]]
+        mom = self._block_moments(cov_re, vcomp, fe_params)
 
-            # Part 1 of the log likelihood (for both ML and REML)
-            ld = _smw_logdet(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var,
-                             cov_aug_logdet)
-            likeval -= ld / 2.
+        # Part 1 of the log likelihood (for both ML and REML)
+        likeval -= mom["logdet"] / 2.
 
-            # Part 2 of the log likelihood (for both ML and REML)
-            u = solver(resid)
-            qf += np.dot(resid, u)
+        # Part 2 of the log likelihood (for both ML and REML)
+        qf = mom["rvr"]
 
-            # Adjustment for REML
-            if self.reml:
-                mat = solver(exog)
-                xvx += np.dot(exog.T, mat)
+        # Adjustment for REML
+        xvx = mom["xvx"]
 
         if self.reml:
             likeval -= (self.n_totobs - self.k_fe) * np.log(qf) / 2.
@@ -1411,48 +1712,6 @@ class MixedLM(base.LikelihoodModel):
 
         return likeval
 
-    def _gen_dV_dPar(self, ex_r, solver, group, max_ix=None):
-        """
-        A generator that yields the element-wise derivative of the
-        marginal covariance matrix with respect to the random effects
-        variance and covariance parameters.
-
-        ex_r : array-like
-            The random effects design matrix
-        solver : function
-            A function that given x returns V^{-1}x, where V
-            is the group's marginal covariance matrix.
-        group : scalar
-            The group label
-        max_ix : integer or None
-            If not None, the generator ends when this index
-            is reached.
-        """
-
-        axr = solver(ex_r)
-
-        # Regular random effects
-        jj = 0
-        for j1 in range(self.k_re):
-            for j2 in range(j1 + 1):
-                if max_ix is not None and jj > max_ix:
-                    return
-                # Need 2d
-                mat_l, mat_r = ex_r[:, j1:j1+1], ex_r[:, j2:j2+1]
-                vsl, vsr = axr[:, j1:j1+1], axr[:, j2:j2+1]
-                yield jj, mat_l, mat_r, vsl, vsr, j1 == j2
-                jj += 1
-
-        # Variance components
-        for ky in self._vc_names:
-            if group in self.exog_vc[ky]:
-                if max_ix is not None and jj > max_ix:
-                    return
-                mat = self.exog_vc[ky][group]
-                axmat = solver(mat)
-                yield jj, mat, mat, axmat, axmat, True
-                jj += 1
-
     def score(self, params, profile_fe=True):
         """
         Returns the score vector of the profile log-likelihood.
@@ -1549,79 +1808,46 @@ class MixedLM(base.LikelihoodModel):
         if calc_fe and (self.fe_pen is not None):
             score_fe -= self.fe_pen.grad(fe_params)
 
+        mom = self._block_moments(cov_re, vcomp, fe_params, derivs=True)
+
         # resid' V^{-1} resid, summed over the groups (a scalar)
-        rvir = 0.
+        rvir = mom["rvr"]
 
         # exog' V^{-1} resid, summed over the groups (a k_fe
         # dimensional vector)
-        xtvir = 0.
+        xtvir = mom["xvr"]
 
         # exog' V^{_1} exog, summed over the groups (a k_fe x k_fe
         # matrix)
-        xtvix = 0.
+        xtvix = mom["xvx"]
 
         # V^{-1} exog' dV/dQ_jj exog V^{-1}, where Q_jj is the jj^th
         # covariance parameter.
         xtax = [0., ] * (self.k_re2 + self.k_vc)
 
         # Temporary related to the gradient of log |V|
-        dlv = np.zeros(self.k_re2 + self.k_vc)
+        dlv = mom["dlv"]
 
         # resid' V^{-1} dV/dQ_jj V^{-1} resid (a scalar)
         rvavr = np.zeros(self.k_re2 + self.k_vc)
 
-        for group_ix, group in enumerate(self.group_labels):
-
-            vc_var = self._expand_vcomp(vcomp, group)
-
-            exog = self.exog_li[group_ix]
-            ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
-
-            # The residuals
-            resid = self.endog_li[group_ix]
-            if self.k_fe > 0:
-                expval = np.dot(exog, fe_params)
-                resid = resid - expval
-
-            if self.reml:
-                viexog = solver(exog)
-                xtvix += np.dot(exog.T, viexog)
-
-            # Contributions to the covariance parameter gradient
-            vir = solver(resid)
-            for (jj, matl, matr, vsl, vsr, sym) in\
-                    self._gen_dV_dPar(ex_r, solver, group):
-                dlv[jj] = _dotsum(matr, vsl)
-                if not sym:
-                    dlv[jj] += _dotsum(matl, vsr)
-
-                ul = _dot(vir, matl)
-                ur = ul.T if sym else _dot(matr.T, vir)
-                ulr = np.dot(ul, ur)
-                rvavr[jj] += ulr
-                if not sym:
-                    rvavr[jj] += ulr.T
+        # dV/dQ_jj = Z_l Z_r' (+ Z_r Z_l' if not sym), where Z_l and
+        # Z_r are the columns ml and mr of the random effects design.
+        for deriv_ix, vzr, _, vzx in mom["blocks"]:
+            for jj, ml, mr, sym in deriv_ix:
+                ulr = np.sum(vzr[:, ml] * vzr[:, mr])
+                rvavr[jj] += ulr if sym else 2 * ulr
 
                 if self.reml:
-                    ul = _dot(viexog.T, matl)
-                    ur = ul.T if sym else _dot(matr.T, viexog)
-                    ulr = np.dot(ul, ur)
-                    xtax[jj] += ulr
-                    if not sym:
-                        xtax[jj] += ulr.T
+                    ulr = np.einsum('gci,gcj->ij', vzx[:, ml], vzx[:, mr])
+                    xtax[jj] += ulr if sym else ulr + ulr.T
 
-            # Contribution of log|V| to the covariance parameter
-            # gradient.
-            if self.k_re > 0:
-                score_re -= 0.5 * dlv[0:self.k_re2]
-            if self.k_vc > 0:
-                score_vc -= 0.5 * dlv[self.k_re2:]
-
-            rvir += np.dot(resid, vir)
-
-            if calc_fe:
-                xtvir += np.dot(exog.T, vir)
+        # Contribution of log|V| to the covariance parameter
+        # gradient.
+        if self.k_re > 0:
+            score_re -= 0.5 * dlv[0:self.k_re2]
+        if self.k_vc > 0:
+            score_vc -= 0.5 * dlv[self.k_re2:]
 
         fac = self.n_totobs
         if self.reml:
@@ -1709,6 +1935,15 @@ class MixedLM(base.LikelihoodModel):
         -------
         hess : 2d ndarray
             The Hessian matrix, evaluated at `params`.
+
+        Notes
+        -----
+        If some groups are solved with the sparse factorization (see
+        `_setup_blocks`), the matrices Z' V^-1 Z needed for the second
+        derivatives of log|V| are not formed.  The Hessian is then
+        approximated by central differences of the analytic score,
+        which costs two sparse factorizations per parameter.  Unlike
+        the analytic Hessian, this includes the penalty terms, if any.
         """
 
         if type(params) is not MixedLMParams:
@@ -1716,13 +1951,21 @@ class MixedLM(base.LikelihoodModel):
                                                use_sqrt=self.use_sqrt,
                                                has_fe=True)
 
+        if any(block["sparse"] for block in self._blocks):
+
+            def score(x):
+                p = MixedLMParams.from_packed(x, self.k_fe, self.k_re,
+                                              use_sqrt=False, has_fe=True)
+                return np.concatenate(self.score_full(p, calc_fe=True))
+
+            hess = approx_fprime(params.get_packed(use_sqrt=False,
+                                                   has_fe=True),
+                                 score, centered=True)
+            return (hess + hess.T) / 2
+
         fe_params = params.fe_params
         vcomp = params.vcomp
         cov_re = params.cov_re
-        if self.k_re > 0:
-            cov_re_inv = np.linalg.inv(cov_re)
-        else:
-            cov_re_inv = np.empty((0, 0))
 
         # Blocks for the fixed and random effects parameters.
         hess_fe = 0.
@@ -1733,97 +1976,72 @@ class MixedLM(base.LikelihoodModel):
         if self.reml:
             fac -= self.exog.shape[1]
 
-        rvir = 0.
-        xtvix = 0.
+        mom = self._block_moments(cov_re, vcomp, fe_params, derivs=True)
+        rvir = mom["rvr"]
+        xtvix = mom["xvx"]
         xtax = [0., ] * (self.k_re2 + self.k_vc)
         m = self.k_re2 + self.k_vc
         B = np.zeros(m)
         D = np.zeros((m, m))
         F = [[0.] * m for k in range(m)]
-        for k, group in enumerate(self.group_labels):
-
-            vc_var = self._expand_vcomp(vcomp, group)
-
-            exog = self.exog_li[k]
-            ex_r, ex2_r = self._aex_r[k], self._aex_r2[k]
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
 
-            # The residuals
-            resid = self.endog_li[k]
-            if self.k_fe > 0:
-                expval = np.dot(exog, fe_params)
-                resid = resid - expval
-
-            viexog = solver(exog)
-            xtvix += np.dot(exog.T, viexog)
-            vir = solver(resid)
-            rvir += np.dot(resid, vir)
+        # dV/dQ_jj = Z_l Z_r' (+ Z_r Z_l' if not sym), where Z_l and
+        # Z_r are the columns ml and mr of the random effects design.
+        # vzr, vzz and vzx are Z' V^-1 resid, Z' V^-1 Z and Z' V^-1
+        # exog for each group.
+        for deriv_ix, vzr, vzz, vzx in mom["blocks"]:
+            for (jj1, ml1, mr1, sym1) in deriv_ix:
 
-            for (jj1, matl1, matr1, vsl1, vsr1, sym1) in\
-                    self._gen_dV_dPar(ex_r, solver, group):
-
-                ul = _dot(viexog.T, matl1)
-                ur = _dot(matr1.T, vir)
-                hess_fere[jj1, :] += np.dot(ul, ur)
+                hess_fere[jj1, :] += np.einsum('gci,gc->i', vzx[:, ml1],
+                                               vzr[:, mr1])
                 if not sym1:
-                    ul = _dot(viexog.T, matr1)
-                    ur = _dot(matl1.T, vir)
-                    hess_fere[jj1, :] += np.dot(ul, ur)
+                    hess_fere[jj1, :] += np.einsum('gci,gc->i', vzx[:, mr1],
+                                                   vzr[:, ml1])
 
                 if self.reml:
-                    ul = _dot(viexog.T, matl1)
-                    ur = ul if sym1 else np.dot(viexog.T, matr1)
-                    ulr = _dot(ul, ur.T)
-                    xtax[jj1] += ulr
-                    if not sym1:
-                        xtax[jj1] += ulr.T
-
-                ul = _dot(vir, matl1)
-                ur = ul if sym1 else _dot(vir, matr1)
-                B[jj1] += np.dot(ul, ur) * (1 if sym1 else 2)
-
-                # V^{-1} * dV/d_theta
-                E = [(vsl1, matr1)]
+                    ulr = np.einsum('gci,gcj->ij', vzx[:, ml1], vzx[:, mr1])
+                    xtax[jj1] += ulr if sym1 else ulr + ulr.T
+
+                ulr = np.sum(vzr[:, ml1] * vzr[:, mr1])
+                B[jj1] += ulr * (1 if sym1 else 2)
+
+                # V^{-1} * dV/d_theta = sum of V^{-1} Z_a Z_b'
+                E = [(ml1, mr1)]
                 if not sym1:
-                    E.append((vsr1, matl1))
+                    E.append((mr1, ml1))
 
-                for (jj2, matl2, matr2, vsl2, vsr2, sym2) in\
-                        self._gen_dV_dPar(ex_r, solver, group, jj1):
+                for (jj2, ml2, mr2, sym2) in deriv_ix:
 
-                    re = sum([_multi_dot_three(matr2.T, x[0], x[1].T)
-                              for x in E])
-                    vt = 2 * _dot(_multi_dot_three(vir[None, :], matl2, re),
-                                  vir[:, None])
+                    if jj2 > jj1:
+                        break
 
-                    if not sym2:
-                        le = sum([_multi_dot_three(matl2.T, x[0], x[1].T)
-                                  for x in E])
-                        vt += 2 * _dot(_multi_dot_three(
-                            vir[None, :], matr2, le), vir[:, None])
+                    vt, rt, um = 0., 0., 0.
+                    for a, b in E:
+                        vt += 2 * np.einsum('gi,gij,gj->', vzr[:, ml2],
+                                            vzz[:, mr2, a], vzr[:, b])
+                        rt += np.sum(vzz[:, ml2, b] * vzz[:, mr2, a]) / 2
+                        if self.reml:
+                            um += np.einsum('gci,gcd,gdj->ij', vzx[:, ml2],
+                                            vzz[:, mr2, a], vzx[:, b])
+                        if not sym2:
+                            vt += 2 * np.einsum('gi,gij,gj->', vzr[:, mr2],
+                                                vzz[:, ml2, a], vzr[:, b])
+                            rt += np.sum(vzz[:, mr2, b] * vzz[:, ml2, a]) / 2
+                            if self.reml:
+                                um += np.einsum('gci,gcd,gdj->ij',
+                                                vzx[:, mr2], vzz[:, ml2, a],
+                                                vzx[:, b])
 
                     D[jj1, jj2] += vt
                     if jj1 != jj2:
                         D[jj2, jj1] += vt
 
-                    rt = _dotsum(vsl2, re.T) / 2
-                    if not sym2:
-                        rt += _dotsum(vsr2, le.T) / 2
-
                     hess_re[jj1, jj2] += rt
                     if jj1 != jj2:
                         hess_re[jj2, jj1] += rt
 
                     if self.reml:
-                        ev = sum([_dot(x[0], _dot(x[1].T, viexog)) for x in E])
-                        u1 = _dot(viexog.T, matl2)
-                        u2 = _dot(matr2.T, ev)
-                        um = np.dot(u1, u2)
                         F[jj1][jj2] += um + um.T
-                        if not sym2:
-                            u1 = np.dot(viexog.T, matr2)
-                            u2 = np.dot(matl2.T, ev)
-                            um = np.dot(u1, u2)
-                            F[jj1][jj2] += um + um.T
 
         hess_fe -= fac * xtvix / rvir
         hess_re = hess_re - 0.5 * fac * (D/rvir - np.outer(B, B) / rvir**2)
@@ -1870,29 +2088,7 @@ class MixedLM(base.LikelihoodModel):
             The estimated error variance.
         """
 
-        try:
-            cov_re_inv = np.linalg.inv(cov_re)
-        except np.linalg.LinAlgError:
-            cov_re_inv = None
-
-        qf = 0.
-        for group_ix, group in enumerate(self.group_labels):
-
-            vc_var = self._expand_vcomp(vcomp, group)
-
-            exog = self.exog_li[group_ix]
-            ex_r, ex2_r = self._aex_r[group_ix], self._aex_r2[group_ix]
-
-            solver = _smw_solver(1., ex_r, ex2_r, cov_re_inv, 1 / vc_var)
-
-            # The residuals
-            resid = self.endog_li[group_ix]
-            if self.k_fe > 0:
-                expval = np.dot(exog, fe_params)
-                resid = resid - expval
-
-            mat = solver(resid)
-            qf += np.dot(resid, mat)
+        qf = self._block_moments(cov_re, vcomp, fe_params)["rvr"]
 
         if self.reml:
             qf /= (self.n_totobs - self.k_fe)
@@ -3,7 +3,8 @@
 '''
 Quantile regression model
 
-Model parameters are estimated using iterated reweighted least squares. The
+Model parameters are estimated using iterated reweighted least squares, or
+the Frisch-Newton interior point method of Portnoy and Koenker (1997). The
 asymptotic covariance matrix estimated using kernel density estimation.
 
 Author: Vincent Arel-Bundock
@@ -21,7 +22,7 @@ from statsmodels.compat.python import range
 import numpy as np
 import warnings
 import scipy.stats as stats
-from scipy.linalg import pinv
+from scipy.linalg import cho_factor, cho_solve, pinv
 from scipy.stats import norm
 from statsmodels.tools.tools import chain_dot
 from statsmodels.compat.numpy import np_matrix_rank
@@ -36,7 +37,7 @@ class QuantReg(RegressionModel):
     '''Quantile Regression
 
     Estimate a quantile regression model using iterative reweighted least
-    squares.
+    squares or the Frisch-Newton interior point method.
 
     Parameters
     ----------
@@ -54,6 +55,10 @@ class QuantReg(RegressionModel):
     Greene (2008, p.407-408), using either the logistic or gaussian kernels
     (kernel argument of the fit method).
 
+    The interior point methods, ``fn`` and ``pfn`` (method argument of the fit
+    method), are much faster than IRLS for large samples. `fit_many` fits
+    several quantiles with warm starts.
+
     References
     ----------
     General:
@@ -62,6 +67,7 @@ class QuantReg(RegressionModel):
     * Green,W. H. (2008). Econometric Analysis. Sixth Edition. International Student Edition.
     * Koenker, R. (2005). Quantile Regression. New York: Cambridge University Press.
     * LeSage, J. P.(1999). Applied Econometrics Using MATLAB,
+    * Portnoy, S. and R. Koenker (1997). The Gaussian Hare and the Laplacian Tortoise: Computability of Squared-Error versus Absolute-Error Estimators. Statistical Science 12: 279-300.
 
     Kernels (used by the fit method):
 
@@ -87,8 +93,9 @@ class QuantReg(RegressionModel):
         return data
 
     def fit(self, q=.5, vcov='robust', kernel='epa', bandwidth='hsheather',
-            max_iter=1000, p_tol=1e-6, **kwargs):
-        '''Solve by Iterative Weighted Least Squares
+            max_iter=1000, p_tol=1e-6, method='irls', start_params=None,
+            **kwargs):
+        '''Solve by Iterative Weighted Least Squares or an interior point method
 
         Parameters
         ----------
@@ -116,6 +123,30 @@ class QuantReg(RegressionModel):
             - hsheather: Hall-Sheather (1988)
             - bofinger: Bofinger (1975)
             - chamberlain: Chamberlain (1994)
+
+        max_iter : int
+            Maximum number of iterations.
+        p_tol : float
+            Convergence tolerance, for the change in the parameters with
+            ``irls`` and for the relative duality gap otherwise.
+        method : string, estimation method:
+
+            - irls : iteratively reweighted least squares (default)
+            - fn : Frisch-Newton interior point method, Portnoy and Koenker
+              (1997)
+            - pfn : Frisch-Newton with the preprocessing of Portnoy and
+              Koenker (1997), for large samples
+
+        start_params : array_like, optional
+            Preliminary estimate for the preprocessing of ``pfn``. By default,
+            the model is first fit on a subsample. Not used otherwise.
+
+        Notes
+        -----
+        The interior point methods solve the linear program of quantile
+        regression to the tolerance `p_tol`, with about 20 to 50 iterations
+        that each solve a k x k linear system, irrespective of the number of
+        observations. They require `exog` to have full column rank.
         '''
 
         if q < 0 or q > 1:
@@ -136,6 +167,12 @@ class QuantReg(RegressionModel):
         else:
             raise Exception("bandwidth must be in 'hsheather', 'bofinger', 'chamberlain'")
 
+        if method not in ('irls', 'fn', 'pfn'):
+            raise ValueError("method must be 'irls', 'fn' or 'pfn'")
+        if method != 'irls' and (q <= 0 or q >= 1):
+            raise ValueError("q must be strictly between 0 and 1 for the "
+                             "interior point methods")
+
         endog = self.endog
         exog = self.exog
         nobs = self.nobs
@@ -143,6 +180,100 @@ class QuantReg(RegressionModel):
         self.rank = exog_rank
         self.df_model = float(self.rank - self.k_constant)
         self.df_resid = self.nobs - self.rank
+
+        if method == 'irls':
+            beta, n_iter, history = self._fit_irls(q, max_iter, p_tol)
+        else:
+            if exog_rank < exog.shape[1]:
+                raise ValueError('The interior point methods require exog '
+                                 'with full column rank')
+            if method == 'fn':
+                beta, n_iter = _frisch_newton(exog, endog, q, p_tol=p_tol,
+                                              max_iter=max_iter)
+            else:
+                beta, n_iter = _preprocessed_frisch_newton(
+                    exog, endog, q, start_params=start_params, p_tol=p_tol,
+                    max_iter=max_iter)
+            history = None
+
+        e = endog - np.dot(exog, beta)
+        # Greene (2008, p.407) writes that Stata 6 uses this bandwidth:
+        # h = 0.9 * np.std(e) / (nobs**0.2)
+        # Instead, we calculate bandwidth as in Stata 12
+        iqre = np.subtract(*np.percentile(e, [75, 25]))
+        h = bandwidth(nobs, q)
+        h = min(np.std(endog),
+                iqre / 1.34) * (norm.ppf(q + h) - norm.ppf(q - h))
+
+        fhat0 = 1. / (nobs * h) * np.sum(kernel(e / h))
+
+        if vcov == 'robust':
+            d = np.where(e > 0, (q/fhat0)**2, ((1-q)/fhat0)**2)
+            xtxi = pinv(np.dot(exog.T, exog))
+            xtdx = np.dot(exog.T * d[np.newaxis, :], exog)
+            vcov = chain_dot(xtxi, xtdx, xtxi)
+        elif vcov == 'iid':
+            vcov = (1. / fhat0)**2 * q * (1 - q) * pinv(np.dot(exog.T, exog))
+        else:
+            raise Exception("vcov must be 'robust' or 'iid'")
+
+        lfit = QuantRegResults(self, beta, normalized_cov_params=vcov)
+
+        lfit.q = q
+        lfit.iterations = n_iter
+        lfit.sparsity = 1. / fhat0
+        lfit.bandwidth = h
+        lfit.history = history
+
+        return RegressionResultsWrapper(lfit)
+
+
+    def fit_many(self, q, method='pfn', **kwargs):
+        '''Fit the model for several quantiles
+
+        Parameters
+        ----------
+        q : array_like
+            The quantiles, each strictly between 0 and 1 unless method is
+            ``irls``.
+        method : string
+            The estimation method, see `fit`. Default is ``pfn``.
+        **kwargs
+            Additional keyword arguments for `fit`.
+
+        Returns
+        -------
+        results : list
+            The results of `fit` for each quantile, in the order of `q`.
+
+        Notes
+        -----
+        The quantiles are fit in increasing order. With ``pfn``, the
+        estimate for the previous quantile is the starting point of the
+        preprocessing for the next one, which replaces the preliminary fit
+        on a subsample and usually leaves only a few observations in the
+        reduced problem.
+        '''
+        q = np.atleast_1d(q)
+        results = [None] * len(q)
+        start_params = kwargs.pop('start_params', None)
+        for i in np.argsort(q, kind='mergesort'):
+            res = self.fit(q=q[i], method=method, start_params=start_params,
+                           **kwargs)
+            results[i] = res
+            start_params = np.asarray(res.params)
+        return results
+
+    def _fit_irls(self, q, max_iter, p_tol):
+        """
+        Iteratively reweighted least squares for `fit`
+
+        Returns the parameters, the number of iterations and the history of
+        the parameters and mean squared errors.
+        """
+        endog = self.endog
+        exog = self.exog
+        exog_rank = self.rank
         n_iter = 0
         xstar = exog
 
@@ -192,36 +323,173 @@ class QuantReg(RegressionModel):
             warnings.warn("Maximum number of iterations (" + str(max_iter) + 
                           ") reached.", IterationLimitWarning)
 
-        e = endog - np.dot(exog, beta)
-        # Greene (2008, p.407) writes that Stata 6 uses this bandwidth:
-        # h = 0.9 * np.std(e) / (nobs**0.2)
-        # Instead, we calculate bandwidth as in Stata 12
-        iqre = stats.scoreatpercentile(e, 75) - stats.scoreatpercentile(e, 25)
-        h = bandwidth(nobs, q)
-        h = min(np.std(endog),
-                iqre / 1.34) * (norm.ppf(q + h) - norm.ppf(q - h))
+        return beta, n_iter, history
 
-        fhat0 = 1. / (nobs * h) * np.sum(kernel(e / h))
 
-        if vcov == 'robust':
-            d = np.where(e > 0, (q/fhat0)**2, ((1-q)/fhat0)**2)
-            xtxi = pinv(np.dot(exog.T, exog))
-            xtdx = np.dot(exog.T * d[np.newaxis, :], exog)
-            vcov = chain_dot(xtxi, xtdx, xtxi)
-        elif vcov == 'iid':
-            vcov = (1. / fhat0)**2 * q * (1 - q) * pinv(np.dot(exog.T, exog))
-        else:
-            raise Exception("vcov must be 'robust' or 'iid'")
+def _step_length(x, dx):
+    # Largest step along dx for which x + step * dx stays non-negative
+    neg = dx < 0
+    if not neg.any():
+        return 1e20
+    return np.min(-x[neg] / dx[neg])
 
-        lfit = QuantRegResults(self, beta, normalized_cov_params=vcov)
 
-        lfit.q = q
-        lfit.iterations = n_iter
-        lfit.sparsity = 1. / fhat0
-        lfit.bandwidth = h
-        lfit.history = history
+def _frisch_newton(exog, endog, q, p_tol=1e-6, max_iter=1000,
+                   beta=0.99995):
+    '''Quantile regression by the Frisch-Newton interior point method
 
-        return RegressionResultsWrapper(lfit)
+    Solves the dual of the linear program of quantile regression,
+
+        max_d y'd  s.t.  X'd = (1 - q) X'1,  0 <= d <= 1,
+
+    shifted by q, by the primal-dual log-barrier method with Mehrotra's
+    predictor-corrector steps, as in Portnoy and Koenker (1997) and the
+    ``fn`` method of R's quantreg. Each iteration solves a k x k system.
+
+    Returns the parameters, the negative of the dual solution of the
+    equality constraints, and the number of iterations.
+    '''
+    nobs = exog.shape[0]
+    c = -endog
+    b = (1 - q) * exog.sum(0)
+    x = np.empty(nobs)
+    x.fill(1. - q)
+    s = 1. - x
+    y = np.linalg.lstsq(exog, c, rcond=-1)[0]
+    r = c - np.dot(exog, y)
+    r[r == 0] = 0.001
+    z = np.where(r > 0, r, 0.)
+    w = z - r
+    gap = np.dot(c, x) - np.dot(y, b) + w.sum()
+
+    n_iter = 0
+    while (gap > p_tol * (1 + np.abs(np.dot(c, x))) and
+           n_iter < max_iter):
+        n_iter += 1
+
+        # Affine scaling (predictor) step
+        weights = 1. / (z / x + w / s)
+        r = z - w
+        xw = exog * weights[:, None]
+        chol = cho_factor(np.dot(exog.T, xw))
+        rhs = np.dot(xw.T, r)
+        dy = cho_solve(chol, rhs)
+        dx = weights * (np.dot(exog, dy) - r)
+        ds = -dx
+        dz = -z * (dx / x + 1)
+        dw = -w * (ds / s + 1)
+        fp = min(beta * min(_step_length(x, dx), _step_length(s, ds)), 1)
+        fd = min(beta * min(_step_length(w, dw), _step_length(z, dz)), 1)
+
+        if min(fp, fd) < 1:
+            # Centering and corrector step
+            mu = np.dot(z, x) + np.dot(w, s)
+            g = (np.dot(z + fd * dz, x + fp * dx) +
+                 np.dot(w + fd * dw, s + fp * ds))
+            mu = mu * (g / mu)**3 / (2 * nobs)
+            dxdz = dx * dz
+            dsdw = ds * dw
+            xinv = 1. / x
+            sinv = 1. / s
+            xi = mu * (xinv - sinv)
+            rhs = rhs + np.dot(xw.T, dxdz - dsdw - xi)
+            dy = cho_solve(chol, rhs)
+            dx = weights * (np.dot(exog, dy) + xi - r - dxdz + dsdw)
+            ds = -dx
+            dz = mu * xinv - z - xinv * z * dx - dxdz
+            dw = mu * sinv - w - sinv * w * ds - dsdw
+            fp = min(beta * min(_step_length(x, dx), _step_length(s, ds)), 1)
+            fd = min(beta * min(_step_length(w, dw), _step_length(z, dz)), 1)
+
+        x += fp * dx
+        s += fp * ds
+        y += fd * dy
+        w += fd * dw
+        z += fd * dz
+        gap = np.dot(c, x) - np.dot(y, b) + w.sum()
+
+    if n_iter == max_iter:
+        warnings.warn("Maximum number of iterations (" + str(max_iter) +
+                      ") reached.", IterationLimitWarning)
+
+    return -y, n_iter
+
+
+def _preprocessed_frisch_newton(exog, endog, q, start_params=None,
+                                p_tol=1e-6, max_iter=1000, m_factor=0.8):
+    '''Frisch-Newton quantile regression with preprocessing
+
+    The preprocessing of Portnoy and Koenker (1997): given a preliminary
+    estimate, the observations whose residuals are far enough below or above
+    the fit that they are unlikely to change sides are each collapsed into a
+    single aggregated observation, and the much smaller remaining problem is
+    solved by `_frisch_newton`. Observations that end up on the wrong side
+    are put back, and the reduced problem is solved again, so that the
+    solution is that of the full problem.
+
+    The preliminary estimate is `start_params` if given, and otherwise the
+    fit on a random subsample of size ((k + 1) * nobs)**(2 / 3).
+
+    Returns the parameters and the total number of interior point
+    iterations.
+    '''
+    nobs, k_exog = exog.shape
+    m = int(round(((k_exog + 1) * nobs)**(2. / 3)))
+    # Standard deviations of the fitted values, up to scale
+    band = np.sqrt((np.dot(exog, np.linalg.inv(np.dot(exog.T, exog))) *
+                    exog).sum(1))
+    band = np.maximum(band, 1e-12)
+    random_state = np.random.RandomState(0)
+    n_iter = 0
+
+    while m < nobs:
+        if start_params is None:
+            idx = random_state.choice(nobs, m, replace=False)
+            params, it = _frisch_newton(exog[idx], endog[idx], q,
+                                        p_tol=p_tol, max_iter=max_iter)
+            n_iter += it
+        else:
+            params = start_params
+        resid = endog - np.dot(exog, params)
+
+        n_keep = m_factor * m
+        lo_q = max(1. / nobs, q - n_keep / (2. * nobs))
+        hi_q = min(q + n_keep / (2. * nobs), (nobs - 1.) / nobs)
+        kappa = np.percentile(resid / band, [100 * lo_q, 100 * hi_q])
+        below = resid < band * kappa[0]
+        above = resid > band * kappa[1]
+
+        while True:
+            keep = ~(below | above)
+            x_reduced = [exog[keep]]
+            y_reduced = [endog[keep]]
+            for glob in (below, above):
+                if glob.any():
+                    x_reduced.append(exog[glob].sum(0)[None, :])
+                    y_reduced.append([endog[glob].sum()])
+            params, it = _frisch_newton(np.concatenate(x_reduced),
+                                        np.concatenate(y_reduced), q,
+                                        p_tol=p_tol, max_iter=max_iter)
+            n_iter += it
+            resid = endog - np.dot(exog, params)
+            below_bad = below & (resid > 0)
+            above_bad = above & (resid < 0)
+            n_bad = below_bad.sum() + above_bad.sum()
+            if n_bad == 0:
+                return params, n_iter
+            if n_bad > 0.1 * n_keep:
+                break
+            below &= ~below_bad
+            above &= ~above_bad
+
+        # Too many observations on the wrong side, try again with a larger
+        # reduced problem
+        m *= 2
+        start_params = None
+
+    params, it = _frisch_newton(exog, endog, q, p_tol=p_tol,
+                                max_iter=max_iter)
+    return params, n_iter + it
 
 
 def _parzen(u):
@@ -0,0 +1,489 @@
+"""
+Rolling and expanding window least squares
+
+The window estimates are computed recursively. The inverse of the
+cross-product matrix of the window is updated with a rank-one update for the
+observation that enters the window and a rank-one downdate for the
+observation that leaves it, which costs O(k_vars**2) operations per window
+instead of a new factorization. The inverse is recomputed from the exactly
+accumulated cross-products at regular intervals and whenever a window is
+close to singular, so that rounding errors of the updates cannot accumulate.
+
+Author: statsmodels developers
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+from scipy import stats
+
+from statsmodels.compat.numpy import np_matrix_rank
+import statsmodels.base.model as base
+from statsmodels.tools.decorators import resettable_cache, cache_readonly
+
+__all__ = ['RollingOLS', 'RollingWLS', 'RollingRegressionResults']
+
+
+def _inv_xtx(xtx):
+    """inverse of a cross-product matrix and its rank"""
+    rank = np_matrix_rank(xtx)
+    if rank == xtx.shape[0]:
+        try:
+            return np.linalg.inv(xtx), rank
+        except np.linalg.LinAlgError:
+            pass
+    return np.linalg.pinv(xtx), rank
+
+
+_rolling_doc = """
+    Rolling %(model)s Least Squares
+
+    Estimates the linear regression separately for each window of `window`
+    consecutive observations, or for each expanding window that starts at
+    the first observation.
+
+    %(params)s
+    window : int
+        Length of the rolling window. If `expanding` is True, then `window`
+        is the number of observations in the first window.
+    %(weights)smin_nobs : int, optional
+        Not used for rolling windows. For expanding windows, the minimum
+        number of observations of the first window. Defaults to `window`, or
+        to the number of regressors if `window` is None.
+    expanding : bool
+        If True, then the windows start at the first observation and grow by
+        one observation at each step.
+    %(extra_params)s
+
+    See Also
+    --------
+    statsmodels.regression.linear_model.%(model_class)s
+    statsmodels.regression.recursive_ls.RecursiveLS
+
+    Notes
+    -----
+    The results for window `t` are stored at the position of the last
+    observation of the window, and are nan for positions before the end of
+    the first window.
+
+    The cross-product matrix of each window is inverted with rank-one
+    updates, see the module docstring. `refresh` in `fit` controls how often
+    the inverse is recomputed from scratch. Windows in which the design
+    matrix does not have full rank use the pseudoinverse.
+
+    Examples
+    --------
+    >>> mod = RollingOLS(endog, exog, window=60)
+    >>> res = mod.fit(cov_type='HC0')
+    >>> res.params      # one row of parameters for each window
+    """
+
+
+class RollingWLS(base.Model):
+    __doc__ = _rolling_doc % {
+        'model': 'Weighted',
+        'model_class': 'WLS',
+        'params': base._model_params_doc,
+        'weights': """weights : array-like, optional
+        1d array of weights, as in `WLS`. If not supplied, then all
+        weights are one.
+    """,
+        'extra_params': base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, window=None, weights=None,
+                 min_nobs=None, expanding=False, missing='none',
+                 hasconst=None, **kwargs):
+        if weights is not None:
+            kwargs['weights'] = np.asarray(weights, dtype=np.float64)
+        super(RollingWLS, self).__init__(endog, exog, missing=missing,
+                                         hasconst=hasconst, **kwargs)
+        if self.exog.ndim == 1:
+            self.exog = self.exog[:, None]
+        nobs, k_vars = self.exog.shape
+        if self.endog.ndim != 1:
+            raise ValueError("endog needs to be 1-dimensional")
+        if getattr(self, 'weights', None) is None:
+            self.weights = None
+        elif self.weights.shape != (nobs,):
+            raise ValueError("weights need to have the same length as endog")
+        elif (self.weights <= 0).any():
+            raise ValueError("weights have to be positive")
+
+        if window is None:
+            if not expanding:
+                raise ValueError("window is required for rolling windows")
+            window = k_vars
+        self.window = int(window)
+        self.expanding = expanding
+        if expanding:
+            self.min_nobs = self.window if min_nobs is None else int(min_nobs)
+        else:
+            self.min_nobs = self.window
+        if self.min_nobs < k_vars:
+            raise ValueError("windows need at least as many observations as "
+                             "there are regressors")
+        if self.min_nobs > nobs:
+            raise ValueError("the first window is longer than the data")
+        self.nobs = nobs
+        self.k_vars = k_vars
+
+        if self.weights is None:
+            self.wendog, self.wexog = self.endog, self.exog
+        else:
+            w_half = np.sqrt(self.weights)
+            self.wendog = w_half * self.endog
+            self.wexog = w_half[:, None] * self.exog
+
+    def _window_sums(self, x):
+        """sum of x over the window ending at each observation"""
+        csum = np.cumsum(x, axis=0)
+        if not self.expanding:
+            csum[self.window:] = csum[self.window:] - csum[:-self.window]
+        return csum
+
+    def fit(self, cov_type='nonrobust', use_t=None, refresh=1000,
+            params_only=False):
+        """
+        Estimate the parameters for all windows
+
+        Parameters
+        ----------
+        cov_type : {'nonrobust', 'HC0', 'HC1'}
+            Covariance estimator of the parameters. The heteroscedasticity
+            robust covariances need the residuals of each window and cost
+            O(window * k_vars**2) operations per window.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values. Defaults to True for the nonrobust
+            covariance and to False otherwise, as in `RegressionResults`.
+        refresh : int
+            Number of rank-one updates after which the inverse of the
+            cross-product matrix is recomputed from the cross-products.
+        params_only : bool
+            If True, then only the parameters are computed, and the
+            covariance of the parameters is not stored.
+
+        Returns
+        -------
+        RollingRegressionResults
+        """
+        cov_type = cov_type if cov_type == 'nonrobust' else cov_type.upper()
+        if cov_type not in ('nonrobust', 'HC0', 'HC1'):
+            raise ValueError("cov_type has to be 'nonrobust', 'HC0' or 'HC1'")
+        refresh = max(int(refresh), 1)
+
+        wendog, wexog = self.wendog, self.wexog
+        nobs, k_vars = wexog.shape
+        window, expanding = self.window, self.expanding
+        start = self.min_nobs - 1
+
+        # With a constant, endog is shifted by its mean, so that the sums of
+        # squares do not lose precision when endog has a large level. The
+        # shift only changes the constant parameter.
+        const_idx = getattr(self.data, 'const_idx', None)
+        center = (self.k_constant and const_idx is not None and
+                  np.ndim(const_idx) == 0)
+        if center:
+            const = self.exog[0, const_idx]
+            level = self.endog.mean()
+            wendog = wendog - level * wexog[:, const_idx] / const
+
+        params = np.full((nobs, k_vars), np.nan)
+        ssr = np.full(nobs, np.nan)
+        rank = np.full(nobs, np.nan)
+        if params_only:
+            cov_unscaled = None
+            cov_hc = None
+        else:
+            cov_unscaled = np.full((nobs, k_vars, k_vars), np.nan)
+            cov_hc = (None if cov_type == 'nonrobust' else
+                      np.full((nobs, k_vars, k_vars), np.nan))
+
+        xtx = np.dot(wexog[:start + 1].T, wexog[:start + 1])
+        xty = np.dot(wexog[:start + 1].T, wendog[:start + 1])
+        yty = np.dot(wendog[:start + 1], wendog[:start + 1])
+        xtx_inv, rank_t = _inv_xtx(xtx)
+        n_updates = 0
+        for t in range(start, nobs):
+            if t > start:
+                x_new, y_new = wexog[t], wendog[t]
+                xtx += np.outer(x_new, x_new)
+                xty += x_new * y_new
+                yty += y_new * y_new
+                drop = not expanding and t >= window
+                if drop:
+                    x_old, y_old = wexog[t - window], wendog[t - window]
+                    xtx -= np.outer(x_old, x_old)
+                    xty -= x_old * y_old
+                    yty -= y_old * y_old
+
+                n_updates += 1
+                update = rank_t == k_vars and n_updates < refresh
+                if update:
+                    # Sherman-Morrison update for the new observation
+                    ax = np.dot(xtx_inv, x_new)
+                    xtx_inv -= np.outer(ax, ax) / (1 + np.dot(x_new, ax))
+                    if drop:
+                        # and downdate for the observation leaving the window
+                        ax = np.dot(xtx_inv, x_old)
+                        denom = 1 - np.dot(x_old, ax)
+                        if denom > np.sqrt(np.finfo(np.float64).eps):
+                            xtx_inv += np.outer(ax, ax) / denom
+                        else:
+                            # window without x_old is (nearly) singular
+                            update = False
+                if not update:
+                    xtx_inv, rank_t = _inv_xtx(xtx)
+                    n_updates = 0
+
+            beta = np.dot(xtx_inv, xty)
+            params[t] = beta
+            ssr[t] = max(yty - 2 * np.dot(beta, xty) +
+                         np.dot(beta, np.dot(xtx, beta)), 0)
+            rank[t] = rank_t
+            if params_only:
+                continue
+            cov_unscaled[t] = xtx_inv
+            if cov_hc is not None:
+                low = 0 if expanding else t - window + 1
+                wx = wexog[low:t + 1]
+                # The meat is recomputed from the residuals of the window.
+                # Updating sums of the fourth moments of the regressors
+                # instead costs O(k_vars**4) per window and loses precision
+                # when the regressors have a large level.
+                wresid = wendog[low:t + 1] - np.dot(wx, beta)
+                xe = wx * wresid[:, None]
+                meat = np.dot(xe.T, xe)
+                cov_hc[t] = np.dot(xtx_inv, np.dot(meat, xtx_inv))
+
+        if center:
+            params[:, const_idx] += level / const
+
+        nobs_window = self._window_sums(np.ones(nobs))
+        nobs_window[:start] = np.nan
+        endog = self.endog - level if center else self.endog
+        if self.weights is None:
+            sum_w = nobs_window
+            sum_wy = self._window_sums(endog)
+        else:
+            sum_w = self._window_sums(self.weights)
+            sum_wy = self._window_sums(self.weights * endog)
+        centered_tss = (self._window_sums(wendog**2) - sum_wy**2 / sum_w)
+        yty_window = self._window_sums(self.wendog**2)
+        if self.weights is None:
+            sum_logw = np.zeros(nobs)
+        else:
+            sum_logw = self._window_sums(np.log(self.weights))
+        centered_tss[:start] = np.nan
+        yty_window[:start] = np.nan
+
+        res = RollingRegressionResults(
+            self, params, ssr=ssr, rank=rank, nobs=nobs_window,
+            centered_tss=centered_tss, uncentered_tss=yty_window,
+            sum_logweights=sum_logw, cov_unscaled=cov_unscaled,
+            cov_hc=cov_hc, cov_type=cov_type, use_t=use_t)
+        return res
+
+
+class RollingOLS(RollingWLS):
+    __doc__ = _rolling_doc % {
+        'model': 'Ordinary',
+        'model_class': 'OLS',
+        'params': base._model_params_doc,
+        'weights': '',
+        'extra_params': base._missing_param_doc + base._extra_param_doc}
+
+    def __init__(self, endog, exog, window=None, min_nobs=None,
+                 expanding=False, missing='none', hasconst=None, **kwargs):
+        super(RollingOLS, self).__init__(
+            endog, exog, window=window, weights=None, min_nobs=min_nobs,
+            expanding=expanding, missing=missing, hasconst=hasconst,
+            **kwargs)
+
+
+class RollingRegressionResults(object):
+    """
+    Results of a rolling or expanding window least squares estimation
+
+    All statistics have one entry for each observation, which refers to the
+    window that ends at the observation. Entries before the end of the first
+    window are nan. If the model data are pandas objects, then the results
+    are returned as pandas objects with the index of the data.
+
+    Attributes
+    ----------
+    params : ndarray
+        nobs x k_vars array of the parameter estimates of each window.
+    bse, tvalues, pvalues : ndarray
+        nobs x k_vars arrays of standard errors, t-statistics and p-values.
+        The p-values are based on the t distribution if `use_t` is True and
+        on the normal distribution otherwise.
+    nobs, df_resid, df_model : ndarray
+        Number of observations and degrees of freedom of each window.
+    ssr, scale, rsquared, rsquared_adj, llf, aic, bic : ndarray
+        Sum of squared residuals, residual variance, R-squared, adjusted
+        R-squared, log-likelihood and information criteria of each window.
+    cov_type : str
+        The covariance estimator of the parameters.
+    """
+
+    def __init__(self, model, params, ssr, rank, nobs, centered_tss,
+                 uncentered_tss, sum_logweights, cov_unscaled=None,
+                 cov_hc=None, cov_type='nonrobust', use_t=None):
+        self.model = model
+        self._params = params
+        self._ssr = ssr
+        self._rank = rank
+        self._nobs = nobs
+        self._centered_tss = centered_tss
+        self._uncentered_tss = uncentered_tss
+        self._sum_logweights = sum_logweights
+        self._cov_unscaled = cov_unscaled
+        self._cov_hc = cov_hc
+        self.cov_type = cov_type
+        if use_t is None:
+            use_t = cov_type == 'nonrobust'
+        self.use_t = use_t
+        self.k_constant = model.k_constant
+        self._cache = resettable_cache()
+
+    def _wrap(self, value):
+        data = self.model.data
+        if not hasattr(data, 'row_labels') or data.row_labels is None:
+            return value
+        import pandas as pd
+        index = data.row_labels
+        if value.ndim == 1:
+            return pd.Series(value, index=index)
+        elif value.ndim == 2:
+            return pd.DataFrame(value, index=index,
+                                columns=self.model.exog_names)
+        else:
+            names = self.model.exog_names
+            idx = pd.MultiIndex.from_product((index, names))
+            return pd.DataFrame(value.reshape(-1, value.shape[-1]),
+                                index=idx, columns=names)
+
+    @cache_readonly
+    def params(self):
+        return self._wrap(self._params)
+
+    @cache_readonly
+    def nobs(self):
+        return self._wrap(self._nobs)
+
+    @cache_readonly
+    def _df_resid(self):
+        return self._nobs - self._rank
+
+    @cache_readonly
+    def df_resid(self):
+        return self._wrap(self._df_resid)
+
+    @cache_readonly
+    def _df_model(self):
+        return self._rank - self.k_constant
+
+    @cache_readonly
+    def df_model(self):
+        return self._wrap(self._df_model)
+
+    @cache_readonly
+    def ssr(self):
+        return self._wrap(self._ssr)
+
+    @cache_readonly
+    def _scale(self):
+        return self._ssr / self._df_resid
+
+    @cache_readonly
+    def scale(self):
+        return self._wrap(self._scale)
+
+    mse_resid = scale
+
+    @cache_readonly
+    def _rsquared(self):
+        if self.k_constant:
+            return 1 - self._ssr / self._centered_tss
+        else:
+            return 1 - self._ssr / self._uncentered_tss
+
+    @cache_readonly
+    def rsquared(self):
+        return self._wrap(self._rsquared)
+
+    @cache_readonly
+    def rsquared_adj(self):
+        return self._wrap(1 - (np.divide(self._nobs - self.k_constant,
+                                         self._df_resid)
+                               * (1 - self._rsquared)))
+
+    @cache_readonly
+    def _llf(self):
+        nobs2 = self._nobs / 2.0
+        llf = -np.log(self._ssr) * nobs2
+        llf -= (1 + np.log(np.pi / nobs2)) * nobs2
+        llf += 0.5 * self._sum_logweights
+        return llf
+
+    @cache_readonly
+    def llf(self):
+        return self._wrap(self._llf)
+
+    @cache_readonly
+    def aic(self):
+        return self._wrap(-2 * self._llf + 2 * self._rank)
+
+    @cache_readonly
+    def bic(self):
+        return self._wrap(-2 * self._llf + np.log(self._nobs) * self._rank)
+
+    @cache_readonly
+    def _cov_params(self):
+        if self._cov_unscaled is None:
+            raise ValueError("the covariance of the parameters is not "
+                             "available after fit with params_only=True")
+        if self.cov_type == 'nonrobust':
+            return self._cov_unscaled * self._scale[:, None, None]
+        elif self.cov_type == 'HC1':
+            factor = self._nobs / self._df_resid
+            return self._cov_hc * factor[:, None, None]
+        return self._cov_hc
+
+    def cov_params(self):
+        """
+        Covariance of the parameter estimates of each window
+
+        Returns
+        -------
+        cov : ndarray
+            nobs x k_vars x k_vars array. For pandas data a DataFrame with a
+            MultiIndex of row label and parameter name.
+        """
+        return self._wrap(self._cov_params)
+
+    @cache_readonly
+    def _bse(self):
+        return np.sqrt(np.diagonal(self._cov_params, axis1=1, axis2=2))
+
+    @cache_readonly
+    def bse(self):
+        return self._wrap(self._bse)
+
+    @cache_readonly
+    def _tvalues(self):
+        return self._params / self._bse
+
+    @cache_readonly
+    def tvalues(self):
+        return self._wrap(self._tvalues)
+
+    @cache_readonly
+    def pvalues(self):
+        if self.use_t:
+            df_resid = self._df_resid[:, None]
+            pvalues = stats.t.sf(np.abs(self._tvalues), df_resid) * 2
+        else:
+            pvalues = stats.norm.sf(np.abs(self._tvalues)) * 2
+        return self._wrap(pvalues)
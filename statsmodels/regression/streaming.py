@@ -0,0 +1,526 @@
+"""
+Least squares estimation for data that does not fit into memory.
+
+The models in this module accumulate the sufficient statistics of a linear
+regression, the cross-products X'WX, X'Wy and y'Wy together with the number
+of observations, over an iterable of data chunks.  Only arrays of size
+(k_vars + 1) x (k_vars + 1) are kept in memory, so the number of
+observations is only limited by the time needed to pass over the data.
+
+Heteroscedasticity robust covariances need the residuals of the final
+parameter estimate and are computed in a second pass over the data.
+
+Author: statsmodels developers
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+
+from statsmodels.compat.numpy import np_matrix_rank
+from statsmodels.base._streaming import (StreamingModelMixin,
+                                         StreamingResultsMixin,
+                                         _chunk_endog_exog, _chunk_vector)
+from statsmodels.tools.decorators import cache_readonly, cache_writable
+from statsmodels.regression.linear_model import (RegressionResults,
+                                                 RegressionResultsWrapper)
+
+__all__ = ['StreamingOLS', 'StreamingWLS', 'StreamingRegressionResults']
+
+
+def _as_chunk(chunk, k_vars=None):
+    """convert one chunk to ndarrays (endog, exog, weights)"""
+    if len(chunk) == 2:
+        endog, exog = chunk
+        weights = None
+    elif len(chunk) == 3:
+        endog, exog, weights = chunk
+    else:
+        raise ValueError("chunks need to be tuples (endog, exog) or "
+                         "(endog, exog, weights)")
+
+    endog, exog = _chunk_endog_exog(endog, exog, k_vars)
+    weights = _chunk_vector(weights, endog.shape[0])
+    return endog, exog, weights
+
+
+class _CrossProducts(object):
+    """
+    Accumulator for the weighted cross-products of a linear regression
+
+    Parameters
+    ----------
+    k_vars : int
+        number of columns of exog
+    method : {"pinv", "qr"}
+        If "pinv", then X'WX, X'Wy are summed up directly. If "qr", then the
+        triangular factor R of the QR decomposition of the augmented matrix
+        [W^(1/2) X, W^(1/2) y] is updated with each chunk, which avoids
+        squaring the condition number of the design matrix.
+    """
+
+    def __init__(self, k_vars, method="pinv"):
+        if method not in ("pinv", "qr"):
+            raise ValueError('method has to be "pinv" or "qr"')
+        self.k_vars = k_vars
+        self.method = method
+        self.nobs = 0
+        self.sum_weights = 0.
+        self.sum_logweights = 0.
+        self.sum_wendog = 0.
+        self.sum_wexog = np.zeros(k_vars)
+        self.yty = 0.
+        self.exog_min = np.full(k_vars, np.inf)
+        self.exog_max = np.full(k_vars, -np.inf)
+        if method == "pinv":
+            self.xtx = np.zeros((k_vars, k_vars))
+            self.xty = np.zeros(k_vars)
+        else:
+            self.r_aug = np.zeros((k_vars + 1, k_vars + 1))
+
+    def update(self, endog, exog, weights=None):
+        """add the contribution of one chunk of observations"""
+        if endog.shape[0] == 0:
+            return
+        if not np.isfinite(exog).all() or not np.isfinite(endog).all():
+            raise ValueError("chunks contain inf or nans")
+        self.nobs += endog.shape[0]
+        self.exog_min = np.minimum(self.exog_min, exog.min(0))
+        self.exog_max = np.maximum(self.exog_max, exog.max(0))
+
+        if weights is None:
+            self.sum_weights += endog.shape[0]
+            self.sum_wendog += endog.sum()
+            self.sum_wexog += exog.sum(0)
+            wendog, wexog = endog, exog
+        else:
+            if (weights <= 0).any():
+                raise ValueError("weights have to be positive")
+            self.sum_weights += weights.sum()
+            self.sum_logweights += np.log(weights).sum()
+            self.sum_wendog += weights.dot(endog)
+            self.sum_wexog += weights.dot(exog)
+            w_half = np.sqrt(weights)
+            wendog = w_half * endog
+            wexog = w_half[:, None] * exog
+
+        self.yty += wendog.dot(wendog)
+        if self.method == "pinv":
+            self.xtx += wexog.T.dot(wexog)
+            self.xty += wexog.T.dot(wendog)
+        else:
+            aug = np.vstack((self.r_aug, np.column_stack((wexog, wendog))))
+            self.r_aug = np.linalg.qr(aug, mode='r')
+
+    @property
+    def wexog_xtx(self):
+        if self.method == "pinv":
+            return self.xtx
+        r = self.r_aug[:-1, :-1]
+        return r.T.dot(r)
+
+    def ssr(self, params):
+        """weighted sum of squared residuals evaluated at params"""
+        if self.method == "qr":
+            resid_proj = self.r_aug.dot(np.r_[-params, 1.])
+            return resid_proj.dot(resid_proj)
+        ssr = (self.yty - 2 * params.dot(self.xty) +
+               params.dot(self.xtx).dot(params))
+        return max(ssr, 0.)
+
+    def solve(self):
+        """
+        least squares solution based on the accumulated cross-products
+
+        Returns
+        -------
+        params : ndarray
+        normalized_cov_params : ndarray
+            pseudo-inverse of X'WX
+        singular_values : ndarray
+            singular values of the weighted design matrix
+        """
+        if self.method == "pinv":
+            normalized_cov_params = np.linalg.pinv(self.xtx)
+            params = normalized_cov_params.dot(self.xty)
+            eigvals = np.linalg.eigvalsh(self.xtx)[::-1]
+            singular_values = np.sqrt(np.clip(eigvals, 0, np.inf))
+        else:
+            r = self.r_aug[:-1, :-1]
+            rinv = np.linalg.pinv(r)
+            params = rinv.dot(self.r_aug[:-1, -1])
+            normalized_cov_params = rinv.dot(rinv.T)
+            singular_values = np.linalg.svd(r, compute_uv=False)
+        return params, normalized_cov_params, singular_values
+
+
+_stream_doc = """
+    %(model)s least squares from data chunks with bounded memory
+
+    The model makes a pass over all chunks when it is fit and only keeps the
+    cross-products of the weighted data.
+
+    Parameters
+    ----------
+    chunks : iterable or callable
+        Source of the data.  Either an iterable that yields tuples
+        %(chunk_desc)s or a callable without arguments that
+        returns such an iterable.  Chunks can be
+        ndarrays, memmaps or pandas objects.  If the first chunk contains
+        pandas objects, then their names are used for the parameters.
+        Computing heteroscedasticity robust covariances requires a second
+        pass over the data, and therefore either a callable or a sequence
+        that can be iterated more than once.
+    hasconst : None or bool
+        Indicates whether the design includes a constant.  If None, then
+        constant columns are detected from the minimum and maximum of each
+        column, and an implicit constant is detected from the projection of
+        the constant on the columns of exog.
+
+    Attributes
+    ----------
+    nobs : float
+        The number of observations, available after `fit`.
+
+    Notes
+    -----
+    %(notes)s
+
+    Examples
+    --------
+    >>> def chunks():
+    ...     for endog, exog in zip(np.array_split(y, 100),
+    ...                            np.array_split(x, 100)):
+    ...         yield endog, exog
+    >>> res = StreamingOLS(chunks).fit(cov_type="HC1")
+    """
+
+
+class StreamingWLS(StreamingModelMixin):
+    __doc__ = _stream_doc % {
+        'model': 'Weighted',
+        'chunk_desc': """``(endog, exog, weights)`` or ``(endog, exog)``""",
+        'notes': """The weights are the inverse of the variance of the observations,
+    as in `WLS`.  A chunk without weights uses a weight of one for all of
+    its observations.  Results differ from `WLS` with the same data only by
+    floating point accumulation error."""}
+
+    _weights_allowed = True
+
+    def __init__(self, chunks, hasconst=None):
+        self.chunks = chunks
+        self.hasconst = hasconst
+        self._data_attr = []
+        self.k_constant = None
+        self.rank = None
+
+    def _as_chunk(self, chunk, k_vars):
+        endog, exog, weights = _as_chunk(chunk, k_vars)
+        if weights is not None and not self._weights_allowed:
+            raise ValueError("%s does not allow weights" %
+                             self.__class__.__name__)
+        return endog, exog, weights
+
+    def _handle_constant(self, cp):
+        if self.hasconst is not None:
+            self.k_constant = int(self.hasconst)
+            const_idx = None
+        else:
+            const_idx = None
+            is_const = cp.exog_min == cp.exog_max
+            values = np.where(is_const, cp.exog_max, 0)
+            if (values == 1).any():
+                const_idx = np.nonzero(values == 1)[0][0]
+            elif (values != 0).any():
+                const_idx = np.nonzero(values != 0)[0][0]
+            if const_idx is not None:
+                self.k_constant = 1
+            else:
+                # implicit constant: project the (weighted) constant on exog
+                sw = cp.sum_wexog
+                fitted = sw.dot(np.linalg.pinv(cp.wexog_xtx)).dot(sw)
+                resid = cp.sum_weights - fitted
+                self.k_constant = int(np.abs(resid) <=
+                                      1e-8 * cp.sum_weights)
+        self.data.k_constant = self.k_constant
+        self.data.const_idx = const_idx
+
+    @property
+    def df_model(self):
+        """
+        The model degree of freedom, defined as the rank of the regressor
+        matrix minus 1 if a constant is included.
+        """
+        return float(self.rank - self.k_constant)
+
+    @property
+    def df_resid(self):
+        """
+        The residual degree of freedom, defined as the number of observations
+        minus the rank of the regressor matrix.
+        """
+        return self.nobs - self.rank
+
+    def fit(self, method="pinv", cov_type='nonrobust', use_t=None):
+        """
+        Fit the model with one pass over the data chunks
+
+        Parameters
+        ----------
+        method : {"pinv", "qr"}
+            "pinv" accumulates the cross-products X'WX and X'Wy and uses the
+            pseudoinverse of X'WX.  "qr" updates the triangular factor of
+            the QR decomposition of the data with each chunk.  It is slower
+            but numerically more stable for ill-conditioned designs.
+        cov_type : str
+            "nonrobust" or one of the heteroscedasticity robust covariances
+            "HC0", "HC1", "HC2" or "HC3".  The robust covariances are
+            computed with a second pass over the data.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when
+            computing p-values. Default behavior depends on cov_type.
+
+        Returns
+        -------
+        StreamingRegressionResults
+        """
+        if cov_type.upper() not in ('NONROBUST', 'HC0', 'HC1', 'HC2', 'HC3'):
+            raise ValueError('cov_type %s is not available for streaming '
+                             'least squares' % cov_type)
+        cp = None
+        for endog, exog, weights in self._iter_chunks():
+            if cp is None:
+                cp = _CrossProducts(self.k_vars, method=method)
+            cp.update(endog, exog, weights)
+        if cp is None or cp.nobs == 0:
+            raise ValueError("no observations in chunks")
+
+        self._cross_products = cp
+        self.nobs = float(cp.nobs)
+        self._handle_constant(cp)
+
+        params, normalized_cov_params, singular_values = cp.solve()
+        self.normalized_cov_params = normalized_cov_params
+        self.wexog_singular_values = singular_values
+        self.rank = np_matrix_rank(np.diag(singular_values))
+
+        res = StreamingRegressionResults(
+            self, params, normalized_cov_params=normalized_cov_params,
+            cov_type=cov_type, use_t=use_t)
+        return RegressionResultsWrapper(res)
+
+    def loglike(self, params):
+        """
+        The Gaussian log-likelihood evaluated at params
+
+        Parameters
+        ----------
+        params : array-like
+            The parameter estimates.
+
+        Returns
+        -------
+        llf : float
+            The value of the log-likelihood, which is the same as for `WLS`.
+        """
+        nobs2 = self.nobs / 2.0
+        ssr = self._cross_products.ssr(np.asarray(params))
+        llf = -np.log(ssr) * nobs2
+        llf -= (1 + np.log(np.pi / nobs2)) * nobs2
+        llf += 0.5 * self._cross_products.sum_logweights
+        return llf
+
+    def predict(self, params, exog=None):
+        """
+        Return linear predicted values from a design matrix.
+
+        Parameters
+        ----------
+        params : array-like
+            Parameters of a linear model
+        exog : array-like
+            Design / exogenous data. Required, the data of the model is not
+            stored.
+
+        Returns
+        -------
+        An array of fitted values
+        """
+        if exog is None:
+            raise ValueError("exog is required, streaming models do not "
+                             "store the data")
+        return np.dot(exog, params)
+
+
+class StreamingOLS(StreamingWLS):
+    __doc__ = _stream_doc % {
+        'model': 'Ordinary',
+        'chunk_desc': "``(endog, exog)``",
+        'notes': """Results differ from `OLS` with the same data only by floating point
+    accumulation error."""}
+
+    _weights_allowed = False
+
+
+class StreamingRegressionResults(StreamingResultsMixin,
+                                 RegressionResults):
+    """
+    Results of a least squares fit to data chunks
+
+    Statistics that depend only on the cross-products of the data are
+    available as in `RegressionResults`.  Residuals and fitted values are not
+    stored, heteroscedasticity robust covariances are computed with an
+    additional pass over the data.
+
+    See Also
+    --------
+    RegressionResults
+    """
+
+    @cache_readonly
+    def nobs(self):
+        return self.model.nobs
+
+    @cache_writable()
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def ssr(self):
+        return self.model._cross_products.ssr(self.params)
+
+    @cache_readonly
+    def centered_tss(self):
+        cp = self.model._cross_products
+        return cp.yty - cp.sum_wendog**2 / cp.sum_weights
+
+    @cache_readonly
+    def uncentered_tss(self):
+        return self.model._cross_products.yty
+
+    def _hc_meat(self, cov_type):
+        """sum of the outer products of wexog times het_scale"""
+        params = self.params
+        normalized_cov_params = self.normalized_cov_params
+        k_vars = len(params)
+        meat = np.zeros((k_vars, k_vars))
+        for endog, exog, weights in self.model._iter_chunks():
+            if weights is None:
+                wexog = exog
+                wresid = endog - exog.dot(params)
+            else:
+                w_half = np.sqrt(weights)
+                wexog = w_half[:, None] * exog
+                wresid = w_half * (endog - exog.dot(params))
+            if cov_type == 'HC2':
+                h = (wexog.dot(normalized_cov_params) * wexog).sum(1)
+                het_scale = wresid**2 / (1 - h)
+            elif cov_type == 'HC3':
+                h = (wexog.dot(normalized_cov_params) * wexog).sum(1)
+                het_scale = (wresid / (1 - h))**2
+            else:
+                het_scale = wresid**2
+            meat += (wexog * het_scale[:, None]).T.dot(wexog)
+        return meat
+
+    def _HCCM_stream(self, cov_type):
+        normalized_cov_params = self.normalized_cov_params
+        meat = self._hc_meat(cov_type)
+        return normalized_cov_params.dot(meat).dot(normalized_cov_params)
+
+    @cache_readonly
+    def cov_HC0(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        return self._HCCM_stream('HC0')
+
+    @cache_readonly
+    def cov_HC1(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        return self.nobs / self.df_resid * self.cov_HC0
+
+    @cache_readonly
+    def cov_HC2(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        return self._HCCM_stream('HC2')
+
+    @cache_readonly
+    def cov_HC3(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        return self._HCCM_stream('HC3')
+
+    def get_prediction(self, exog=None, transform=True, weights=None,
+                       row_labels=None, **kwds):
+        if exog is None:
+            raise ValueError("exog is required, streaming models do not "
+                             "store the data")
+        return super(StreamingRegressionResults, self).get_prediction(
+            exog=exog, transform=transform, weights=weights,
+            row_labels=row_labels, **kwds)
+
+    get_prediction.__doc__ = RegressionResults.get_prediction.__doc__
+
+    def summary(self, yname=None, xname=None, title=None, alpha=.05):
+        """Summarize the Regression Results
+
+        The summary does not include residual diagnostics, which would
+        require the residuals of all observations.
+
+        Parameters
+        -----------
+        yname : string, optional
+            Default is `y`
+        xname : list of strings, optional
+            Default is `var_##` for ## in p the number of regressors
+        title : string, optional
+            Title for the top table. If not None, then this replaces the
+            default title
+        alpha : float
+            significance level for the confidence intervals
+
+        Returns
+        -------
+        smry : Summary instance
+            this holds the summary tables and text, which can be printed or
+            converted to various output formats.
+        """
+        top_left = [('Dep. Variable:', None),
+                    ('Model:', None),
+                    ('Method:', ['Least Squares']),
+                    ('Date:', None),
+                    ('Time:', None),
+                    ('No. Observations:', None),
+                    ('Df Residuals:', None),
+                    ('Df Model:', None),
+                    ('Covariance Type:', [self.cov_type]),
+                    ]
+
+        top_right = [('R-squared:', ["%#8.3f" % self.rsquared]),
+                     ('Adj. R-squared:', ["%#8.3f" % self.rsquared_adj]),
+                     ('F-statistic:', ["%#8.4g" % self.fvalue]),
+                     ('Prob (F-statistic):', ["%#6.3g" % self.f_pvalue]),
+                     ('Log-Likelihood:', None),
+                     ('AIC:', ["%#8.4g" % self.aic]),
+                     ('BIC:', ["%#8.4g" % self.bic]),
+                     ('Cond. No.', ["%#8.3g" % self.condition_number]),
+                     ]
+
+        if title is None:
+            title = self.model.__class__.__name__ + ' ' + "Regression Results"
+
+        from statsmodels.iolib.summary import Summary
+        smry = Summary()
+        smry.add_table_2cols(self, gleft=top_left, gright=top_right,
+                             yname=yname, xname=xname, title=title)
+        smry.add_table_params(self, yname=yname, xname=xname, alpha=alpha,
+                              use_t=self.use_t)
+        smry.add_extra_txt(["Warnings:",
+                            "[1] " + self.cov_kwds['description']])
+        return smry
@@ -0,0 +1,106 @@
+"""
+Tests for least squares with absorbed fixed effects
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.stats.sandwich_covariance import (cov_cluster,
+                                                   cov_cluster_2groups)
+
+
+def _gen_data(nobs=600, seed=976):
+    np.random.seed(seed)
+    firm = np.random.randint(0, 40, size=nobs)
+    year = np.random.randint(0, 10, size=nobs)
+    exog = np.random.randn(nobs, 2) + 0.1 * firm[:, None]
+    endog = (exog.dot([1., -0.5]) + 0.2 * firm - 0.1 * year +
+             np.random.randn(nobs))
+    weights = np.random.uniform(0.5, 2, size=nobs)
+    # full rank set of dummy variables
+    dummies = np.column_stack((pd.get_dummies(firm).values,
+                               pd.get_dummies(year).values[:, 1:]))
+    exog_dummies = np.column_stack((exog, dummies.astype(float)))
+    return endog, exog, exog_dummies, firm, year, weights
+
+
+@pytest.mark.parametrize('weighted', [False, True])
+def test_absorb_dummies(weighted):
+    endog, exog, exog_dummies, firm, year, weights = _gen_data()
+    absorb = np.column_stack((firm, year))
+    if weighted:
+        mod1 = WLS(endog, exog, weights=weights, absorb=absorb)
+        mod2 = WLS(endog, exog_dummies, weights=weights)
+    else:
+        mod1 = OLS(endog, exog, absorb=absorb)
+        mod2 = OLS(endog, exog_dummies)
+    res1, res2 = mod1.fit(), mod2.fit()
+    assert_equal(mod1.df_absorb, 49)
+    assert_allclose(res1.params, res2.params[:2], rtol=1e-9)
+    assert_allclose(res1.bse, res2.bse[:2], rtol=1e-9)
+    assert_equal(res1.df_resid, res2.df_resid)
+    assert_equal(res1.df_model, 2)
+    assert_allclose(res1.llf, res2.llf, rtol=1e-12)
+    assert_allclose(res1.ssr, res2.ssr, rtol=1e-10)
+    assert_allclose(res1.resid, res2.resid, atol=1e-10)
+    assert_allclose(res1.fittedvalues, res2.fittedvalues, atol=1e-9)
+    # heteroscedasticity robust with df correction
+    assert_allclose(res1.get_robustcov_results('HC1').bse,
+                    res2.get_robustcov_results('HC1').bse[:2], rtol=1e-9)
+    res1.summary()
+
+
+def test_absorb_cluster():
+    endog, exog, exog_dummies, firm, year, _ = _gen_data()
+    res1 = OLS(endog, exog, absorb=np.column_stack((firm, year))).fit()
+    res2 = OLS(endog, exog_dummies).fit()
+    nobs = len(endog)
+
+    # neither factor is nested in the clusters, same as with dummies
+    cluster = (firm + year) % 7
+    assert_allclose(cov_cluster(res1, cluster),
+                    cov_cluster(res2, cluster)[:2, :2], rtol=1e-9)
+    groups = np.column_stack((cluster, (3 * firm + year) % 5))
+    assert_allclose(cov_cluster_2groups(res1, groups)[0],
+                    cov_cluster_2groups(res2, groups)[0][:2, :2], rtol=1e-9)
+
+    # firm effects are nested in clusters and not counted as parameters
+    cluster = firm // 4
+    k_dummies = exog_dummies.shape[1]
+    correction = (nobs - k_dummies) / (nobs - 2 - 10)
+    assert_allclose(cov_cluster(res1, cluster),
+                    cov_cluster(res2, cluster)[:2, :2] * correction,
+                    rtol=1e-9)
+    res1c = OLS(endog, exog, absorb=np.column_stack((firm, year))).fit(
+        cov_type='cluster', cov_kwds={'groups': cluster})
+    assert_allclose(res1c.cov_params(), cov_cluster(res1, cluster),
+                    rtol=1e-12)
+
+
+def test_absorb_pandas_single_factor():
+    endog, exog, exog_dummies, firm, year, _ = _gen_data()
+    endog = pd.Series(endog, name='y')
+    exog = pd.DataFrame(exog, columns=['a', 'b'])
+    firm = pd.Series(firm).map(lambda i: 'firm%d' % i)
+    res1 = OLS(endog, exog, absorb=firm).fit()
+    res2 = OLS(endog, exog_dummies[:, :42]).fit()
+    assert_equal(res1.params.index.tolist(), ['a', 'b'])
+    assert_allclose(res1.params, res2.params[:2], rtol=1e-9)
+    assert_allclose(res1.bse, res2.bse[:2], rtol=1e-9)
+    assert_equal(res1.model.df_absorb, 40)
+
+
+def test_absorb_errors():
+    endog, exog, _, firm, year, _ = _gen_data()
+    exog_const = np.column_stack((np.ones(len(endog)), exog))
+    with pytest.raises(ValueError):
+        OLS(endog, exog_const, absorb=firm)
+    with pytest.raises(NotImplementedError):
+        OLS(endog, exog, absorb=np.column_stack((firm, year)),
+            missing='drop')
@@ -13,11 +13,11 @@ import statsmodels.tools.numdiff as nd
 import os
 import csv
 import scipy
+from distutils.version import LooseVersion
 
 # TODO: add tests with unequal group sizes
 
-v = scipy.__version__.split(".")[1]
-old_scipy = int(v) < 16
+old_scipy = LooseVersion(scipy.__version__) < '0.16'
 
 class R_Results(object):
     """
@@ -363,6 +363,160 @@ class TestMixedLM(object):
         assert_allclose(result.params, result2.params)
         assert_allclose(result.bse, result2.bse)
 
+    def test_unequal_groups(self):
+        # Groups of varying sizes, with varying numbers of variance
+        # component columns, are stacked into several blocks.
+
+        np.random.seed(3559)
+        sizes = np.random.randint(2, 7, size=150)
+        n_grp, n = len(sizes), sizes.sum()
+        groups = np.repeat(np.arange(n_grp), sizes)
+        exog_fe = np.random.normal(size=(n, 2))
+        exog_re = np.ones((n, 2))
+        exog_re[:, 1] = np.random.normal(size=n)
+        exog_vc = np.random.normal(size=(n, 2))
+        slopes = np.random.normal(size=(n_grp, 2))
+        slopes_vc = np.random.normal(size=(n_grp, 2))
+        endog = (exog_fe.sum(1) + (slopes[groups] * exog_re).sum(1) +
+                 (slopes_vc[groups] * exog_vc).sum(1) +
+                 np.random.normal(size=n))
+
+        vc = {"a": {}}
+        for i in range(n_grp):
+            ix = np.flatnonzero(groups == i)
+            vc["a"][i] = exog_vc[ix, 0:1 + i % 2]
+
+        model = MixedLM(endog, exog_fe, groups, exog_re, exog_vc=vc,
+                        use_sqrt=False)
+        assert_equal(len(model._blocks), 2)
+
+        fe_params = np.r_[0.5, -0.5]
+        cov_re = np.array([[1., 0.3], [0.3, 0.5]])
+        vcomp = np.r_[0.7]
+        params = MixedLMParams.from_components(fe_params, cov_re=cov_re,
+                                               vcomp=vcomp)
+        params_vec = params.get_packed(use_sqrt=False, has_fe=True)
+
+        # Compare to the log-likelihood using the full covariance
+        # matrix
+        vmat = np.eye(n)
+        for i in range(n_grp):
+            ix = np.flatnonzero(groups == i)
+            exr = exog_re[ix]
+            vmat[np.ix_(ix, ix)] += (np.dot(exr, np.dot(cov_re, exr.T)) +
+                                     vcomp[0] * np.dot(vc["a"][i],
+                                                       vc["a"][i].T))
+        resid = endog - np.dot(exog_fe, fe_params)
+        qf = np.dot(resid, np.linalg.solve(vmat, resid))
+        llf = (-np.linalg.slogdet(vmat)[1] / 2 - n * np.log(qf) / 2 -
+               n * np.log(2 * np.pi) / 2 + n * np.log(n) / 2 - n / 2.)
+
+        for reml in False, True:
+            rslt = model.fit(reml=reml)
+            if not reml:
+                assert_allclose(model.loglike(params, profile_fe=False), llf,
+                                rtol=1e-10)
+
+            loglike = loglike_function(model, profile_fe=False, has_fe=True)
+            gr = -model.score(params, profile_fe=False)
+            ngr = nd.approx_fprime(params_vec, loglike)
+            assert_allclose(gr, ngr, rtol=1e-4)
+
+            # The Hessian at the MLE
+            hess = -model.hessian(rslt.params_object)
+            nhess = nd.approx_hess(rslt.params_object.get_packed(
+                use_sqrt=False, has_fe=True), loglike)
+            assert_allclose(hess, nhess, rtol=1e-3)
+
+    @skipif(old_scipy, 'SciPy too old')
+    def test_sparse_crossed(self):
+        # Crossed random effects in a single group use the sparse
+        # factorization
+
+        np.random.seed(3560)
+        n = 1500
+        a = np.random.randint(0, 80, size=n)
+        b = np.random.randint(0, 60, size=n)
+        y = (np.random.normal(size=80)[a] +
+             0.5 * np.random.normal(size=60)[b] + np.random.normal(size=n))
+        data = pd.DataFrame({"y": y, "x": np.random.normal(size=n),
+                             "a": a, "b": b, "g": 1})
+        vcf = {"a": "0 + C(a)", "b": "0 + C(b)"}
+
+        rslts = []
+        for use_sparse in False, True:
+            model = MixedLM.from_formula("y ~ x", groups="g", re_formula="0",
+                                         vc_formula=vcf, data=data,
+                                         use_sparse=use_sparse)
+            assert_equal(model._blocks[0]["sparse"], use_sparse)
+            rslts.append(model.fit())
+        result, result2 = rslts
+
+        assert_allclose(result.params, result2.params, rtol=1e-6)
+        assert_allclose(result.bse, result2.bse, rtol=1e-6)
+        assert_allclose(result.llf, result2.llf, rtol=1e-10)
+
+    @skipif(old_scipy, 'SciPy too old')
+    def test_sparse_derivs(self):
+        # The score and Hessian of a sparse group with a random slope
+        # and crossed variance components, compared to the dense
+        # calculations
+
+        np.random.seed(3561)
+        n = 800
+        g = np.repeat(np.arange(4), n // 4)
+        a = np.random.randint(0, 60, size=n)
+        b = np.random.randint(0, 50, size=n)
+        x = np.random.normal(size=n)
+        y = (x + np.random.normal(size=4)[g] +
+             np.random.normal(size=4)[g] * x +
+             np.random.normal(size=(4, 60))[g, a] +
+             0.5 * np.random.normal(size=(4, 50))[g, b] +
+             np.random.normal(size=n))
+        data = pd.DataFrame({"y": y, "x": x, "a": a, "b": b, "g": g})
+        vcf = {"a": "0 + C(a)", "b": "0 + C(b)"}
+
+        params = MixedLMParams.from_components(
+            np.r_[0.1, 0.9], cov_re=np.array([[0.5, 0.1], [0.1, 0.3]]),
+            vcomp=np.r_[0.8, 0.4])
+        for reml in False, True:
+            models, rslts = [], []
+            for use_sparse in False, True:
+                model = MixedLM.from_formula(
+                    "y ~ x", groups="g", re_formula="1 + x", vc_formula=vcf,
+                    data=data, use_sparse=use_sparse, use_sqrt=False)
+                assert_equal(model._blocks[0]["sparse"], use_sparse)
+                rslts.append(model.fit(reml=reml))
+                models.append(model)
+            model, model2 = models
+
+            assert_allclose(model2.score(params, profile_fe=False),
+                            model.score(params, profile_fe=False),
+                            rtol=1e-8)
+
+            # The Hessian at the MLE
+            params_mle = rslts[0].params_object
+            assert_allclose(model2.hessian(params_mle),
+                            model.hessian(params_mle), rtol=1e-4, atol=1e-4)
+            assert_allclose(rslts[1].bse, rslts[0].bse, rtol=1e-4)
+
+    def test_sparse_inv_diag(self):
+        from scipy.sparse.linalg import splu
+        from statsmodels.regression.mixed_linear_model import (
+            _sparse_inv_diag)
+
+        np.random.seed(3562)
+        z = scipy.sparse.random(200, 80, density=0.03, format="csr")
+        qmat = scipy.sparse.csc_matrix(z.T.dot(z) + scipy.sparse.eye(80))
+        desired = np.diag(np.linalg.inv(qmat.toarray()))
+
+        # The selected inverse, and solves for a pivoted factorization
+        lu = splu(qmat, permc_spec="NATURAL", diag_pivot_thresh=0,
+                  options={"SymmetricMode": True})
+        assert_allclose(_sparse_inv_diag(lu), desired, rtol=1e-10)
+        lu = splu(qmat)
+        assert_allclose(_sparse_inv_diag(lu), desired, rtol=1e-10)
+
     def test_pastes_vcomp(self):
         # pastes data from lme4
         #
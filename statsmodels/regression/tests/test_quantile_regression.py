@@ -1,7 +1,9 @@
 import scipy.stats
 import numpy as np
 import statsmodels.api as sm
-from numpy.testing import assert_allclose, assert_equal, assert_almost_equal
+from numpy.testing import (assert_allclose, assert_equal, assert_almost_equal,
+                           assert_raises)
+import pytest
 from patsy import dmatrices  # pylint: disable=E0611
 from statsmodels.regression.quantile_regression import QuantReg
 from .results_quantile_regression import (
@@ -252,3 +254,46 @@ def test_zero_resid():
     assert_allclose(res.bse, np.array([0.04455029, 0.01155251]), rtol=1e-4, atol=1e-20)
     assert_allclose(res.resid, np.array([-9.99982796e-08, 3.22583598e-02,
                                          -3.22574234e-02, 9.46361860e-07]), rtol=1e-4, atol=1e-20)
+
+
+@pytest.mark.parametrize('method', ['fn', 'pfn'])
+def test_interior_point(method):
+    data = sm.datasets.engel.load_pandas().data
+    y, X = dmatrices('foodexp ~ income', data, return_type='dataframe')
+    res = QuantReg(y, X).fit(q=.1, method=method, p_tol=1e-10)
+    assert_allclose(np.array(res.fittedvalues), Rquantreg.fittedvalues,
+                    rtol=1e-7)
+    assert res.history is None
+
+    # the robust vcov depends on the sign of the residuals that are zero
+    # at the solution
+    res1 = QuantReg(y, X).fit(q=.25, vcov='iid', p_tol=1e-10)
+    res2 = QuantReg(y, X).fit(q=.25, vcov='iid', method=method, p_tol=1e-10)
+    assert_allclose(res2.params, res1.params, rtol=1e-7)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-5)
+
+    assert_raises(ValueError, QuantReg(y, X).fit, q=0, method=method)
+    X['income2'] = 2 * X['income']
+    assert_raises(ValueError, QuantReg(y, X).fit, q=.5, method=method)
+
+
+def test_fit_many():
+    np.random.seed(2468)
+    nobs = 5000
+    exog = sm.add_constant(np.random.randn(nobs, 3))
+    endog = exog.sum(1) + (1 + np.abs(exog[:, 1])) * np.random.randn(nobs)
+    mod = QuantReg(endog, exog)
+
+    def check_loss(params, q):
+        resid = endog - np.dot(exog, params)
+        return np.sum(resid * (q - (resid < 0)))
+
+    q = [.75, .25, .5, .3]
+    results = mod.fit_many(q, p_tol=1e-10)
+    for qi, res in zip(q, results):
+        assert_equal(res.q, qi)
+        res_fn = mod.fit(q=qi, method='fn', p_tol=1e-10)
+        assert_allclose(res.params, res_fn.params, rtol=1e-6, atol=1e-8)
+        res_irls = mod.fit(q=qi)
+        assert (check_loss(res.params, qi) <=
+                check_loss(res_irls.params, qi) + 1e-6)
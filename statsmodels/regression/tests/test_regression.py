@@ -11,7 +11,8 @@ from numpy.testing import (assert_almost_equal, assert_approx_equal, assert_,
 from scipy.linalg import toeplitz
 from statsmodels.tools.tools import add_constant, categorical
 from statsmodels.compat.numpy import np_matrix_rank
-from statsmodels.regression.linear_model import OLS, WLS, GLS, yule_walker
+from statsmodels.regression.linear_model import (OLS, WLS, GLS, BatchOLS,
+                                                 yule_walker)
 from statsmodels.datasets import longley
 from scipy.stats import t as student_t
 
@@ -1245,6 +1246,179 @@ def test_regularized_options():
     assert_allclose(result1.params, result2.params)
 
 
+def test_regularized_path():
+    np.random.seed(83124)
+    n, p = 200, 8
+    xmat = np.random.normal(size=(n, p))
+    xmat[:, 1] += xmat[:, 0]
+    yvec = xmat[:, :3].sum(1) + np.random.normal(size=n)
+    exog = add_constant(xmat)
+    model = OLS(yvec, exog)
+    wts = np.r_[0, np.ones(p)]
+    for L1_wt in [1., 0.5]:
+        path = model.fit_regularized_path(L1_wt=L1_wt, n_alphas=20,
+                                          penalty_wts=wts)
+        assert_equal(path.params.shape, (20, p + 1))
+        assert_(path.converged.all())
+        # only the unpenalized constant at the largest penalty
+        assert_equal(path.df_model[0], 1)
+        assert_equal(path.df_model[-1], p + 1)
+        path2 = model.fit_regularized_path(alphas=path.alphas, L1_wt=L1_wt,
+                                           penalty_wts=wts,
+                                           strong_rules=False)
+        assert_allclose(path.params, path2.params, rtol=1e-8, atol=1e-10)
+        for i in [3, 10, 19]:
+            rslt = model.fit_regularized(alpha=path.alphas[i] * wts,
+                                         L1_wt=L1_wt, maxiter=1000)
+            assert_allclose(path.params[i], rslt.params, rtol=1e-6,
+                            atol=1e-8)
+            assert_allclose(path.get_results(i).params, path.params[i])
+
+
+def test_regularized_path_pandas():
+    np.random.seed(3132)
+    xmat = pandas.DataFrame(np.random.normal(size=(100, 3)),
+                            columns=['a', 'b', 'c'])
+    yvec = pandas.Series(xmat.sum(1) + np.random.normal(size=100))
+    path = OLS(yvec, xmat).fit_regularized_path(alphas=[1., 0.5, 0.1])
+    assert_equal(path.params.columns.tolist(), ['a', 'b', 'c'])
+    assert_allclose(path.params.index, [1., 0.5, 0.1])
+    assert_raises(ValueError, OLS(yvec, xmat).fit_regularized_path,
+                  alphas=[0.1, 1.])
+
+class TestOLSCholesky(object):
+    # compare fit with the Cholesky factor of X'X to the pinv fit
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(872451)
+        nobs = 200
+        exog = add_constant(np.random.randn(nobs, 3))
+        endog = exog.sum(1) + (1 + exog[:, 1]**2) * np.random.randn(nobs)
+        weights = np.random.uniform(0.5, 2, size=nobs)
+        cls.res1 = OLS(endog, exog).fit(method="cholesky")
+        cls.res2 = OLS(endog, exog).fit()
+        cls.res1w = WLS(endog, exog, weights=weights).fit(method="cholesky")
+        cls.res2w = WLS(endog, exog, weights=weights).fit()
+
+    def test_no_pinv(self):
+        assert_(not hasattr(self.res1.model, 'pinv_wexog'))
+        assert_equal(self.res1.model.rank, 4)
+
+    def test_params(self):
+        for res1, res2 in [(self.res1, self.res2), (self.res1w, self.res2w)]:
+            assert_allclose(res1.params, res2.params, rtol=1e-12)
+            assert_allclose(res1.bse, res2.bse, rtol=1e-12)
+            assert_allclose(res1.normalized_cov_params,
+                            res2.normalized_cov_params, rtol=1e-12)
+            assert_allclose(res1.condition_number, res2.condition_number,
+                            rtol=1e-8)
+
+    def test_hc(self):
+        for res1, res2 in [(self.res1, self.res2), (self.res1w, self.res2w)]:
+            for name in ['cov_HC0', 'cov_HC1', 'cov_HC2', 'cov_HC3']:
+                assert_allclose(getattr(res1, name), getattr(res2, name),
+                                rtol=1e-12)
+
+    def test_sandwich(self):
+        import statsmodels.stats.sandwich_covariance as sw
+        assert_allclose(sw.cov_hc2(self.res1), sw.cov_hc2(self.res2),
+                        rtol=1e-12)
+        groups = np.arange(self.res1.nobs) // 5
+        assert_allclose(sw.cov_cluster(self.res1, groups),
+                        sw.cov_cluster(self.res2, groups), rtol=1e-12)
+
+    def test_influence(self):
+        infl1 = self.res1.get_influence()
+        infl2 = self.res2.get_influence()
+        assert_allclose(infl1.hat_matrix_diag, infl2.hat_matrix_diag,
+                        rtol=1e-12)
+        assert_allclose(infl1.cooks_distance[0], infl2.cooks_distance[0],
+                        rtol=1e-10)
+
+    def test_singular(self):
+        exog = self.res2.model.exog
+        exog = np.column_stack((exog, exog[:, 1] + exog[:, 2]))
+        endog = self.res2.model.endog
+        res1 = OLS(endog, exog).fit(method="cholesky")
+        res2 = OLS(endog, exog).fit()
+        assert_(res1.model.wexog_cholesky is None)
+        assert_equal(res1.df_model, 3)
+        assert_allclose(res1.fittedvalues, res2.fittedvalues, rtol=1e-10)
+        assert_allclose(res1.params, res2.params, rtol=1e-8)
+
+
+class TestBatchOLS(object):
+
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(987531)
+        nobs, k_endog = 100, 5
+        exog = add_constant(np.random.randn(nobs, 2))
+        endog = (exog.dot(np.random.randn(3, k_endog)) +
+                 np.random.randn(nobs, k_endog))
+        cls.endog, cls.exog = endog, exog
+        cls.res = BatchOLS(endog, exog).fit()
+        cls.res_single = [OLS(endog[:, i], exog).fit()
+                          for i in range(k_endog)]
+
+    def test_vectorized(self):
+        res = self.res
+        attrs = ['params', 'bse', 'tvalues', 'pvalues']
+        for i, res_i in enumerate(self.res_single):
+            for attr in attrs:
+                assert_allclose(getattr(res, attr)[:, i], getattr(res_i, attr),
+                                rtol=1e-10)
+            for attr in ['ssr', 'scale', 'rsquared', 'rsquared_adj',
+                         'fvalue', 'f_pvalue', 'llf', 'aic', 'bic']:
+                assert_allclose(getattr(res, attr)[i], getattr(res_i, attr),
+                                rtol=1e-10)
+        assert_equal(res.df_resid, self.res_single[0].df_resid)
+        assert_equal(res.df_model, self.res_single[0].df_model)
+
+    def test_get_results(self):
+        for method in ['pinv', 'qr', 'cholesky']:
+            res = BatchOLS(self.endog, self.exog).fit(method=method)
+            res_3 = res.get_results(3)
+            assert_(res.get_results(3) is res_3)
+            assert_allclose(res_3.params, self.res_single[3].params,
+                            rtol=1e-10)
+            assert_allclose(res_3.HC1_se, self.res_single[3].HC1_se,
+                            rtol=1e-10)
+            assert_allclose(res_3.params, res.params[:, 3], rtol=1e-10)
+
+    def test_pandas(self):
+        endog = pandas.DataFrame(self.endog,
+                                 columns=['y%d' % i for i in range(5)])
+        exog = pandas.DataFrame(self.exog, columns=['const', 'a', 'b'])
+        res = BatchOLS(endog, exog).fit()
+        assert_equal(res.params.columns.tolist(), endog.columns.tolist())
+        assert_equal(res.bse.index.tolist(), ['const', 'a', 'b'])
+        assert_allclose(res.params.values, self.res.params, rtol=1e-10)
+        res_1 = res.get_results(1)
+        assert_equal(res_1.model.endog_names, 'y1')
+        assert_equal(res_1.params.index.tolist(), ['const', 'a', 'b'])
+
+    def test_missing(self):
+        endog = pandas.DataFrame(self.endog.copy(),
+                                 columns=['y%d' % i for i in range(5)])
+        exog = pandas.DataFrame(self.exog.copy(), columns=['const', 'a', 'b'])
+        endog.iloc[[3, 10], 0] = np.nan
+        exog.iloc[20, 1] = np.nan
+        res = BatchOLS(endog, exog, missing='drop').fit()
+        res_2 = res.get_results(2)
+        # the missing data option is passed on to the column model
+        assert_(hasattr(res_2.model.data, 'missing_row_idx'))
+        assert_equal(res_2.nobs, 97)
+        assert_allclose(res_2.params.values, res.params.values[:, 2],
+                        rtol=1e-10)
+        res1 = OLS(endog.iloc[:, 2].drop([3, 10]), exog.drop([3, 10]),
+                   missing='drop').fit()
+        assert_allclose(res_2.bse.values, res1.bse.values, rtol=1e-10)
+
+    def test_1d_raises(self):
+        assert_raises(ValueError, BatchOLS, self.endog[:, 0], self.exog)
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, '-vvs', '-x', '--pdb'])
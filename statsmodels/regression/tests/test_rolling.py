@@ -0,0 +1,139 @@
+"""
+Tests for rolling and expanding window least squares
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.rolling import RollingOLS, RollingWLS
+from statsmodels.tools.tools import add_constant
+
+
+def _gen_data(nobs=120, seed=9876543):
+    np.random.seed(seed)
+    exog = add_constant(np.random.randn(nobs, 2))
+    endog = exog.sum(1) + (1 + np.abs(exog[:, 1])) * np.random.randn(nobs)
+    weights = np.random.uniform(0.5, 2, size=nobs)
+    return endog, exog, weights
+
+
+def _check_windows(res, endog, exog, window, expanding=False, weights=None,
+                   cov_type='nonrobust'):
+    nobs = len(endog)
+    params = np.asarray(res.params)
+    bse = np.asarray(res.bse)
+    assert np.isnan(params[:window - 1]).all()
+    for t in range(window - 1, nobs):
+        low = 0 if expanding else t - window + 1
+        sl = slice(low, t + 1)
+        if weights is None:
+            res_t = OLS(endog[sl], exog[sl]).fit(cov_type=cov_type)
+        else:
+            res_t = WLS(endog[sl], exog[sl],
+                        weights=weights[sl]).fit(cov_type=cov_type)
+        assert_allclose(params[t], res_t.params, rtol=1e-9, atol=1e-12)
+        assert_allclose(bse[t], res_t.bse, rtol=1e-8)
+        assert_allclose(np.asarray(res.rsquared)[t], res_t.rsquared,
+                        rtol=1e-8)
+        assert_allclose(np.asarray(res.ssr)[t], res_t.ssr, rtol=1e-8)
+        assert_allclose(np.asarray(res.llf)[t], res_t.llf, rtol=1e-8)
+        assert_allclose(np.asarray(res.aic)[t], res_t.aic, rtol=1e-8)
+        assert_allclose(np.asarray(res.pvalues)[t], res_t.pvalues,
+                        rtol=1e-6, atol=1e-14)
+        assert_equal(np.asarray(res.df_resid)[t], res_t.df_resid)
+
+
+@pytest.mark.parametrize('cov_type', ['nonrobust', 'HC0', 'HC1'])
+def test_rolling_ols(cov_type):
+    endog, exog, _ = _gen_data()
+    res = RollingOLS(endog, exog, window=30).fit(cov_type=cov_type,
+                                                 refresh=7)
+    _check_windows(res, endog, exog, 30, cov_type=cov_type)
+
+
+def test_expanding_ols():
+    endog, exog, _ = _gen_data()
+    res = RollingOLS(endog, exog, window=10, expanding=True).fit()
+    _check_windows(res, endog, exog, 10, expanding=True)
+
+
+@pytest.mark.parametrize('expanding', [False, True])
+@pytest.mark.parametrize('cov_type', ['HC0', 'HC1'])
+def test_hc_level_offset(expanding, cov_type):
+    # The results do not lose precision with a large level of endog. The
+    # tolerance is that of OLS, which loses some precision as well.
+    endog, exog, _ = _gen_data(nobs=300)
+    endog = endog + 1e6
+    res = RollingOLS(endog, exog, window=20, expanding=expanding).fit(
+        cov_type=cov_type)
+    for t in range(19, len(endog)):
+        low = 0 if expanding else t - 19
+        res_t = OLS(endog[low:t + 1], exog[low:t + 1]).fit(cov_type=cov_type)
+        assert_allclose(res.params[t], res_t.params, rtol=1e-7, atol=1e-8)
+        assert_allclose(res.bse[t], res_t.bse, rtol=1e-7)
+        assert_allclose(res.ssr[t], res_t.ssr, rtol=1e-7)
+        assert_allclose(res.rsquared[t], res_t.rsquared, rtol=1e-7)
+
+
+def test_rolling_wls():
+    endog, exog, weights = _gen_data()
+    res = RollingWLS(endog, exog, window=25, weights=weights).fit(
+        cov_type='HC0')
+    _check_windows(res, endog, exog, 25, weights=weights, cov_type='HC0')
+
+
+def test_singular_window():
+    endog, exog, _ = _gen_data()
+    dummy = np.zeros(len(endog))
+    dummy[50:55] = 1
+    exog = np.column_stack((exog, dummy))
+    res = RollingOLS(endog, exog, window=20).fit()
+    params = np.asarray(res.params)
+    rank = np.asarray(res.df_model) + 1
+    assert_equal(rank[19:50], 3)
+    assert_equal(rank[50:74], 4)
+    assert_equal(rank[74:], 3)
+    for t in [45, 52, 60, 73, 74, 80]:
+        res_t = OLS(endog[t - 19:t + 1], exog[t - 19:t + 1]).fit()
+        assert_allclose(params[t], res_t.params, rtol=1e-8, atol=1e-12)
+
+
+def test_pandas():
+    endog, exog, _ = _gen_data()
+    index = pd.date_range('2000-01-01', periods=len(endog), freq='D')
+    endog = pd.Series(endog, index=index, name='y')
+    exog = pd.DataFrame(exog, index=index, columns=['const', 'a', 'b'])
+    res = RollingOLS(endog, exog, window=30).fit()
+    assert isinstance(res.params, pd.DataFrame)
+    assert_equal(res.params.columns.tolist(), ['const', 'a', 'b'])
+    assert res.params.index.equals(index)
+    assert isinstance(res.rsquared, pd.Series)
+    res_t = OLS(endog.iloc[40:70], exog.iloc[40:70]).fit()
+    assert_allclose(res.params.iloc[69], res_t.params, rtol=1e-9)
+    cov = res.cov_params()
+    assert_allclose(cov.loc[index[69]], res_t.cov_params(), rtol=1e-8)
+
+
+def test_params_only():
+    endog, exog, _ = _gen_data()
+    res = RollingOLS(endog, exog, window=30).fit(params_only=True)
+    res2 = RollingOLS(endog, exog, window=30).fit()
+    assert_allclose(res.params, res2.params)
+    with pytest.raises(ValueError):
+        res.bse
+
+
+def test_errors():
+    endog, exog, _ = _gen_data()
+    with pytest.raises(ValueError):
+        RollingOLS(endog, exog, window=2)
+    with pytest.raises(ValueError):
+        RollingOLS(endog, exog)
+    with pytest.raises(ValueError):
+        RollingOLS(endog, exog, window=30).fit(cov_type='HAC')
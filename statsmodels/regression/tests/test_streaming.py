@@ -0,0 +1,162 @@
+"""
+Tests for least squares on data chunks
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.regression.streaming import StreamingOLS, StreamingWLS
+
+
+def _gen_data(nobs=500, seed=987125):
+    np.random.seed(seed)
+    exog = np.column_stack((np.ones(nobs), np.random.randn(nobs, 3)))
+    endog = (exog.sum(1) +
+             np.random.randn(nobs) * (1 + np.abs(exog[:, 1])))
+    weights = np.random.uniform(0.5, 2, size=nobs)
+    return endog, exog, weights
+
+
+class CheckStreaming(object):
+
+    def test_params(self):
+        res1, res2 = self.res1, self.res2
+        assert_allclose(res1.params, res2.params, rtol=1e-10)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+        assert_allclose(res1.tvalues, res2.tvalues, rtol=1e-10)
+        assert_allclose(res1.pvalues, res2.pvalues, rtol=1e-8)
+
+    def test_fit_stats(self):
+        res1, res2 = self.res1, self.res2
+        assert_equal(res1.nobs, res2.nobs)
+        assert_equal(res1.df_model, res2.df_model)
+        assert_equal(res1.df_resid, res2.df_resid)
+        assert_equal(res1.k_constant, res2.k_constant)
+        assert_allclose(res1.ssr, res2.ssr, rtol=1e-10)
+        assert_allclose(res1.scale, res2.scale, rtol=1e-10)
+        assert_allclose(res1.rsquared, res2.rsquared, rtol=1e-10)
+        assert_allclose(res1.rsquared_adj, res2.rsquared_adj, rtol=1e-10)
+        assert_allclose(res1.fvalue, res2.fvalue, rtol=1e-10)
+        assert_allclose(res1.f_pvalue, res2.f_pvalue, rtol=1e-8)
+        assert_allclose(res1.llf, res2.llf, rtol=1e-10)
+        assert_allclose(res1.aic, res2.aic, rtol=1e-10)
+        assert_allclose(res1.condition_number, res2.condition_number,
+                        rtol=1e-6)
+
+    def test_hc(self):
+        res1, res2 = self.res1, self.res2
+        for name in ['cov_HC0', 'cov_HC1', 'cov_HC2', 'cov_HC3']:
+            assert_allclose(getattr(res1, name), getattr(res2, name),
+                            rtol=1e-10)
+
+    def test_robust_results(self):
+        res1 = self.res1.get_robustcov_results('HC1')
+        res2 = self.res2.get_robustcov_results('HC1')
+        assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+        assert_allclose(res1.fvalue, res2.fvalue, rtol=1e-10)
+
+    def test_tests(self):
+        res1, res2 = self.res1, self.res2
+        r = np.eye(4)[2:]
+        assert_allclose(res1.f_test(r).fvalue, res2.f_test(r).fvalue,
+                        rtol=1e-10)
+        assert_allclose(res1.t_test(r).pvalue, res2.t_test(r).pvalue,
+                        rtol=1e-8)
+
+    def test_no_resid(self):
+        with pytest.raises(NotImplementedError):
+            self.res1.resid
+        with pytest.raises(NotImplementedError):
+            self.res1.resid_pearson
+        # GLM only attributes of the shared mixin are not added
+        assert_equal(hasattr(self.res1, 'mu'), False)
+        self.res1.summary()
+
+
+class TestStreamingOLS(CheckStreaming):
+
+    @classmethod
+    def setup_class(cls):
+        endog, exog, _ = _gen_data()
+
+        def chunks():
+            for idx in np.array_split(np.arange(len(endog)), 7):
+                yield endog[idx], exog[idx]
+
+        cls.res1 = StreamingOLS(chunks).fit()
+        cls.res2 = OLS(endog, exog).fit()
+
+
+class TestStreamingOLSQR(CheckStreaming):
+
+    @classmethod
+    def setup_class(cls):
+        endog, exog, _ = _gen_data()
+        chunks = [(endog[i:i + 64], exog[i:i + 64])
+                  for i in range(0, len(endog), 64)]
+        cls.res1 = StreamingOLS(chunks).fit(method="qr")
+        cls.res2 = OLS(endog, exog).fit()
+
+
+class TestStreamingWLS(CheckStreaming):
+
+    @classmethod
+    def setup_class(cls):
+        endog, exog, weights = _gen_data()
+        chunks = [(endog[i:i + 100], exog[i:i + 100], weights[i:i + 100])
+                  for i in range(0, len(endog), 100)]
+        cls.res1 = StreamingWLS(chunks).fit()
+        cls.res2 = WLS(endog, exog, weights=weights).fit()
+
+
+def test_pandas_names_and_cov_type():
+    endog, exog, _ = _gen_data()
+    exog = pd.DataFrame(exog, columns=['const', 'a', 'b', 'c'])
+    endog = pd.Series(endog, name='y')
+    chunks = [(endog[i:i + 50], exog[i:i + 50])
+              for i in range(0, len(endog), 50)]
+    res1 = StreamingOLS(chunks).fit(cov_type='HC3')
+    res2 = OLS(endog, exog).fit(cov_type='HC3')
+    assert_equal(res1.model.exog_names, ['const', 'a', 'b', 'c'])
+    assert_equal(res1.model.endog_names, 'y')
+    assert_equal(res1.cov_type, 'HC3')
+    assert_allclose(res1.params, res2.params, rtol=1e-10)
+    assert_allclose(res1.bse, res2.bse, rtol=1e-10)
+    assert_equal(res1.params.index.tolist(), res2.params.index.tolist())
+
+
+def test_implicit_constant():
+    endog, exog, _ = _gen_data()
+    dummy = (exog[:, 1] > 0).astype(float)
+    exog = np.column_stack((dummy, 1 - dummy, exog[:, 2:]))
+    chunks = [(endog[i:i + 100], exog[i:i + 100])
+              for i in range(0, len(endog), 100)]
+    res1 = StreamingOLS(chunks).fit()
+    res2 = OLS(endog, exog).fit()
+    assert_equal(res1.k_constant, 1)
+    assert_allclose(res1.rsquared, res2.rsquared, rtol=1e-10)
+
+    res1 = StreamingOLS(chunks, hasconst=False).fit()
+    assert_equal(res1.k_constant, 0)
+
+
+def test_iterator_single_pass():
+    endog, exog, _ = _gen_data()
+    chunks = iter([(endog[:250], exog[:250]), (endog[250:], exog[250:])])
+    res = StreamingOLS(chunks).fit()
+    assert_allclose(res.params, OLS(endog, exog).fit().params, rtol=1e-10)
+    # robust covariances need a second pass through the data
+    with pytest.raises(ValueError):
+        res.cov_HC0
+
+
+def test_weights_not_allowed_ols():
+    endog, exog, weights = _gen_data()
+    with pytest.raises(ValueError):
+        StreamingOLS([(endog, exog, weights)]).fit()
@@ -4,7 +4,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 
 from statsmodels.regression.linear_model import WLS
-from statsmodels.regression._tools import _MinimalWLS
+from statsmodels.regression._tools import _MinimalWLS, _WLSWorkspace
 
 class TestMinimalWLS(TestCase):
     @classmethod
@@ -37,3 +37,33 @@ class TestMinimalWLS(TestCase):
         minres = _MinimalWLS(self.endog2, self.exog2, weights=self.weights2).fit()
         assert_allclose(res.params, minres.params)
         assert_allclose(res.resid, minres.resid)
+
+
+class TestWLSWorkspace(TestCase):
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(4321)
+        cls.exog = rs.randn(200, 4) * [1, 10, 1000, 1e-3]
+        cls.endog = cls.exog.sum(1) + rs.randn(200)
+        cls.weights = rs.uniform(0.5, 2, size=200)
+
+    def test_equivalence_with_wls(self):
+        workspace = _WLSWorkspace(self.exog)
+        for weights in [self.weights, np.ones(200), self.weights[::-1]]:
+            res = WLS(self.endog, self.exog, weights=weights).fit()
+            params = workspace.fit(self.endog, weights).params
+            assert workspace._factor is not None
+            assert_allclose(params, res.params, rtol=1e-10)
+            assert_allclose(workspace.normalized_cov_params(),
+                            res.normalized_cov_params, rtol=1e-8)
+
+    def test_singular(self):
+        # falls back to lstsq and the pseudoinverse
+        exog = np.column_stack((self.exog, self.exog[:, :2].sum(1)))
+        workspace = _WLSWorkspace(exog)
+        params = workspace.fit(self.endog, self.weights).params
+        assert workspace._factor is None
+        res = WLS(self.endog, exog, weights=self.weights).fit()
+        assert_allclose(params, res.params, rtol=1e-8)
+        assert_allclose(workspace.normalized_cov_params(),
+                        res.normalized_cov_params, rtol=1e-8)
@@ -0,0 +1,3 @@
+from .bootstrap import (bootstrap, BootstrapResults, IIDBootstrap,
+                        MovingBlockBootstrap, StationaryBootstrap,
+                        ClusterBootstrap, WildBootstrap, Subsample)
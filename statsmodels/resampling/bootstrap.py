@@ -0,0 +1,600 @@
+"""
+Bootstrap and subsampling inference for model results
+
+The resampling schemes draw the indices of the observations of each
+resample (or, for the wild bootstrap, multipliers of the residuals), so the
+data is only copied when the model of a resample is created. `bootstrap`
+refits the model on each resample, optionally in parallel with a separate
+random number stream for each chunk of replications, and returns the
+replications of any attribute of the results, with percentile, basic and BCa
+confidence intervals.
+
+License: BSD-3
+"""
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from statsmodels.compat.python import getargspec, range, string_types
+from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools.sm_exceptions import PerfectSeparationError
+
+
+class _Resampler(object):
+    # Base class of the resampling schemes. Subclasses implement `draw`.
+
+    def draw(self, nobs, random_state):
+        """
+        Draw the indices of the observations of one resample
+
+        Parameters
+        ----------
+        nobs : int
+            The number of observations in the data.
+        random_state : RandomState
+            The random number generator.
+
+        Returns
+        -------
+        index : ndarray
+            The indices of the observations in the resample.
+        """
+        raise NotImplementedError
+
+    def resample_model(self, model, draw, fitted=None, resid=None):
+        """
+        Create the model of a resample
+
+        Parameters
+        ----------
+        model : Model instance
+            The model of the original data.
+        draw : ndarray
+            The result of `draw`.
+        fitted, resid : ndarray, optional
+            The fitted values and residuals of the original data. Only used
+            by the wild bootstrap.
+
+        Returns
+        -------
+        model : Model instance
+            A new model of the same class with the resampled data.
+        """
+        return _subset_model(model, draw)
+
+    def jackknife(self, nobs):
+        """
+        Iterate over the indices of the delete-one jackknife samples
+
+        Used for the acceleration of the BCa interval. The jackknife deletes
+        one observation at a time, or one block or cluster for the schemes
+        that resample blocks or clusters.
+        """
+        index = np.arange(nobs)
+        for i in range(nobs):
+            yield np.delete(index, i)
+
+    def scale(self, nobs):
+        """
+        The ratio of the standard deviation of the statistic in the
+        resamples to its standard deviation in the data
+        """
+        return 1.
+
+
+class IIDBootstrap(_Resampler):
+    """
+    Nonparametric bootstrap of independent observations
+
+    Draws `nobs` observations with replacement.
+    """
+
+    def draw(self, nobs, random_state):
+        return random_state.randint(0, nobs, size=nobs)
+
+
+class MovingBlockBootstrap(_Resampler):
+    """
+    Moving block bootstrap for dependent observations
+
+    Parameters
+    ----------
+    block_size : int
+        The number of consecutive observations in each block.
+    circular : bool
+        If True (default), blocks wrap around the end of the data, so that
+        all observations are equally likely to be drawn.
+
+    Notes
+    -----
+    Blocks with uniformly drawn starting points are concatenated until the
+    resample has `nobs` observations.
+    """
+
+    def __init__(self, block_size, circular=True):
+        if block_size < 1:
+            raise ValueError('block_size must be at least 1')
+        self.block_size = int(block_size)
+        self.circular = circular
+
+    def draw(self, nobs, random_state):
+        block_size = min(self.block_size, nobs)
+        n_blocks = -(-nobs // block_size)
+        high = nobs if self.circular else nobs - block_size + 1
+        starts = random_state.randint(0, high, size=n_blocks)
+        index = (starts[:, None] + np.arange(block_size)).ravel()[:nobs]
+        return index % nobs
+
+    def jackknife(self, nobs):
+        index = np.arange(nobs)
+        for start in range(0, nobs, self.block_size):
+            yield np.delete(index, np.arange(start,
+                                             min(start + self.block_size,
+                                                 nobs)))
+
+
+class StationaryBootstrap(MovingBlockBootstrap):
+    """
+    Stationary bootstrap of Politis and Romano (1994)
+
+    Parameters
+    ----------
+    block_size : float
+        The expected number of consecutive observations in each block.
+
+    Notes
+    -----
+    The block lengths are independent geometric random variables, and blocks
+    wrap around the end of the data, so that the resampled series is
+    stationary. The jackknife for the BCa interval deletes blocks of
+    length `block_size` rounded to an integer.
+
+    References
+    ----------
+    Politis, D. N., and J. P. Romano (1994). The Stationary Bootstrap.
+    Journal of the American Statistical Association 89: 1303-1313.
+    """
+
+    def __init__(self, block_size):
+        if block_size < 1:
+            raise ValueError('block_size must be at least 1')
+        self.expected_block_size = block_size
+        self.block_size = int(round(block_size))
+        self.circular = True
+
+    def draw(self, nobs, random_state):
+        prob_new = 1. / self.expected_block_size
+        new_block = random_state.uniform(size=nobs) < prob_new
+        new_block[0] = True
+        block = np.cumsum(new_block) - 1
+        positions = np.arange(nobs)
+        # position of the start of the current block
+        block_start = np.maximum.accumulate(np.where(new_block, positions, 0))
+        starts = random_state.randint(0, nobs, size=block[-1] + 1)
+        return (starts[block] + positions - block_start) % nobs
+
+
+class ClusterBootstrap(_Resampler):
+    """
+    Bootstrap of clusters of observations
+
+    Parameters
+    ----------
+    groups : array_like
+        The cluster label of each observation.
+
+    Notes
+    -----
+    Draws as many clusters as there are in the data, with replacement, and
+    keeps all observations of each drawn cluster, so the number of
+    observations of a resample varies when the clusters have different
+    sizes.
+    """
+
+    def __init__(self, groups):
+        groups = np.asarray(groups)
+        labels, inverse = np.unique(groups, return_inverse=True)
+        self.groups = groups
+        self.n_groups = len(labels)
+        self._order = np.argsort(inverse, kind='mergesort')
+        self._bounds = np.r_[0, np.cumsum(np.bincount(inverse))]
+
+    def _members(self, group_idx):
+        bounds = self._bounds
+        return np.concatenate([self._order[bounds[g]:bounds[g + 1]]
+                               for g in group_idx])
+
+    def draw(self, nobs, random_state):
+        if nobs != len(self.groups):
+            raise ValueError('groups must have one label per observation')
+        return self._members(random_state.randint(0, self.n_groups,
+                                                  size=self.n_groups))
+
+    def jackknife(self, nobs):
+        group_idx = np.arange(self.n_groups)
+        for g in range(self.n_groups):
+            yield np.sort(self._members(np.delete(group_idx, g)))
+
+
+class WildBootstrap(_Resampler):
+    """
+    Wild bootstrap of the residuals
+
+    Parameters
+    ----------
+    dist : {'rademacher', 'mammen'}
+        The distribution of the multipliers of the residuals, the symmetric
+        two-point distribution on -1 and 1 (default), or the two-point
+        distribution of Mammen (1993).
+
+    Notes
+    -----
+    The exog and the other data are kept fixed, and the endog of a
+    resample is ``fittedvalues + resid * v`` with independent multipliers
+    `v` of mean zero and variance one. This bootstrap is robust to
+    heteroscedasticity and meant for models of the conditional mean such as
+    OLS and WLS.
+
+    References
+    ----------
+    Mammen, E. (1993). Bootstrap and Wild Bootstrap for High Dimensional
+    Linear Models. The Annals of Statistics 21: 255-285.
+    """
+
+    def __init__(self, dist='rademacher'):
+        if dist not in ('rademacher', 'mammen'):
+            raise ValueError("dist must be 'rademacher' or 'mammen'")
+        self.dist = dist
+
+    def draw(self, nobs, random_state):
+        if self.dist == 'rademacher':
+            return 2. * (random_state.uniform(size=nobs) < 0.5) - 1
+        sqrt5 = np.sqrt(5)
+        low = random_state.uniform(size=nobs) < (sqrt5 + 1) / (2 * sqrt5)
+        return np.where(low, -(sqrt5 - 1) / 2, (sqrt5 + 1) / 2)
+
+    def resample_model(self, model, draw, fitted=None, resid=None):
+        init_kwds = model._get_init_kwds()
+        return model.__class__(fitted + resid * draw, model.exog, **init_kwds)
+
+
+class Subsample(_Resampler):
+    """
+    Subsampling without replacement
+
+    Parameters
+    ----------
+    size : int
+        The number of observations of each subsample.
+
+    Notes
+    -----
+    The spread of the statistic in subsamples of size `size` is rescaled by
+    ``sqrt(size / nobs)`` for standard errors and confidence intervals,
+    which assumes a root-n consistent statistic (Politis, Romano and Wolf,
+    1999). Subsampling is valid under weaker conditions than the bootstrap
+    but needs `size` to be small relative to `nobs`. The BCa interval is not
+    available.
+
+    References
+    ----------
+    Politis, D. N., J. P. Romano, and M. Wolf (1999). Subsampling. New York:
+    Springer.
+    """
+
+    def __init__(self, size):
+        self.size = int(size)
+
+    def draw(self, nobs, random_state):
+        if self.size > nobs:
+            raise ValueError('size must not be larger than the number of '
+                             'observations')
+        return np.sort(random_state.permutation(nobs)[:self.size])
+
+    def jackknife(self, nobs):
+        raise ValueError('the BCa interval is not available for subsampling')
+
+    def scale(self, nobs):
+        return np.sqrt(self.size / nobs)
+
+
+def _subset_model(model, index):
+    # Create a model of the same class for a subset of the observations. The
+    # extra arrays with one entry per observation, like weights and offsets,
+    # are subset as well.
+    nobs = model.endog.shape[0]
+    init_kwds = model._get_init_kwds()
+    for key, value in init_kwds.items():
+        if (isinstance(value, (np.ndarray, pd.Series)) and value.ndim > 0 and
+                value.shape[0] == nobs):
+            init_kwds[key] = np.asarray(value)[index]
+    exog = model.exog
+    if exog is not None:
+        exog = exog[index]
+    return model.__class__(model.endog[index], exog, **init_kwds)
+
+
+def _evaluate(results, statistic):
+    if isinstance(statistic, string_types):
+        value = getattr(results, statistic)
+    else:
+        value = statistic(results)
+    return value
+
+
+def _refit_statistic(model, statistic, fit_kwds, k_stat):
+    try:
+        value = _evaluate(model.fit(**fit_kwds), statistic)
+    except (np.linalg.LinAlgError, PerfectSeparationError):
+        return np.nan * np.ones(k_stat)
+    return np.asarray(value, dtype=float).ravel()
+
+
+def _bootstrap_chunk(model, resampler, statistic, fit_kwds, fitted, resid,
+                     k_stat, n_reps, seed):
+    # Replications of one chunk, with its own random number stream
+    random_state = np.random.RandomState(seed)
+    nobs = model.endog.shape[0]
+    out = np.empty((n_reps, k_stat))
+    for i in range(n_reps):
+        draw = resampler.draw(nobs, random_state)
+        new_model = resampler.resample_model(model, draw, fitted, resid)
+        out[i] = _refit_statistic(new_model, statistic, fit_kwds, k_stat)
+    return out
+
+
+def _default_fit_kwds(results, fit_kwds):
+    # Start the optimization of each resample at the original estimate, and
+    # turn off convergence messages
+    fit_kwds = {} if fit_kwds is None else dict(fit_kwds)
+    try:
+        fit_args = getargspec(results.model.fit).args
+    except (TypeError, ValueError):
+        fit_args = []
+    if 'start_params' in fit_args and 'start_params' not in fit_kwds:
+        fit_kwds['start_params'] = np.asarray(results.params)
+    if 'disp' in fit_args and 'disp' not in fit_kwds:
+        fit_kwds['disp'] = 0
+    return fit_kwds
+
+
+def bootstrap(results, resampler=None, statistic='params', n_reps=999,
+              fit_kwds=None, seed=None, n_jobs=1, chunksize=50):
+    """
+    Bootstrap or subsampling distribution of a statistic of model results
+
+    Parameters
+    ----------
+    results : Results instance
+        The results of a model fit, for example `LikelihoodModelResults`.
+        The model is refit on each resample.
+    resampler : resampling scheme, optional
+        An instance of `IIDBootstrap` (default), `MovingBlockBootstrap`,
+        `StationaryBootstrap`, `ClusterBootstrap`, `WildBootstrap` or
+        `Subsample`.
+    statistic : string or callable
+        The name of an attribute of the results, like 'params' (default),
+        'bse' or 'llf', or a function that takes results and returns a
+        scalar or one-dimensional array.
+    n_reps : int
+        The number of replications.
+    fit_kwds : dict, optional
+        Keyword arguments for the fit of each resample. If the fit method of
+        the model has the arguments `start_params` or `disp`, they default
+        to the original estimates and 0.
+    seed : {None, int, RandomState}
+        Seed of the random number generator. The seeds of the chunks of
+        replications are drawn from it.
+    n_jobs : int
+        The number of processes. Requires joblib if not 1, and -1 uses all
+        CPUs.
+    chunksize : int
+        The number of replications in each chunk. Each chunk has its own
+        random number stream, so that the results depend on `seed` and
+        `chunksize` but not on `n_jobs`.
+
+    Returns
+    -------
+    results : BootstrapResults
+
+    Notes
+    -----
+    Replications for which the fit fails with a singular matrix or perfect
+    separation are recorded as nan and ignored by the summary statistics.
+    The data of the model is pickled once for each chunk when `n_jobs` is
+    not 1.
+
+    Examples
+    --------
+    >>> res = sm.OLS(endog, exog).fit()
+    >>> boot = bootstrap(res, WildBootstrap(), n_reps=999, seed=1234)
+    >>> boot.conf_int(method='bca')
+    """
+    if resampler is None:
+        resampler = IIDBootstrap()
+    fit_kwds = _default_fit_kwds(results, fit_kwds)
+    model = results.model
+
+    estimate = _evaluate(results, statistic)
+    names = getattr(estimate, 'index', None)
+    estimate = np.asarray(estimate, dtype=float).ravel()
+    k_stat = len(estimate)
+
+    if isinstance(resampler, WildBootstrap):
+        fitted = np.asarray(results.fittedvalues)
+        resid = model.endog - fitted
+    else:
+        fitted = resid = None
+
+    if not isinstance(seed, np.random.RandomState):
+        seed = np.random.RandomState(seed)
+    sizes = [chunksize] * (n_reps // chunksize)
+    if n_reps % chunksize:
+        sizes.append(n_reps % chunksize)
+    seeds = seed.randint(0, 2**31 - 1, size=len(sizes))
+    args = (model, resampler, statistic, fit_kwds, fitted, resid, k_stat)
+
+    if n_jobs == 1:
+        out = [_bootstrap_chunk(*(args + (size, chunk_seed)))
+               for size, chunk_seed in zip(sizes, seeds)]
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_bootstrap_chunk, n_jobs,
+                                                 verbose=0)
+        out = parallel(p_func(*(args + (size, chunk_seed)))
+                       for size, chunk_seed in zip(sizes, seeds))
+    replicates = np.concatenate(out, 0)
+
+    return BootstrapResults(results, estimate, replicates, resampler,
+                            statistic, fit_kwds, names)
+
+
+class BootstrapResults(object):
+    """
+    Bootstrap or subsampling replications of a statistic
+
+    Attributes
+    ----------
+    estimate : ndarray
+        The statistic of the original results.
+    replicates : ndarray
+        The statistic of each resample, shape (n_reps, len(estimate)).
+    n_reps : int
+        The number of replications.
+    n_failed : int
+        The number of replications for which the fit failed.
+    resampler : resampling scheme
+        The resampling scheme.
+    names : Index or None
+        The names of the elements of the statistic, if it is a pandas
+        Series.
+    """
+
+    def __init__(self, results, estimate, replicates, resampler, statistic,
+                 fit_kwds, names=None):
+        self._results = results
+        self.estimate = estimate
+        self.replicates = replicates
+        self.resampler = resampler
+        self.statistic = statistic
+        self.fit_kwds = fit_kwds
+        self.names = names
+        self.n_reps = replicates.shape[0]
+        self.n_failed = int(np.isnan(replicates).any(1).sum())
+        self._scale = resampler.scale(results.model.endog.shape[0])
+
+    @cache_readonly
+    def bse(self):
+        """
+        Standard deviation of the replications
+
+        Rescaled to the sample size of the data for subsampling.
+        """
+        return self._scale * np.nanstd(self.replicates, axis=0, ddof=1)
+
+    @cache_readonly
+    def bias(self):
+        """
+        Mean of the replications minus the estimate
+        """
+        return self._scale * (np.nanmean(self.replicates, 0) - self.estimate)
+
+    @cache_readonly
+    def jackknife_values(self):
+        """
+        The statistic of the delete-one jackknife samples
+
+        Used for the acceleration of the BCa interval, computed on first
+        access.
+        """
+        model = self._results.model
+        nobs = model.endog.shape[0]
+        k_stat = len(self.estimate)
+        values = [_refit_statistic(_subset_model(model, index),
+                                   self.statistic, self.fit_kwds, k_stat)
+                  for index in self.resampler.jackknife(nobs)]
+        return np.array(values)
+
+    def _centered_quantiles(self, probs):
+        # Quantiles of the replications, rescaled around the estimate;
+        # probs has shape (n_probs, k_stat)
+        reps = self.replicates
+        out = np.empty(probs.shape)
+        for j in range(reps.shape[1]):
+            out[:, j] = np.nanpercentile(reps[:, j], 100 * probs[:, j])
+        return self.estimate + self._scale * (out - self.estimate)
+
+    def conf_int(self, alpha=.05, method='percentile'):
+        """
+        Bootstrap confidence intervals
+
+        Parameters
+        ----------
+        alpha : float
+            The intervals have coverage 1 - alpha.
+        method : {'percentile', 'basic', 'bca'}
+            The percentile interval (default), the basic (reverse
+            percentile) interval, or the bias-corrected and accelerated
+            interval of Efron (1987). The acceleration of BCa uses the
+            delete-one jackknife, which refits the model once for each
+            observation, block or cluster.
+
+        Returns
+        -------
+        conf_int : ndarray or DataFrame
+            The lower and upper bounds, shape (len(estimate), 2). A DataFrame
+            if the statistic has names.
+
+        References
+        ----------
+        Efron, B. (1987). Better Bootstrap Confidence Intervals. Journal of
+        the American Statistical Association 82: 171-185.
+        """
+        k_stat = len(self.estimate)
+        probs = np.array([alpha / 2, 1 - alpha / 2])
+        if method == 'percentile':
+            ci = self._centered_quantiles(np.tile(probs[:, None], k_stat))
+        elif method == 'basic':
+            q = self._centered_quantiles(np.tile(probs[::-1, None], k_stat))
+            ci = 2 * self.estimate - q
+        elif method == 'bca':
+            reps = self.replicates
+            n_valid = (~np.isnan(reps)).sum(0)
+            prop = (((reps < self.estimate).sum(0) +
+                     0.5 * (reps == self.estimate).sum(0)) / n_valid)
+            z0 = stats.norm.ppf(prop)
+            jack = self.jackknife_values
+            diff = np.nanmean(jack, 0) - jack
+            denom = 6 * np.nansum(diff**2, 0)**1.5
+            accel = np.nansum(diff**3, 0) / np.where(denom == 0, 1, denom)
+            z = stats.norm.ppf(probs)[:, None]
+            probs = stats.norm.cdf(z0 + (z0 + z) / (1 - accel * (z0 + z)))
+            ci = self._centered_quantiles(probs)
+        else:
+            raise ValueError("method must be 'percentile', 'basic' or 'bca'")
+        ci = ci.T
+        if self.names is not None:
+            ci = pd.DataFrame(ci, index=self.names, columns=['lower', 'upper'])
+        return ci
+
+    def summary_frame(self, alpha=.05, method='percentile'):
+        """
+        Estimate, bootstrap standard error, bias and confidence interval
+
+        Parameters
+        ----------
+        alpha : float
+            The intervals have coverage 1 - alpha.
+        method : {'percentile', 'basic', 'bca'}
+            The type of confidence interval, see `conf_int`.
+
+        Returns
+        -------
+        frame : DataFrame
+        """
+        ci = np.asarray(self.conf_int(alpha=alpha, method=method))
+        data = np.column_stack((self.estimate, self.bse, self.bias, ci))
+        columns = ['estimate', 'bse', 'bias', 'ci_lower', 'ci_upper']
+        return pd.DataFrame(data, index=self.names, columns=columns)
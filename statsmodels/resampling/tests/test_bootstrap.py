@@ -0,0 +1,143 @@
+"""
+Tests for the bootstrap and subsampling of model results
+
+License: BSD-3
+"""
+from __future__ import division
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose, assert_equal
+from scipy import stats
+import pytest
+
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.discrete.discrete_model import Logit
+from statsmodels.resampling.bootstrap import (
+    bootstrap, IIDBootstrap, MovingBlockBootstrap, StationaryBootstrap,
+    ClusterBootstrap, WildBootstrap, Subsample)
+from statsmodels.tools.tools import add_constant
+
+
+def _gen_data(nobs=200, seed=97531):
+    np.random.seed(seed)
+    exog = add_constant(np.random.randn(nobs, 2))
+    endog = exog.sum(1) + (1 + np.abs(exog[:, 1])) * np.random.randn(nobs)
+    return endog, exog
+
+
+def test_draws():
+    random_state = np.random.RandomState(0)
+    nobs = 103
+
+    index = IIDBootstrap().draw(nobs, random_state)
+    assert_equal(index.shape, (nobs,))
+    assert index.min() >= 0 and index.max() < nobs
+
+    index = MovingBlockBootstrap(10, circular=False).draw(nobs, random_state)
+    assert_equal(index.shape, (nobs,))
+    blocks = index[:100].reshape(10, 10)
+    assert_equal(np.diff(blocks, axis=1), 1)
+    assert index.max() < nobs
+
+    index = StationaryBootstrap(8).draw(nobs, random_state)
+    assert_equal(index.shape, (nobs,))
+    steps = np.diff(index)
+    # blocks wrap around and restart
+    continued = (steps == 1) | (steps == 1 - nobs)
+    assert 0.75 < continued.mean() < 0.95
+
+    groups = np.repeat(np.arange(20), np.arange(1, 21))
+    resampler = ClusterBootstrap(groups)
+    index = resampler.draw(len(groups), random_state)
+    drawn = groups[index]
+    for g in np.unique(drawn):
+        assert_equal((drawn == g).sum() % (g + 1), 0)
+    assert_equal(len(list(resampler.jackknife(len(groups)))), 20)
+
+    index = Subsample(30).draw(nobs, random_state)
+    assert_equal(len(np.unique(index)), 30)
+
+
+def test_iid_ols():
+    endog, exog = _gen_data()
+    res = OLS(endog, exog).fit(cov_type='HC0')
+    boot = bootstrap(res, n_reps=400, seed=1234)
+    assert_equal(boot.replicates.shape, (400, 3))
+    assert_equal(boot.n_failed, 0)
+    assert_allclose(boot.bse, res.bse, rtol=0.15)
+
+    ci = boot.conf_int()
+    assert (ci[:, 0] < res.params).all() and (res.params < ci[:, 1]).all()
+    ci_basic = boot.conf_int(method='basic')
+    assert_allclose(ci_basic, 2 * res.params[:, None] - ci[:, ::-1])
+
+    boot2 = bootstrap(res, n_reps=400, seed=1234, chunksize=50)
+    assert_allclose(boot2.replicates, boot.replicates)
+    with warnings.catch_warnings():
+        # joblib is optional
+        warnings.simplefilter('ignore')
+        boot3 = bootstrap(res, n_reps=400, seed=1234, n_jobs=2)
+    assert_allclose(boot3.replicates, boot.replicates)
+
+
+def test_bca():
+    # BCa interval of the mean compared to scipy
+    if not hasattr(stats, 'bootstrap'):
+        pytest.skip('scipy.stats.bootstrap is not available')
+    np.random.seed(2468)
+    endog = np.random.exponential(size=60)
+    res = OLS(endog, np.ones(len(endog))).fit()
+    boot = bootstrap(res, n_reps=4000, seed=1357)
+    ci = boot.conf_int(method='bca')
+    ci_scipy = stats.bootstrap((endog,), np.mean, n_resamples=4000,
+                               method='BCa', random_state=1357)
+    assert_allclose(ci[0], [ci_scipy.confidence_interval.low,
+                            ci_scipy.confidence_interval.high], rtol=0.03)
+    jack = boot.jackknife_values[:, 0]
+    assert_allclose(jack, (endog.sum() - endog) / (len(endog) - 1))
+    # the interval of a right skewed statistic is shifted to the right
+    ci_perc = boot.conf_int()
+    assert ci[0, 0] > ci_perc[0, 0]
+
+
+def test_wild_wls():
+    endog, exog = _gen_data()
+    weights = np.random.uniform(0.5, 2, size=len(endog))
+    res = WLS(endog, exog, weights=weights).fit(cov_type='HC0')
+    for dist in ['rademacher', 'mammen']:
+        boot = bootstrap(res, WildBootstrap(dist), n_reps=400, seed=4321)
+        assert_allclose(boot.bse, res.bse, rtol=0.15)
+
+    boot = bootstrap(res, IIDBootstrap(), n_reps=400, seed=4321)
+    assert_allclose(boot.bse, res.bse, rtol=0.15)
+
+
+def test_subsample():
+    endog, exog = _gen_data(nobs=1000)
+    res = OLS(endog, exog).fit(cov_type='HC0')
+    boot = bootstrap(res, Subsample(100), n_reps=400, seed=5)
+    assert_allclose(boot.bse, res.bse, rtol=0.2)
+    assert_allclose(boot.bse,
+                    np.sqrt(0.1) * np.std(boot.replicates, 0, ddof=1))
+    with pytest.raises(ValueError):
+        boot.conf_int(method='bca')
+
+
+def test_names_statistic():
+    endog, exog = _gen_data()
+    exog = pd.DataFrame(exog, columns=['const', 'a', 'b'])
+    res = Logit((endog > 1).astype(float), exog).fit(disp=0)
+    groups = np.arange(len(endog)) // 4
+    boot = bootstrap(res, ClusterBootstrap(groups), n_reps=50, seed=9)
+    ci = boot.conf_int(method='bca')
+    assert_equal(ci.index.tolist(), ['const', 'a', 'b'])
+    frame = boot.summary_frame()
+    assert_allclose(frame['estimate'], res.params)
+
+    boot = bootstrap(res, MovingBlockBootstrap(5),
+                     statistic=lambda r: r.prsquared, n_reps=20, seed=9)
+    assert_equal(boot.replicates.shape, (20, 1))
+    assert boot.names is None
@@ -180,15 +180,13 @@ class OLSInfluence(object):
     -----
     One part of the results can be calculated without any auxiliary regression
     (some of which have the `_internal` postfix in the name. Other statistics
-    require leave-one-observation-out (LOOO) auxiliary regression, and will be
-    slower (mainly results with `_external` postfix in the name).
-    The auxiliary LOOO regression only the required results are stored.
+    are based on the leave-one-observation-out (LOOO) regressions (mainly
+    results with `_external` postfix in the name).
 
-    Using the LOO measures is currently only recommended if the data set
-    is not too large. One possible approach for LOOO measures would be to
-    identify possible problem observations with the _internal measures, and
-    then run the leave-one-observation-out only with observations that are
-    possible outliers. (However, this is not yet available in an automized way.)
+    The LOOO results are not computed by refitting the regression for each
+    observation. They are obtained in closed form from the diagonal of the
+    hat matrix and the residuals with the rank-one downdate of the
+    cross-product of exog, which requires O(nobs * k_vars) memory and time.
 
     This should be extended to general least squares.
 
@@ -218,7 +216,11 @@ class OLSInfluence(object):
         -----
         temporarily calculated here, this should go to model class
         '''
-        return (self.exog * self.results.model.pinv_wexog.T).sum(1)
+        if hasattr(self.results.model, 'pinv_wexog'):
+            return (self.exog * self.results.model.pinv_wexog.T).sum(1)
+        else:
+            xxi = self.results.normalized_cov_params
+            return (np.dot(self.exog, xxi) * self.exog).sum(1)
 
     @cache_readonly
     def resid_press(self):
@@ -269,8 +271,6 @@ class OLSInfluence(object):
         '''(cached attribute) studentized residuals using LOOO variance
 
         this uses sigma from leave-one-out estimates
-
-        requires leave one out loop for observations
         '''
         sigma_looo = np.sqrt(self.sigma2_not_obsi)
         return self.get_resid_studentized_external(sigma=sigma_looo)
@@ -329,7 +329,7 @@ class OLSInfluence(object):
         '''(cached attribute) dffits measure for influence of an observation
 
         based on resid_studentized_external,
-        uses results from leave-one-observation-out loop
+        uses results from leave-one-observation-out regressions
 
         It is recommended that observations with dffits large than a
         threshold of 2 sqrt{k / n} where k is the number of parameters, should
@@ -357,7 +357,7 @@ class OLSInfluence(object):
     def dfbetas(self):
         '''(cached attribute) dfbetas
 
-        uses results from leave-one-observation-out loop
+        uses results from leave-one-observation-out regressions
         '''
         dfbetas = self.results.params - self.params_not_obsi#[None,:]
         dfbetas /= np.sqrt(self.sigma2_not_obsi[:,None])
@@ -368,27 +368,44 @@ class OLSInfluence(object):
     def sigma2_not_obsi(self):
         '''(cached attribute) error variance for all LOOO regressions
 
-        This is 'mse_resid' from each auxiliary regression.
+        This is 'mse_resid' from each auxiliary regression, computed without
+        refitting as ::
 
-        uses results from leave-one-observation-out loop
+           (ssr - resid**2 / (1 - hii)) / (df_resid - 1)
         '''
-        return np.asarray(self._res_looo['mse_resid'])
+        hii = self.hat_matrix_diag
+        resid = self.results.resid
+        ssr_noti = self.results.ssr - resid**2 / (1 - hii)
+        return ssr_noti / (self.results.df_resid - 1)
 
     @cache_readonly
     def params_not_obsi(self):
         '''(cached attribute) parameter estimates for all LOOO regressions
 
-        uses results from leave-one-observation-out loop
+        computed without refitting as ::
+
+           params - inv(X'X) x_i resid_i / (1 - hii)
         '''
-        return np.asarray(self._res_looo['params'])
+        hii = self.hat_matrix_diag
+        model = self.results.model
+        if hasattr(model, 'pinv_wexog'):
+            xxi_x = model.pinv_wexog.T
+        else:
+            xxi_x = np.dot(self.exog, self.results.normalized_cov_params)
+        d_params = xxi_x * (self.results.resid / (1 - hii))[:, None]
+        return self.results.params - d_params
 
     @cache_readonly
     def det_cov_params_not_obsi(self):
         '''(cached attribute) determinant of cov_params of all LOOO regressions
 
-        uses results from leave-one-observation-out loop
+        computed without refitting as ::
+
+           sigma2_not_obsi**k_vars * det(inv(X'X)) / (1 - hii)
         '''
-        return np.asarray(self._res_looo['det_cov_params'])
+        hii = self.hat_matrix_diag
+        det_xxi = np.linalg.det(self.results.normalized_cov_params)
+        return self.sigma2_not_obsi**self.k_vars * det_xxi / (1 - hii)
 
     @cache_readonly
     def cooks_distance(self):
@@ -415,7 +432,6 @@ class OLSInfluence(object):
 
         This uses determinant of the estimate of the parameter covariance
         from leave-one-out estimates.
-        requires leave one out loop for observations
 
         '''
         #don't use inplace division / because then we change original
@@ -528,37 +544,6 @@ class OLSInfluence(object):
 
         return res_loo
 
-    @cache_readonly
-    def _res_looo(self):
-        '''collect required results from the LOOO loop
-
-        all results will be attached.
-        currently only 'params', 'mse_resid', 'det_cov_params' are stored
-
-        regresses endog on exog dropping one observation at a time
-
-        this uses a nobs loop, only attributes of the OLS instance are stored.
-        '''
-        from statsmodels.sandbox.tools.cross_val import LeaveOneOut
-        get_det_cov_params = lambda res: np.linalg.det(res.cov_params())
-
-        endog = self.endog
-        exog = self.exog
-
-        params = np.zeros(exog.shape, dtype=np.float)
-        mse_resid = np.zeros(endog.shape, dtype=np.float)
-        det_cov_params = np.zeros(endog.shape, dtype=np.float)
-
-        cv_iter = LeaveOneOut(self.nobs)
-        for inidx, outidx in cv_iter:
-            res_i = self.model_class(endog[inidx], exog[inidx]).fit()
-            params[outidx] = res_i.params
-            mse_resid[outidx] = res_i.mse_resid
-            det_cov_params[outidx] = get_det_cov_params(res_i)
-
-        return dict(params=params, mse_resid=mse_resid,
-                       det_cov_params=det_cov_params)
-
     def summary_frame(self):
         """
         Creates a DataFrame with all available influence results.
@@ -664,6 +649,182 @@ class OLSInfluence(object):
                            html_fmt=fmt_html)
 
 
+class GLMInfluence(object):
+    '''class to calculate outlier and influence measures for GLM results
+
+    Parameters
+    ----------
+    results : GLMResults instance
+        the results of a GLM fit
+
+    Notes
+    -----
+    The leave-one-observation-out (LOOO) measures are one-step approximations.
+    Starting at the full sample estimate, one iteration of iteratively
+    reweighted least squares without the observation is computed in closed
+    form from the diagonal of the hat matrix of the weighted regression and
+    the working residuals, see Williams (1987). This requires O(nobs * k_vars)
+    memory and time and no refitting.
+
+    For the Gaussian family with identity link the one-step parameters are
+    exact and the measures agree with those of `OLSInfluence`.
+
+    References
+    ----------
+    Williams, D. A. 1987. "Generalized Linear Model Diagnostics Using the
+        Deviance and Single Case Deletions." Applied Statistics 36 (2): 181-91.
+    '''
+
+    def __init__(self, results):
+        self.results = maybe_unwrap_results(results)
+        self.nobs, self.k_vars = self.results.model.exog.shape
+        self.endog = self.results.model.endog
+        self.exog = self.results.model.exog
+        self.model_class = self.results.model.__class__
+        self.scale = self.results.scale
+
+    @cache_readonly
+    def _weights(self):
+        # weights of the final IRLS iteration, i.e. the expected information
+        # factor with scale equal to one
+        model = self.results.model
+        mu = self.results.mu
+        return (model.iweights * model.n_trials *
+                model.family.weights(mu))
+
+    @cache_readonly
+    def _xwxi(self):
+        # normalized covariance of the weighted regression, inv(X'WX)
+        exog = self.exog
+        return np.linalg.pinv(np.dot(exog.T * self._weights, exog))
+
+    @cache_readonly
+    def hat_matrix_diag(self):
+        '''(cached attribute) diagonal of the hat matrix of the weighted
+        regression of the last IRLS iteration
+        '''
+        xwxi_x = np.dot(self.exog, self._xwxi)
+        return self._weights * (xwxi_x * self.exog).sum(1)
+
+    @cache_readonly
+    def resid_studentized(self):
+        '''(cached attribute) studentized Pearson residuals
+
+        resid_pearson / sqrt(scale * (1 - hii))
+        '''
+        hii = self.hat_matrix_diag
+        return (self.results.resid_pearson /
+                np.sqrt(self.scale * (1 - hii)))
+
+    @cache_readonly
+    def d_params(self):
+        '''(cached attribute) one-step change of the parameters when an
+        observation is left out
+
+        computed as ::
+
+           inv(X'WX) x_i w_i resid_working_i / (1 - hii)
+
+        where w and the working residuals are those of the last IRLS
+        iteration.
+        '''
+        model = self.results.model
+        mu = self.results.mu
+        hii = self.hat_matrix_diag
+        score_factor = (self._weights * (self.endog - mu) *
+                        model.family.link.deriv(mu))
+        xwxi_x = np.dot(self.exog, self._xwxi)
+        return xwxi_x * (score_factor / (1 - hii))[:, None]
+
+    @cache_readonly
+    def params_not_obsi(self):
+        '''(cached attribute) one-step parameter estimates for all LOOO
+        samples
+        '''
+        return self.results.params - self.d_params
+
+    @cache_readonly
+    def dfbetas(self):
+        '''(cached attribute) dfbetas
+
+        one-step change of the parameters divided by their standard errors
+        based on the expected information matrix
+        '''
+        return self.d_params / np.sqrt(self.scale * np.diag(self._xwxi))
+
+    @cache_readonly
+    def cooks_distance(self):
+        '''(cached attribute) Cooks distance based on the one-step change of
+        the parameters
+
+        Returns
+        -------
+        cooks_d : ndarray
+        pvals : ndarray
+            p-values based on the F distribution
+        '''
+        hii = self.hat_matrix_diag
+        cooks_d2 = self.resid_studentized**2 / self.k_vars
+        cooks_d2 *= hii / (1 - hii)
+
+        from scipy import stats
+        pvals = stats.f.sf(cooks_d2, self.k_vars, self.results.df_resid)
+
+        return cooks_d2, pvals
+
+    @cache_readonly
+    def dffits_internal(self):
+        '''(cached attribute) dffits measure for influence of an observation
+
+        based on resid_studentized
+        '''
+        hii = self.hat_matrix_diag
+        dffits_ = self.resid_studentized * np.sqrt(hii / (1 - hii))
+        dffits_threshold = 2 * np.sqrt(self.k_vars * 1. / self.nobs)
+        return dffits_, dffits_threshold
+
+    def summary_frame(self):
+        """
+        Creates a DataFrame with all available influence results.
+
+        Returns
+        -------
+        frame : DataFrame
+            A DataFrame with all results.
+
+        Notes
+        -----
+        The resultant DataFrame contains four variables in addition to the
+        DFBETAS. These are:
+
+        * cooks_d : Cook's Distance defined in `cooks_distance`
+        * standard_resid : Studentized Pearson residuals defined in
+          `resid_studentized`
+        * hat_diag : The diagonal of the hat matrix defined in
+          `hat_matrix_diag`
+        * dffits_internal : DFFITS statistics defined in `dffits_internal`
+        """
+        from pandas import DataFrame
+
+        data = self.results.model.data
+        row_labels = data.row_labels
+        beta_labels = ['dfb_' + i for i in data.xnames]
+
+        summary_data = DataFrame(dict(
+                            cooks_d=self.cooks_distance[0],
+                            standard_resid=self.resid_studentized,
+                            hat_diag=self.hat_matrix_diag,
+                            dffits_internal=self.dffits_internal[0],
+                            ),
+                            columns=['cooks_d', 'standard_resid',
+                                     'hat_diag', 'dffits_internal'],
+                            index=row_labels)
+        dfbeta = DataFrame(self.dfbetas, columns=beta_labels,
+                           index=row_labels)
+
+        return dfbeta.join(summary_data)
+
+
 def summary_table(res, alpha=0.05):
     """
     Generate summary table of outlier and influence similar to SAS
@@ -74,7 +74,6 @@ TODO
      note this will not be optimal in the panel context, see Peterson
 * HAC should maybe return the chosen nlags
 * get consistent notation, varies by paper, S, scale, sigma?
-* replace diag(hat_matrix) calculations in cov_hc2, cov_hc3
 
 
 References
@@ -105,7 +104,8 @@ from statsmodels.compat.python import range
 import pandas as pd
 import numpy as np
 
-from statsmodels.tools.grouputils import Group
+from statsmodels.tools.grouputils import (Group, _is_nested,
+                                          _absorbed_df_codes)
 from statsmodels.stats.moment_helpers import se_cov
 
 __all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_hac', 'cov_nw_panel',
@@ -166,11 +166,26 @@ def _HCCM(results, scale):
 
     where pinv(x) = (X'X)^(-1) X
     and scale is (nobs,)
+
+    If the model does not have `pinv_wexog`, then the sandwich is computed
+    from `results.normalized_cov_params` without the (k_vars, nobs) array.
     '''
-    H = np.dot(results.model.pinv_wexog,
-        scale[:,None]*results.model.pinv_wexog.T)
+    if hasattr(results.model, 'pinv_wexog'):
+        H = np.dot(results.model.pinv_wexog,
+            scale[:,None]*results.model.pinv_wexog.T)
+    else:
+        wexog = results.model.wexog
+        xxi = results.normalized_cov_params
+        H = np.dot(np.dot(xxi, np.dot(wexog.T, scale[:,None] * wexog)), xxi)
     return H
 
+def _hat_diag(results):
+    '''
+    diagonal of the hat matrix X (X'X)^(-1) X' computed row by row
+    '''
+    exog = results.model.exog
+    return (np.dot(exog, results.normalized_cov_params) * exog).sum(1)
+
 def cov_hc0(results):
     """
     See statsmodels.RegressionResults
@@ -195,10 +210,7 @@ def cov_hc2(results):
     See statsmodels.RegressionResults
     """
 
-    # probably could be optimized
-    h = np.diag(np.dot(results.model.exog,
-                          np.dot(results.normalized_cov_params,
-                          results.model.exog.T)))
+    h = _hat_diag(results)
     het_scale = results.resid**2/(1-h)
     cov_hc2_ = _HCCM(results, het_scale)
     return cov_hc2_
@@ -208,10 +220,7 @@ def cov_hc3(results):
     See statsmodels.RegressionResults
     """
 
-    # above probably could be optimized to only calc the diag
-    h = np.diag(np.dot(results.model.exog,
-                          np.dot(results.normalized_cov_params,
-                          results.model.exog.T)))
+    h = _hat_diag(results)
     het_scale=(results.resid/(1-h))**2
     cov_hc3_ = _HCCM(results, het_scale)
     return cov_hc3_
@@ -281,7 +290,15 @@ def _HCCM1(results, scale):
         robust covariance matrix for the parameter estimates
 
     '''
-    if scale.ndim == 1:
+    if not hasattr(results.model, 'pinv_wexog'):
+        wexog = results.model.wexog
+        xxi = results.normalized_cov_params
+        if scale.ndim == 1:
+            meat = np.dot(wexog.T, scale[:,None] * wexog)
+        else:
+            meat = np.dot(wexog.T, np.dot(scale, wexog))
+        H = np.dot(np.dot(xxi, meat), xxi)
+    elif scale.ndim == 1:
         H = np.dot(results.model.pinv_wexog,
                    scale[:,None]*results.model.pinv_wexog.T)
     else:
@@ -518,6 +535,22 @@ def cov_crosssection_0(results, group):
     cov = _HCCM1(results, scale)
     return cov
 
+def _absorbed_df_cluster(results, group):
+    """number of absorbed fixed effects that are not nested in the clusters
+    """
+    if isinstance(results, tuple):
+        return 0
+    if hasattr(results, '_results'):
+        results = results._results
+    codes = getattr(results.model, '_absorb_codes', None)
+    if codes is None:
+        return 0
+    codes = [code for code in codes if not _is_nested(code, group)]
+    if not codes:
+        return 0
+    return _absorbed_df_codes(codes)
+
+
 def cov_cluster(results, group, use_correction=True):
     '''cluster robust covariance matrix
 
@@ -541,6 +574,10 @@ def cov_cluster(results, group, use_correction=True):
     -----
     same result as Stata in UCLA example and same as Peterson
 
+    If the model absorbs fixed effects, then the number of absorbed effects
+    is added to the number of parameters in the small sample correction,
+    except for factors that are nested within the clusters.
+
     '''
     #TODO: currently used version of groupsums requires 2d resid
     xu, hessian_inv = _get_sandwich_arrays(results, cov_type='clu')
@@ -558,6 +595,9 @@ def cov_cluster(results, group, use_correction=True):
     cov_c = _HCCM2(hessian_inv, scale)
 
     if use_correction:
+        # absorbed fixed effects count as parameters unless they are
+        # nested within the clusters
+        k_params += _absorbed_df_cluster(results, group)
         cov_c *= (n_groups / (n_groups - 1.) *
                   ((nobs-1.) / float(nobs - k_params)))
 
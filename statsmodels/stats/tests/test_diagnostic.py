@@ -834,6 +834,64 @@ def test_influence_dtype():
     assert_almost_equal(cr1, cr3, decimal=8)
 
 
+def test_influence_looo_closed_form():
+    # compare closed form leave-one-observation-out results with refits
+    np.random.seed(987125)
+    nobs = 40
+    exog = add_constant(np.random.randn(nobs, 2))
+    endog = exog.sum(1) + np.random.randn(nobs)
+    infl = OLS(endog, exog).fit().get_influence()
+
+    params = np.zeros((nobs, 3))
+    mse_resid = np.zeros(nobs)
+    det_cov_params = np.zeros(nobs)
+    for i in range(nobs):
+        mask = np.arange(nobs) != i
+        res_i = OLS(endog[mask], exog[mask]).fit()
+        params[i] = res_i.params
+        mse_resid[i] = res_i.mse_resid
+        det_cov_params[i] = np.linalg.det(res_i.cov_params())
+
+    assert_allclose(infl.params_not_obsi, params, rtol=1e-12)
+    assert_allclose(infl.sigma2_not_obsi, mse_resid, rtol=1e-12)
+    assert_allclose(infl.det_cov_params_not_obsi, det_cov_params, rtol=1e-12)
+
+
+def test_glm_influence():
+    from statsmodels.genmod.generalized_linear_model import GLM
+    from statsmodels.genmod import families
+
+    np.random.seed(987125)
+    nobs = 60
+    exog = add_constant(0.5 * np.random.randn(nobs, 2))
+    endog = exog.sum(1) + np.random.randn(nobs)
+
+    # Gaussian identity is exact and agrees with OLS
+    infl_ols = OLS(endog, exog).fit().get_influence()
+    infl = GLM(endog, exog).fit().get_influence()
+    assert_allclose(infl.hat_matrix_diag, infl_ols.hat_matrix_diag,
+                    rtol=1e-12)
+    assert_allclose(infl.params_not_obsi, infl_ols.params_not_obsi,
+                    rtol=1e-12)
+    assert_allclose(infl.resid_studentized,
+                    infl_ols.resid_studentized_internal, rtol=1e-12)
+    assert_allclose(infl.cooks_distance[0], infl_ols.cooks_distance[0],
+                    rtol=1e-12)
+    assert_allclose(infl.dffits_internal[0], infl_ols.dffits_internal[0],
+                    rtol=1e-12)
+
+    # one-step approximation for Poisson
+    endog = np.random.poisson(np.exp(exog.sum(1)))
+    res = GLM(endog, exog, family=families.Poisson()).fit()
+    infl = res.get_influence()
+    params = np.array([GLM(np.delete(endog, i), np.delete(exog, i, 0),
+                           family=families.Poisson()).fit().params
+                       for i in range(nobs)])
+    d_params = res.params - params
+    assert_allclose(infl.d_params, d_params, atol=0.05 * np.abs(d_params).max())
+    assert_equal(infl.summary_frame().shape, (nobs, 7))
+
+
 def test_outlier_test():
     # results from R with NA -> 1. Just testing interface here because
     # outlier_test is just a wrapper
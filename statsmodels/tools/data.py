@@ -86,6 +86,12 @@ def struct_to_ndarray(arr):
     return arr.view((float, len(arr.dtype.names)), type=np.ndarray)
 
 
+def _is_sparse(x):
+    """True if x is a scipy.sparse matrix"""
+    from scipy import sparse
+    return sparse.issparse(x)
+
+
 def _is_using_ndarray_type(endog, exog):
     return (type(endog) is np.ndarray and
             (type(exog) is np.ndarray or exog is None))
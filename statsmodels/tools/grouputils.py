@@ -181,6 +181,143 @@ def dummy_sparse(groups):
     return indi
 
 
+def _group_codes(groups):
+    """list of integer codes, one array for each column of groups"""
+    groups = np.asarray(groups)
+    if groups.ndim == 1:
+        groups = groups[:, None]
+    elif groups.ndim != 2:
+        raise ValueError("groups needs to be 1- or 2-dimensional")
+    return [pd.factorize(groups[:, j])[0] for j in range(groups.shape[1])]
+
+
+def demean_groups(x, groups, weights=None, start=None, tol=1e-10,
+                  maxiter=10000):
+    """
+    Partial out the fixed effects of one or more group factors
+
+    Parameters
+    ----------
+    x : ndarray, 1d or 2d (nobs, k)
+        The variables that are demeaned.
+    groups : array-like, 1d or 2d (nobs, n_factors)
+        Group labels, one column for each factor.
+    weights : ndarray, 1d, optional
+        Weights of the observations for weighted group means.
+    start : ndarray, optional
+        Starting value with the same shape as x. It needs to differ from x
+        only by a sum of group effects, for example
+        ``x - x_previous + demeaned_previous`` if x_previous has already
+        been demeaned with slightly different weights.
+    tol : float
+        Convergence tolerance for the largest group mean, relative to the
+        largest absolute value of x.
+    maxiter : int
+        Maximum number of sweeps through the factors.
+
+    Returns
+    -------
+    x_demeaned : ndarray
+        The residuals of the weighted least squares projection of x on the
+        dummy variables of all factors.
+    n_iter : int
+        The number of sweeps through the factors.
+
+    Notes
+    -----
+    The projection is computed with the method of alternating projections:
+    the weighted group means of each factor are subtracted in turn until
+    the group means of all factors are zero. With a single factor one
+    sweep is exact. The dummy variables are never created.
+    """
+    return _demean_codes(x, _group_codes(groups), weights=weights,
+                         start=start, tol=tol, maxiter=maxiter)
+
+
+def _demean_codes(x, codes, weights=None, start=None, tol=1e-10,
+                  maxiter=10000):
+    """demean_groups for a list of integer code arrays"""
+    x = np.asarray(x, dtype=np.float64)
+    x_dm = (x if start is None else np.asarray(start, np.float64)).copy()
+    is_1d = x_dm.ndim == 1
+    if is_1d:
+        x_dm = x_dm[:, None]
+    nobs, k_vars = x_dm.shape
+    if weights is None:
+        weights = np.ones(nobs)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    wsums = [np.bincount(code, weights=weights) for code in codes]
+    threshold = tol * max(np.max(np.abs(x)), 1e-300)
+    n_iter = 0
+    for n_iter in range(1, maxiter + 1):
+        max_mean = 0.
+        for code, wsum in zip(codes, wsums):
+            wx = weights[:, None] * x_dm
+            means = np.column_stack([
+                np.bincount(code, weights=wx[:, j], minlength=len(wsum))
+                for j in range(k_vars)]) / wsum[:, None]
+            x_dm -= means[code]
+            max_mean = max(max_mean, np.max(np.abs(means)))
+        if len(codes) == 1 or max_mean < threshold:
+            break
+
+    if is_1d:
+        x_dm = x_dm[:, 0]
+    return x_dm, n_iter
+
+
+def absorbed_df(groups):
+    """
+    Number of linearly independent group effects of several factors
+
+    Parameters
+    ----------
+    groups : array-like, 1d or 2d (nobs, n_factors)
+        Group labels, one column for each factor.
+
+    Returns
+    -------
+    df : int
+        The number of levels of all factors, minus the redundant levels.
+
+    Notes
+    -----
+    The redundancies between the first two factors are the number of
+    connected components of their bipartite graph, which is exact. Each
+    additional factor is assumed to add one redundant level, which can
+    overstate the degrees of freedom, i.e. is conservative.
+    """
+    return _absorbed_df_codes(_group_codes(groups))
+
+
+def _absorbed_df_codes(codes):
+    """absorbed_df for a list of integer code arrays"""
+    n_levels = [code.max() + 1 for code in codes]
+    df = sum(n_levels)
+    if len(codes) == 1:
+        return df
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+    n0, n1 = n_levels[:2]
+    edges = sparse.coo_matrix((np.ones(len(codes[0])),
+                               (codes[0], codes[1] + n0)),
+                              shape=(n0 + n1, n0 + n1))
+    n_components = connected_components(edges, directed=False)[0]
+    return df - n_components - (len(codes) - 2)
+
+
+def _is_nested(code, group):
+    """True if each level of the integer codes is within one group"""
+    group = pd.factorize(np.asarray(group))[0]
+    n_levels = code.max() + 1
+    gmin = np.full(n_levels, group.max() + 1)
+    gmax = np.full(n_levels, -1)
+    np.minimum.at(gmin, code, group)
+    np.maximum.at(gmax, code, group)
+    return bool((gmin == gmax).all())
+
+
 class Group(object):
 
     def __init__(self, group, name=''):
@@ -11,9 +11,17 @@ changes for statsmodels (Josef Perktold)
 """
 from __future__ import print_function
 
+import warnings
+
+import numpy as np
+
 from statsmodels.tools.sm_exceptions import (ModuleUnavailableWarning,
                                              module_unavailable_doc)
 
+#: Exceptions of a failed estimation, which `batch_apply` records per item
+ESTIMATION_ERRORS = (np.linalg.LinAlgError, ValueError, FloatingPointError,
+                     OverflowError)
+
 
 def parallel_func(func, n_jobs, verbose=5):
     """Return parallel instance with delayed function
@@ -73,3 +81,87 @@ def parallel_func(func, n_jobs, verbose=5):
         my_func = func
         parallel = list
     return parallel, my_func, n_jobs
+
+
+def split_series(endog):
+    """Split the data of a batch into a list of series and their names
+
+    Parameters
+    ----------
+    endog : array_like or sequence
+        A 2-dimensional array or DataFrame holds one series in each column.
+        Otherwise a sequence of array_like, one for each series.
+
+    Returns
+    -------
+    series : list
+        The series, pandas Series for the columns of a DataFrame.
+    names : list
+        The column names of a DataFrame, otherwise the positions.
+    """
+    import pandas as pd
+    if isinstance(endog, pd.DataFrame):
+        names = list(endog.columns)
+        series = [endog.iloc[:, i] for i in range(endog.shape[1])]
+    else:
+        if isinstance(endog, np.ndarray) and endog.ndim == 2:
+            series = [endog[:, i] for i in range(endog.shape[1])]
+        else:
+            series = list(endog)
+        names = list(range(len(series)))
+    return series, names
+
+
+def _apply_chunk(func, args, errors):
+    out = []
+    for item_args in args:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                out.append(func(*item_args))
+        except errors as e:
+            out.append({'error': '%s: %s' % (e.__class__.__name__, e)})
+    return out
+
+
+def batch_apply(func, args, errors=ESTIMATION_ERRORS, n_jobs=1,
+                chunksize=None):
+    """Apply a function to many items, optionally in parallel processes
+
+    Parameters
+    ----------
+    func : callable
+        Module level function, which returns a dict for each item.
+    args : list of tuple
+        The arguments of `func` for each item.
+    errors : tuple of exceptions
+        Exceptions raised by `func` that are recorded as the failure of an
+        item, by a dict with key 'error' and the message of the exception.
+        Other exceptions are raised.
+    n_jobs : int
+        Number of processes. -1 uses all CPUs. Default is 1, which applies
+        `func` in the current process.
+    chunksize : int, optional
+        Number of items that are sent to a process at once. The default
+        splits the items into four chunks per process.
+
+    Returns
+    -------
+    out : list of dict
+        The results for each item, in the order of `args`.
+
+    Notes
+    -----
+    Warnings raised by `func` are not shown. The processes are run with
+    joblib, if it is installed. Otherwise the items are processed in the
+    current process.
+    """
+    n_items = len(args)
+    if n_jobs == 1:
+        return _apply_chunk(func, args, errors)
+    parallel, p_func, n_jobs = parallel_func(_apply_chunk, n_jobs, verbose=0)
+    if chunksize is None:
+        chunksize = max(1, -(-n_items // (4 * n_jobs)))
+    chunks = [args[i:i + chunksize] for i in range(0, n_items, chunksize)]
+    out = parallel(p_func(func, chunk, errors) for chunk in chunks)
+    return [item for chunk in out for item in chunk]
@@ -248,3 +248,33 @@ def test_init_api():
     grouping = Grouping(list_groups)
     np.testing.assert_array_equal(grouping.group_names,
                                   ['group0', 'group1', 'group2'])
+
+
+def test_demean_groups():
+    from statsmodels.tools.grouputils import demean_groups, absorbed_df
+    np.random.seed(123)
+    nobs = 400
+    groups = np.column_stack((np.random.randint(0, 20, size=nobs),
+                              np.random.randint(0, 8, size=nobs)))
+    x = np.random.randn(nobs, 2)
+    weights = np.random.uniform(0.5, 2, size=nobs)
+    dummies = np.column_stack((pd.get_dummies(groups[:, 0]).values,
+                               pd.get_dummies(groups[:, 1]).values))
+    dummies = dummies.astype(float)
+    sw = np.sqrt(weights)[:, None]
+    params = np.linalg.lstsq(dummies * sw, x * sw, rcond=-1)[0]
+    expected = x - dummies.dot(params)
+
+    x_dm, n_iter = demean_groups(x, groups, weights=weights)
+    np.testing.assert_allclose(x_dm, expected, atol=1e-8)
+    x_dm, n_iter = demean_groups(x[:, 0], groups[:, 0])
+    np.testing.assert_allclose(x_dm, x[:, 0] - pd.Series(x[:, 0]).groupby(
+        groups[:, 0]).transform('mean').values, atol=1e-12)
+    np.testing.assert_equal(n_iter, 1)
+
+    np.testing.assert_equal(absorbed_df(groups),
+                            np.linalg.matrix_rank(dummies))
+    # two disconnected sets of groups
+    groups2 = np.column_stack((np.repeat([0, 1, 2, 3], 5),
+                               np.repeat([0, 1], 10)))
+    np.testing.assert_equal(absorbed_df(groups2), 4)
@@ -11,3 +11,41 @@ def test_parallel():
         parallel, p_func, n_jobs = parallel_func(sqrt, n_jobs=-1, verbose=0)
         y = parallel(p_func(i**2) for i in range(10))
     testing.assert_equal(x,y)
+
+
+def _inverse(x):
+    if x == 0:
+        raise ValueError('zero')
+    elif x < 0:
+        raise TypeError('negative')
+    return {'value': 1. / x}
+
+
+def test_batch_apply():
+    import pytest
+    from statsmodels.tools.parallel import batch_apply
+    for n_jobs in [1, 2]:
+        out = batch_apply(_inverse, [(2.,), (0.,), (4.,)], n_jobs=n_jobs,
+                          chunksize=1)
+        testing.assert_equal(out, [{'value': 0.5},
+                                   {'error': 'ValueError: zero'},
+                                   {'value': 0.25}])
+        # other exceptions are not recorded
+        with pytest.raises(TypeError):
+            batch_apply(_inverse, [(2.,), (-1.,)], n_jobs=n_jobs)
+
+
+def test_split_series():
+    import numpy as np
+    import pandas as pd
+    from statsmodels.tools.parallel import split_series
+    x = np.arange(6.).reshape(3, 2)
+    series, names = split_series(x)
+    testing.assert_equal(series, [x[:, 0], x[:, 1]])
+    testing.assert_equal(names, [0, 1])
+    series, names = split_series(pd.DataFrame(x, columns=['a', 'b']))
+    testing.assert_equal(names, ['a', 'b'])
+    testing.assert_equal(series[1].values, x[:, 1])
+    series, names = split_series([x[:, 0], x[:2, 1]])
+    testing.assert_equal(len(series[1]), 2)
+    testing.assert_equal(names, [0, 1])
@@ -9,7 +9,8 @@ from scipy.linalg import svdvals
 import pandas as pd
 
 from statsmodels.datasets import webuse
-from statsmodels.tools.data import _is_using_pandas, _is_recarray
+from statsmodels.tools.data import (_is_using_pandas, _is_recarray,
+                                   _is_sparse)
 from statsmodels.compat.numpy import np_matrix_rank
 
 
@@ -464,6 +465,32 @@ def chain_dot(*arrs):
     return reduce(lambda x, y: np.dot(y, x), arrs[::-1])
 
 
+def _multiply_rows(x, w):
+    """
+    Multiply the rows of x by the elements of w.
+
+    x can be a scipy.sparse matrix, in which case a sparse CSR matrix is
+    returned.
+    """
+    if _is_sparse(x):
+        return x.multiply(np.asarray(w)[:, None]).tocsr()
+    return np.asarray(w)[:, None] * x
+
+
+def _cross_product(x, weights=None):
+    """
+    Dense weighted cross-product matrix ``x.T diag(weights) x``.
+
+    x can be a scipy.sparse matrix, which is not converted to a dense
+    array.
+    """
+    xw = x if weights is None else _multiply_rows(x, weights)
+    xtx = xw.T.dot(x)
+    if _is_sparse(xtx):
+        xtx = xtx.toarray()
+    return xtx
+
+
 def nan_dot(A, B):
     """
     Returns np.dot(left_matrix, right_matrix) with the convention that
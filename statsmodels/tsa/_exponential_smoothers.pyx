@@ -0,0 +1,192 @@
+#cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Holt-Winters exponential smoothing recursions
+
+The level, slope and seasonal recursions of the Holt-Winters models, and the
+sum of squared errors that `ExponentialSmoothing.fit` minimizes, for each
+combination of no, additive or multiplicative trend and seasonal components.
+
+The trend and seasonal components are given by the integer codes in
+`COMPONENTS`.
+
+License: BSD-3
+"""
+import numpy as np
+cimport numpy as np
+cimport cython
+from libc.math cimport pow
+
+np.import_array()
+
+cdef enum:
+    NONE = 0
+    ADD = 1
+    MUL = 2
+
+COMPONENTS = {None: NONE, 'add': ADD, 'mul': MUL}
+
+
+cdef inline double _trended(double l, double b, double phi,
+                            int trend) nogil:
+    # Level combined with the (damped) slope
+    if trend == ADD:
+        return l + phi * b
+    elif trend == MUL:
+        return l * pow(b, phi)
+    return l
+
+
+cdef inline bint _invalid(double alpha, double beta, double gamma, int trend,
+                          int seasonal) nogil:
+    # Parameter restrictions, outside of which the objective is `max_seen`
+    if trend != NONE and seasonal != NONE:
+        return alpha * beta == 0.0 or beta > alpha or gamma > 1 - alpha
+    elif trend != NONE:
+        return alpha == 0.0 or beta > alpha
+    elif seasonal != NONE:
+        return alpha == 0.0 or gamma > 1 - alpha
+    return False
+
+
+cdef void _smooth(double[::1] y, double[::1] l, double[::1] b,
+                  double[::1] s, double alpha, double beta, double gamma,
+                  double phi, int trend, int seasonal, int m, int n) nogil:
+    cdef:
+        int i
+        double alphac = 1 - alpha, betac = 1 - beta, gammac = 1 - gamma
+        double trended
+
+    for i in range(1, n):
+        trended = _trended(l[i - 1], b[i - 1], phi, trend)
+        if seasonal == MUL:
+            l[i] = (alpha * y[i - 1]) / s[i - 1] + alphac * trended
+        elif seasonal == ADD:
+            l[i] = (alpha * y[i - 1]) - alpha * s[i - 1] + alphac * trended
+        else:
+            l[i] = (alpha * y[i - 1]) + alphac * trended
+
+        if trend == ADD:
+            b[i] = beta * (l[i] - l[i - 1]) + betac * phi * b[i - 1]
+        elif trend == MUL:
+            b[i] = beta * (l[i] / l[i - 1]) + betac * pow(b[i - 1], phi)
+
+        if seasonal == MUL:
+            s[i + m - 1] = (gamma * y[i - 1]) / trended + gammac * s[i - 1]
+        elif seasonal == ADD:
+            s[i + m - 1] = ((gamma * y[i - 1]) - gamma * trended +
+                            gammac * s[i - 1])
+
+
+cdef double _sse(double[::1] y, double[::1] l, double[::1] b, double[::1] s,
+                 double phi, int trend, int seasonal, int n) nogil:
+    cdef:
+        int i
+        double fitted, sse = 0
+
+    for i in range(n):
+        fitted = _trended(l[i], b[i], phi, trend)
+        if seasonal == MUL:
+            fitted = fitted * s[i]
+        elif seasonal == ADD:
+            fitted = fitted + s[i]
+        sse = sse + (fitted - y[i]) * (fitted - y[i])
+    return sse
+
+
+def holt_win_smooth(double[::1] y, double[::1] l, double[::1] b,
+                    double[::1] s, double alpha, double beta, double gamma,
+                    double phi, int trend, int seasonal, int m, int n):
+    """
+    Run the Holt-Winters recursions in place
+
+    Parameters
+    ----------
+    y : ndarray
+        The (transformed) data.
+    l, b, s : ndarray
+        The level, slope and seasonal arrays, with the initial values in
+        `l[0]`, `b[0]` and `s[:m]`. Updated in place for the periods
+        1, ..., n - 1 (and `s` for m, ..., n + m - 2).
+    alpha, beta, gamma, phi : float
+        The smoothing parameters and the damping parameter.
+    trend, seasonal : int
+        Component codes, see `COMPONENTS`.
+    m : int
+        The number of seasons.
+    n : int
+        The number of periods.
+    """
+    with nogil:
+        _smooth(y, l, b, s, alpha, beta, gamma, phi, trend, seasonal, m, n)
+
+
+def holt_win_sse(double[::1] y, double[::1] l, double[::1] b, double[::1] s,
+                 double alpha, double beta, double gamma, double phi,
+                 int trend, int seasonal, int m, int n, double max_seen):
+    """
+    Sum of squared errors of the Holt-Winters fitted values
+
+    Runs the recursions in place, as in `holt_win_smooth`, and returns
+    `max_seen` for parameters outside of the admissible region.
+    """
+    cdef double sse
+    if _invalid(alpha, beta, gamma, trend, seasonal):
+        return max_seen
+    with nogil:
+        _smooth(y, l, b, s, alpha, beta, gamma, phi, trend, seasonal, m, n)
+        sse = _sse(y, l, b, s, phi, trend, seasonal, n)
+    return sse
+
+
+def holt_win_sse_grid(double[:, ::1] y, double[:, ::1] initial,
+                      double[:, ::1] params, int trend, int seasonal, int m,
+                      double max_seen):
+    """
+    Sum of squared errors for a grid of parameters and many series
+
+    Parameters
+    ----------
+    y : ndarray
+        The (transformed) series, shape (n_series, nobs).
+    initial : ndarray
+        The initial level, slope and seasons of each series, shape
+        (n_series, 2 + m).
+    params : ndarray
+        The grid of smoothing parameters, shape (n_grid, 4), with columns
+        alpha, beta, gamma and phi.
+    trend, seasonal : int
+        Component codes, see `COMPONENTS`.
+    m : int
+        The number of seasons.
+    max_seen : float
+        The value for parameters outside of the admissible region.
+
+    Returns
+    -------
+    sse : ndarray
+        Sum of squared errors, shape (n_series, n_grid).
+    """
+    cdef:
+        int i, j, k
+        int n_series = y.shape[0], n = y.shape[1], n_grid = params.shape[0]
+        double[::1] l = np.zeros(n)
+        double[::1] b = np.zeros(n)
+        double[::1] s = np.zeros(n + m)
+        double[:, ::1] sse = np.empty((n_series, n_grid))
+
+    with nogil:
+        for i in range(n_series):
+            for j in range(n_grid):
+                if _invalid(params[j, 0], params[j, 1], params[j, 2], trend,
+                            seasonal):
+                    sse[i, j] = max_seen
+                    continue
+                l[0] = initial[i, 0]
+                b[0] = initial[i, 1]
+                for k in range(m):
+                    s[k] = initial[i, 2 + k]
+                _smooth(y[i], l, b, s, params[j, 0], params[j, 1],
+                        params[j, 2], params[j, 3], trend, seasonal, m, n)
+                sse[i, j] = _sse(y[i], l, b, s, params[j, 3], trend,
+                                 seasonal, n)
+    return np.asarray(sse)
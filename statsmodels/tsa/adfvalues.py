@@ -1,5 +1,5 @@
 from scipy.stats import norm
-from numpy import array, polyval, inf, asarray
+from numpy import array, polyval, inf, asarray, where
 
 __all__ = ['mackinnonp','mackinnoncrit']
 
@@ -174,8 +174,9 @@ def mackinnonp(teststat, regression="c", N=1, lags=None):
 
     Parameters
     ----------
-    teststat : float
-        "T-value" from an Augmented Dickey-Fuller regression.
+    teststat : float or array_like
+        "T-value" from an Augmented Dickey-Fuller regression.  An array of
+        test statistics returns an array of p-values.
     regression : str {"c", "nc", "ct", "ctt"}
         This is the method of regression that was used.  Following MacKinnon's
         notation, this can be "c" for constant, "nc" for no constant, "ct" for
@@ -186,7 +187,7 @@ def mackinnonp(teststat, regression="c", N=1, lags=None):
 
     Returns
     -------
-    p-value : float
+    p-value : float or ndarray
         The p-value for the ADF statistic estimated using MacKinnon 1994.
 
     References
@@ -204,6 +205,16 @@ def mackinnonp(teststat, regression="c", N=1, lags=None):
     maxstat = eval("tau_max_"+regression)
     minstat = eval("tau_min_"+regression)
     starstat = eval("tau_star_"+regression)
+    if asarray(teststat).ndim > 0:
+        teststat = asarray(teststat, dtype=float)
+        smallp = eval("tau_" + regression + "_smallp["+str(N-1)+"]")
+        largep = eval("tau_" + regression + "_largep["+str(N-1)+"]")
+        pvalue = norm.cdf(where(teststat <= starstat[N-1],
+                                polyval(smallp[::-1], teststat),
+                                polyval(largep[::-1], teststat)))
+        pvalue[teststat > maxstat[N-1]] = 1.0
+        pvalue[teststat < minstat[N-1]] = 0.0
+        return pvalue
     if teststat > maxstat[N-1]:
         return 1.0
     elif teststat < minstat[N-1]:
@@ -362,9 +373,10 @@ def mackinnoncrit(N=1, regression ="c", nobs=inf):
         no constant.  The values for the no constant case are taken from the
         1996 paper, as they were not updated for 2010 due to the unrealistic
         assumptions that would underlie such a case.
-    nobs : int or np.inf
+    nobs : int, np.inf or array_like
         This is the sample size.  If the sample size is numpy.inf, then the
-        asymptotic critical values are returned.
+        asymptotic critical values are returned.  For an array of sample
+        sizes, the critical values are returned with shape (len(nobs), 3).
 
     References
     ----------
@@ -380,6 +392,9 @@ def mackinnoncrit(N=1, regression ="c", nobs=inf):
         raise ValueError("regression keyword %s not understood") % reg
     if nobs is inf:
         return eval("tau_"+reg+"_2010["+str(N-1)+",:,0]")
+    elif asarray(nobs).ndim > 0:
+        return polyval(eval("tau_"+reg+"_2010["+str(N-1)+",:,::-1].T"),
+                       1./asarray(nobs, dtype=float)[:, None])
     else:
         return polyval(eval("tau_"+reg+"_2010["+str(N-1)+",:,::-1].T"),1./nobs)
 
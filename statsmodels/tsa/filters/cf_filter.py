@@ -1,4 +1,4 @@
-from statsmodels.compat.python import range
+from statsmodels.compat.scipy import _next_regular
 
 import numpy as np
 from ._utils import _maybe_get_pandas_wrapper
@@ -11,7 +11,6 @@ from ._utils import _maybe_get_pandas_wrapper
 # number between  0 and 1, where 1 corresponds to the Nyquist frequency, p
 # radians per sample.
 
-#NOTE: uses a loop, could probably be sped-up for very large datasets
 def cffilter(X, low=6, high=32, drift=True):
     """
     Christiano Fitzgerald asymmetric, random walk filter
@@ -56,6 +55,14 @@ def cffilter(X, low=6, high=32, drift=True):
 
     .. plot:: plots/cff_plot.py
 
+    Notes
+    -----
+    The weights of the interior observations only depend on the distance
+    between the observations, so that the filter is computed for all
+    observations and series with a single FFT convolution. The weights of
+    the first and last observation are computed from cumulative sums of the
+    ideal band-pass weights.
+
     See Also
     --------
     statsmodels.tsa.filters.bk_filter.bkfilter
@@ -63,7 +70,7 @@ def cffilter(X, low=6, high=32, drift=True):
     statsmodels.tsa.seasonal.seasonal_decompose
 
     """
-    #TODO: cythonize/vectorize loop?, add ability for symmetric filter,
+    #TODO: add ability for symmetric filter,
     #      and estimates of theta other than random walk.
     if low < 2:
         raise ValueError("low must be >= 2")
@@ -78,18 +85,28 @@ def cffilter(X, low=6, high=32, drift=True):
     if drift: # get drift adjusted series
         X = X - np.arange(nobs)[:,None]*(X[-1] - X[0])/(nobs-1)
 
-    J = np.arange(1,nobs+1)
+    J = np.arange(1,nobs)
     Bj = (np.sin(b*J)-np.sin(a*J))/(np.pi*J)
     B0 = (b-a)/np.pi
-    Bj = np.r_[B0,Bj][:,None]
-    y = np.zeros((nobs,nseries))
-
-    for i in range(nobs):
-
-        B = -.5*Bj[0] -np.sum(Bj[1:-i-2])
-        A = -Bj[0] - np.sum(Bj[1:-i-2]) - np.sum(Bj[1:i]) - B
-        y[i] = Bj[0] * X[i] + np.dot(Bj[1:-i-2].T,X[i+1:-1]) + B*X[-1] + \
-                np.dot(Bj[1:i].T, X[1:i][::-1]) + A*X[0]
+    Bj = np.r_[B0,Bj]
+
+    # interior observations X[1:-1] have weight Bj[abs(i - j)]
+    Xint = np.zeros((nobs, nseries))
+    Xint[1:-1] = X[1:-1]
+    kernel = np.r_[Bj[:0:-1], Bj]
+    nfft = _next_regular(3 * nobs - 2)
+    y = np.fft.irfft(np.fft.rfft(kernel, nfft)[:,None] *
+                     np.fft.rfft(Xint, nfft, axis=0), nfft, axis=0)
+    y = y[nobs-1:2*nobs-1]
+
+    # weights of the end points, sums of Bj[1:k] as cumulative sums
+    csum = np.r_[0, np.cumsum(Bj[1:])]
+    i = np.arange(nobs)
+    B = -.5*B0 - csum[np.maximum(nobs - i - 2, 0)]
+    A = -B0 - csum[np.maximum(nobs - i - 2, 0)] - csum[np.maximum(i - 1, 0)] - B
+    B[-1] += B0
+    A[0] += B0
+    y += B[:,None]*X[-1] + A[:,None]*X[0]
     y = y.squeeze()
 
     cycle, trend = y, X.squeeze()-y
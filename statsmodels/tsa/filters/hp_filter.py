@@ -1,7 +1,6 @@
 from __future__ import absolute_import
 
-from scipy import sparse
-from scipy.sparse.linalg import spsolve
+from scipy.linalg import solveh_banded
 import numpy as np
 from ._utils import _maybe_get_pandas_wrapper
 
@@ -13,7 +12,9 @@ def hpfilter(X, lamb=1600):
     Parameters
     ----------
     X : array-like
-        The 1d ndarray timeseries to filter of length (nobs,) or (nobs,1)
+        The 1d ndarray timeseries to filter of length (nobs,) or (nobs,1),
+        or a 2d array of shape (nobs, nseries) with one series in each
+        column.
     lamb : float
         The Hodrick-Prescott smoothing parameter. A value of 1600 is
         suggested for quarterly data. Ravn and Uhlig suggest using a value
@@ -55,10 +56,10 @@ def hpfilter(X, lamb=1600):
     min sum((X[t] - T[t])**2 + lamb*((T[t+1] - T[t]) - (T[t] - T[t-1]))**2)
      T   t
 
-    Here we implemented the HP filter as a ridge-regression rule using
-    scipy.sparse. In this sense, the solution can be written as
+    Here we implemented the HP filter as a ridge-regression rule. In this
+    sense, the solution can be written as
 
-    T = inv(I - lamb*K'K)X
+    T = inv(I + lamb*K'K)X
 
     where I is a nobs x nobs identity matrix, and K is a (nobs-2) x nobs matrix
     such that
@@ -67,6 +68,10 @@ def hpfilter(X, lamb=1600):
     K[i,j] = -2 if i == j + 1
     K[i,j] = 0 otherwise
 
+    I + lamb*K'K is a symmetric, positive definite, pentadiagonal matrix. It
+    is factored once with a banded Cholesky decomposition, which is used for
+    all columns of X.
+
     See Also
     --------
     statsmodels.tsa.filters.bk_filter.bkfilter
@@ -84,16 +89,19 @@ def hpfilter(X, lamb=1600):
     """
     _pandas_wrapper = _maybe_get_pandas_wrapper(X)
     X = np.asarray(X, float)
-    if X.ndim > 1:
+    if X.ndim > 1 and X.shape[1] == 1:
         X = X.squeeze()
     nobs = len(X)
-    I = sparse.eye(nobs,nobs)
-    offsets = np.array([0,1,2])
-    data = np.repeat([[1.],[-2.],[1.]], nobs, axis=1)
-    K = sparse.dia_matrix((data, offsets), shape=(nobs-2,nobs))
 
-    use_umfpack = True
-    trend = spsolve(I+lamb*K.T.dot(K), X, use_umfpack=use_umfpack)
+    # upper diagonals of I + lamb*K'K in banded storage
+    kernel = np.array([1., -2., 1.])
+    ab = np.zeros((3, nobs))
+    for i in range(3):
+        for j in range(i, 3):
+            ab[2 - j + i, j:nobs - 2 + j] += lamb * kernel[i] * kernel[j]
+    ab[2] += 1
+
+    trend = solveh_banded(ab, X)
 
     cycle = X-trend
     if _pandas_wrapper is not None:
@@ -591,6 +591,42 @@ def test_hpfilter_pandas():
     assert_equal(cycle.name, "realgdp")
 
 
+def test_hpfilter_2d():
+    dta = macrodata.load_pandas().data[['realgdp', 'realcons', 'unemp']]
+    cycle, trend = hpfilter(dta.values, 1600)
+    assert_equal(cycle.shape, dta.shape)
+    for i in range(dta.shape[1]):
+        cycle1, trend1 = hpfilter(dta.values[:, i], 1600)
+        assert_allclose(trend[:, i], trend1, rtol=1e-12)
+        assert_allclose(cycle[:, i], cycle1, rtol=1e-10, atol=1e-10)
+    assert_allclose(cycle + trend, dta.values, rtol=1e-12)
+
+    cycle, trend = hpfilter(dta, 1600)
+    assert_equal(list(cycle.columns), list(dta.columns))
+    assert_allclose(cycle.values, hpfilter(dta.values, 1600)[0])
+
+
+def test_cfitz_filter_loop():
+    # compare with the weights of each observation, computed as in the
+    # original loop implementation
+    np.random.seed(1234)
+    nobs = 40
+    X = np.random.randn(nobs, 2).cumsum(0)
+    low, high = 3, 15
+    a, b = 2 * np.pi / high, 2 * np.pi / low
+    J = np.arange(1, nobs + 1)
+    Bj = np.r_[(b - a) / np.pi, (np.sin(b * J) - np.sin(a * J)) / (np.pi * J)]
+    cyc = np.zeros((nobs, 2))
+    for i in range(nobs):
+        B = -.5 * Bj[0] - np.sum(Bj[1:-i - 2])
+        A = -Bj[0] - np.sum(Bj[1:-i - 2]) - np.sum(Bj[1:i]) - B
+        cyc[i] = (Bj[0] * X[i] + np.dot(Bj[1:-i - 2], X[i + 1:-1]) +
+                  B * X[-1] + np.dot(Bj[1:i], X[1:i][::-1]) + A * X[0])
+    res_cyc, res_trend = cffilter(X, low, high, drift=False)
+    assert_allclose(res_cyc, cyc, rtol=1e-10, atol=1e-12)
+    assert_allclose(res_trend, X - cyc, rtol=1e-10, atol=1e-12)
+
+
 class TestFilters(object):
     @classmethod
     def setup_class(cls):
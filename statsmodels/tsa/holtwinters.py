@@ -13,12 +13,17 @@ Author: Terence L van Zyl
 
 """
 import numpy as np
+import pandas as pd
 
 from statsmodels.base.model import Results
 from statsmodels.base.wrapper import populate_wrapper, union_dicts, ResultsWrapper
+from statsmodels.tools.parallel import (ESTIMATION_ERRORS, batch_apply,
+                                        split_series)
 from statsmodels.tsa.base.tsa_model import TimeSeriesModel
+from statsmodels.tsa._exponential_smoothers import (
+    COMPONENTS, holt_win_smooth, holt_win_sse, holt_win_sse_grid)
 
-from scipy.optimize import basinhopping, brute, minimize
+from scipy.optimize import basinhopping, minimize
 from scipy.spatial.distance import sqeuclidean
 try:
     from scipy.special import inv_boxcox
@@ -28,204 +33,49 @@ except ImportError:
 from scipy.stats import boxcox
 
 
-def _holt_init(x, xi, p, y, l, b):
-    """Initialization for the Holt Models"""
-    p[xi] = x
-    alpha, beta, _, l0, b0, phi = p[:6]
-    alphac = 1 - alpha
-    betac = 1 - beta
-    y_alpha = alpha * y
-    l[:] = 0
-    b[:] = 0
-    l[0] = l0
-    b[0] = b0
-    return alpha, beta, phi, alphac, betac, y_alpha
-
-
-def _holt__(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Simple Exponential Smoothing
-    Minimization Function
-    (,)
+def _holt_win_objective(x, xi, p, y, l, b, s, m, n, max_seen, trend,
+                        seasonal):
     """
-    alpha, beta, phi, alphac, betac, y_alpha = _holt_init(x, xi, p, y, l, b)
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1]) + (alphac * (l[i - 1]))
-    return sqeuclidean(l, y)
-
+    Sum of squared errors, the objective minimized in `fit`
 
-def _holt_mul_dam(x, xi, p, y, l, b, s, m, n, max_seen):
+    Sets the free parameters `p[xi]` to `x` and runs the compiled recursions,
+    with `trend` and `seasonal` given by their component codes.
     """
-    Multiplicative and Multiplicative Damped 
-    Minimization Function
-    (M,) & (Md,)
-    """
-    alpha, beta, phi, alphac, betac, y_alpha = _holt_init(x, xi, p, y, l, b)
-    if alpha == 0.0:
-        return max_seen
-    if beta > alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1]) + (alphac * (l[i - 1] * b[i - 1]**phi))
-        b[i] = (beta * (l[i] / l[i - 1])) + (betac * b[i - 1]**phi)
-    return sqeuclidean(l * b**phi, y)
-
-
-def _holt_add_dam(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Additive and Additive Damped 
-    Minimization Function
-    (A,) & (Ad,)
-    """
-    alpha, beta, phi, alphac, betac, y_alpha = _holt_init(x, xi, p, y, l, b)
-    if alpha == 0.0:
-        return max_seen
-    if beta > alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1]) + (alphac * (l[i - 1] + phi * b[i - 1]))
-        b[i] = (beta * (l[i] - l[i - 1])) + (betac * phi * b[i - 1])
-    return sqeuclidean(l + phi * b, y)
-
-
-def _holt_win_init(x, xi, p, y, l, b, s, m):
-    """Initialization for the Holt Winters Seasonal Models"""
     p[xi] = x
     alpha, beta, gamma, l0, b0, phi = p[:6]
-    s0 = p[6:]
-    alphac = 1 - alpha
-    betac = 1 - beta
-    gammac = 1 - gamma
-    y_alpha = alpha * y
-    y_gamma = gamma * y
-    l[:] = 0
-    b[:] = 0
-    s[:] = 0
     l[0] = l0
     b[0] = b0
-    s[:m] = s0
-    return alpha, beta, gamma, phi, alphac, betac, gammac, y_alpha, y_gamma
+    s[:m] = p[6:]
+    return holt_win_sse(y, l, b, s, alpha, beta, gamma, phi, trend, seasonal,
+                        m, n, max_seen)
 
 
-def _holt_win__mul(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Multiplicative Seasonal 
-    Minimization Function
-    (,M)
-    """
-    alpha, beta, gamma, phi, alphac, betac, gammac, y_alpha, y_gamma = _holt_win_init(
-        x, xi, p, y, l, b, s, m)
-    if alpha == 0.0:
-        return max_seen
-    if gamma > 1 - alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1] / s[i - 1]) + (alphac * (l[i - 1]))
-        s[i + m - 1] = (y_gamma[i - 1] / (l[i - 1])) + (gammac * s[i - 1])
-    return sqeuclidean(l * s[:-(m - 1)], y)
-
-
-def _holt_win__add(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Additive Seasonal 
-    Minimization Function
-    (,A)
-    """
-    alpha, beta, gamma, phi, alphac, betac, gammac, y_alpha, y_gamma = _holt_win_init(
-        x, xi, p, y, l, b, s, m)
-    if alpha == 0.0:
-        return max_seen
-    if gamma > 1 - alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1]) - (alpha * s[i - 1]) + (alphac * (l[i - 1]))
-        s[i + m - 1] = y_gamma[i - 1] - \
-            (gamma * (l[i - 1])) + (gammac * s[i - 1])
-    return sqeuclidean(l + s[:-(m - 1)], y)
-
-
-def _holt_win_add_mul_dam(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Additive and Additive Damped with Multiplicative Seasonal 
-    Minimization Function
-    (A,M) & (Ad,M)
+def _start_grid(free, fixed, Ns=20):
     """
-    alpha, beta, gamma, phi, alphac, betac, gammac, y_alpha, y_gamma = _holt_win_init(
-        x, xi, p, y, l, b, s, m)
-    if alpha * beta == 0.0:
-        return max_seen
-    if beta > alpha or gamma > 1 - alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1] / s[i - 1]) + \
-            (alphac * (l[i - 1] + phi * b[i - 1]))
-        b[i] = (beta * (l[i] - l[i - 1])) + (betac * phi * b[i - 1])
-        s[i + m - 1] = (y_gamma[i - 1] / (l[i - 1] + phi *
-                                          b[i - 1])) + (gammac * s[i - 1])
-    return sqeuclidean((l + phi * b) * s[:-(m - 1)], y)
-
-
-def _holt_win_mul_mul_dam(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Multiplicative and Multiplicative Damped with Multiplicative Seasonal 
-    Minimization Function
-    (M,M) & (Md,M)
-    """
-    alpha, beta, gamma, phi, alphac, betac, gammac, y_alpha, y_gamma = _holt_win_init(
-        x, xi, p, y, l, b, s, m)
-    if alpha * beta == 0.0:
-        return max_seen
-    if beta > alpha or gamma > 1 - alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1] / s[i - 1]) + \
-            (alphac * (l[i - 1] * b[i - 1]**phi))
-        b[i] = (beta * (l[i] / l[i - 1])) + (betac * b[i - 1]**phi)
-        s[i + m - 1] = (y_gamma[i - 1] / (l[i - 1] *
-                                          b[i - 1]**phi)) + (gammac * s[i - 1])
-    return sqeuclidean((l * b**phi) * s[:-(m - 1)], y)
-
-
-def _holt_win_add_add_dam(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Additive and Additive Damped with Additive Seasonal 
-    Minimization Function
-    (A,A) & (Ad,A)
-    """
-    alpha, beta, gamma, phi, alphac, betac, gammac, y_alpha, y_gamma = _holt_win_init(
-        x, xi, p, y, l, b, s, m)
-    if alpha * beta == 0.0:
-        return max_seen
-    if beta > alpha or gamma > 1 - alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1]) - (alpha * s[i - 1]) + \
-            (alphac * (l[i - 1] + phi * b[i - 1]))
-        b[i] = (beta * (l[i] - l[i - 1])) + (betac * phi * b[i - 1])
-        s[i + m - 1] = y_gamma[i - 1] - \
-            (gamma * (l[i - 1] + phi * b[i - 1])) + (gammac * s[i - 1])
-    return sqeuclidean((l + phi * b) + s[:-(m - 1)], y)
-
-
-def _holt_win_mul_add_dam(x, xi, p, y, l, b, s, m, n, max_seen):
-    """
-    Multiplicative and Multiplicative Damped with Additive Seasonal 
-    Minimization Function
-    (M,A) & (M,Ad)
+    Grid of the smoothing parameters for the starting values of `fit`
+
+    Parameters
+    ----------
+    free : ndarray
+        Boolean indicator of the free parameters among alpha, beta, gamma and
+        phi.
+    fixed : ndarray
+        The values of alpha, beta, gamma and phi.
+    Ns : int, optional
+        Number of points in [0, 1] for each free parameter.
+
+    Returns
+    -------
+    grid : ndarray
+        The parameters, shape (Ns**free.sum(), 4), in the order in which
+        `scipy.optimize.brute` evaluates them.
     """
-    alpha, beta, gamma, phi, alphac, betac, gammac, y_alpha, y_gamma = _holt_win_init(
-        x, xi, p, y, l, b, s, m)
-    if alpha * beta == 0.0:
-        return max_seen
-    if beta > alpha or gamma > 1 - alpha:
-        return max_seen
-    for i in range(1, n):
-        l[i] = (y_alpha[i - 1]) - (alpha * s[i - 1]) + \
-            (alphac * (l[i - 1] * b[i - 1]**phi))
-        b[i] = (beta * (l[i] / l[i - 1])) + (betac * b[i - 1]**phi)
-        s[i + m - 1] = y_gamma[i - 1] - \
-            (gamma * (l[i - 1] * b[i - 1]**phi)) + (gammac * s[i - 1])
-    return sqeuclidean((l * phi * b) + s[:-(m - 1)], y)
+    k = int(np.sum(free))
+    grid = np.tile(np.asarray(fixed, dtype=float), (Ns**k, 1))
+    if k > 0:
+        points = np.mgrid[(slice(0.0, 1.0, complex(Ns)),) * k]
+        grid[:, free] = points.reshape(k, -1).T
+    return grid
 
 
 class HoltWintersResults(Results):
@@ -342,6 +192,124 @@ class HoltWintersResultsWrapper(ResultsWrapper):
 populate_wrapper(HoltWintersResultsWrapper, HoltWintersResults)
 
 
+def _fit_batch_series(cls, endog, steps, model_kwds, fit_kwds):
+    """
+    Fit the model of one series in `ExponentialSmoothing.fit_batch`
+
+    Returns a dictionary with the estimates.
+    """
+    model = cls(np.asarray(endog, dtype=float), **model_kwds)
+    res = model.fit(**fit_kwds)
+    params = res.params
+    opt = res.mle_retvals
+    values = [np.nan if params[name] is None else params[name]
+              for name in _batch_param_names]
+    fit = {'params': np.r_[values, params['initial_seasons']],
+           'seasonal_periods': model.seasonal_periods,
+           'sse': res.sse, 'aic': res.aic, 'aicc': res.aicc, 'bic': res.bic,
+           'nobs': model.nobs,
+           'converged': np.nan if opt is None else float(opt.success)}
+    if steps > 0:
+        fit['forecasts'] = np.asarray(res.forecast(steps))
+    return fit
+
+
+# The model raises NotImplementedError for data it cannot handle, for
+# example non-positive values with multiplicative components
+_batch_errors = ESTIMATION_ERRORS + (NotImplementedError,)
+
+_batch_param_names = ['smoothing_level', 'smoothing_slope',
+                      'smoothing_seasonal', 'damping_slope', 'initial_level',
+                      'initial_slope']
+
+
+class HoltWintersBatchResults(object):
+    """
+    Results of fitting one exponential smoothing model to many series
+
+    Parameters
+    ----------
+    fits : list of dict
+        The estimates for each series.
+    names : list
+        The names of the series.
+    steps : int
+        The number of forecasts.
+
+    Attributes
+    ----------
+    names : list
+        Names of the series, the columns of a DataFrame or integers.
+    param_names : list
+        Names of the parameters, with one `initial_seasons.i` for each
+        season.
+    params : ndarray, (n_series, k_params)
+        Parameter estimates, nan for series that failed and for parameters
+        that are not in the model.
+    sse, aic, aicc, bic, nobs : ndarray, (n_series,)
+        Sum of squared errors, information criteria and number of
+        observations of each series.
+    converged : ndarray, (n_series,)
+        Whether the optimizer converged, nan for series that failed or that
+        were not optimized.
+    forecasts : ndarray, (n_series, steps)
+        Out-of-sample forecasts, only available if steps is positive.
+    errors : dict
+        Error messages of the series that failed, keyed by the position
+        of the series.
+    failed : ndarray, (n_series,)
+        Boolean indicator for the series that failed.
+
+    See Also
+    --------
+    ExponentialSmoothing.fit_batch
+    """
+    _stats = ['sse', 'aic', 'aicc', 'bic', 'nobs', 'converged']
+
+    def __init__(self, fits, names, steps):
+        self.names = names
+        self.errors = dict((i, fit['error']) for i, fit in enumerate(fits)
+                           if 'error' in fit)
+        self.failed = np.array(['error' in fit for fit in fits], bool)
+        n_series = len(fits)
+        ok = [fit for fit in fits if 'error' not in fit]
+        m = ok[0]['seasonal_periods'] if ok else 0
+        self.param_names = _batch_param_names + [
+            'initial_seasons.%d' % i for i in range(m)]
+
+        self.params = np.full((n_series, len(self.param_names)), np.nan)
+        for key in self._stats:
+            setattr(self, key, np.full(n_series, np.nan))
+        if steps > 0:
+            self.forecasts = np.full((n_series, steps), np.nan)
+
+        for i, fit in enumerate(fits):
+            if 'error' in fit:
+                continue
+            self.params[i] = fit['params']
+            for key in self._stats:
+                getattr(self, key)[i] = fit[key]
+            if steps > 0:
+                self.forecasts[i] = fit['forecasts']
+
+    def summary_frame(self):
+        """
+        DataFrame with the estimates and statistics of all series
+
+        Returns
+        -------
+        frame : DataFrame
+            One row for each series, with columns for the parameters,
+            sse, aic, aicc, bic, nobs, converged and the error message.
+        """
+        frame = pd.DataFrame(self.params, index=self.names,
+                             columns=self.param_names)
+        for key in self._stats:
+            frame[key] = getattr(self, key)
+        frame['error'] = [self.errors.get(i) for i in range(len(self.names))]
+        return frame
+
+
 class ExponentialSmoothing(TimeSeriesModel):
     """
     Holt Winter's Exponential Smoothing
@@ -534,32 +502,21 @@ class ExponentialSmoothing(TimeSeriesModel):
             init_beta = beta if beta is not None else 0.1 * init_alpha if trending else beta
             init_gamma = None
             init_phi = phi if phi is not None else 0.99
-            # Selection of functions to optimize for approporate parameters
-            func_dict = {('mul', 'add'): _holt_win_add_mul_dam,
-                         ('mul', 'mul'): _holt_win_mul_mul_dam,
-                         ('mul', None): _holt_win__mul,
-                         ('add', 'add'): _holt_win_add_add_dam,
-                         ('add', 'mul'): _holt_win_mul_add_dam,
-                         ('add', None): _holt_win__add,
-                         (None, 'add'): _holt_add_dam,
-                         (None, 'mul'): _holt_mul_dam,
-                         (None, None): _holt__}
             if seasoning:
                 init_gamma = gamma if gamma is not None else 0.05 * \
                     (1 - init_alpha)
                 xi = np.array([alpha is None, beta is None, gamma is None,
                                True, trending, phi is None and damped] + [True] * m)
-                func = func_dict[(seasonal, trend)]
             elif trending:
                 xi = np.array([alpha is None, beta is None, False,
                                True, True, phi is None and damped] + [False] * m)
-                func = func_dict[(None, trend)]
             else:
                 xi = np.array([alpha is None, False, False,
                                True, False, False] + [False] * m)
-                func = func_dict[(None, None)]
             p[:] = [init_alpha, init_beta, init_gamma, l0, b0, init_phi] + s0
-            
+            y = np.ascontiguousarray(y, dtype=float)
+            codes = (COMPONENTS[trend], COMPONENTS[seasonal])
+
             # txi [alpha, beta, gamma, l0, b0, phi, s0,..,s_(m-1)]
             # Have a quick look in the region for a good starting place for alpha etc.
             # using guestimates for the levels
@@ -567,23 +524,29 @@ class ExponentialSmoothing(TimeSeriesModel):
                 [True, True, True, False, False, True] + [False] * m)
             bounds = np.array([(0.0, 1.0), (0.0, 1.0), (0.0, 1.0),
                                (0.0, None), (0.0, None), (0.0, 1.0)] + [(None, None), ] * m)
-            res = brute(func, bounds[txi], (txi, p, y, l, b, s, m, self.nobs, max_seen),
-                        Ns=20, full_output=True, finish=None)
-            (p[txi], max_seen, grid, Jout) = res
+            if txi.any():
+                smoothing = np.array([0, 1, 2, 5])
+                grid = _start_grid(txi[smoothing], p[smoothing])
+                sse = holt_win_sse_grid(
+                    y[None, :], np.r_[p[3:5], p[6:]][None, :], grid,
+                    codes[0], codes[1], m, max_seen)[0]
+                best = np.argmin(sse)
+                p[smoothing] = grid[best]
+                max_seen = sse[best]
             [alpha, beta, gamma, l0, b0, phi] = p[:6]
-            s0 = p[6:]            
-            #bounds = np.array([(0.0,1.0),(0.0,1.0),(0.0,1.0),(0.0,None),(0.0,None),(0.8,1.0)] + [(None,None),]*m)
+            s0 = p[6:]
+            args = (xi, p, y, l, b, s, m, self.nobs, max_seen) + codes
             if use_basinhopping:
                 # Take a deeper look in the local minimum we are in to find the best
                 # solution to parameters, maybe hop around to try escape the local
                 # minimum we may be in.
-                res = basinhopping(func, p[xi], minimizer_kwargs={'args': (
-                    xi, p, y, l, b, s, m, self.nobs, max_seen), 'bounds': bounds[xi]}, stepsize=0.01)
+                res = basinhopping(_holt_win_objective, p[xi], minimizer_kwargs={
+                    'args': args, 'bounds': bounds[xi]}, stepsize=0.01)
             else:
                 # Take a deeper look in the local minimum we are in to find the best
                 # solution to parameters
-                res = minimize(func, p[xi], args=(
-                    xi, p, y, l, b, s, m, self.nobs, max_seen), bounds=bounds[xi])                
+                res = minimize(_holt_win_objective, p[xi], args=args,
+                               bounds=bounds[xi])
             p[xi] = res.x            
             [alpha, beta, gamma, l0, b0, phi] = p[:6]
             s0 = p[6:]
@@ -595,6 +558,63 @@ class ExponentialSmoothing(TimeSeriesModel):
         hwfit._results.mle_retvals = opt
         return hwfit
 
+    @classmethod
+    def fit_batch(cls, endog, steps=0, fit_kwds=None, n_jobs=1,
+                  chunksize=None, **kwargs):
+        """
+        Fit the same model specification to many independent series
+
+        Parameters
+        ----------
+        endog : array_like or sequence
+            The series. A 2-dimensional array or DataFrame holds one series in
+            each column. Otherwise a sequence of array_like, one for each
+            series, which can differ in length.
+        steps : int, optional
+            Number of out-of-sample forecasts for each series. Default is 0.
+        fit_kwds : dict, optional
+            Keyword arguments for `fit`.
+        n_jobs : int, optional
+            Number of processes. -1 uses all CPUs. Default is 1, which fits
+            the series in the current process.
+        chunksize : int, optional
+            Number of series that are sent to a process at once. The default
+            splits the series into four chunks per process.
+        **kwargs
+            Keyword arguments used to create the model for each series, for
+            example `trend`, `seasonal` and `seasonal_periods`.
+
+        Returns
+        -------
+        HoltWintersBatchResults
+
+        Notes
+        -----
+        The starting values of each series are found by evaluating the sum of
+        squared errors over the same grid of smoothing parameters as `fit`,
+        in a single call to the compiled recursions. Estimation errors raised
+        while creating or fitting the model of a series, including the
+        NotImplementedError for data that the model cannot handle, are
+        stored in the results, the parameters and statistics of that series
+        are nan. Other exceptions are raised.
+
+        The processes are run with joblib, if it is installed. Otherwise
+        the series are fit in the current process.
+
+        Examples
+        --------
+        >>> res = ExponentialSmoothing.fit_batch(
+        ...     df, trend='add', seasonal='mul', seasonal_periods=12, steps=12)
+        >>> res.forecasts.shape
+        (df.shape[1], 12)
+        """
+        endog, names = split_series(endog)
+        fit_kwds = {} if fit_kwds is None else dict(fit_kwds)
+        args = [(cls, series, steps, kwargs, fit_kwds) for series in endog]
+        fits = batch_apply(_fit_batch_series, args, errors=_batch_errors,
+                           n_jobs=n_jobs, chunksize=chunksize)
+        return HoltWintersBatchResults(fits, names, steps)
+
     def _predict(self, h=None, smoothing_level=None, smoothing_slope=None,
                  smoothing_seasonal=None, initial_level=None, initial_slope=None,
                  damping_slope=None, initial_seasons=None, use_boxcox=None, lamda=None, remove_bias=None):
@@ -635,15 +655,6 @@ class ExponentialSmoothing(TimeSeriesModel):
             y = data.squeeze()
             if np.ndim(y) != 1:
                 raise NotImplementedError('Only 1 dimensional data supported')
-        y_alpha = np.zeros((self.nobs,))
-        y_gamma = np.zeros((self.nobs,))
-        alphac = 1 - alpha
-        y_alpha[:] = alpha * y
-        if trending:
-            betac = 1 - beta
-        if seasoning:
-            gammac = 1 - gamma
-            y_gamma[:] = gamma * y
         l = np.zeros((self.nobs + h + 1,))
         b = np.zeros((self.nobs + h + 1,))
         s = np.zeros((self.nobs + h + m + 1,))
@@ -664,58 +675,25 @@ class ExponentialSmoothing(TimeSeriesModel):
                   'add': np.multiply,
                   None: lambda b, phi: 0
                   }[trend]
+        i = self.nobs
+        holt_win_smooth(np.ascontiguousarray(y, dtype=float), l, b, s, alpha,
+                        beta if trending else 0.0,
+                        gamma if seasoning else 0.0, phi, COMPONENTS[trend],
+                        COMPONENTS[seasonal], m, i + 1)
+        slope = b[1:i + 1].copy()
+        season = s[m:i + m].copy()
+        l[i:] = l[i]
+        if trending:
+            b[:i] = dampen(b[:i], phi)
+            b[i:] = dampen(b[i], phi_h)
+        trend = trended(l, b)
         if seasonal == 'mul':
-            for i in range(1, self.nobs + 1):
-                l[i] = y_alpha[i - 1] / s[i - 1] + \
-                    (alphac * trended(l[i - 1], dampen(b[i - 1], phi)))
-                if trending:
-                    b[i] = (beta * detrend(l[i], l[i - 1])) + \
-                        (betac * dampen(b[i - 1], phi))
-                s[i + m - 1] = y_gamma[i - 1] / \
-                    trended(l[i - 1], dampen(b[i - 1], phi)) + \
-                    (gammac * s[i - 1])
-            slope = b[1:i + 1].copy()
-            season = s[m:i + m].copy()
-            l[i:] = l[i]
-            if trending:
-                b[:i] = dampen(b[:i], phi)
-                b[i:] = dampen(b[i], phi_h)
-            trend = trended(l, b)
-            s[i + m - 1:] = [s[(i - 1) + j % m] for j in range(h + 1 + 1)]            
+            s[i + m - 1:] = [s[(i - 1) + j % m] for j in range(h + 1 + 1)]
             fitted = trend * s[:-m]
         elif seasonal == 'add':
-            for i in range(1, self.nobs + 1):
-                l[i] = y_alpha[i - 1] - (alpha * s[i - 1]) + \
-                    (alphac * trended(l[i - 1], dampen(b[i - 1], phi)))
-                if trending:
-                    b[i] = (beta * detrend(l[i], l[i - 1])) + \
-                        (betac * dampen(b[i - 1], phi))
-                s[i + m - 1] = y_gamma[i - 1] - \
-                    (gamma * trended(l[i - 1],
-                                     dampen(b[i - 1], phi))) + (gammac * s[i - 1])
-            slope = b[1:i + 1].copy()
-            season = s[m:i + m].copy()
-            l[i:] = l[i]
-            if trending:
-                b[:i] = dampen(b[:i], phi)
-                b[i:] = dampen(b[i], phi_h)
-            trend = trended(l, b)
-            s[i + m - 1:] = [s[(i - 1) + j % m] for j in range(h + 1 + 1)]            
+            s[i + m - 1:] = [s[(i - 1) + j % m] for j in range(h + 1 + 1)]
             fitted = trend + s[:-m]
         else:
-            for i in range(1, self.nobs + 1):
-                l[i] = y_alpha[i - 1] + \
-                    (alphac * trended(l[i - 1], dampen(b[i - 1], phi)))
-                if trending:
-                    b[i] = (beta * detrend(l[i], l[i - 1])) + \
-                        (betac * dampen(b[i - 1], phi))
-            slope = b[1:i + 1].copy()
-            season = s[m:i + m].copy()
-            l[i:] = l[i]
-            if trending:
-                b[:i] = dampen(b[:i], phi)
-                b[i:] = dampen(b[i], phi_h)
-            trend = trended(l, b)
             fitted = trend
         level = l[1:i + 1].copy()
         if use_boxcox or use_boxcox == 'log' or isinstance(use_boxcox, float):
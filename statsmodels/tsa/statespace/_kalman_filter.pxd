@@ -44,6 +44,7 @@ cdef int MEMORY_NO_LIKELIHOOD
 cdef int MEMORY_NO_GAIN
 cdef int MEMORY_NO_SMOOTHING
 cdef int MEMORY_NO_STD_FORECAST
+cdef int MEMORY_STEADY_STATE
 cdef int MEMORY_CONSERVE
 
 # ### Timing options
@@ -170,6 +171,9 @@ cdef class sKalmanFilter(object):
 
     cdef void initialize_statespace_object_pointers(self) except *
     cdef void initialize_filter_object_pointers(self)
+    cdef int steady_state_index(self, int t, int memory_flag)
+    cdef int steady_state_storage(self, int storage)
+    cdef void grow_steady_state_storage(self) except *
     cdef void initialize_function_pointers(self) except *
     cdef void post_convergence(self)
     cdef void numerical_stability(self)
@@ -296,6 +300,9 @@ cdef class dKalmanFilter(object):
 
     cdef void initialize_statespace_object_pointers(self) except *
     cdef void initialize_filter_object_pointers(self)
+    cdef int steady_state_index(self, int t, int memory_flag)
+    cdef int steady_state_storage(self, int storage)
+    cdef void grow_steady_state_storage(self) except *
     cdef void initialize_function_pointers(self) except *
     cdef void post_convergence(self)
     cdef void numerical_stability(self)
@@ -422,6 +429,9 @@ cdef class cKalmanFilter(object):
 
     cdef void initialize_statespace_object_pointers(self) except *
     cdef void initialize_filter_object_pointers(self)
+    cdef int steady_state_index(self, int t, int memory_flag)
+    cdef int steady_state_storage(self, int storage)
+    cdef void grow_steady_state_storage(self) except *
     cdef void initialize_function_pointers(self) except *
     cdef void post_convergence(self)
     cdef void numerical_stability(self)
@@ -548,6 +558,9 @@ cdef class zKalmanFilter(object):
 
     cdef void initialize_statespace_object_pointers(self) except *
     cdef void initialize_filter_object_pointers(self)
+    cdef int steady_state_index(self, int t, int memory_flag)
+    cdef int steady_state_storage(self, int storage)
+    cdef void grow_steady_state_storage(self) except *
     cdef void initialize_function_pointers(self) except *
     cdef void post_convergence(self)
     cdef void numerical_stability(self)
@@ -6,6 +6,8 @@ License: Simplified-BSD
 """
 from __future__ import division, absolute_import, print_function
 
+import operator
+from numbers import Integral
 from warnings import warn
 
 import numpy as np
@@ -41,6 +43,7 @@ MEMORY_NO_LIKELIHOOD = 0x08
 MEMORY_NO_GAIN = 0x10
 MEMORY_NO_SMOOTHING = 0x20
 MEMORY_NO_STD_FORECAST = 0x40
+MEMORY_STEADY_STATE = 0x80
 MEMORY_CONSERVE = (
     MEMORY_NO_FORECAST | MEMORY_NO_PREDICTED | MEMORY_NO_FILTERED |
     MEMORY_NO_LIKELIHOOD | MEMORY_NO_GAIN | MEMORY_NO_SMOOTHING |
@@ -208,7 +211,8 @@ class KalmanFilter(Representation):
     memory_options = [
         'memory_store_all', 'memory_no_forecast', 'memory_no_predicted',
         'memory_no_filtered', 'memory_no_likelihood', 'memory_no_gain',
-        'memory_no_smoothing', 'memory_no_std_forecast', 'memory_conserve'
+        'memory_no_smoothing', 'memory_no_std_forecast', 'memory_conserve',
+        'memory_steady_state'
     ]
 
     memory_store_all = OptionWrapper('conserve_memory', MEMORY_STORE_ALL)
@@ -250,6 +254,10 @@ class KalmanFilter(Representation):
     """
     (bool) Flag to conserve the maximum amount of memory.
     """
+    memory_steady_state = OptionWrapper('conserve_memory', MEMORY_STEADY_STATE)
+    """
+    (bool) Flag to store covariance matrices only until steady-state.
+    """
 
     timing_options = [
         'timing_init_predicted', 'timing_init_filtered'
@@ -656,6 +664,14 @@ class KalmanFilter(Representation):
             this option is used, smoothing is unavailable.
         MEMORY_NO_SMOOTHING = 0x20
             Do not store standardized forecast errors.
+        MEMORY_STEADY_STATE = 0x80
+            Once the filter has converged to its steady-state, do not store
+            the (constant) forecast error covariance, filtered and predicted
+            state covariance and Kalman gain matrices for the remaining
+            periods. These are expanded to all periods only if they are
+            accessed in the results object. Only has an effect for
+            time-invariant models without missing data. If this option is
+            used, smoothing is unavailable.
         MEMORY_CONSERVE
             Do not store any intermediate matrices.
 
@@ -1191,6 +1207,167 @@ class KalmanFilter(Representation):
         return irf
 
 
+def _steady_state_operator(op, reflected=False):
+    def method(self, other):
+        if reflected:
+            return op(other, np.asarray(self))
+        return op(np.asarray(self), other)
+    return method
+
+
+class SteadyStateArray(object):
+    """
+    Read-only covariance-type array of a filter that converged
+
+    Only the matrices up to and including the steady-state period are
+    stored; the matrix of the steady-state period represents all later
+    periods.
+
+    Parameters
+    ----------
+    stored : array
+        Matrices of the periods up to the steady-state period, which is
+        the last period of the array.
+    length : int
+        Number of periods of the represented array.
+
+    Notes
+    -----
+    Indexing returns views of the stored matrices, or a read-only
+    `np.broadcast_to` view of the steady-state matrix for periods after
+    convergence, so that accessing the matrices of single periods or of
+    the converged stretch never allocates the full array. Other numpy
+    operations work on a temporary read-only expansion to the full time
+    dimension (through `__array__`). The full array is kept only once an
+    element is assigned, after which the array behaves as an ordinary
+    array.
+    """
+    def __init__(self, stored, length):
+        self._stored = stored
+        self._steady_t = stored.shape[-1] - 1
+        self.shape = stored.shape[:-1] + (length,)
+        self._full = None
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def dtype(self):
+        return self._stored.dtype
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def _expand(self):
+        steady_t = self._steady_t
+        steady = np.broadcast_to(
+            self._stored[..., steady_t:],
+            self.shape[:-1] + (self.shape[-1] - steady_t,))
+        return np.concatenate((self._stored[..., :steady_t], steady),
+                              axis=-1)
+
+    def __array__(self, dtype=None):
+        if self._full is not None:
+            value = self._full
+        else:
+            value = self._expand()
+            value.flags.writeable = False
+        if dtype is not None:
+            value = value.astype(dtype, copy=False)
+        return value
+
+    def __getitem__(self, key):
+        if self._full is not None:
+            return self._full[key]
+        if not isinstance(key, tuple):
+            key = (key,)
+        n_ellipsis = sum(k is Ellipsis for k in key)
+        if n_ellipsis == 1:
+            i = [k is Ellipsis for k in key].index(True)
+            key = (key[:i] + (slice(None),) * (self.ndim - len(key) + 1) +
+                   key[i + 1:])
+        key = key + (slice(None),) * (self.ndim - len(key))
+        simple = all(isinstance(k, (slice, Integral)) for k in key)
+        if n_ellipsis > 1 or len(key) != self.ndim or not simple:
+            return np.asarray(self)[key]
+
+        steady_t = self._steady_t
+        stored = self._stored[key[:-1] + (slice(None),)]
+        length = self.shape[-1]
+        if isinstance(key[-1], Integral):
+            t = operator.index(key[-1])
+            if not -length <= t < length:
+                raise IndexError('index %d is out of bounds for axis %d with'
+                                 ' size %d' % (t, self.ndim - 1, length))
+            return stored[..., min(t % length, steady_t)]
+        index = np.arange(length)[key[-1]]
+        if len(index) == 0:
+            return stored[..., :0]
+        elif index.max() <= steady_t:
+            step = key[-1].step
+            if step is None or step > 0:
+                return stored[..., index[0]:index[-1] + 1:step]
+            return stored[..., index]
+        elif index.min() >= steady_t:
+            return np.broadcast_to(stored[..., steady_t:],
+                                   stored.shape[:-1] + (len(index),))
+        return stored[..., np.minimum(index, steady_t)]
+
+    def __setitem__(self, key, value):
+        if self._full is None:
+            self._full = self._expand()
+        self._full[key] = value
+
+    def __getattr__(self, name):
+        # `copy`, `T`, `real`, `sum`, ... of the expanded array
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(np.asarray(self), name)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(self.shape[0]):
+            yield self[i]
+
+    def __repr__(self):
+        return repr(np.asarray(self))
+
+    __add__ = _steady_state_operator(operator.add)
+    __radd__ = _steady_state_operator(operator.add, reflected=True)
+    __sub__ = _steady_state_operator(operator.sub)
+    __rsub__ = _steady_state_operator(operator.sub, reflected=True)
+    __mul__ = _steady_state_operator(operator.mul)
+    __rmul__ = _steady_state_operator(operator.mul, reflected=True)
+    __truediv__ = _steady_state_operator(operator.truediv)
+    __rtruediv__ = _steady_state_operator(operator.truediv, reflected=True)
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+    __pow__ = _steady_state_operator(operator.pow)
+
+    def __neg__(self):
+        return -np.asarray(self)
+
+
+def _steady_state_array(name, extra=0):
+    """
+    Property for a covariance-type array of `FilterResults`, which is only
+    expanded to the full time dimension when first accessed
+    """
+    private_name = '_' + name
+
+    def fget(self):
+        return self._expand_steady_state(private_name, self.nobs + extra)
+
+    def fset(self, value):
+        setattr(self, private_name, value)
+
+    return property(fget, fset)
+
+
 class FilterResults(FrozenRepresentation):
     """
     Results from applying the Kalman filter to a state space model.
@@ -1312,6 +1489,17 @@ class FilterResults(FrozenRepresentation):
 
     _attributes = FrozenRepresentation._model_attributes + _filter_attributes
 
+    # Period after which only one (steady-state) covariance matrix was stored;
+    # None if all periods were stored
+    _steady_state_t = None
+
+    filtered_state_cov = _steady_state_array('filtered_state_cov')
+    predicted_state_cov = _steady_state_array('predicted_state_cov', extra=1)
+    forecasts_error_cov = _steady_state_array('forecasts_error_cov')
+    tmp1 = _steady_state_array('tmp1')
+    tmp3 = _steady_state_array('tmp3')
+    tmp4 = _steady_state_array('tmp4')
+
     def __init__(self, model):
         super(FilterResults, self).__init__(model)
 
@@ -1376,19 +1564,26 @@ class FilterResults(FrozenRepresentation):
         self.converged = bool(kalman_filter.converged)
         self.period_converged = kalman_filter.period_converged
 
+        # With the steady-state memory option, the covariance-type arrays were
+        # only written up to (and including) the steady-state period, so only
+        # that part is copied
+        has_missing = np.sum(self.nmissing) > 0
+        steady_t = self.period_converged + 2
+        if (self.memory_steady_state and self.converged and
+                not has_missing and steady_t < self.nobs):
+            self._steady_state_t = steady_t
+        else:
+            self._steady_state_t = None
+        copy_cov = self._copy_steady_state
+
         self.filtered_state = np.array(kalman_filter.filtered_state, copy=True)
-        self.filtered_state_cov = np.array(
-            kalman_filter.filtered_state_cov, copy=True
-        )
+        self.filtered_state_cov = copy_cov(kalman_filter.filtered_state_cov)
         self.predicted_state = np.array(
             kalman_filter.predicted_state, copy=True
         )
-        self.predicted_state_cov = np.array(
-            kalman_filter.predicted_state_cov, copy=True
-        )
+        self.predicted_state_cov = copy_cov(kalman_filter.predicted_state_cov)
 
         # Reset caches
-        has_missing = np.sum(self.nmissing) > 0
         if not self._compatibility_mode and not (self.memory_no_std_forecast or
                                                  self.invert_lu or
                                                  self.solve_lu or
@@ -1425,12 +1620,11 @@ class FilterResults(FrozenRepresentation):
                     kalman_filter.tmp4, self.missing, reorder_cols=True,
                     reorder_rows=True, prefix=self.prefix))
             else:
-                self._kalman_gain = np.array(
-                    kalman_filter.kalman_gain, copy=True)
-                self.tmp1 = np.array(kalman_filter.tmp1, copy=True)
+                self._kalman_gain = copy_cov(kalman_filter.kalman_gain)
+                self.tmp1 = copy_cov(kalman_filter.tmp1)
                 self.tmp2 = np.array(kalman_filter.tmp2, copy=True)
-                self.tmp3 = np.array(kalman_filter.tmp3, copy=True)
-                self.tmp4 = np.array(kalman_filter.tmp4, copy=True)
+                self.tmp3 = copy_cov(kalman_filter.tmp3)
+                self.tmp4 = copy_cov(kalman_filter.tmp4)
         else:
             self._kalman_gain = None
 
@@ -1440,9 +1634,7 @@ class FilterResults(FrozenRepresentation):
         self.forecasts_error = np.array(
             kalman_filter.forecast_error, copy=True
         )
-        self.forecasts_error_cov = np.array(
-            kalman_filter.forecast_error_cov, copy=True
-        )
+        self.forecasts_error_cov = copy_cov(kalman_filter.forecast_error_cov)
         self.llf_obs = np.array(kalman_filter.loglikelihood, copy=True)
 
         # If there was missing data, save the original values from the Kalman
@@ -1545,6 +1737,31 @@ class FilterResults(FrozenRepresentation):
                         self.design[:, :, design_t].T
                     ) + self.obs_cov[:, :, obs_cov_t]
 
+    def _copy_steady_state(self, array):
+        # Arrays that are stored for all periods have at least
+        # `_steady_state_t + 1` entries; the shorter arrays of the other
+        # memory conservation options are copied as-is.
+        if self._steady_state_t is not None:
+            array = array[..., :self._steady_state_t + 1]
+        return np.array(array, copy=True)
+
+    def _expand_steady_state(self, name, length):
+        """
+        Expand a stored steady-state array to the full time dimension
+
+        The stored array is wrapped in a `SteadyStateArray`, which represents
+        the periods from the steady-state period onwards by a read-only
+        `np.broadcast_to` view of the steady-state matrix instead of
+        allocating them.
+        """
+        value = getattr(self, name, None)
+        steady_t = self._steady_state_t
+        if (isinstance(value, np.ndarray) and steady_t is not None and
+                value.shape[-1] == steady_t + 1 and length > steady_t + 1):
+            value = SteadyStateArray(value, length)
+            setattr(self, name, value)
+        return value
+
     @property
     def kalman_gain(self):
         """
@@ -1586,7 +1803,7 @@ class FilterResults(FrozenRepresentation):
                             np.linalg.inv(F[:, :, 0])
                         )
                     )
-        return self._kalman_gain
+        return self._expand_steady_state('_kalman_gain', self.nobs)
 
     @property
     def standardized_forecasts_error(self):
@@ -18,6 +18,7 @@ from scipy.stats import norm
 from .simulation_smoother import SimulationSmoother
 from .kalman_smoother import SmootherResults
 from .kalman_filter import (INVERT_UNIVARIATE, SOLVE_LU)
+from ._kalman_filter import dscore_filter
 import statsmodels.tsa.base.tsa_model as tsbase
 import statsmodels.base.wrapper as wrap
 from statsmodels.tools.numdiff import (_get_epsilon, approx_hess_cs,
@@ -25,6 +26,7 @@ from statsmodels.tools.numdiff import (_get_epsilon, approx_hess_cs,
 from statsmodels.tools.decorators import cache_readonly, resettable_cache
 from statsmodels.tools.eval_measures import aic, bic, hqic
 from statsmodels.tools.tools import pinv_extended, Bunch
+from statsmodels.tools.parallel import batch_apply, split_series
 from statsmodels.tools.sm_exceptions import PrecisionWarning
 import statsmodels.genmod._prediction as pred
 from statsmodels.genmod.families.links import identity
@@ -398,9 +400,11 @@ class MLEModel(tsbase.TimeSeriesModel):
         return_params : boolean, optional
             Whether or not to return only the array of maximizing parameters.
             Default is False.
-        optim_score : {'harvey', 'approx'} or None, optional
-            The method by which the score vector is calculated. 'harvey' uses
-            the method from Harvey (1989), 'approx' uses either finite
+        optim_score : {'analytic', 'harvey', 'approx'} or None, optional
+            The method by which the score vector is calculated. 'analytic'
+            computes the score in a single pass of the Kalman filter, jointly
+            with the partial derivatives of the filter recursions, 'harvey'
+            uses the method from Harvey (1989), 'approx' uses either finite
             difference or complex step differentiation depending upon the
             value of `optim_complex_step`, and None uses the built-in gradient
             approximation of the optimizer. Default is None. This keyword is
@@ -428,6 +432,37 @@ class MLEModel(tsbase.TimeSeriesModel):
         statsmodels.base.model.LikelihoodModel.fit
         MLEResults
         """
+        mlefit = self._fit_mle(
+            start_params=start_params, transformed=transformed,
+            method=method, maxiter=maxiter, full_output=full_output,
+            disp=disp, callback=callback, optim_score=optim_score,
+            optim_complex_step=optim_complex_step,
+            optim_hessian=optim_hessian, flags=flags, **kwargs)
+
+        # Just return the fitted parameters if requested
+        if return_params:
+            return self.transform_params(mlefit.params)
+        # Otherwise construct the results class if desired
+        else:
+            res = self.smooth(mlefit.params, transformed=False,
+                              cov_type=cov_type, cov_kwds=cov_kwds)
+
+            res.mlefit = mlefit
+            res.mle_retvals = mlefit.mle_retvals
+            res.mle_settings = mlefit.mle_settings
+
+            return res
+
+    def _fit_mle(self, start_params=None, transformed=True, method='lbfgs',
+                 maxiter=50, full_output=1, disp=5, callback=None,
+                 optim_score=None, optim_complex_step=None,
+                 optim_hessian=None, flags=None, **kwargs):
+        """
+        Maximize the loglikelihood for `fit`
+
+        Returns the results of `LikelihoodModel.fit`, with the
+        unconstrained parameters.
+        """
         if start_params is None:
             start_params = self.start_params
             transformed = True
@@ -467,20 +502,7 @@ class MLEModel(tsbase.TimeSeriesModel):
                                            full_output=full_output,
                                            disp=disp, callback=callback,
                                            skip_hessian=True, **kwargs)
-
-        # Just return the fitted parameters if requested
-        if return_params:
-            return self.transform_params(mlefit.params)
-        # Otherwise construct the results class if desired
-        else:
-            res = self.smooth(mlefit.params, transformed=False,
-                              cov_type=cov_type, cov_kwds=cov_kwds)
-
-            res.mlefit = mlefit
-            res.mle_retvals = mlefit.mle_retvals
-            res.mle_settings = mlefit.mle_settings
-
-            return res
+        return mlefit
 
     @property
     def _res_classes(self):
@@ -1018,6 +1040,174 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         return -partials / 2.
 
+    def _score_analytic(self, params, transformed=True,
+                        approx_complex_step=True, approx_centered=False,
+                        **kwargs):
+        score_obs = self._score_obs_analytic(
+            params, transformed=transformed,
+            approx_complex_step=approx_complex_step,
+            approx_centered=approx_centered, **kwargs)
+        return np.sum(score_obs, axis=0)
+
+    def _score_obs_analytic(self, params, transformed=True,
+                            approx_complex_step=True, approx_centered=False,
+                            **kwargs):
+        """
+        Score per observation, from the Kalman filter partial derivatives
+
+        Parameters
+        ----------
+        params : array_like, optional
+            Array of parameters at which to evaluate the score.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Only transformed
+            parameters are supported.
+        approx_complex_step : boolean, optional
+            Whether to compute the partial derivatives of the system matrices
+            by complex step differentiation (the default) or by finite
+            differences.
+        approx_centered : boolean, optional
+            Whether to use centered finite differences when
+            `approx_complex_step` is False.
+
+        Notes
+        -----
+        The partial derivatives of the state space system matrices and of the
+        initial state and its covariance matrix are computed by complex step
+        (or finite difference) differentiation of `update` (which does not
+        require running the Kalman filter). The Kalman filter is then run
+        once, jointly with the recursions for the partial derivatives of the
+        predicted state and its covariance matrix, which give the score at
+        each observation as in Harvey (1989), section 3.4.5.
+
+        The filter is always the conventional Kalman filter with the model's
+        initialization and loglikelihood burn, so that options of the Kalman
+        filter cannot be passed as keyword arguments.
+
+        References
+        ----------
+        Harvey, Andrew C. 1990.
+        Forecasting, Structural Time Series Models and the Kalman Filter.
+        Cambridge University Press.
+
+        """
+        if kwargs:
+            raise TypeError("_score_obs_analytic() got unexpected keyword"
+                            " argument(s) %s" % ', '.join(
+                                "'%s'" % name for name in sorted(kwargs)))
+        if not transformed:
+            raise ValueError('Cannot compute the analytic score with'
+                             ' untransformed parameters.')
+        if self.ssm._complex_endog:
+            raise ValueError('Cannot compute the analytic score when data'
+                             ' are complex.')
+        params = np.array(params, ndmin=1)
+        n = len(params)
+        names = ['design', 'obs_intercept', 'obs_cov', 'transition',
+                 'state_intercept', 'selection', 'state_cov']
+
+        def system(complex_step):
+            prefix, _, _ = self.ssm._initialize_representation()
+            self.ssm._initialize_state(prefix=prefix,
+                                       complex_step=complex_step)
+            ss = self.ssm._statespaces[prefix]
+            matrices = [np.array(getattr(self.ssm, '_' + name))
+                        for name in names]
+            return (matrices + [np.array(ss.initial_state),
+                                np.array(ss.initial_state_cov)], ss)
+
+        def perturbed(step, complex_step=False):
+            self.update(params + step, transformed=True,
+                        complex_step=complex_step)
+            return system(complex_step)[0]
+
+        # Partial derivatives of the system matrices and the initialization,
+        # the last two entries are those of the initial state and its
+        # covariance matrix
+        if approx_complex_step:
+            epsilon = _get_epsilon(params, 2., None, n)
+        else:
+            epsilon = _get_epsilon(params, 3. if approx_centered else 2.,
+                                   None, n)
+        partials = [[] for name in names + ['state', 'state_cov']]
+        plus = []
+        minus = []
+        for i in range(n):
+            step = np.zeros(n)
+            step[i] = epsilon[i]
+            if approx_complex_step:
+                values = perturbed(1j * step, complex_step=True)
+                for j in range(len(values)):
+                    partials[j].append(values[j].imag / epsilon[i])
+            else:
+                plus.append(perturbed(step))
+                if approx_centered:
+                    minus.append(perturbed(-step))
+
+        # Values at the params themselves
+        self.update(params, transformed=True)
+        values, ss = system(False)
+        if not approx_complex_step:
+            for i in range(n):
+                for j in range(len(values)):
+                    if approx_centered:
+                        partials[j].append((plus[i][j] - minus[i][j]) /
+                                           (2 * epsilon[i]))
+                    else:
+                        partials[j].append((plus[i][j] - values[j]) /
+                                           epsilon[i])
+        matrices, initial_state, initial_state_cov = (
+            values[:-2], values[-2], values[-1])
+        partial_initial_state = partials.pop(-2)
+        partial_initial_state_cov = partials.pop(-1)
+        (design, obs_intercept, obs_cov, transition, state_intercept,
+         selection, state_cov) = [np.real(m) for m in matrices]
+        (partial_design, partial_obs_intercept, partial_obs_cov,
+         partial_transition, partial_state_intercept, partial_selection,
+         partial_state_cov) = [
+            np.zeros(m.shape + (0,)) if n == 0 else np.stack(m, axis=-1)
+            for m in partials]
+
+        # Selected state covariance matrix and its partial derivatives
+        nt = max(selection.shape[2], state_cov.shape[2])
+        selection = np.broadcast_to(selection, selection.shape[:2] + (nt,))
+        state_cov = np.broadcast_to(state_cov, state_cov.shape[:2] + (nt,))
+        partial_selection = np.broadcast_to(
+            partial_selection, selection.shape + (n,))
+        partial_state_cov = np.broadcast_to(
+            partial_state_cov, state_cov.shape + (n,))
+        selected_state_cov = np.einsum('irt,rst,jst->ijt', selection,
+                                       state_cov, selection)
+        rqr = np.einsum('irtk,rst,jst->ijtk', partial_selection, state_cov,
+                        selection)
+        partial_selected_state_cov = (
+            rqr + rqr.transpose(1, 0, 2, 3) +
+            np.einsum('irt,rstk,jst->ijtk', selection, partial_state_cov,
+                      selection))
+
+        def farray(x):
+            return np.asfortranarray(x, dtype=np.float64)
+
+        llf_obs, score_obs = dscore_filter(
+            farray(self.ssm.endog),
+            np.asfortranarray(ss.missing, dtype=np.int32),
+            farray(design), farray(obs_intercept), farray(obs_cov),
+            farray(transition), farray(state_intercept),
+            farray(selected_state_cov), farray(np.real(initial_state)),
+            farray(np.real(initial_state_cov)),
+            farray(partial_design), farray(partial_obs_intercept),
+            farray(partial_obs_cov), farray(partial_transition),
+            farray(partial_state_intercept),
+            farray(partial_selected_state_cov),
+            farray(np.column_stack(partial_initial_state) if n > 0 else
+                   np.zeros((self.k_states, 0))),
+            farray(np.stack(partial_initial_state_cov, axis=-1) if n > 0 else
+                   np.zeros((self.k_states, self.k_states, 0))),
+            self.ssm.tolerance)
+        score_obs[:self.ssm.loglikelihood_burn] = 0
+
+        return score_obs
+
     _score_param_names = ['transformed', 'score_method',
                           'approx_complex_step', 'approx_centered']
     _score_param_defaults = [True, 'approx', None, False]
@@ -1042,8 +1232,11 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation, calculated using first-order complex
-        step differentiation on the `loglike` method.
+        By default, this is a numerical approximation, calculated using
+        first-order complex step differentiation on the `loglike` method. If
+        `method='analytic'` is given, the score is instead computed in a single
+        pass of the Kalman filter, from the partial derivatives of the filter
+        recursions.
 
         Both \*args and \*\*kwargs are necessary because the optimizer from
         `fit` must call this function and only supports passing arguments via
@@ -1073,6 +1266,10 @@ class MLEModel(tsbase.TimeSeriesModel):
         if method == 'harvey':
             score = self._score_harvey(
                 params, approx_complex_step=approx_complex_step, **kwargs)
+        elif method == 'analytic':
+            score = self._score_analytic(
+                params, approx_complex_step=approx_complex_step,
+                approx_centered=approx_centered, **kwargs)
         elif method == 'approx' and approx_complex_step:
             score = self._score_complex_step(params, **kwargs)
         elif method == 'approx':
@@ -1105,8 +1302,11 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation, calculated using first-order complex
-        step differentiation on the `loglikeobs` method.
+        By default, this is a numerical approximation, calculated using
+        first-order complex step differentiation on the `loglikeobs` method.
+        If `method='analytic'` is given, the score is instead computed in a
+        single pass of the Kalman filter, from the partial derivatives of the
+        filter recursions.
         """
         params = np.array(params, ndmin=1)
 
@@ -1125,6 +1325,11 @@ class MLEModel(tsbase.TimeSeriesModel):
             score = self._score_obs_harvey(
                 params, transformed=transformed,
                 approx_complex_step=approx_complex_step, **kwargs)
+        elif method == 'analytic':
+            score = self._score_obs_analytic(
+                params, transformed=transformed,
+                approx_complex_step=approx_complex_step,
+                approx_centered=approx_centered, **kwargs)
         elif method == 'approx' and approx_complex_step:
             # the default epsilon can be too small
             epsilon = _get_epsilon(params, 2., None, len(params))
@@ -1501,6 +1706,106 @@ class MLEModel(tsbase.TimeSeriesModel):
         """
         raise NotImplementedError
 
+    @classmethod
+    def fit_batch(cls, endog, exog=None, steps=0, forecast_exog=None,
+                  fit_kwds=None, n_jobs=1, chunksize=None, **kwargs):
+        """
+        Fit the same model specification to many independent series
+
+        Parameters
+        ----------
+        endog : array_like or sequence
+            The series. A 2-dimensional array or DataFrame holds one
+            univariate series in each column. Otherwise a sequence of
+            array_like, one for each series, which can differ in length.
+        exog : sequence, optional
+            Sequence of exogenous arrays, one for each series.
+        steps : int, optional
+            Number of out-of-sample forecasts for each series. Default is 0.
+        forecast_exog : sequence, optional
+            Sequence of exogenous arrays for the forecast period, one for
+            each series, if the model has exog.
+        fit_kwds : dict, optional
+            Keyword arguments for the maximum likelihood estimation, see
+            `fit`. `disp` defaults to 0. `cov_type` and `return_params` are
+            not used.
+        n_jobs : int, optional
+            Number of processes. -1 uses all CPUs. Default is 1, which fits
+            the series in the current process.
+        chunksize : int, optional
+            Number of series that are sent to a process at once. The default
+            splits the series into four chunks per process.
+        **kwargs
+            Keyword arguments used to create the model for each series, for
+            example `order` for SARIMAX.
+
+        Returns
+        -------
+        MLEBatchResults
+
+        Notes
+        -----
+        For each series the parameters are estimated as in `fit`, and the
+        model is then only filtered, i.e. the smoother and the covariance
+        of the parameters are not computed. Estimation errors (linear algebra
+        errors, value errors such as non-stationary starting parameters, and
+        floating point errors) raised while creating or fitting the model of
+        a series are stored in the results, the parameters and statistics of
+        that series are nan. Other exceptions are raised.
+        Warnings are not shown, in particular convergence warnings are
+        replaced by the `converged` attribute of the results.
+
+        The processes are run with joblib, if it is installed. Otherwise
+        the series are fit in the current process.
+
+        Examples
+        --------
+        >>> from statsmodels.tsa.statespace.sarimax import SARIMAX
+        >>> res = SARIMAX.fit_batch(df, order=(1, 0, 1), steps=12, n_jobs=4)
+        >>> res.params.shape
+        (df.shape[1], 3)
+        >>> res.forecasts.shape
+        (df.shape[1], 12)
+        """
+        endog, names = split_series(endog)
+        n_series = len(endog)
+        if exog is not None and len(exog) != n_series:
+            raise ValueError('exog needs one element for each series')
+        if forecast_exog is not None and len(forecast_exog) != n_series:
+            raise ValueError('forecast_exog needs one element for each '
+                             'series')
+
+        fit_kwds = {} if fit_kwds is None else dict(fit_kwds)
+        fit_kwds.setdefault('disp', 0)
+        for key in ['cov_type', 'cov_kwds', 'return_params']:
+            fit_kwds.pop(key, None)
+
+        args = [(cls, endog[i], None if exog is None else exog[i],
+                 None if forecast_exog is None else forecast_exog[i],
+                 steps, kwargs, fit_kwds) for i in range(n_series)]
+        fits = batch_apply(_fit_batch_series, args, n_jobs=n_jobs,
+                           chunksize=chunksize)
+        return MLEBatchResults(fits, names, steps)
+
+
+def _filter_results_array(name):
+    """
+    Property referencing an array of the filter results
+
+    Used for the covariance-type output, which the filter results only expand
+    from its steady-state storage when accessed.
+    """
+    def fget(self):
+        if self.filter_results is None:
+            return None
+        return getattr(self.filter_results, name)
+
+    def fset(self, value):
+        if self.filter_results is not None:
+            setattr(self.filter_results, name, value)
+
+    return property(fget, fset)
+
 
 class MLEResults(tsbase.TimeSeriesModelResults):
     r"""
@@ -1534,6 +1839,10 @@ class MLEResults(tsbase.TimeSeriesModelResults):
     statsmodels.tsa.statespace.kalman_filter.FilterResults
     statsmodels.tsa.statespace.representation.FrozenRepresentation
     """
+    filtered_state_cov = _filter_results_array('filtered_state_cov')
+    predicted_state_cov = _filter_results_array('predicted_state_cov')
+    forecasts_error_cov = _filter_results_array('forecasts_error_cov')
+
     def __init__(self, model, params, results, cov_type='opg',
                  cov_kwds=None, **kwargs):
         self.data = model.data
@@ -1584,11 +1893,11 @@ class MLEResults(tsbase.TimeSeriesModelResults):
                 ' information matrix.')
         self.model.update(self.params)
 
-        # References of filter and smoother output
+        # References of filter and smoother output (the covariance-type
+        # filter output is referenced through properties)
         extra_arrays = [
-            'filtered_state', 'filtered_state_cov', 'predicted_state',
-            'predicted_state_cov', 'forecasts', 'forecasts_error',
-            'forecasts_error_cov', 'standardized_forecasts_error',
+            'filtered_state', 'predicted_state', 'forecasts',
+            'forecasts_error', 'standardized_forecasts_error',
             'scaled_smoothed_estimator',
             'scaled_smoothed_estimator_cov', 'smoothing_error',
             'smoothed_state',
@@ -1604,6 +1913,8 @@ class MLEResults(tsbase.TimeSeriesModelResults):
         self._data_attr_model = getattr(self, '_data_attr_model', [])
         self._data_attr_model.extend(['ssm'])
         self._data_attr.extend(extra_arrays)
+        self._data_attr.extend(['filtered_state_cov', 'predicted_state_cov',
+                                'forecasts_error_cov'])
         self._data_attr.extend(['filter_results', 'smoother_results'])
         self.data_in_cache = getattr(self, 'data_in_cache', [])
         self.data_in_cache.extend([])
@@ -2785,6 +3096,111 @@ class MLEResultsWrapper(wrap.ResultsWrapper):
 wrap.populate_wrapper(MLEResultsWrapper, MLEResults)
 
 
+def _fit_batch_series(cls, endog, exog, forecast_exog, steps, model_kwds,
+                      fit_kwds):
+    """
+    Fit the model of one series in `MLEModel.fit_batch`
+
+    Returns a dictionary with the estimates.
+    """
+    kwds = dict(model_kwds)
+    if exog is not None:
+        kwds['exog'] = exog
+    model = cls(endog, **kwds)
+    mlefit = model._fit_mle(**fit_kwds)
+    res = model.filter(mlefit.params, transformed=False, cov_type='none')
+    fit = {'params': np.asarray(res.params),
+           'param_names': model.param_names,
+           'llf': res.llf, 'aic': res.aic, 'bic': res.bic, 'nobs': res.nobs,
+           'converged': mlefit.mle_retvals.get('converged', np.nan)}
+    if steps > 0:
+        fit['forecasts'] = np.asarray(res.forecast(steps, exog=forecast_exog))
+    return fit
+
+
+class MLEBatchResults(object):
+    """
+    Results of fitting one model specification to many series
+
+    Parameters
+    ----------
+    fits : list of dict
+        The estimates for each series.
+    names : list
+        The names of the series.
+    steps : int
+        The number of forecasts.
+
+    Attributes
+    ----------
+    names : list
+        Names of the series, the columns of a DataFrame or integers.
+    param_names : list
+        Names of the parameters.
+    params : ndarray, (n_series, k_params)
+        Parameter estimates, nan for series that failed.
+    llf, aic, bic, nobs : ndarray, (n_series,)
+        Loglikelihood, information criteria and number of observations of
+        each series.
+    converged : ndarray, (n_series,)
+        Whether the optimizer converged, nan for series that failed.
+    forecasts : ndarray, (n_series, steps) or (n_series, steps, k_endog)
+        Out-of-sample forecasts, only available if steps is positive.
+    errors : dict
+        Error messages of the series that failed, keyed by the position
+        of the series.
+    failed : ndarray, (n_series,)
+        Boolean indicator for the series that failed.
+
+    See Also
+    --------
+    MLEModel.fit_batch
+    """
+
+    def __init__(self, fits, names, steps):
+        self.names = names
+        self.errors = dict((i, fit['error']) for i, fit in enumerate(fits)
+                           if 'error' in fit)
+        self.failed = np.array(['error' in fit for fit in fits], bool)
+        n_series = len(fits)
+        ok = [fit for fit in fits if 'error' not in fit]
+        self.param_names = ok[0]['param_names'] if ok else []
+
+        k_params = len(self.param_names)
+        self.params = np.full((n_series, k_params), np.nan)
+        for key in ['llf', 'aic', 'bic', 'nobs', 'converged']:
+            setattr(self, key, np.full(n_series, np.nan))
+        if steps > 0:
+            shape = ok[0]['forecasts'].shape if ok else (steps,)
+            self.forecasts = np.full((n_series,) + shape, np.nan)
+
+        for i, fit in enumerate(fits):
+            if 'error' in fit:
+                continue
+            self.params[i] = fit['params']
+            for key in ['llf', 'aic', 'bic', 'nobs', 'converged']:
+                getattr(self, key)[i] = fit[key]
+            if steps > 0:
+                self.forecasts[i] = fit['forecasts']
+
+    def summary_frame(self):
+        """
+        DataFrame with the estimates and statistics of all series
+
+        Returns
+        -------
+        frame : DataFrame
+            One row for each series, with columns for the parameters,
+            llf, aic, bic, nobs, converged and the error message.
+        """
+        frame = pd.DataFrame(self.params, index=self.names,
+                             columns=self.param_names)
+        for key in ['llf', 'aic', 'bic', 'nobs', 'converged']:
+            frame[key] = getattr(self, key)
+        frame['error'] = [self.errors.get(i) for i in range(len(self.names))]
+        return frame
+
+
 class PredictionResults(pred.PredictionResults):
     """
 
@@ -660,11 +660,12 @@ class Representation(object):
                 if matrix == 'obs':
                     existing = self.obs.astype(dtype)[:]
                 else:
-                    new = getattr(self, '_' + matrix).astype(dtype)
+                    new = getattr(self, '_' + matrix)
                     if existing.shape == new.shape:
-                        existing[:] = new[:]
+                        # cast in place, avoids a temporary copy
+                        existing[:] = new
                     else:
-                        existing = new
+                        existing = new.astype(dtype)
 
         # Determine if we need to (re-)create the _statespace models
         # (if time-varying matrices changed)
@@ -42,11 +42,13 @@ except ImportError:
 
 
 from scipy.linalg import solve_discrete_lyapunov
+from statsmodels.tsa.statespace.kalman_filter import SteadyStateArray
 from statsmodels.tsa.statespace.mlemodel import MLEModel
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 from statsmodels.tsa.statespace import _statespace as ss
 from .results import results_kalman_filter
-from numpy.testing import assert_almost_equal, assert_allclose
+from numpy.testing import (assert_almost_equal, assert_allclose, assert_,
+                           assert_equal, assert_raises)
 
 # Skip copy test on older NumPy since deepcopy does not copy order
 NP_LT_18 = LooseVersion(np.__version__).version[:2] < [1, 8]
@@ -818,3 +820,88 @@ def test_stationary_initialization():
     check_stationary_initialization_2dim(np.float64)
     check_stationary_initialization_2dim(np.complex64)
     check_stationary_initialization_2dim(np.complex128)
+
+
+@pytest.mark.parametrize('filter_option', [None, 'filter_univariate',
+                                           'timing_init_filtered'])
+def test_memory_steady_state(filter_option):
+    # Storing the covariance matrices only until the filter converges must not
+    # change any of the output
+    np.random.seed(1234)
+    endog = np.random.randn(200)
+    mod = SARIMAX(endog, order=(1, 0, 1), seasonal_order=(1, 0, 0, 4))
+    if filter_option is not None:
+        setattr(mod.ssm, filter_option, True)
+    params = [0.5, 0.2, 0.3, 1.]
+    res1 = mod.filter(params)
+    mod.ssm.memory_steady_state = True
+    res2 = mod.filter(params)
+    mod.ssm.memory_steady_state = False
+
+    assert_(res2.filter_results.converged)
+    steady_t = res2.filter_results.period_converged + 2
+    # The filter output buffers are not allocated for the full sample
+    kfilter = mod.ssm._kalman_filter
+    assert_(np.asarray(kfilter.predicted_state_cov).shape[-1] < mod.nobs)
+    assert_equal(np.asarray(kfilter.predicted_state).shape[-1], mod.nobs + 1)
+    assert_equal(res2.filter_results._predicted_state_cov.shape[-1],
+                 steady_t + 1)
+    assert_equal(res2.filter_results._steady_state_t, steady_t)
+
+    for name in ['filtered_state_cov', 'predicted_state_cov',
+                 'forecasts_error_cov', 'filtered_state', 'predicted_state',
+                 'forecasts', 'standardized_forecasts_error', 'llf_obs']:
+        desired = getattr(res1.filter_results, name)
+        actual = getattr(res2.filter_results, name)
+        assert_allclose(actual, desired, atol=1e-14)
+    # The covariance matrices after convergence are views of the
+    # steady-state matrix, and no full-length buffer is allocated
+    fres = res2.filter_results
+    for name, length in [('filtered_state_cov', mod.nobs),
+                         ('predicted_state_cov', mod.nobs + 1),
+                         ('forecasts_error_cov', mod.nobs),
+                         ('kalman_gain', mod.nobs)]:
+        value = getattr(fres, name)
+        assert_(isinstance(value, SteadyStateArray))
+        assert_equal(value.shape[-1], length)
+        stored = value._stored
+        assert_equal(stored.shape[-1], steady_t + 1)
+        assert_(value._full is None)
+        assert_(np.shares_memory(value[:, :, -1], stored))
+        assert_(np.shares_memory(value[..., 2:steady_t], stored))
+        tail = value[..., steady_t:]
+        assert_equal(tail.shape[-1], length - steady_t)
+        assert_equal(tail.strides[-1], 0)
+        assert_(np.shares_memory(tail, stored))
+        assert_(not tail.flags.writeable)
+        assert_(value._full is None)
+    # Numpy operations use a read-only expansion, which is not kept
+    cov = fres.predicted_state_cov
+    assert_(not np.asarray(cov).flags.writeable)
+    assert_(cov._full is None)
+    # The full array is only allocated when an element is assigned
+    full = np.array(cov)
+    cov[0, 0, -1] = 10.
+    full[0, 0, -1] = 10.
+    assert_(cov._full is not None)
+    assert_equal(np.asarray(cov), full)
+    assert_equal(cov[0, 0, -2], full[0, 0, -2])
+    # The final (out-of-sample) predicted covariance matrix is filled in
+    # after convergence
+    assert_allclose(res1.filter_results.predicted_state_cov[..., -1],
+                    res1.filter_results.predicted_state_cov[..., -2])
+    assert_allclose(res2.filter_results.kalman_gain,
+                    res1.filter_results.kalman_gain, atol=1e-14)
+    assert_allclose(res2.forecasts_error_cov, res1.forecasts_error_cov)
+    assert_allclose(res2.llf, res1.llf)
+
+    # Missing data disables the steady-state storage
+    endog[10] = np.nan
+    mod = SARIMAX(endog, order=(1, 0, 1), seasonal_order=(1, 0, 0, 4))
+    mod.ssm.memory_steady_state = True
+    res = mod.filter(params)
+    assert_(res.filter_results._steady_state_t is None)
+    assert_equal(res.filter_results._predicted_state_cov.shape[-1], 201)
+
+    # Smoothing requires all covariance matrices
+    assert_raises(ValueError, mod.smooth, params)
@@ -17,7 +17,8 @@ from statsmodels.tsa.statespace import (sarimax, varmax, kalman_filter,
 from statsmodels.tsa.statespace.mlemodel import MLEModel, MLEResultsWrapper
 from statsmodels.tsa.statespace.tools import compatibility_mode
 from statsmodels.datasets import nile
-from numpy.testing import assert_almost_equal, assert_equal, assert_allclose, assert_raises
+from numpy.testing import (assert_almost_equal, assert_equal, assert_allclose,
+                           assert_raises, assert_)
 from statsmodels.tsa.statespace.tests.results import results_sarimax, results_var_misc
 
 current_path = os.path.dirname(os.path.abspath(__file__))
@@ -257,6 +258,9 @@ def test_score_analytic_ar1():
                                    approx_centered=True)
     assert_allclose(harvey_fd_centered, analytic_score, atol=1e-5)
 
+    kalman = mod.score(params, transformed=True, method='analytic')
+    assert_allclose(kalman, analytic_score)
+
     # Check the approximations for untransformed parameters. The analytic
     # check now comes from chain rule with the analytic derivative of the
     # transformation
@@ -302,6 +306,9 @@ def test_score_analytic_ar1():
                                    approx_centered=True)
     assert_allclose(harvey_fd_centered, analytic_score, atol=1e-5)
 
+    kalman = mod.score(uparams, transformed=False, method='analytic')
+    assert_allclose(kalman, analytic_score)
+
     # Check the Hessian: these approximations are not very good, particularly
     # when phi is close to 0
     params = np.r_[0.5, 1.]
@@ -322,6 +329,75 @@ def test_score_analytic_ar1():
                         analytic_hessian, atol=1e-1)
 
 
+def test_score_analytic_filter():
+    # Test the score from the Kalman filter partial derivatives against the
+    # complex-step approximation, including missing data, time-varying
+    # system matrices and a multivariate model
+    from statsmodels.tsa.statespace import dynamic_factor, structural
+    np.random.seed(1234)
+    nobs = 200
+    level = np.cumsum(np.random.normal(size=nobs)) * 0.3
+    endog = level + np.random.normal(size=nobs)
+    exog = np.random.normal(size=nobs)
+    endog_missing = endog.copy()
+    endog_missing[[5, 40, 41, 150]] = np.nan
+    multivariate = np.c_[level, 0.5 * level, -level] + np.random.normal(
+        size=(nobs, 3))
+    multivariate[10, 0] = np.nan
+    multivariate[20] = np.nan
+
+    models = [
+        (sarimax.SARIMAX(endog, order=(2, 0, 1)), [0.5, 0.2, 0.3, 1.2]),
+        (sarimax.SARIMAX(endog_missing, order=(1, 1, 1),
+                         seasonal_order=(1, 0, 0, 4)), [0.3, 0.2, 0.1, 0.8]),
+        (sarimax.SARIMAX(endog, exog=exog, order=(1, 0, 0),
+                         mle_regression=False, trend='c'), [0.1, 0.5, 1.5]),
+        (structural.UnobservedComponents(endog_missing, 'llevel',
+                                         autoregressive=1),
+         [1.1, 0.1, 0.4, 0.5]),
+        (dynamic_factor.DynamicFactor(multivariate, k_factors=1,
+                                      factor_order=1),
+         [1., 0.5, -1., 1., 1., 1., 0.8]),
+    ]
+    for mod, params in models:
+        params = np.array(params)
+        desired = mod.score_obs(params)
+        actual = mod.score_obs(params, method='analytic')
+        assert_allclose(actual, desired, rtol=1e-6, atol=1e-6)
+        assert_allclose(mod.score(params, method='analytic'),
+                        mod.score(params), rtol=1e-6, atol=1e-6)
+
+    # Fit using the analytic score
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 1))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res1 = mod.fit(disp=False, optim_score='analytic')
+        res2 = mod.fit(disp=False, optim_score='approx')
+    assert_allclose(res1.params, res2.params, rtol=1e-4)
+    assert_allclose(res1.llf, res2.llf)
+
+    # Finite difference partial derivatives of the system matrices
+    params = np.array([0.5, 0.2, 1.2])
+    desired = mod.score(params, method='analytic')
+    for centered in [False, True]:
+        actual = mod.score(params, method='analytic',
+                           approx_complex_step=False,
+                           approx_centered=centered)
+        assert_allclose(actual, desired, rtol=1e-5)
+
+    # Untransformed parameters and options of the Kalman filter are not
+    # supported
+    uparams = mod.untransform_params(params)
+    assert_allclose(mod.score(uparams, transformed=False, method='analytic'),
+                    mod.score(uparams, transformed=False), rtol=1e-6)
+    assert_raises(ValueError, mod.score_obs, params, method='analytic',
+                  transformed=False, approx_complex_step=False)
+    assert_raises(TypeError, mod.score, params, method='analytic',
+                  conserve_memory=0)
+    assert_raises(TypeError, mod.score_obs, params, method='analytic',
+                  inversion_method=1)
+
+
 def test_cov_params():
     mod, res = get_dummy_mod()
 
@@ -909,3 +985,50 @@ def test_lutkepohl_information_criteria():
     bic = res.info_criteria('bic') - 6 * np.log(res.nobs_effective)
     assert_allclose(aic, true['estat_aic'])
     assert_allclose(bic, true['estat_bic'])
+
+
+def test_fit_batch():
+    from statsmodels.tsa.statespace.mlemodel import MLEBatchResults
+    np.random.seed(1234)
+    endog = np.zeros((80, 4))
+    eps = np.random.normal(size=(81, 4))
+    for t in range(80):
+        endog[t] = 0.5 * endog[t - 1] + eps[t + 1] + 0.3 * eps[t]
+    # the AR starting parameters of a random walk are non-stationary
+    endog[:, 2] = np.arange(80.)
+    endog = pd.DataFrame(endog, columns=list('abcd'))
+
+    for n_jobs in [1, 2]:
+        res = sarimax.SARIMAX.fit_batch(endog, order=(1, 0, 1), steps=3,
+                                        n_jobs=n_jobs, chunksize=1)
+        assert_(isinstance(res, MLEBatchResults))
+        assert_equal(res.failed, [False, False, True, False])
+        assert_equal(list(res.errors.keys()), [2])
+        assert_(res.errors[2].startswith('ValueError'))
+        assert_(np.isnan(res.params[2]).all())
+        assert_equal(res.param_names, ['ar.L1', 'ma.L1', 'sigma2'])
+        for i in [0, 3]:
+            res_i = sarimax.SARIMAX(endog.iloc[:, i], order=(1, 0, 1)).fit(
+                disp=0)
+            assert_allclose(res.params[i], res_i.params)
+            assert_allclose(res.llf[i], res_i.llf)
+            assert_allclose(res.aic[i], res_i.aic)
+            assert_allclose(res.forecasts[i], res_i.forecast(3))
+            assert_equal(res.converged[i], 1)
+
+    frame = res.summary_frame()
+    assert_equal(frame.index.tolist(), list('abcd'))
+    assert_allclose(frame['llf'], res.llf)
+
+    # list of series of different length with exog
+    exog = [np.arange(60.), np.arange(70.)]
+    endog = [np.arange(60.) + np.random.normal(size=60),
+             np.arange(70.) + np.random.normal(size=70)]
+    forecast_exog = [[[60.], [61.]], [[70.], [71.]]]
+    res = sarimax.SARIMAX.fit_batch(endog, exog=exog, steps=2,
+                                    forecast_exog=forecast_exog)
+    for i in range(2):
+        res_i = sarimax.SARIMAX(endog[i], exog=exog[i]).fit(disp=0)
+        assert_allclose(res.params[i], res_i.params)
+        assert_allclose(res.forecasts[i],
+                        res_i.forecast(2, exog=forecast_exog[i]))
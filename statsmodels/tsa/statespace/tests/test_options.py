@@ -36,6 +36,7 @@ from statsmodels.tsa.statespace.kalman_filter import (
     MEMORY_NO_GAIN,
     MEMORY_NO_SMOOTHING,
     MEMORY_NO_STD_FORECAST,
+    MEMORY_STEADY_STATE,
     MEMORY_CONSERVE
 )
 from statsmodels.tsa.statespace.kalman_smoother import (
@@ -196,7 +197,7 @@ class TestOptions(Options):
         # Try setting and unsetting all
         model.conserve_memory = 0
         for name in model.memory_options:
-            if name == 'memory_conserve':
+            if name in ['memory_conserve', 'memory_steady_state']:
                 continue
             setattr(model, name, True)
         assert_equal(
@@ -212,6 +213,10 @@ class TestOptions(Options):
             setattr(model, name, False)
         assert_equal(model.conserve_memory, 0)
 
+        model.memory_steady_state = True
+        assert_equal(model.conserve_memory, MEMORY_STEADY_STATE)
+        model.memory_steady_state = False
+
     def test_smoother_outputs(self):
         model = self.model
 
@@ -14,13 +14,15 @@ from statsmodels.tools.tools import add_constant, Bunch
 from statsmodels.tsa.tsatools import lagmat, lagmat2ds, add_trend
 from statsmodels.tsa.adfvalues import mackinnonp, mackinnoncrit
 from statsmodels.tsa._bds import bds
-from statsmodels.tsa.arima_model import ARMA
+from statsmodels.tsa.arima_model import ARMA, ARIMA
 from statsmodels.tools.sm_exceptions import InterpolationWarning, MissingDataError
 
 
 __all__ = ['acovf', 'acf', 'pacf', 'pacf_yw', 'pacf_ols', 'ccovf', 'ccf',
            'periodogram', 'q_stat', 'coint', 'arma_order_select_ic',
-           'adfuller', 'kpss', 'bds']
+           'adfuller', 'kpss', 'bds', 'adfuller_batch', 'kpss_batch',
+           'coint_batch', 'arma_order_select_stepwise',
+           'OnlineAutocovariance']
 
 
 #NOTE: now in two places to avoid circular import
@@ -293,6 +295,228 @@ def adfuller(x, maxlag=None, regression="c", autolag='AIC',
             return adfstat, pvalue, usedlag, nobs, critvalues, icbest
 
 
+def _batch_upper_cholesky(a):
+    """
+    Upper triangular Cholesky factors of a stack of matrices
+
+    Matrices that are not positive definite give a factor of nan.
+    """
+    try:
+        return np.linalg.cholesky(a).transpose(0, 2, 1)
+    except LinAlgError:
+        r = np.empty_like(a)
+        r.fill(np.nan)
+        for i in range(a.shape[0]):
+            try:
+                r[i] = np.linalg.cholesky(a[i]).T
+            except LinAlgError:
+                pass
+        return r
+
+
+def _adf_batch_factor(x, xdiff, nlags, ntrend, level_first, chunksize=2**22):
+    """
+    Triangular factor of the ADF regressions of many series
+
+    Parameters
+    ----------
+    x : ndarray
+        The series in levels, shape (nobs, n_series).
+    xdiff : ndarray
+        The first differences of `x`.
+    nlags : int
+        The number of lagged differences included in the regression.
+    ntrend : int
+        The number of deterministic trend terms, 0 to 3.
+    level_first : bool
+        If True, then the regressors are ordered trend, level and lagged
+        differences from low to high lag, otherwise the level is the last
+        regressor.
+    chunksize : int
+        Approximate number of elements of the design matrices that are
+        created at once.
+
+    Returns
+    -------
+    r : ndarray
+        Upper triangular factor of the cross-product of [exog, endog] for
+        each series, shape (n_series, k_exog + 1, k_exog + 1).  This is the
+        R of the QR decomposition of [exog, endog] up to signs.
+    nobs : int
+        The number of observations in the regressions.
+
+    Notes
+    -----
+    The deterministic trend terms are the first regressors, so they are
+    included in all nested regressions.  The other columns are projected
+    on the orthogonal complement of the trend terms before the
+    cross-products are formed.  This leaves all residuals and the entries
+    of `r` after the trend rows unchanged, but avoids the loss of
+    precision of the Cholesky decomposition when the levels are large
+    relative to their variation, since the cross-product squares the
+    condition number.
+    """
+    nobs = xdiff.shape[0] - nlags
+    n_series = x.shape[1]
+    k = ntrend + 1 + nlags
+    if level_first:
+        level_col, lag_cols = ntrend, ntrend + 1 + np.arange(nlags)
+    else:
+        level_col, lag_cols = k - 1, ntrend + np.arange(nlags)
+    trend = np.vander(np.arange(1, nobs + 1) / float(nobs), ntrend,
+                      increasing=True)
+    q_trend = np.linalg.qr(trend)[0]
+
+    xx = np.empty((n_series, k + 1, k + 1))
+    step = max(1, chunksize // (nobs * (k + 1)))
+    for start in range(0, n_series, step):
+        idx = slice(start, start + step)
+        z = np.empty((min(step, n_series - start), nobs, k + 1))
+        z[:, :, :ntrend] = trend
+        z[:, :, level_col] = x[nlags:-1, idx].T
+        for i in range(nlags):
+            z[:, :, lag_cols[i]] = xdiff[nlags - i - 1:-i - 1, idx].T
+        z[:, :, k] = xdiff[nlags:, idx].T
+        if ntrend > 0:
+            zo = z[:, :, ntrend:]
+            zo -= np.matmul(q_trend, np.matmul(q_trend.T, zo))
+        xx[idx] = np.matmul(z.transpose(0, 2, 1), z)
+    return _batch_upper_cholesky(xx), nobs
+
+
+def adfuller_batch(x, maxlag=None, regression="c", autolag='AIC'):
+    """
+    Augmented Dickey-Fuller unit root test for many series
+
+    Parameters
+    ----------
+    x : array_like, 2d
+        The data with one series in each column, shape (nobs, n_series).
+    maxlag : int
+        Maximum lag which is included in test, default 12*(nobs/100)^{1/4}
+    regression : {'c','ct','ctt','nc'}
+        Constant and trend order to include in regression
+
+        * 'c' : constant only (default)
+        * 'ct' : constant and trend
+        * 'ctt' : constant, and linear and quadratic trend
+        * 'nc' : no constant, no trend
+    autolag : {'AIC', 'BIC', 't-stat', None}
+        Lag length selection, see `adfuller`.  The lag length is selected
+        separately for each series.
+
+    Returns
+    -------
+    adf : ndarray
+        Test statistics
+    pvalue : ndarray
+        MacKinnon's approximate p-values based on MacKinnon (1994, 2010)
+    usedlag : ndarray
+        Number of lags used
+    nobs : ndarray
+        Number of observations used for the ADF regression and calculation of
+        the critical values
+    critical values : dict
+        Arrays of critical values for the test statistics at the 1 %, 5 %,
+        and 10 % levels. Based on MacKinnon (2010)
+    icbest : ndarray
+        The maximized information criterion if autolag is not None.
+
+    See Also
+    --------
+    adfuller
+
+    Notes
+    -----
+    The results are the same as those of `adfuller` applied to each column
+    of `x`, but without estimating an OLS model for each lag length and
+    series.
+
+    All regressions of the lag length search of a series are nested and use
+    the same observations.  They are computed from a single upper triangular
+    factor R of the cross-product of [exog, endog], which is the R of a QR
+    decomposition: the sum of squared residuals of the regression on the
+    first j columns is the sum of squares of R[j:, -1], and the t-value of
+    its last coefficient is R[j - 1, -1] divided by the standard error of
+    the regression.  The factors of all series are computed with a single
+    batched decomposition, and the final regressions are computed in one
+    batch for each selected lag length.
+
+    Series for which a regression is singular have nan results.
+    """
+    trenddict = {None: 'nc', 0: 'c', 1: 'ct', 2: 'ctt'}
+    if regression is None or isinstance(regression, (int, long)):
+        regression = trenddict[regression]
+    regression = regression.lower()
+    if regression not in ['c', 'nc', 'ct', 'ctt']:
+        raise ValueError("regression option %s not understood" % regression)
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    elif x.ndim != 2:
+        raise ValueError("x must be 1d or 2d. Got %d dims." % x.ndim)
+    nobs, n_series = x.shape
+    ntrend = ['nc', 'c', 'ct', 'ctt'].index(regression)
+
+    if maxlag is None:
+        #from Greene referencing Schwert 1989
+        maxlag = int(np.ceil(12. * np.power(nobs / 100., 1 / 4.)))
+
+    xdiff = np.diff(x, axis=0)
+    if autolag:
+        method = autolag.lower()
+        if method not in ['aic', 'bic', 't-stat']:
+            raise ValueError("Information Criterion %s not understood."
+                             % autolag)
+        # all regressions of the lag search are nested in the largest one
+        r, nobs_ic = _adf_batch_factor(x, xdiff, maxlag, ntrend, True)
+        k = r.shape[1] - 1
+        startlag = ntrend + 1
+        nparams = np.arange(startlag, k + 1)
+        ssr = np.cumsum(r[:, ::-1, k] ** 2, axis=1)[:, ::-1][:, nparams]
+        if method == 't-stat':
+            stop = 1.6448536269514722
+            tvalues = np.abs(r[:, nparams - 1, k] /
+                             np.sqrt(ssr / (nobs_ic - nparams)))
+            # the largest lag with a significant last coefficient
+            signif = (tvalues >= stop)[:, ::-1]
+            bestlag = np.where(signif.any(1), maxlag - signif.argmax(1), 0)
+            icbest = tvalues[np.arange(n_series), bestlag]
+        else:
+            llf = -nobs_ic / 2. * (np.log(2 * np.pi) +
+                                   np.log(ssr / nobs_ic) + 1)
+            if method == 'aic':
+                ic = -2 * llf + 2 * nparams
+            else:
+                ic = -2 * llf + np.log(nobs_ic) * nparams
+            bestlag = ic.argmin(1)
+            icbest = ic[np.arange(n_series), bestlag]
+        usedlag = bestlag
+    else:
+        usedlag = np.repeat(maxlag, n_series)
+        icbest = None
+
+    #run the final regressions, one batch for each lag length
+    adfstat = np.empty(n_series)
+    for lag in np.unique(usedlag):
+        idx = usedlag == lag
+        r, _ = _adf_batch_factor(x[:, idx], xdiff[:, idx], lag, ntrend,
+                                 False)
+        k = r.shape[1] - 1
+        sigma = np.abs(r[:, k, k]) / np.sqrt(nobs - 1 - lag - k)
+        adfstat[idx] = r[:, k - 1, k] / sigma
+    nobs = nobs - 1 - usedlag
+
+    pvalue = mackinnonp(adfstat, regression=regression, N=1)
+    critvalues = mackinnoncrit(N=1, regression=regression, nobs=nobs)
+    critvalues = {"1%" : critvalues[:, 0], "5%" : critvalues[:, 1],
+                  "10%" : critvalues[:, 2]}
+    if not autolag:
+        return adfstat, pvalue, usedlag, nobs, critvalues
+    else:
+        return adfstat, pvalue, usedlag, nobs, critvalues, icbest
+
+
 def acovf(x, unbiased=False, demean=True, fft=False, missing='none'):
     """
     Autocovariance for 1D
@@ -590,26 +814,24 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
 
     Notes
     -----
-    This solves yule_walker equations or ols for each desired lag
-    and contains currently duplicate calculations.
+    The Yule-Walker equations of all lags are solved with a single
+    Levinson-Durbin recursion on the sample autocovariances, which are
+    computed by FFT. This gives the same partial autocorrelations as solving
+    the Yule-Walker equations separately for each lag, see `pacf_yw`, so that
+    the 'yw' and 'ld' methods are identical.  The 'ols' method estimates a
+    regression for each lag.
     """
 
     if method == 'ols':
         ret = pacf_ols(x, nlags=nlags)
-    elif method in ['yw', 'ywu', 'ywunbiased', 'yw_unbiased']:
-        ret = pacf_yw(x, nlags=nlags, method='unbiased')
-    elif method in ['ywm', 'ywmle', 'yw_mle']:
-        ret = pacf_yw(x, nlags=nlags, method='mle')
-    elif method in ['ld', 'ldu', 'ldunbiase', 'ld_unbiased']:
-        acv = acovf(x, unbiased=True)
-        ld_ = levinson_durbin(acv, nlags=nlags, isacov=True)
-        #print 'ld', ld_
-        ret = ld_[2]
+    elif method in ['yw', 'ywu', 'ywunbiased', 'yw_unbiased',
+                    'ld', 'ldu', 'ldunbiase', 'ld_unbiased']:
+        acv = acovf(x, unbiased=True, fft=True)
+        ret = levinson_durbin(acv[:nlags + 1], nlags=nlags, isacov=True)[2]
     # inconsistent naming with ywmle
-    elif method in ['ldb', 'ldbiased', 'ld_biased']:
-        acv = acovf(x, unbiased=False)
-        ld_ = levinson_durbin(acv, nlags=nlags, isacov=True)
-        ret = ld_[2]
+    elif method in ['ywm', 'ywmle', 'yw_mle', 'ldb', 'ldbiased', 'ld_biased']:
+        acv = acovf(x, unbiased=False, fft=True)
+        ret = levinson_durbin(acv[:nlags + 1], nlags=nlags, isacov=True)[2]
     else:
         raise ValueError('method not available')
     if alpha is not None:
@@ -622,7 +844,7 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
         return ret
 
 
-def ccovf(x, y, unbiased=True, demean=True):
+def ccovf(x, y, unbiased=True, demean=True, fft=True):
     ''' crosscovariance for 1D
 
     Parameters
@@ -631,17 +853,19 @@ def ccovf(x, y, unbiased=True, demean=True):
        time series data
     unbiased : boolean
        if True, then denominators is n-k, otherwise n
+    demean : boolean
+       if True, then subtract the means of x and y
+    fft : boolean
+       If True, use FFT convolution, otherwise np.correlate, which does a
+       full convolution.  Default is True.
 
     Returns
     -------
     ccovf : array
         autocovariance function
-
-    Notes
-    -----
-    This uses np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
     '''
+    x = np.asarray(x)
+    y = np.asarray(y)
     n = len(x)
     if demean:
         xo = x - x.mean()
@@ -650,14 +874,19 @@ def ccovf(x, y, unbiased=True, demean=True):
         xo = x
         yo = y
     if unbiased:
-        xi = np.ones(n)
-        d = np.correlate(xi, xi, 'full')
+        d = np.arange(n, 0, -1)
     else:
         d = n
-    return (np.correlate(xo, yo, 'full') / d)[n - 1:]
+    if fft:
+        nfft = _next_regular(2 * n + 1)
+        cov = np.fft.irfft(np.fft.rfft(xo, n=nfft) *
+                           np.conjugate(np.fft.rfft(yo, n=nfft)), n=nfft)[:n]
+    else:
+        cov = np.correlate(xo, yo, 'full')[n - 1:]
+    return cov / d
 
 
-def ccf(x, y, unbiased=True):
+def ccf(x, y, unbiased=True, fft=True):
     '''cross-correlation function for 1d
 
     Parameters
@@ -666,6 +895,9 @@ def ccf(x, y, unbiased=True):
        time series data
     unbiased : boolean
        if True, then denominators for autocovariance is n-k, otherwise n
+    fft : boolean
+       If True, use FFT convolution, otherwise np.correlate, which does a
+       full convolution.  Default is True.
 
     Returns
     -------
@@ -674,14 +906,11 @@ def ccf(x, y, unbiased=True):
 
     Notes
     -----
-    This is based np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
-
     If unbiased is true, the denominator for the autocovariance is adjusted
     but the autocorrelation is not an unbiased estimtor.
 
     '''
-    cvf = ccovf(x, y, unbiased=unbiased, demean=True)
+    cvf = ccovf(x, y, unbiased=unbiased, demean=True, fft=fft)
     return cvf / (np.std(x) * np.std(y))
 
 
@@ -774,8 +1003,7 @@ def levinson_durbin(s, nlags=10, isacov=False):
     for k in range(2, order + 1):
         phi[k, k] = (sxx_m[k] - np.dot(phi[1:k, k-1],
                                        sxx_m[1:k][::-1])) / sig[k-1]
-        for j in range(1, k):
-            phi[j, k] = phi[j, k-1] - phi[k, k] * phi[k-j, k-1]
+        phi[1:k, k] = phi[1:k, k-1] - phi[k, k] * phi[k-1:0:-1, k-1]
         sig[k] = sig[k-1] * (1 - phi[k, k]**2)
 
     sigma_v = sig[-1]
@@ -785,6 +1013,177 @@ def levinson_durbin(s, nlags=10, isacov=False):
     return sigma_v, arcoefs, pacf_, sig, phi  # return everything
 
 
+class OnlineAutocovariance(object):
+    """
+    Autocovariances of a stream of observations
+
+    The lagged cross-products are updated for each new observation, so that
+    the autocovariance, autocorrelation and partial autocorrelation functions
+    of all observations, or of a sliding window of the latest observations,
+    are available at any time without recomputing them from the data.
+
+    Parameters
+    ----------
+    nlags : int
+        The largest lag of the autocovariances.
+    window : int, optional
+        The number of latest observations used.  If None (default), then all
+        observations are used.  Must be larger than `nlags`.
+    unbiased : bool
+        If True, then denominators is n-k, otherwise n
+    demean : bool
+        If True, then subtract the mean of the observations
+
+    Attributes
+    ----------
+    nobs : int
+        The number of observations in the window, or of all observations.
+
+    Notes
+    -----
+    Each update costs O(nlags) operations and the memory is O(nlags), or
+    O(window) with a window.  The statistics are the same as those of
+    `acovf`, `acf` and `pacf` with the 'ld' methods, computed from the
+    observations in the window.  The results for lags that are not smaller
+    than `nobs` are nan.
+
+    If `demean` is True, then the cross-products are accumulated for the
+    observations minus the first observation of the stream, which avoids the
+    loss of precision of the demeaning for series with a large mean.  With a window, observations
+    leaving the window are subtracted from the sums, so that rounding errors
+    accumulate over the stream.
+
+    Examples
+    --------
+    >>> acov = OnlineAutocovariance(nlags=10, window=500)
+    >>> for value in stream:
+    ...     acov.update(value)
+    >>> acov.acf()
+    """
+    def __init__(self, nlags=40, window=None, unbiased=False, demean=True):
+        if window is not None and window <= nlags:
+            raise ValueError("window must be larger than nlags")
+        self.nlags = nlags
+        self.window = window
+        self.unbiased = unbiased
+        self.demean = demean
+        self.nobs = 0
+        # ring buffer with the latest observations, and without a window
+        # the first observations of the stream
+        self._buffer = np.zeros(window if window is not None else nlags + 1)
+        self._head = np.zeros(nlags)
+        self._count = 0
+        self._shift = None
+        self._sum = 0.
+        self._cross = np.zeros(nlags + 1)
+
+    def _latest(self, k):
+        # the k latest observations, latest first
+        idx = (self._count - 1 - np.arange(k)) % len(self._buffer)
+        return self._buffer[idx]
+
+    def _first(self, k):
+        # the k first observations, first first
+        if self.window is None:
+            return self._head[:k]
+        idx = (self._count - self.nobs + np.arange(k)) % len(self._buffer)
+        return self._buffer[idx]
+
+    def update(self, x):
+        """
+        Add new observations
+
+        Parameters
+        ----------
+        x : float or array_like
+            The new observation or a 1d array of new observations, oldest
+            first.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        if not len(x):
+            return
+        if self._shift is None:
+            self._shift = x[0] if self.demean else 0.
+        nlags = self.nlags
+        size = len(self._buffer)
+        for value in x - self._shift:
+            if self.nobs == self.window:
+                # drop the oldest observation in the window
+                first = self._first(nlags + 1)
+                self._cross -= first[0] * first
+                self._sum -= first[0]
+                self.nobs -= 1
+            k = min(nlags, self.nobs)
+            self._cross[0] += value * value
+            self._cross[1:k + 1] += value * self._latest(k)
+            self._sum += value
+            if self._count < nlags:
+                self._head[self._count] = value
+            self._buffer[self._count % size] = value
+            self._count += 1
+            self.nobs += 1
+
+    def acovf(self):
+        """
+        Autocovariance function of the observations
+
+        Returns
+        -------
+        acovf : ndarray
+            The autocovariances for lags 0 to nlags.
+        """
+        nobs = self.nobs
+        nlags = self.nlags
+        acov = np.empty(nlags + 1)
+        acov.fill(np.nan)
+        k = min(nlags, nobs - 1)
+        if k < 0:
+            return acov
+        lags = np.arange(k + 1)
+        cross = self._cross[:k + 1]
+        if self.demean:
+            mean = self._sum / nobs
+            # sums of the observations without the last or the first k
+            head = self._sum - np.r_[0, np.cumsum(self._latest(k))]
+            tail = self._sum - np.r_[0, np.cumsum(self._first(k))]
+            cross = cross - mean * (head + tail) + (nobs - lags) * mean**2
+        acov[:k + 1] = cross / ((nobs - lags) if self.unbiased else nobs)
+        return acov
+
+    def acf(self):
+        """
+        Autocorrelation function of the observations
+
+        Returns
+        -------
+        acf : ndarray
+            The autocorrelations for lags 0 to nlags.
+        """
+        acov = self.acovf()
+        return acov / acov[0]
+
+    def pacf(self):
+        """
+        Partial autocorrelation function of the observations
+
+        Returns
+        -------
+        pacf : ndarray
+            The partial autocorrelations for lags 0 to nlags, computed with
+            the Levinson-Durbin recursion.
+        """
+        acov = self.acovf()
+        k = int(np.isfinite(acov).sum()) - 1
+        pacf_ = np.empty(self.nlags + 1)
+        pacf_.fill(np.nan)
+        if k > 0:
+            pacf_[:k + 1] = levinson_durbin(acov[:k + 1], nlags=k,
+                                            isacov=True)[2]
+        elif k == 0:
+            pacf_[0] = 1.
+        return pacf_
+
+
 def grangercausalitytests(x, maxlag, addconst=True, verbose=True):
     """four tests for granger non causality of 2 timeseries
 
@@ -1032,11 +1431,111 @@ def coint(y0, y1, trend='c', method='aeg', maxlag=None, autolag='aic',
     return res_adf[0], pval_asy, crit
 
 
+def coint_batch(y0, y1, trend='c', maxlag=None):
+    """Test for no-cointegration of many univariate equations
+
+    Parameters
+    ----------
+    y0 : array_like, 2d
+        first elements in the cointegrating vectors, one equation in each
+        column, shape (nobs, n_eq)
+    y1 : array_like
+        remaining elements in the cointegrating vectors, shape (nobs, n_eq)
+        for one or (nobs, n_eq, k) for k remaining variables in each
+        equation.
+    trend : str {'c', 'ct'}
+        trend term included in regression for cointegrating equation
+        * 'c' : constant
+        * 'ct' : constant and linear trend
+        * also available quadratic trend 'ctt', and no constant 'nc'
+    maxlag : None or int
+        keyword for `adfuller_batch`, the number of lags used in the unit-root
+        tests of the residuals.
+
+    Returns
+    -------
+    coint_t : ndarray
+        t-statistics of unit-root tests on residuals
+    pvalue : ndarray
+        MacKinnon's approximate, asymptotic p-values based on MacKinnon (1994)
+    crit_value : ndarray
+        Critical values for the test statistic at the 1 %, 5 %, and 10 %
+        levels based on regression curve. These only depend on the number of
+        observations and are the same for all equations.
+
+    See Also
+    --------
+    coint
+
+    Notes
+    -----
+    The results are the same as those of `coint` applied to each equation.
+    The first stage regressions are computed in a single batch from QR
+    decompositions of the regressors after projecting out the trend, and
+    the unit-root tests on the residuals use `adfuller_batch`.
+    """
+    trend = trend.lower()
+    if trend not in ['c', 'nc', 'ct', 'ctt']:
+        raise ValueError("trend option %s not understood" % trend)
+    y0 = np.asarray(y0, dtype=float)
+    y1 = np.asarray(y1, dtype=float)
+    if y0.ndim == 1:
+        y0 = y0[:, None]
+    if y1.ndim < 3:
+        y1 = y1.reshape(y0.shape + (1,))
+    nobs, n_eq, k_vars = y1.shape
+    k_vars += 1   # add 1 for y0
+    ntrend = ['nc', 'c', 'ct', 'ctt'].index(trend)
+
+    # The trend is projected out of y0 and y1 before the regression of y0
+    # on y1, and both projections use orthonormal bases from QR
+    # decompositions, so that the residuals are not affected by the level
+    # of the series as with the normal equations.
+    xx = y1.transpose(1, 0, 2)
+    yy = y0.T[:, :, None]
+    if ntrend > 0:
+        trend_exog = np.vander(np.arange(1, nobs + 1) / float(nobs), ntrend,
+                               increasing=True)
+        q_trend = np.linalg.qr(trend_exog)[0]
+        xx = xx - np.matmul(q_trend, np.matmul(q_trend.T, xx))
+        yy = yy - np.matmul(q_trend, np.matmul(q_trend.T, yy))
+    q_x = np.linalg.qr(xx)[0]
+    resid = (yy - np.matmul(q_x, np.matmul(q_x.transpose(0, 2, 1),
+                                           yy)))[:, :, 0].T
+    if trend == 'nc':
+        tss = (y0 ** 2).sum(0)
+    else:
+        tss = ((y0 - y0.mean(0)) ** 2).sum(0)
+    rsquared = 1 - (resid ** 2).sum(0) / tss
+
+    coint_t = np.zeros(n_eq)
+    valid = rsquared < 1 - np.sqrt(np.finfo(np.double).eps)
+    if valid.any():
+        coint_t[valid] = adfuller_batch(resid[:, valid], maxlag=maxlag,
+                                        autolag=None, regression='nc')[0]
+    if not valid.all():
+        import warnings
+        warnings.warn("y0 and y1 are perfectly colinear for %d equations.  "
+                      "Cointegration test is not reliable in these cases."
+                      % (~valid).sum())
+
+    # no constant or trend, see egranger in Stata and MacKinnon
+    if trend == 'nc':
+        crit = np.array([np.nan] * 3)  # 2010 critical values not available
+    else:
+        crit = mackinnoncrit(N=k_vars, regression=trend, nobs=nobs - 1)
+
+    pval_asy = mackinnonp(coint_t, regression=trend, N=k_vars)
+    return coint_t, pval_asy, crit
+
+
 def _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params=None):
+    # order is (p, q) for ARMA or (p, d, q) for ARIMA
+    mod = ARMA if len(order) == 2 else ARIMA
     try:
-        return ARMA(y, order=order, **model_kw).fit(disp=0, trend=trend,
-                                                    start_params=start_params,
-                                                    **fit_kw)
+        return mod(y, order=order, **model_kw).fit(disp=0, trend=trend,
+                                                   start_params=start_params,
+                                                   **fit_kw)
     except LinAlgError:
         # SVD convergence failure on badly misspecified models
         return
@@ -1047,7 +1546,7 @@ def _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params=None):
             return
         # try a little harder, should be handled in fit really
         elif ('initial' not in error.args[0] or 'initial' in str(error)):
-            start_params = [.1] * sum(order)
+            start_params = [.1] * (order[0] + order[-1])
             if trend == 'c':
                 start_params = [.1] + start_params
             return _safe_arma_fit(y, order, model_kw, trend, fit_kw,
@@ -1058,8 +1557,94 @@ def _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params=None):
         return
 
 
+
+def _order_params(res):
+    """
+    Parameters of an ARMA, ARIMA or state space results instance by name
+
+    The trend and exog parameters of ARMA results, which precede the lag
+    polynomials, are named x0, x1, ...  The lag polynomials are named ar.L1,
+    ar.L2, ... and ma.L1, ma.L2, ... as in the state space models.
+    """
+    params = np.asarray(res.params)
+    if isinstance(res.model, ARMA):
+        k = res.k_trend + res.k_exog
+        names = (['x%d' % i for i in range(k)] +
+                 ['ar.L%d' % i for i in range(1, res.k_ar + 1)] +
+                 ['ma.L%d' % i for i in range(1, res.k_ma + 1)])
+    else:
+        names = res.model.param_names
+    return dict(zip(names, params))
+
+
+def _fit_order(model, y, order, model_kw, trend, fit_kw, warm=None):
+    """
+    Fit one order of an order search, returns None if the estimation fails
+
+    `warm` holds the parameters of a nested model as returned by
+    `_order_params`.  Lag coefficients that are not in the nested model
+    start at zero.  A failed warm-started fit is retried with the default
+    starting values.  Only estimation failures, LinAlgError and ValueError
+    for example from non-stationary or non-invertible parameters, are
+    treated as failed fits, other exceptions are raised.
+    """
+    if issubclass(model, ARMA):
+        start_params = None
+        if warm is not None:
+            start_params = []
+            while 'x%d' % len(start_params) in warm:
+                start_params.append(warm['x%d' % len(start_params)])
+            start_params += [warm.get('ar.L%d' % i, 0.)
+                             for i in range(1, order[0] + 1)]
+            start_params += [warm.get('ma.L%d' % i, 0.)
+                             for i in range(1, order[-1] + 1)]
+        res = _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params)
+        if res is None and start_params is not None:
+            res = _safe_arma_fit(y, order, model_kw, trend, fit_kw)
+        return res
+
+    trend = None if trend == 'nc' else trend
+    try:
+        mod = model(y, order=order, trend=trend, **model_kw)
+        start_params = None
+        if warm is not None:
+            start_params = [
+                warm.get(name, 0. if name.startswith(('ar.', 'ma.'))
+                         else value)
+                for name, value in zip(mod.param_names, mod.start_params)]
+        try:
+            return mod.fit(start_params=start_params, disp=0, **fit_kw)
+        except (LinAlgError, ValueError):
+            if start_params is None:
+                raise
+            return mod.fit(disp=0, **fit_kw)
+    except (LinAlgError, ValueError):  # failed fits are nan in the ic table
+        return
+
+
+def _arma_ic_row(y, ar, ma_range, ic, trend, model_kw, fit_kw, warm_start):
+    # information criteria for one AR order, warm-started along the MA orders
+    results = np.empty((len(ic), len(ma_range)))
+    warm = None
+    for j, ma in enumerate(ma_range):
+        if ar == 0 and ma == 0 and trend == 'nc':
+            results[:, j] = np.nan
+            continue
+
+        mod = _fit_order(ARMA, y, (ar, ma), model_kw, trend, fit_kw, warm)
+        if mod is None:
+            results[:, j] = np.nan
+            continue
+        if warm_start:
+            warm = _order_params(mod)
+
+        for i, criteria in enumerate(ic):
+            results[i, j] = getattr(mod, criteria)
+    return results
+
+
 def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
-                         model_kw={}, fit_kw={}):
+                         model_kw={}, fit_kw={}, n_jobs=1, warm_start=False):
     """
     Returns information criteria for many ARMA models
 
@@ -1080,6 +1665,13 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
         Keyword arguments to be passed to the ``ARMA`` model
     fit_kw : dict
         Keyword arguments to be passed to ``ARMA.fit``.
+    n_jobs : int
+        Number of processes. The models of each AR order are fit in one
+        process. -1 uses all CPUs. Default is 1, which fits all models in the
+        current process.
+    warm_start : bool
+        If True, then each model starts from the estimates of the model with
+        the same AR order and one MA lag less. Default is False.
 
     Returns
     -------
@@ -1113,7 +1705,11 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
     function computes the full exact MLE estimate of each model and can be,
     therefore a little slow. An implementation using approximate estimates
     will be provided in the future. In the meantime, consider passing
-    {method : 'css'} to fit_kw.
+    {method : 'css'} to fit_kw, or use `arma_order_select_stepwise`, which
+    only estimates the models around the current best order.
+
+    The processes are run with joblib, if it is installed. Otherwise all
+    models are fit in the current process.
     """
     from pandas import DataFrame
 
@@ -1124,21 +1720,16 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
     elif not isinstance(ic, (list, tuple)):
         raise ValueError("Need a list or a tuple for ic if not a string.")
 
-    results = np.zeros((len(ic), max_ar + 1, max_ma + 1))
-
-    for ar in ar_range:
-        for ma in ma_range:
-            if ar == 0 and ma == 0 and trend == 'nc':
-                results[:, ar, ma] = np.nan
-                continue
-
-            mod = _safe_arma_fit(y, (ar, ma), model_kw, trend, fit_kw)
-            if mod is None:
-                results[:, ar, ma] = np.nan
-                continue
-
-            for i, criteria in enumerate(ic):
-                results[i, ar, ma] = getattr(mod, criteria)
+    args = [(y, ar, ma_range, ic, trend, model_kw, fit_kw, warm_start)
+            for ar in ar_range]
+    if n_jobs == 1:
+        rows = [_arma_ic_row(*arg) for arg in args]
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_arma_ic_row, n_jobs,
+                                                 verbose=0)
+        rows = parallel(p_func(*arg) for arg in args)
+    results = np.stack(rows, axis=1)
 
     dfs = [DataFrame(res, columns=ma_range, index=ar_range) for res in results]
 
@@ -1153,6 +1744,156 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
 
     return Bunch(**res)
 
+
+def arma_order_select_stepwise(y, max_ar=5, max_ma=5, ic='aic', trend='c',
+                               model=None, d=0, start_order=(2, 2),
+                               model_kw={}, fit_kw={}, n_jobs=1):
+    """
+    Stepwise search for the ARMA order with the smallest information criterion
+
+    Parameters
+    ----------
+    y : array-like
+        Time-series data
+    max_ar : int
+        Maximum number of AR lags to use. Default 5.
+    max_ma : int
+        Maximum number of MA lags to use. Default 5.
+    ic : str
+        The information criterion that is minimized, the name of an attribute
+        of the results, for example 'aic', 'bic' or 'hqic'.
+    trend : str
+        The trend to use when fitting the models, 'c' or 'nc'.  For state
+        space models any trend of the model is possible.
+    model : Model class
+        The model, ``ARMA`` (default) or a state space model with an `order`
+        and a `trend` argument like ``SARIMAX``.  ``ARIMA`` is used for ARMA
+        models if `d` is larger than zero.
+    d : int
+        The order of integration.  Default is 0.
+    start_order : tuple
+        The (AR, MA) order of the first model.  Default is (2, 2).
+    model_kw : dict
+        Keyword arguments to be passed to the model, for example the
+        `seasonal_order` of a ``SARIMAX`` model.
+    fit_kw : dict
+        Keyword arguments to be passed to the `fit` method of the model.
+    n_jobs : int
+        Number of processes used to fit the models of each step.  -1 uses
+        all CPUs.  Default is 1, which fits all models in the current process.
+
+    Returns
+    -------
+    obj : Results object
+        The ic is an attribute with a DataFrame of its values, which are nan
+        for the orders that have not been estimated. The AR order used is the
+        row index. The MA order used is the column index. The minimum order
+        is available as ``ic_min_order``, its results instance as
+        ``best_results`` and the number of estimated models as ``n_fits``.
+
+    See Also
+    --------
+    arma_order_select_ic
+
+    Notes
+    -----
+    The search follows the stepwise algorithm of Hyndman and Khandakar
+    (2008) for a fixed trend and seasonal order.  It starts with the models
+    of orders `start_order`, (0, 0), (1, 0) and (0, 1).  In each step, the
+    models with AR and/or MA order one lag above or below the current best
+    order are estimated, and the search stops when none of them improves
+    on the current best model.
+
+    Each model starts from the estimates of the already estimated nested
+    model with the smallest information criterion, with zeros for the
+    additional lag coefficients, which are stationary and invertible if the
+    nested estimates are.  The models of a step are independent of each
+    other and are fit in parallel if `n_jobs` is not 1. The processes are run
+    with joblib, if it is installed.
+
+    References
+    ----------
+    Hyndman, R.J. and Khandakar, Y. (2008).  Automatic time series
+    forecasting: the forecast package for R.  Journal of Statistical
+    Software, 27(3).
+    """
+    from pandas import DataFrame
+
+    if model is None:
+        model = ARMA
+    is_arma = issubclass(model, ARMA)
+    if is_arma and d > 0:
+        model = ARIMA
+
+    def full_order(order):
+        if is_arma and d == 0:
+            return order
+        return (order[0], d, order[1])
+
+    def valid(order):
+        # ARMA models without constant need at least one lag
+        return (0 <= order[0] <= max_ar and 0 <= order[1] <= max_ma and
+                not (is_arma and trend == 'nc' and order == (0, 0)))
+
+    if n_jobs != 1:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_fit_order, n_jobs,
+                                                 verbose=0)
+
+    results = {}
+    table = np.empty((max_ar + 1, max_ma + 1))
+    table.fill(np.nan)
+
+    def fit_orders(orders):
+        args = []
+        for order in orders:
+            nested = [k for k, v in iteritems(results) if v is not None and
+                      k[0] <= order[0] and k[1] <= order[1]]
+            warm = None
+            if nested:
+                warm = _order_params(results[min(nested,
+                                                 key=lambda k: table[k])])
+            args.append((model, y, full_order(order), model_kw, trend,
+                         fit_kw, warm))
+        if n_jobs == 1:
+            fits = [_fit_order(*arg) for arg in args]
+        else:
+            fits = parallel(p_func(*arg) for arg in args)
+        for order, res in zip(orders, fits):
+            results[order] = res
+            if res is not None:
+                table[order] = getattr(res, ic)
+
+    start_order = (min(start_order[0], max_ar), min(start_order[1], max_ma))
+    orders = []
+    for order in [start_order, (0, 0), (1, 0), (0, 1)]:
+        if valid(order) and order not in orders:
+            orders.append(order)
+    fit_orders(orders)
+
+    best = None
+    while not np.isnan(table).all():
+        new_best = np.unravel_index(np.nanargmin(table), table.shape)
+        new_best = tuple(int(i) for i in new_best)
+        if new_best == best:
+            break
+        best = new_best
+        orders = [(best[0] + i, best[1] + j) for i, j in
+                  [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1)]]
+        orders = [order for order in orders
+                  if valid(order) and order not in results]
+        if not orders:
+            break
+        fit_orders(orders)
+
+    res = {ic: DataFrame(table, columns=lrange(max_ma + 1),
+                         index=lrange(max_ar + 1)),
+           ic + '_min_order': best,
+           'best_results': results.get(best),
+           'n_fits': len(results)}
+    return Bunch(**res)
+
+
 def has_missing(data):
     """
     Returns True if 'data' contains missing entries, otherwise False
@@ -1285,3 +2026,88 @@ def _sigma_est_kpss(resids, nobs, lags):
         resids_prod = np.dot(resids[i:], resids[:nobs - i])
         s_hat += 2 * resids_prod * (1. - (i / (lags + 1.)))
     return s_hat / nobs
+
+
+def kpss_batch(x, regression='c', lags=None):
+    """
+    Kwiatkowski-Phillips-Schmidt-Shin test for stationarity of many series
+
+    Parameters
+    ----------
+    x : array_like, 2d
+        The data with one series in each column, shape (nobs, n_series).
+    regression : str{'c', 'ct'}
+        Indicates the null hypothesis for the KPSS test
+        * 'c' : The data is stationary around a constant (default)
+        * 'ct' : The data is stationary around a trend
+    lags : int
+        Indicates the number of lags to be used. If None (default),
+        lags is set to int(12 * (n / 100)**(1 / 4)), as outlined in
+        Schwert (1989).
+
+    Returns
+    -------
+    kpss_stat : ndarray
+        The KPSS test statistics
+    p_value : ndarray
+        The p-values of the tests, interpolated from Table 1 in
+        Kwiatkowski et al. (1992), see `kpss`.
+    lags : int
+        The truncation lag parameter
+    crit : dict
+        The critical values at 10%, 5%, 2.5% and 1%. Based on
+        Kwiatkowski et al. (1992).
+
+    See Also
+    --------
+    kpss
+
+    Notes
+    -----
+    The results are the same as those of `kpss` applied to each column of
+    `x`.  A single warning is issued if some of the statistics are outside
+    the table of critical values.
+    """
+    from warnings import warn
+
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    elif x.ndim != 2:
+        raise ValueError("x of shape {0} not understood".format(x.shape))
+    nobs = x.shape[0]
+    hypo = regression.lower()
+
+    if hypo == 'ct':
+        exog = add_constant(np.arange(1, nobs + 1))
+        resids = x - exog.dot(np.linalg.pinv(exog).dot(x))
+        crit = [0.119, 0.146, 0.176, 0.216]
+    elif hypo == 'c':
+        resids = x - x.mean(0)
+        crit = [0.347, 0.463, 0.574, 0.739]
+    else:
+        raise ValueError("hypothesis '{0}' not understood".format(hypo))
+
+    if lags is None:
+        # from Kwiatkowski et al. referencing Schwert (1989)
+        lags = int(np.ceil(12. * np.power(nobs / 100., 1 / 4.)))
+
+    pvals = [0.10, 0.05, 0.025, 0.01]
+
+    eta = (resids.cumsum(0) ** 2).sum(0) / (nobs ** 2)  # eq. 11, p. 165
+    s_hat = (resids ** 2).sum(0)
+    for i in range(1, lags + 1):
+        resids_prod = (resids[i:] * resids[:nobs - i]).sum(0)
+        s_hat += 2 * resids_prod * (1. - (i / (lags + 1.)))
+    s_hat /= nobs
+
+    kpss_stat = eta / s_hat
+    p_value = np.interp(kpss_stat, crit, pvals)
+
+    if (p_value == pvals[-1]).any():
+        warn("p-value is smaller than the indicated p-value", InterpolationWarning)
+    if (p_value == pvals[0]).any():
+        warn("p-value is greater than the indicated p-value", InterpolationWarning)
+
+    crit_dict = {'10%': crit[0], '5%': crit[1], '2.5%': crit[2], '1%': crit[3]}
+    return kpss_stat, p_value, lags, crit_dict
@@ -224,3 +224,56 @@ class TestHoltWinters(object):
 
     def test_raises(self):
         pass
+
+
+def test_fit_batch():
+    np.random.seed(1234)
+    nobs, n_series = 60, 5
+    t = np.arange(nobs)
+    endog = np.column_stack([
+        50 + 0.2 * i * t + 5 * np.sin(2 * np.pi * t / 4) +
+        np.random.normal(size=nobs) for i in range(n_series)])
+    endog = pd.DataFrame(endog, columns=list('abcde'))
+    res = ExponentialSmoothing.fit_batch(endog, steps=6, trend='add',
+                                         seasonal='add', seasonal_periods=4)
+    assert_equal(res.names, list('abcde'))
+    assert_equal(res.params.shape, (n_series, 10))
+    assert_equal(res.forecasts.shape, (n_series, 6))
+    assert_equal(res.failed, False)
+    for i in range(n_series):
+        fit = ExponentialSmoothing(endog.iloc[:, i].values, trend='add',
+                                   seasonal='add', seasonal_periods=4).fit()
+        assert_almost_equal(res.sse[i], fit.sse)
+        assert_almost_equal(res.params[i, 0], fit.params['smoothing_level'])
+        assert_almost_equal(res.params[i, 6:], fit.params['initial_seasons'])
+        assert_almost_equal(res.forecasts[i], fit.forecast(6))
+
+    # Failures are recorded per series
+    endog.iloc[:, 2] = -1
+    res = ExponentialSmoothing.fit_batch(endog, seasonal='mul',
+                                         seasonal_periods=4)
+    assert_equal(res.failed, [False, False, True, False, False])
+    assert 2 in res.errors
+    frame = res.summary_frame()
+    assert_equal(frame.shape, (n_series, 17))
+    assert np.isnan(frame.loc['c', 'sse'])
+
+    # Errors that are not estimation failures are raised
+    assert_raises(TypeError, ExponentialSmoothing.fit_batch, endog + 2,
+                  fit_kwds={'smoothing_level_': 0.5})
+
+
+def test_start_grid():
+    # The starting values are the best point of the same grid as
+    # scipy.optimize.brute
+    from scipy.optimize import brute
+    from statsmodels.tsa.holtwinters import _start_grid
+    grid = _start_grid(np.array([True, False, True, False]),
+                       [0.5, 0.1, 0.2, 1.0], Ns=5)
+    assert_equal(grid.shape, (25, 4))
+    assert_equal(grid[:, 1], 0.1)
+    assert_equal(grid[:, 3], 1.0)
+    points = []
+    brute(lambda x: points.append(x.copy()) or 0.,
+          [(0.0, 1.0), (0.0, 1.0)], Ns=5, finish=None)
+    assert_almost_equal(grid[:, [0, 2]], np.array(points))
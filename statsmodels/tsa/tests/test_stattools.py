@@ -5,8 +5,13 @@ from statsmodels.tools.sm_exceptions import ColinearityWarning
 from statsmodels.tsa.stattools import (adfuller, acf, pacf_ols, pacf_yw,
                                                pacf, grangercausalitytests,
                                                coint, acovf, kpss, ResultsStore,
-                                               arma_order_select_ic)
+                                               arma_order_select_ic,
+                                               adfuller_batch, kpss_batch,
+                                               coint_batch,
+                                               arma_order_select_stepwise,
+                                               ccovf, ccf, OnlineAutocovariance)
 import numpy as np
+import pytest
 import pandas as pd
 from numpy.testing import (assert_almost_equal, assert_equal, assert_warns,
                            assert_raises, dec, assert_, assert_allclose)
@@ -533,6 +538,90 @@ def test_arma_order_select_ic():
     assert_(res.aic.columns.equals(aic.columns))
     assert_equal(res.aic_min_order, (1, 2))
 
+def _gen_arma_order_data():
+    from statsmodels.tsa.arima_process import arma_generate_sample
+    np.random.seed(2014)
+    return arma_generate_sample(np.r_[1, -.75, .25], np.r_[1, .65, .35], 250)
+
+
+def test_arma_order_select_ic_warm_start():
+    y = _gen_arma_order_data()
+    res0 = arma_order_select_ic(y, ic=['aic', 'bic'], trend='nc')
+    res1 = arma_order_select_ic(y, ic=['aic', 'bic'], trend='nc',
+                                warm_start=True)
+    assert_allclose(res1.aic.values, res0.aic.values, rtol=1e-6)
+    assert_allclose(res1.bic.values, res0.bic.values, rtol=1e-6)
+    assert_equal(res1.aic_min_order, res0.aic_min_order)
+    assert_equal(res1.bic_min_order, res0.bic_min_order)
+
+
+def test_arma_order_select_stepwise():
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+    y = _gen_arma_order_data()
+    res0 = arma_order_select_ic(y, max_ar=4, max_ma=3, ic='aic', trend='nc')
+    res = arma_order_select_stepwise(y, max_ar=4, max_ma=3, ic='aic',
+                                     trend='nc')
+    assert_equal(res.aic_min_order, res0.aic_min_order)
+    assert_(res.n_fits < 20)
+    fitted = ~np.isnan(res.aic.values)
+    assert_equal(fitted.sum(), res.n_fits)
+    assert_allclose(res.aic.values[fitted], res0.aic.values[fitted],
+                    rtol=1e-6)
+    assert_allclose(res.best_results.aic, np.nanmin(res0.aic.values),
+                    rtol=1e-6)
+    assert_(res.aic.index.equals(res0.aic.index))
+    assert_(res.aic.columns.equals(res0.aic.columns))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res = arma_order_select_stepwise(y, max_ar=3, max_ma=3, ic='bic',
+                                         trend='nc', model=SARIMAX)
+    assert_equal(res.bic_min_order, res0.aic_min_order)
+    assert_(isinstance(res.best_results.model, SARIMAX))
+    assert_allclose(res.best_results.bic, np.nanmin(res.bic.values))
+
+    # ARIMA for integrated series
+    res = arma_order_select_stepwise(np.cumsum(y), max_ar=3, max_ma=3,
+                                     ic='bic', trend='nc', d=1)
+    assert_equal(res.bic_min_order, res0.aic_min_order)
+    assert_equal(res.best_results.k_diff, 1)
+
+
+def test_arma_order_select_stepwise_warm_failure(monkeypatch):
+    # failed warm-started fits are retried with the default start_params
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+    y = _gen_arma_order_data()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res0 = arma_order_select_stepwise(y, max_ar=3, max_ma=3, ic='bic',
+                                          trend='nc', model=SARIMAX)
+
+    fit = SARIMAX.fit
+
+    def cold_fit(self, start_params=None, **kwds):
+        if start_params is not None:
+            raise ValueError('Non-stationary starting autoregressive '
+                             'parameters found.')
+        return fit(self, **kwds)
+
+    monkeypatch.setattr(SARIMAX, 'fit', cold_fit)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res = arma_order_select_stepwise(y, max_ar=3, max_ma=3, ic='bic',
+                                         trend='nc', model=SARIMAX)
+    assert_equal(np.isnan(res.bic.values), np.isnan(res0.bic.values))
+    assert_allclose(res.bic.values, res0.bic.values, rtol=1e-5)
+    assert_equal(res.bic_min_order, res0.bic_min_order)
+
+    # other errors are not treated as failed estimation
+    def bad_fit(self, start_params=None, **kwds):
+        raise TypeError('bad fit')
+
+    monkeypatch.setattr(SARIMAX, 'fit', bad_fit)
+    assert_raises(TypeError, arma_order_select_stepwise, y, max_ar=1,
+                  max_ma=1, trend='nc', model=SARIMAX)
+
+
 def test_arma_order_select_ic_failure():
     # this should trigger an SVD convergence failure, smoke test that it
     # returns, likely platform dependent failure...
@@ -554,12 +643,169 @@ def test_arma_order_select_ic_failure():
         res = arma_order_select_ic(y)
 
 
+def test_ccovf_fft():
+    np.random.seed(4567)
+    x = np.random.randn(500).cumsum() + 100
+    y = np.random.randn(500)
+    for unbiased in [True, False]:
+        for demean in [True, False]:
+            res = ccovf(x, y, unbiased=unbiased, demean=demean, fft=True)
+            res1 = ccovf(x, y, unbiased=unbiased, demean=demean, fft=False)
+            assert_allclose(res, res1, rtol=1e-8, atol=1e-10)
+    assert_allclose(ccf(x, y), ccf(x, y, fft=False), atol=1e-12)
+
+
+def test_pacf_levinson_durbin():
+    np.random.seed(4567)
+    e = np.random.randn(501)
+    x = e[1:] + 0.6 * e[:-1]
+    assert_allclose(pacf(x, nlags=20), pacf_yw(x, nlags=20), atol=1e-12)
+    assert_allclose(pacf(x, nlags=20, method='ywm'),
+                    pacf_yw(x, nlags=20, method='mle'), atol=1e-12)
+    assert_allclose(pacf(x, nlags=20, method='ld'), pacf(x, nlags=20))
+
+
+@pytest.mark.parametrize('window', [None, 150])
+@pytest.mark.parametrize('unbiased', [True, False])
+@pytest.mark.parametrize('demean', [True, False])
+def test_online_autocovariance(window, unbiased, demean):
+    np.random.seed(4567)
+    e = np.random.randn(401)
+    x = e[1:] + 0.6 * e[:-1] + 1000
+    mod = OnlineAutocovariance(nlags=10, window=window, unbiased=unbiased,
+                               demean=demean)
+    mod.update(x[0])
+    for start in range(1, len(x), 37):
+        end = min(start + 37, len(x))
+        mod.update(x[start:end])
+        if window is not None:
+            start = max(0, end - window)
+        else:
+            start = 0
+        assert_equal(mod.nobs, end - start)
+        nlags = min(10, end - start - 1)
+        acov = acovf(x[start:end], unbiased=unbiased, demean=demean)
+        assert_allclose(mod.acovf()[:nlags + 1], acov[:nlags + 1],
+                        rtol=1e-7, atol=1e-8)
+        assert_allclose(mod.acf()[:nlags + 1],
+                        acov[:nlags + 1] / acov[0], rtol=1e-7, atol=1e-8)
+    method = 'ld' if unbiased else 'ldb'
+    if demean:
+        assert_allclose(mod.pacf(), pacf(x[-mod.nobs:], nlags=10,
+                                         method=method), rtol=1e-6)
+
+    mod = OnlineAutocovariance(nlags=5)
+    mod.update([3., 1.])
+    assert_equal(np.isnan(mod.acovf()), [False, False] + [True] * 4)
+    assert_equal(np.isnan(mod.pacf()), [False, False] + [True] * 4)
+    assert_raises(ValueError, OnlineAutocovariance, nlags=5, window=5)
+
+
 def test_acf_fft_dataframe():
     # regression test #322
 
     result = acf(sunspots.load_pandas().data[['SUNACTIVITY']], fft=True)
     assert_equal(result.ndim, 1)
 
+
+def _gen_unit_root_data(nobs=250, n_series=8, seed=93456):
+    np.random.seed(seed)
+    e = np.random.randn(nobs, n_series)
+    x = np.cumsum(e, 0)
+    # half of the series are stationary MA(1)
+    x[:, ::2] = e[:, ::2] + 0.5 * np.roll(e[:, ::2], 1, 0)
+    return x + 10
+
+
+@pytest.mark.parametrize('regression', ['c', 'ct', 'ctt', 'nc'])
+@pytest.mark.parametrize('autolag', ['AIC', 'BIC', None])
+def test_adfuller_batch(regression, autolag):
+    x = _gen_unit_root_data()
+    res = adfuller_batch(x, regression=regression, autolag=autolag)
+    for i in range(x.shape[1]):
+        res1 = adfuller(x[:, i], regression=regression, autolag=autolag)
+        assert_allclose(res[0][i], res1[0], rtol=1e-8)
+        assert_allclose(res[1][i], res1[1], rtol=1e-8, atol=1e-12)
+        assert_equal(res[2][i], res1[2])
+        assert_equal(res[3][i], res1[3])
+        for key in res1[4]:
+            assert_allclose(res[4][key][i], res1[4][key], rtol=1e-12)
+        if autolag is not None:
+            assert_allclose(res[5][i], res1[5], rtol=1e-8)
+
+
+@pytest.mark.parametrize('regression', ['c', 'ct', 'ctt'])
+@pytest.mark.parametrize('autolag', ['AIC', 't-stat'])
+def test_adfuller_batch_level_offset(regression, autolag):
+    # A large level offset must not affect the results when the
+    # regression includes a constant. The reference is computed without
+    # the offset, since the single-series OLS loses precision as well.
+    x = _gen_unit_root_data(n_series=20)
+    res = adfuller_batch(x + 1e8, regression=regression, autolag=autolag)
+    for i in range(x.shape[1]):
+        res1 = adfuller(x[:, i], regression=regression, autolag=autolag)
+        assert_allclose(res[0][i], res1[0], rtol=1e-6)
+        assert_equal(res[2][i], res1[2])
+        assert_allclose(res[5][i], res1[5], rtol=1e-6)
+
+
+def test_adfuller_batch_tstat():
+    x = _gen_unit_root_data()
+    res = adfuller_batch(x, maxlag=8, regression='ct', autolag='t-stat')
+    for i in range(x.shape[1]):
+        res1 = adfuller(x[:, i], maxlag=8, regression='ct', autolag='t-stat')
+        assert_allclose(res[0][i], res1[0], rtol=1e-8)
+        assert_equal(res[2][i], res1[2])
+        assert_allclose(res[5][i], res1[5], rtol=1e-8)
+
+
+@pytest.mark.parametrize('regression', ['c', 'ct'])
+def test_kpss_batch(regression):
+    x = _gen_unit_root_data()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res = kpss_batch(x, regression)
+        for i in range(x.shape[1]):
+            res1 = kpss(x[:, i], regression)
+            assert_allclose(res[0][i], res1[0], rtol=1e-10)
+            assert_allclose(res[1][i], res1[1], rtol=1e-10)
+            assert_equal(res[2], res1[2])
+            assert_equal(res[3], res1[3])
+
+
+@pytest.mark.parametrize('trend', ['c', 'ct', 'nc'])
+def test_coint_batch(trend):
+    np.random.seed(5678)
+    nobs, n_eq = 250, 6
+    y1 = np.cumsum(np.random.randn(nobs, n_eq, 2), 0)
+    y0 = y1[:, :, 0] - 0.5 * y1[:, :, 1] + np.random.randn(nobs, n_eq)
+    y0[:, ::2] += np.cumsum(np.random.randn(nobs, n_eq // 2), 0)
+    for exog in [y1[:, :, 0], y1]:
+        res = coint_batch(y0, exog, trend=trend, maxlag=2)
+        for i in range(n_eq):
+            res1 = coint(y0[:, i], exog[:, i], trend=trend, maxlag=2)
+            assert_allclose(res[0][i], res1[0], rtol=1e-7)
+            assert_allclose(res[1][i], res1[1], rtol=1e-7, atol=1e-12)
+            assert_allclose(res[2], res1[2], rtol=1e-12)
+
+
+@pytest.mark.parametrize('trend', ['c', 'ct'])
+@pytest.mark.parametrize('offset', [1e6, 1e8])
+def test_coint_batch_level_offset(trend, offset):
+    # The statistics do not depend on the level of the series. The
+    # reference is computed without the offset, since the single-equation
+    # OLS loses precision as well.
+    np.random.seed(5678)
+    nobs, n_eq = 250, 4
+    y1 = np.cumsum(np.random.randn(nobs, n_eq), 0)
+    y0 = y1 + np.random.randn(nobs, n_eq)
+    y0[:, ::2] += np.cumsum(np.random.randn(nobs, n_eq // 2), 0)
+    res = coint_batch(y0 + offset, y1 + offset, trend=trend, maxlag=2)
+    for i in range(n_eq):
+        res1 = coint(y0[:, i], y1[:, i], trend=trend, maxlag=2)
+        assert_allclose(res[0][i], res1[0], rtol=1e-6)
+        assert_allclose(res[1][i], res1[1], rtol=1e-6, atol=1e-12)
+
 if __name__=="__main__":
     import pytest
     pytest.main([__file__, '-vvs', '-x', '--pdb'])